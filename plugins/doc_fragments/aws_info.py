@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2021, Davinder Pal <dpsangwal@gmail.com>
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # common options of aws info modules
+    DOCUMENTATION = r"""
+options:
+  max_items:
+    description:
+      - stop fetching pages once given number of items are returned.
+      - pages after that are not requested from aws. apis without paginator return first given number of items of their single response.
+      - result contains C(next_token) which can be passed as I(starting_token) to get next items, it is C(null) after last item.
+    required: false
+    type: int
+  starting_token:
+    description:
+      - continue pagination from C(next_token) of previous result.
+    required: false
+    type: str
+  page_size:
+    description:
+      - number of items requested per api call.
+      - some aws apis don't support it or have their own upper limit.
+    required: false
+    type: int
+  fields:
+    description:
+      - return only given fields of each item, unused fields are never converted to snake_case or returned.
+      - list of paths, nested keys are separated by C(.) and keys can be camelCase or snake_case, example C(['ClusterArn', 'tags.key']).
+      - 'or jmespath expression evaluated against each item with aws key names, example C("{arn: clusterArn, name: clusterName}").'
+      - items which are not dictionaries ( for example list of arns ) are not changed by list of paths.
+    required: false
+    type: raw
+  regions:
+    description:
+      - run same operation in all given regions concurrently instead of I(region).
+      - C(all) selects every enabled region where service is available.
+      - result is returned as C(regions) dictionary keyed by region and errors as C(failed_regions) dictionary keyed by region.
+      - error in one region doesn't fail the task, only invalid options do.
+    required: false
+    type: list
+    elements: str
+  max_workers:
+    description:
+      - maximum number of regions / accounts queried at same time.
+    required: false
+    type: int
+    default: 10
+  account_ids:
+    description:
+      - run same operation in all given accounts concurrently by assuming I(role_name) in each of them.
+      - result is returned as C(accounts) dictionary keyed by account id and errors as C(failed_accounts) dictionary keyed by account id.
+      - can be combined with I(regions), then result of each account is nested as C(regions) and C(failed_regions).
+      - error in one account doesn't fail the task, only invalid options do.
+    required: false
+    type: list
+    elements: str
+  role_name:
+    description:
+      - name of role to assume in every account of I(account_ids), example C(OrganizationAccountAccessRole).
+      - required with I(account_ids).
+    required: false
+    type: str
+  role_session_name:
+    description:
+      - session name used to assume I(role_name).
+    required: false
+    type: str
+    default: 'ansible-missing-collection'
+  role_credentials_cache:
+    description:
+      - directory to cache assumed role credentials until they expire, so next tasks don't assume role again.
+      - credentials are always cached in memory during single task.
+    required: false
+    type: path
+  cache:
+    description:
+      - cache result on disk in I(cache_dir) and return it for I(cache_ttl) seconds without calling aws.
+      - cache key is account, region, service, operation and options, result contains C(cache_hit).
+      - with I(regions) or I(account_ids) every region / account is cached separately.
+    required: false
+    type: bool
+    default: false
+  cache_dir:
+    description:
+      - directory of I(cache), entries are written atomically so parallel forks can share it.
+    required: false
+    type: path
+    default: '~/.ansible/aws_info_cache'
+  cache_ttl:
+    description:
+      - seconds for which cached result is used.
+    required: false
+    type: int
+    default: 300
+  cache_max_size:
+    description:
+      - maximum size of I(cache_dir) in MB, least recently used results are removed above it.
+    required: false
+    type: int
+    default: 100
+  collect_metrics:
+    description:
+      - return C(_perf) with api call, page, item, retry and throttle counts, wall time, peak rss of module and
+        time spent in network, parse, fields, snake_case and serialization phases.
+      - with I(regions) or I(account_ids) counters and phases of all regions / accounts are added up.
+    required: false
+    type: bool
+    default: false
+  dest:
+    description:
+      - write items of lists to given file on target as newline delimited json, one item per line, instead of returning them.
+      - items are written while pages are fetched, so memory use doesn't grow with number of items.
+      - result contains only C(dest), C(count) of written items, C(size) of file in bytes and sha256 C(checksum) of file.
+      - 'with I(regions) or I(account_ids) each line is C({"region": ..., "account_id": ..., "item": ...}).'
+      - file is replaced atomically when module succeeds and is readable only by owner. can't be used with I(cache).
+    required: false
+    type: path
+  dest_gzip:
+    description:
+      - gzip compress I(dest), C(size) and C(checksum) are of compressed file.
+    required: false
+    type: bool
+    default: false
+  rate_limit:
+    description:
+      - maximum requests per second of each api operation, enforced by client side token bucket before every request and retry.
+      - limit is shared by all threads which call same account and region, for example batches of I(expand).
+      - on throttling errors rate is lowered to 70% and then raised back to given rate by 10% of it per second while calls succeed.
+    required: false
+    type: float
+  rate_limit_operations:
+    description:
+      - 'maximum requests per second of given api operations, overrides I(rate_limit), example C({"DescribeServices": 5}).'
+      - without I(rate_limit) only given operations are limited.
+    required: false
+    type: dict
+  since_state:
+    description:
+      - state file on target with content hash of every listed item, written by previous run of same task.
+      - every list of result is returned as dictionary compared to that state, with C(added) and C(changed) items,
+        identifiers of C(removed) items and C(unchanged) count. then state is replaced atomically with current items.
+      - items are hashed while pages are fetched, unchanged items are never kept, so result size depends on number of changes only.
+      - without state file every item is C(added), result contains C(since_state.baseline=true) then.
+      - lists of failed regions / accounts keep their previous state. use one file per task.
+      - can't be used with I(dest), I(cache), I(max_items) or I(starting_token).
+    required: false
+    type: path
+  since_state_id:
+    description:
+      - item key which identifies item, example C(invalidation_id).
+      - first of C(arn), C(id), C(name), C(*_arn), C(*_id), C(*_name) keys of item if not given, string items are their own identifier.
+      - items without identifier are identified by content, their changes show as removed and added.
+    required: false
+    type: str
+"""
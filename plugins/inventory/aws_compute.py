@@ -0,0 +1,311 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+name: aws_compute
+short_description: EC2 instances of ECS clusters, EKS nodegroups and Auto Scaling groups.
+description:
+  - Inventory of EC2 instances which run ECS container instances, EKS nodegroups or belong to Auto Scaling groups.
+  - Regions are fetched at same time on the controller, instead of running info modules for every host.
+  - Uses a YAML configuration file that ends with C(aws_compute.yml) or C(aws_compute.yaml).
+  - Hosts are added to groups C(ecs_<cluster>), C(eks_<cluster>), C(eks_nodegroup_<nodegroup>) and C(asg_<auto scaling group>).
+  - Host variables are snake_case attributes of EC2 DescribeInstances with C(region), C(ecs_cluster), C(ecs_container_instance_arn),
+    C(eks_cluster), C(eks_nodegroup) and C(autoscaling_group) where they apply.
+version_added: 0.4.0
+options:
+  plugin:
+    description: token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['community.missing_collection.aws_compute', 'aws_compute']
+  regions:
+    description:
+      - regions to fetch, region of profile / environment if not given.
+    type: list
+    elements: str
+    default: []
+  sources:
+    description:
+      - which instances are added to inventory.
+    type: list
+    elements: str
+    choices: ['ecs', 'eks', 'autoscaling']
+    default: ['ecs', 'eks', 'autoscaling']
+  ecs_clusters:
+    description:
+      - names of ecs clusters, all clusters if not given.
+    type: list
+    elements: str
+    default: []
+  eks_clusters:
+    description:
+      - names of eks clusters, all clusters if not given.
+    type: list
+    elements: str
+    default: []
+  hostnames:
+    description:
+      - instance attributes ( snake_case ) used as inventory hostname, first one which is set is used.
+    type: list
+    elements: str
+    default: ['private_ip_address', 'instance_id']
+  max_workers:
+    description:
+      - maximum number of regions and describe calls fetched at same time.
+    type: int
+    default: 10
+  aws_profile:
+    description: boto3 profile.
+    type: str
+    env:
+      - name: AWS_PROFILE
+  aws_access_key:
+    description: aws access key id.
+    type: str
+    env:
+      - name: AWS_ACCESS_KEY_ID
+  aws_secret_key:
+    description: aws secret access key.
+    type: str
+    env:
+      - name: AWS_SECRET_ACCESS_KEY
+  aws_security_token:
+    description: aws session token.
+    type: str
+    env:
+      - name: AWS_SESSION_TOKEN
+author:
+  - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+requirements:
+  - boto3
+"""
+
+EXAMPLES = """
+# ansible.cfg
+# [inventory]
+# enable_plugins = community.missing_collection.aws_compute
+
+# inventory/prod.aws_compute.yml
+plugin: community.missing_collection.aws_compute
+regions:
+  - eu-central-1
+  - us-east-1
+sources:
+  - ecs
+  - eks
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/inventory_cache
+cache_timeout: 600
+keyed_groups:
+  - key: placement.availability_zone
+    prefix: az
+
+# only auto scaling groups, hosts by instance id
+plugin: community.missing_collection.aws_compute
+sources:
+  - autoscaling
+hostnames:
+  - instance_id
+compose:
+  ansible_host: private_ip_address
+"""
+
+import json
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import boto3
+    import botocore.config
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:
+    boto3 = None
+
+from ansible.errors import AnsibleError
+from ansible.module_utils._text import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_json_default
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_batch_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_iterator
+
+# botocore retries throttled calls of all regions with backoff.
+_RETRY_CONFIG = dict(retries=dict(mode='standard', max_attempts=10))
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'community.missing_collection.aws_compute'
+
+    def verify_file(self, path):
+        return super(InventoryModule, self).verify_file(path) and path.endswith(('aws_compute.yml', 'aws_compute.yaml'))
+
+    def _client(self, service: str, region: str):
+        # sessions aren't thread safe, every region worker creates its own.
+        session = boto3.session.Session(
+            profile_name=self.get_option('aws_profile'),
+            aws_access_key_id=self.get_option('aws_access_key'),
+            aws_secret_access_key=self.get_option('aws_secret_key'),
+            aws_session_token=self.get_option('aws_security_token'),
+            region_name=region,
+        )
+        return session.client(service, config=botocore.config.Config(**_RETRY_CONFIG))
+
+    def _ecs_instances(self, region: str) -> dict:
+        # {instance id: {'ecs_cluster': name, 'ecs_container_instance_arn': arn}}
+        ecs = self._client('ecs', region)
+        clusters = self.get_option('ecs_clusters') or [
+            arn.split('/')[-1] for arn in aws_response_list_iterator(True, ecs.get_paginator('list_clusters').paginate(), 'clusterArns')
+        ]
+        _return = {}
+        for cluster in clusters:
+            arns = list(aws_response_list_iterator(
+                True, ecs.get_paginator('list_container_instances').paginate(cluster=cluster), 'containerInstanceArns'
+            ))
+            container_instances = aws_response_batch_parser(
+                partial(ecs.describe_container_instances, cluster=cluster),
+                'containerInstances',
+                arns,
+                'containerInstances',
+                100,
+                max_workers=self.get_option('max_workers'),
+            )
+            for container_instance in container_instances:
+                # external instances ( ECS Anywhere ) aren't ec2 instances.
+                if not container_instance.get('ec2_instance_id', '').startswith('i-'):
+                    continue
+                _return[container_instance['ec2_instance_id']] = dict(
+                    ecs_cluster=cluster,
+                    ecs_container_instance_arn=container_instance['container_instance_arn'],
+                )
+        return _return
+
+    def _eks_groups(self, region: str) -> dict:
+        # {auto scaling group name: {'eks_cluster': name, 'eks_nodegroup': name}}
+        eks = self._client('eks', region)
+        clusters = self.get_option('eks_clusters') or list(
+            aws_response_list_iterator(True, eks.get_paginator('list_clusters').paginate(), 'clusters')
+        )
+        _return = {}
+        for cluster in clusters:
+            for nodegroup in aws_response_list_iterator(True, eks.get_paginator('list_nodegroups').paginate(clusterName=cluster), 'nodegroups'):
+                described = eks.describe_nodegroup(clusterName=cluster, nodegroupName=nodegroup)['nodegroup']
+                for group in described.get('resources', {}).get('autoScalingGroups', []):
+                    _return[group['name']] = dict(eks_cluster=cluster, eks_nodegroup=nodegroup)
+        return _return
+
+    def _autoscaling_instances(self, region: str, names: list = None) -> dict:
+        # {instance id: {'autoscaling_group': name}} of all groups or given `names`
+        autoscaling = self._client('autoscaling', region)
+        if names is None:
+            groups = aws_response_list_iterator(True, autoscaling.get_paginator('describe_auto_scaling_groups').paginate(), 'AutoScalingGroups')
+        else:
+            groups = aws_response_batch_parser(
+                autoscaling.describe_auto_scaling_groups,
+                'AutoScalingGroupNames',
+                names,
+                'AutoScalingGroups',
+                50,
+                max_workers=self.get_option('max_workers'),
+            )
+        _return = {}
+        for group in groups:
+            for instance in group.get('instances', []):
+                _return[instance['instance_id']] = dict(autoscaling_group=group['auto_scaling_group_name'])
+        return _return
+
+    def _region_hosts(self, region: str) -> list:
+        sources = self.get_option('sources')
+        members = {}
+        if 'ecs' in sources:
+            members.update(self._ecs_instances(region))
+        if 'autoscaling' in sources or 'eks' in sources:
+            eks_groups = self._eks_groups(region) if 'eks' in sources else {}
+            names = None if 'autoscaling' in sources else list(eks_groups)
+            if names != []:
+                for instance_id, group in self._autoscaling_instances(region, names).items():
+                    group.update(eks_groups.get(group['autoscaling_group'], {}))
+                    members.setdefault(instance_id, {}).update(group)
+
+        ec2 = self._client('ec2', region)
+        reservations = aws_response_batch_parser(
+            ec2.describe_instances, 'InstanceIds', sorted(members), 'Reservations', 200, max_workers=self.get_option('max_workers')
+        )
+        hosts = []
+        for reservation in reservations:
+            for instance in reservation['instances']:
+                instance['tags'] = dict((tag['key'], tag['value']) for tag in instance.get('tags', []))
+                instance['region'] = region
+                instance.update(members[instance['instance_id']])
+                hosts.append(instance)
+        # datetimes as strings, same as after cache round trip.
+        return json.loads(json.dumps(hosts, default=aws_json_default))
+
+    def _fetch(self) -> dict:
+        """
+        :return: {region: [snake_case ec2 instance with ecs_*, eks_* and autoscaling_group keys]}
+        """
+        regions = self.get_option('regions') or [boto3.session.Session(profile_name=self.get_option('aws_profile')).region_name]
+        if None in regions:
+            raise AnsibleError('regions must be given when profile / environment has no region')
+        with ThreadPoolExecutor(max_workers=max(1, min(self.get_option('max_workers'), len(regions)))) as executor:
+            futures = dict((region, executor.submit(self._region_hosts, region)) for region in regions)
+            _return = {}
+            for region, future in futures.items():
+                try:
+                    _return[region] = future.result()
+                except (BotoCoreError, ClientError) as e:
+                    raise AnsibleError('Failed to fetch aws compute inventory of {0}: {1}'.format(region, to_native(e)))
+        return _return
+
+    def _hostname(self, instance: dict) -> str:
+        for attribute in self.get_option('hostnames'):
+            if instance.get(attribute):
+                return instance[attribute]
+        return None
+
+    def _populate(self, results: dict):
+        strict = self.get_option('strict')
+        for region in sorted(results):
+            for instance in results[region]:
+                hostname = self._hostname(instance)
+                if hostname is None:
+                    continue
+                self.inventory.add_host(hostname)
+                for key, value in instance.items():
+                    self.inventory.set_variable(hostname, key, value)
+                for prefix, key in (('ecs', 'ecs_cluster'), ('eks', 'eks_cluster'), ('eks_nodegroup', 'eks_nodegroup'), ('asg', 'autoscaling_group')):
+                    if instance.get(key):
+                        group = self.inventory.add_group(self._sanitize_group_name('{0}_{1}'.format(prefix, instance[key])))
+                        self.inventory.add_child(group, hostname)
+                self._set_composite_vars(self.get_option('compose'), instance, hostname, strict=strict)
+                self._add_host_to_composed_groups(self.get_option('groups'), instance, hostname, strict=strict)
+                self._add_host_to_keyed_groups(self.get_option('keyed_groups'), instance, hostname, strict=strict)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache=cache)
+        if boto3 is None:
+            raise AnsibleError('boto3 is required for aws_compute inventory')
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        # cache=False when inventory is refreshed, read from aws and update cache.
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        results = None
+        if use_cache:
+            try:
+                results = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if results is None:
+            results = self._fetch()
+        if update_cache:
+            self._cache[cache_key] = results
+        self._populate(results)
@@ -0,0 +1,170 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+name: aws_info
+short_description: Result of aws info modules, memoized for the playbook run.
+description:
+  - Runs C(community.missing_collection.aws_*_info) modules on the controller and returns their result.
+  - Module options are passed as keyword arguments, same names and values as in module task.
+  - Results are memoized per profile, region, module and options until I(memoize_ttl) expires.
+    Lookups run in forked workers, so results are shared between tasks through files in I(memoize_dir).
+  - Memoized results belong to one C(ansible-playbook) run, next playbook run queries aws again.
+version_added: 0.4.0
+options:
+  _terms:
+    description: names of aws info modules example C(aws_kms_info).
+    required: true
+    type: list
+    elements: str
+  region:
+    description: aws region, region of profile / environment if not given.
+    type: str
+    env:
+      - name: AWS_REGION
+      - name: AWS_DEFAULT_REGION
+  profile:
+    description: boto3 profile, default credentials if not given.
+    type: str
+    env:
+      - name: AWS_PROFILE
+  memoize:
+    description: reuse result of same lookup in this playbook run.
+    type: bool
+    default: true
+  memoize_ttl:
+    description: maximum age of memoized result in seconds.
+    type: int
+    default: 3600
+  memoize_dir:
+    description: directory of memoized results shared by forks.
+    type: path
+    default: ~/.ansible/aws_info_cache/lookup
+author:
+  - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
+requirements:
+  - boto3
+"""
+
+EXAMPLES = """
+- name: kms aliases, fetched once for all hosts and tasks
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.missing_collection.aws_info', 'aws_kms_info', list_aliases=true, region='eu-central-1').aliases }}"
+
+- name: arns of secrets
+  ansible.builtin.set_fact:
+    secret_arns: "{{ lookup('community.missing_collection.aws_info', 'aws_secretsmanager_info', list_secrets=true).secrets | map(attribute='arn') }}"
+
+- name: always query aws
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.missing_collection.aws_info', 'aws_ecs_info', list_clusters=true, memoize=false) }}"
+"""
+
+RETURN = """
+_raw:
+  description: result of every module in I(_terms), same as registered result of module task.
+  type: list
+  elements: dict
+"""
+
+import copy
+import importlib
+import json
+import multiprocessing
+import os
+import re
+import time
+
+from ansible.errors import AnsibleLookupError
+from ansible.plugins.lookup import LookupBase
+from ansible.utils.display import Display
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_cache_entry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_cache_key
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_cache_set
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_json_default
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info_lookup import AwsInfoLookup
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info_lookup import AwsInfoLookupExit
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info_lookup import aws_info_lookup_start
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info_lookup import aws_info_lookup_stop
+
+display = Display()
+
+_MODULE_NAME = re.compile(r'^aws_\w+_info$')
+_MODULES = 'ansible_collections.community.missing_collection.plugins.modules.'
+_LOOKUP_OPTIONS = ('region', 'profile', 'memoize', 'memoize_ttl', 'memoize_dir')
+# {key: ( created, result )} of current process, memoize_dir shares results with other forks and runs.
+_MEMO = {}
+
+
+def _playbook_run() -> str:
+    # lookups run in forked workers of ansible-playbook or in its main process, that process is the playbook run.
+    process = multiprocessing.parent_process() or multiprocessing.current_process()
+    try:
+        # pids are reused by long lived controllers, start time since boot makes them unique.
+        with open('/proc/{0}/stat'.format(process.pid)) as f:
+            started = f.read().rsplit(')', 1)[1].split()[19]
+    except (IOError, OSError, IndexError):
+        started = ''
+    return '{0}-{1}'.format(process.pid, started)
+
+
+def _run_module(name: str, lookup: AwsInfoLookup) -> dict:
+    if not _MODULE_NAME.match(name):
+        raise AnsibleLookupError('{0} is not an aws info module'.format(name))
+    try:
+        module = importlib.import_module(_MODULES + name)
+    except ImportError as e:
+        raise AnsibleLookupError('unknown aws info module {0}: {1}'.format(name, e))
+    if not hasattr(module, 'aws_info_module'):
+        raise AnsibleLookupError('{0} can not run as lookup'.format(name))
+
+    aws_info_lookup_start(lookup)
+    try:
+        module.main()
+    except AwsInfoLookupExit as e:
+        result = e.result
+    else:
+        raise AnsibleLookupError('{0} returned no result'.format(name))
+    finally:
+        aws_info_lookup_stop()
+    if result.get('failed'):
+        raise AnsibleLookupError('{0}: {1}'.format(name, result.get('msg')))
+    # datetimes as strings, same as module result and memoize_dir.
+    return json.loads(json.dumps(result, default=aws_json_default))
+
+
+class LookupModule(LookupBase):
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=dict((k, v) for k, v in kwargs.items() if k in _LOOKUP_OPTIONS))
+        params = dict((k, v) for k, v in kwargs.items() if k not in _LOOKUP_OPTIONS)
+        region = self.get_option('region')
+        profile = self.get_option('profile')
+        memoize_dir = os.path.expanduser(self.get_option('memoize_dir'))
+        run = _playbook_run()
+
+        _return = []
+        for name in terms:
+            key = aws_cache_key(run=run, profile=profile, region=region, module=name, params=params)
+            result = None
+            if self.get_option('memoize'):
+                created, result = _MEMO.get(key, (0, None))
+                if time.time() - created > self.get_option('memoize_ttl'):
+                    # age of memoized result starts when it was fetched from aws, not when it was read from file.
+                    created, result = aws_cache_entry(memoize_dir, key, self.get_option('memoize_ttl'))
+                    if result is not None:
+                        _MEMO[key] = (created, result)
+            if result is None:
+                lookup = AwsInfoLookup(copy.deepcopy(params), region=region, profile=profile)
+                result = _run_module(name, lookup)
+                for warning in lookup.warnings:
+                    display.warning('{0}: {1}'.format(name, warning))
+                if self.get_option('memoize'):
+                    _MEMO[key] = (time.time(), result)
+                    aws_cache_set(memoize_dir, key, result, 100 * 1024 * 1024)
+            _return.append(copy.deepcopy(result))
+        return _return
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""assume same role in many aws accounts and cache credentials until they expire."""
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:
+    pass    # Handled by AnsibleAWSModule
+
+from ansible.module_utils._text import to_native
+
+# credentials are refreshed when they expire in less than given seconds.
+_EXPIRY_MARGIN = 300
+
+_CREDENTIALS = {}
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _valid(credentials: dict) -> bool:
+    return credentials is not None and (credentials['expiration'] - _now()).total_seconds() > _EXPIRY_MARGIN
+
+
+def _cache_file(cache_dir: str, role_arn: str, role_session_name: str) -> str:
+    name = hashlib.sha256('{0}:{1}'.format(role_arn, role_session_name).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, name + '.json')
+
+
+def _read_cache(path: str):
+    try:
+        with open(path) as f:
+            credentials = json.load(f)
+        credentials['expiration'] = datetime.datetime.fromisoformat(credentials['expiration'])
+        return credentials
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(path: str, credentials: dict):
+    # cache is best effort, credentials are still returned if it can't be written.
+    cache_dir = os.path.dirname(path)
+    data = dict(credentials, expiration=credentials['expiration'].isoformat())
+    tmp = None
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o700)
+        # mkstemp creates file with 0600, os.replace makes it visible atomically.
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except (IOError, OSError):
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _assume_role(sts, role_arn: str, role_session_name: str, cache_dir: str = None) -> dict:
+    key = (role_arn, role_session_name)
+    credentials = _CREDENTIALS.get(key)
+    if not _valid(credentials) and cache_dir:
+        credentials = _read_cache(_cache_file(cache_dir, role_arn, role_session_name))
+    if not _valid(credentials):
+        _response = sts.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)['Credentials']
+        credentials = dict(
+            aws_access_key_id=_response['AccessKeyId'],
+            aws_secret_access_key=_response['SecretAccessKey'],
+            aws_session_token=_response['SessionToken'],
+            expiration=_response['Expiration'],
+        )
+        if cache_dir:
+            _write_cache(_cache_file(cache_dir, role_arn, role_session_name), credentials)
+    _CREDENTIALS[key] = credentials
+    return credentials
+
+
+def aws_assume_roles(sts, account_ids: list, role_name: str, role_session_name: str, cache_dir: str = None, max_workers: int = 10) -> tuple:
+    """
+    assume `role_name` in every account concurrently.
+
+    :param sts: boto3 sts client.
+    :param account_ids: example ['123456789012']
+    :param role_name: example 'OrganizationAccountAccessRole'
+    :param role_session_name: example 'ansible'
+    :param cache_dir: optional directory to cache credentials across module runs.
+    :param max_workers: maximum number of assume role calls at same time.
+    :return: ( {account_id: boto3 credential kwargs}, {account_id: {'msg': error}} )
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    partition = sts.meta.partition
+    _return = {}
+    _failed = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(account_ids)))) as executor:
+        futures = dict(
+            (
+                account_id,
+                executor.submit(
+                    _assume_role,
+                    sts,
+                    'arn:{0}:iam::{1}:role/{2}'.format(partition, account_id, role_name),
+                    role_session_name,
+                    cache_dir
+                )
+            )
+            for account_id in account_ids
+        )
+        for account_id, future in futures.items():
+            try:
+                credentials = future.result()
+            except (BotoCoreError, ClientError) as e:
+                _failed[account_id] = dict(msg='Failed to assume role {0}: {1}'.format(role_name, to_native(e)))
+                continue
+            _return[account_id] = dict((k, v) for k, v in credentials.items() if k != 'expiration')
+    return _return, _failed
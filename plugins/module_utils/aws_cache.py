@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""on disk cache of aws info module results with ttl and size based lru eviction."""
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+def aws_json_default(value):
+    """
+    json.dump default of aws responses, same as ansible module result serialization.
+
+    :param value: value not supported by json example datetime
+    :return: iso format string of datetime, list of set or str of anything else.
+    """
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def aws_cache_key(**kwargs) -> str:
+    """
+    stable key of given values.
+
+    :param kwargs: example account_id='123456789012', region='eu-central-1', service='ecs', operation='_ecs_result', params={}
+    :return: sha256 hex digest
+    """
+    return hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=aws_json_default).encode('utf-8')).hexdigest()
+
+
+def _cache_file(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, key + '.json')
+
+
+def aws_cache_entry(cache_dir: str, key: str, ttl: int) -> tuple:
+    """
+    :param cache_dir: cache directory.
+    :param key: from `aws_cache_key`
+    :param ttl: maximum age of cached value in seconds.
+    :return: ( time.time() when value was stored, value ) or ( None, None ) if it is missing or expired.
+    """
+    path = _cache_file(cache_dir, key)
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None, None
+    if time.time() - cached.get('created', 0) > ttl:
+        return None, None
+    try:
+        # mtime is last use of entry for lru eviction.
+        os.utime(path, None)
+    except OSError:
+        pass
+    return cached.get('created', 0), cached.get('value')
+
+
+def aws_cache_get(cache_dir: str, key: str, ttl: int):
+    """
+    same as `aws_cache_entry` without creation time.
+
+    :return: cached value or None if it is missing or expired.
+    """
+    return aws_cache_entry(cache_dir, key, ttl)[1]
+
+
+def _evict(cache_dir: str, max_size: int):
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.json'):
+            continue
+        try:
+            stat = os.stat(os.path.join(cache_dir, name))
+        except OSError:
+            # removed by other fork
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+        total += stat.st_size
+    for _mtime, size, name in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+        total -= size
+
+
+def aws_cache_set(cache_dir: str, key: str, value, max_size: int):
+    """
+    store value atomically, so parallel forks never read partial entries.
+
+    cache is best effort, errors while writing are ignored.
+
+    :param cache_dir: cache directory, created if missing.
+    :param key: from `aws_cache_key`
+    :param value: json serializable value, datetime is stored as iso format string.
+    :param max_size: least recently used entries are removed when directory is bigger than given bytes.
+    """
+    tmp = None
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o700)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(dict(created=time.time(), value=value), f, default=aws_json_default)
+        os.replace(tmp, _cache_file(cache_dir, key))
+        tmp = None
+        _evict(cache_dir, max_size)
+    except (IOError, OSError, TypeError, ValueError):
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""return only added, changed and removed items of aws info modules compared to previous run, see `since_state` option."""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_json_default
+
+# state of current module run, None when `since_state` is not used.
+_ACTIVE = None
+_STATE_VERSION = 1
+# identifier of item if `since_state_id` isn't given, first key which is set.
+_ID_KEYS = ('arn', 'id', 'name')
+
+
+class AwsDeltaItems(list):
+    """
+    added and changed items returned by parsers instead of all items, `hashes` is {id: content hash} of all items.
+
+    it is still a list so module code which returns it doesn't need to know about delta.
+    """
+
+    def __init__(self, added: list, changed: list, hashes: dict, scope: tuple):
+        super(AwsDeltaItems, self).__init__(added + changed)
+        self.added = added
+        self.changed = changed
+        self.hashes = hashes
+        self.scope = scope
+
+
+def aws_delta_id(item, id_key: str = None):
+    """
+    identifier of list item.
+
+    :param item: snake_case item example {'alias_arn': 'arn:aws:kms:...', 'alias_name': 'alias/test'}
+    :param id_key: item key of identifier, guessed from `arn`, `id`, `name` and `*_arn`, `*_id`, `*_name` keys if not given.
+    :return: example 'arn:aws:kms:...' or None if item has no identifier.
+    """
+    if not isinstance(item, dict):
+        return item if isinstance(item, (str, int)) else None
+    if id_key is not None:
+        return item.get(id_key)
+    for key in _ID_KEYS:
+        if isinstance(item.get(key), (str, int)):
+            return item[key]
+    for suffix in _ID_KEYS:
+        keys = sorted(k for k, v in item.items() if k.endswith('_' + suffix) and isinstance(v, (str, int)))
+        if keys:
+            return item[keys[0]]
+    return None
+
+
+def _content_hash(item) -> str:
+    data = json.dumps(item, sort_keys=True, separators=(',', ':'), default=aws_json_default)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class AwsDeltaState(object):
+    """
+    content hash per item identifier of every result list, loaded from and saved to `since_state` file.
+
+    safe to use from many threads, every region / account worker compares its own scope.
+    """
+
+    def __init__(self, path: str, id_key: str = None):
+        """
+        :param path: state file, missing file means every item is added.
+        :param id_key: see `aws_delta_id`
+        :raise ValueError: if file isn't a state file.
+        """
+        self.path = path
+        self.id_key = id_key
+        self._lock = threading.Lock()
+        self._scope = threading.local()
+        # {(account_id, region, result key): {id: hash}}
+        self._previous = {}
+        self._current = {}
+        self.exists = os.path.exists(path)
+        if self.exists:
+            with open(path) as f:
+                state = json.load(f)
+            if not isinstance(state, dict) or state.get('version') != _STATE_VERSION:
+                raise ValueError('{0} is not a since_state file of version {1}'.format(path, _STATE_VERSION))
+            for entry in state['lists']:
+                self._previous[(entry['account_id'], entry['region'], entry['key'])] = entry['hashes']
+        # {(account_id, region): {id: hash}} of all lists, parsers don't know result key of their items.
+        self._previous_by_scope = {}
+        for (account_id, region, _key), hashes in self._previous.items():
+            self._previous_by_scope.setdefault((account_id, region), {}).update(hashes)
+
+    def set_target(self, target: dict):
+        """
+        compare items parsed by current thread with previous items of same account and region.
+
+        :param target: example {'account_id': '123456789012', 'region': 'eu-central-1'} or None for current account and region.
+        """
+        target = target or {}
+        self._scope.value = (target.get('account_id'), target.get('region'))
+
+    def compare(self, items) -> AwsDeltaItems:
+        """
+        :param items: iterable of snake_case items, consumed one at a time and only added or changed ones are kept.
+        :return: added and changed items with hashes of all items.
+        """
+        scope = getattr(self._scope, 'value', (None, None))
+        previous = self._previous_by_scope.get(scope, {})
+        added = []
+        changed = []
+        hashes = {}
+        for item in items:
+            content_hash = _content_hash(item)
+            item_id = aws_delta_id(item, self.id_key)
+            # items without identifier are identified by content, a change shows as removed and added.
+            item_id = content_hash if item_id is None else str(item_id)
+            if item_id in hashes:
+                item_id = '{0}#{1}'.format(item_id, content_hash)
+            hashes[item_id] = content_hash
+            if item_id not in previous:
+                added.append(item)
+            elif previous[item_id] != content_hash:
+                changed.append(item)
+        return AwsDeltaItems(added, changed, hashes, scope)
+
+    def result(self, items: AwsDeltaItems, key: str) -> dict:
+        """
+        record hashes of `items` returned as result `key` and compare them with previous run.
+
+        :return: example {'added': [], 'changed': [], 'removed': ['id'], 'unchanged': 10}
+        """
+        scope_key = items.scope + (key,)
+        previous = self._previous.get(scope_key, {})
+        with self._lock:
+            self._current[scope_key] = items.hashes
+        return dict(
+            added=items.added,
+            changed=items.changed,
+            removed=sorted(item_id for item_id in previous if item_id not in items.hashes),
+            unchanged=len(items.hashes) - len(items.added) - len(items.changed),
+        )
+
+    def save(self):
+        """
+        atomically replace state file, lists which weren't returned in this run ( failed regions ) keep previous state.
+        """
+        lists = dict(self._previous)
+        lists.update(self._current)
+        state = dict(
+            version=_STATE_VERSION,
+            lists=[
+                dict(account_id=account_id, region=region, key=key, hashes=hashes)
+                for (account_id, region, key), hashes in sorted(lists.items(), key=lambda kv: json.dumps(kv[0]))
+            ],
+        )
+        state_dir = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(state_dir):
+            os.makedirs(state_dir)
+        fd, tmp = tempfile.mkstemp(dir=state_dir, prefix='.' + os.path.basename(self.path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f, sort_keys=True)
+            os.replace(tmp, self.path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
+def aws_delta_open(path: str, id_key: str = None) -> AwsDeltaState:
+    """
+    make parsers of current module run return only items which are added or changed since state in `path`.
+
+    :param path: state file of previous run.
+    :param id_key: item key of identifier, see `aws_delta_id`
+    :return: active state.
+    """
+    global _ACTIVE
+    _ACTIVE = AwsDeltaState(path, id_key=id_key)
+    return _ACTIVE
+
+
+def aws_delta_close():
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def aws_delta_active():
+    """
+    :return: active `AwsDeltaState` or None if all items are returned.
+    """
+    return _ACTIVE
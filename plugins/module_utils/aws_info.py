@@ -0,0 +1,515 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""shared options and execution of aws info modules."""
+import json
+import time
+from functools import partial
+
+try:
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:
+    pass    # Handled by AnsibleAWSModule
+
+try:
+    from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+    from ansible.module_utils.errors import UnsupportedError
+except ImportError:
+    ArgumentSpecValidator = None    # ansible < 2.11, options are validated by AnsibleAWSModule only
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import _load_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_feature_active
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_pagination_next_token
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_fields
+
+
+def aws_info_argument_spec() -> dict:
+    """
+    common options of aws info modules, documented in `community.missing_collection.aws_info`.
+
+    :return: argument spec to merge into module argument spec.
+    """
+    return dict(
+        max_items=dict(required=False, type=int),
+        page_size=dict(required=False, type=int),
+        starting_token=dict(required=False, type=str, no_log=False),
+        fields=dict(required=False, type=aws_response_fields),
+        regions=dict(required=False, type='list', elements='str'),
+        max_workers=dict(required=False, type=int, default=10),
+        account_ids=dict(required=False, type='list', elements='str'),
+        role_name=dict(required=False, type=str),
+        role_session_name=dict(required=False, type=str, default='ansible-missing-collection'),
+        role_credentials_cache=dict(required=False, type='path'),
+        cache=dict(required=False, type='bool', default=False),
+        cache_dir=dict(required=False, type='path', default='~/.ansible/aws_info_cache'),
+        cache_ttl=dict(required=False, type=int, default=300),
+        cache_max_size=dict(required=False, type=int, default=100),
+        collect_metrics=dict(required=False, type='bool', default=False),
+        dest=dict(required=False, type='path'),
+        dest_gzip=dict(required=False, type='bool', default=False),
+        rate_limit=dict(required=False, type=float),
+        rate_limit_operations=dict(required=False, type=dict),
+        since_state=dict(required=False, type='path'),
+        since_state_id=dict(required=False, type=str),
+    )
+
+
+# AnsibleModule arguments checked by ArgumentSpecValidator.
+_VALIDATOR_KWARGS = ('mutually_exclusive', 'required_together', 'required_one_of', 'required_if', 'required_by')
+
+
+def _aws_info_validate(argument_spec: dict, kwargs: dict):
+    params = _load_params()
+    validator = ArgumentSpecValidator(argument_spec, **dict((k, v) for k, v in kwargs.items() if k in _VALIDATOR_KWARGS))
+    # aws connection options like region aren't part of argument_spec, AnsibleAWSModule validates them.
+    if not [e for e in validator.validate(params).errors if not isinstance(e, UnsupportedError)]:
+        return
+    names = set(argument_spec)
+    for spec in argument_spec.values():
+        names.update(spec.get('aliases') or [])
+    # unknown options are aws connection options, hidden in invocation because some of them are credentials.
+    unknown = dict((k, dict(type='raw', no_log=True)) for k in params if k not in names and not k.startswith('_ansible_'))
+    # fails with same message as AnsibleAWSModule.
+    AnsibleModule(argument_spec=dict(argument_spec, **unknown), **kwargs)
+
+
+def _aws_info_lookup_module(lookup, argument_spec: dict, kwargs: dict):
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_info_lookup import AwsInfoLookupExit
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_info_lookup import AwsInfoLookupModule
+    if ArgumentSpecValidator is None:
+        raise AwsInfoLookupExit(dict(failed=True, msg='aws_info lookup requires ansible-core 2.11 or newer'))
+    validator = ArgumentSpecValidator(argument_spec, **dict((k, v) for k, v in kwargs.items() if k in _VALIDATOR_KWARGS))
+    validated = validator.validate(lookup.params)
+    if validated.error_messages:
+        raise AwsInfoLookupExit(dict(failed=True, msg=validated.errors.msg))
+    return AwsInfoLookupModule(lookup, validated.validated_parameters)
+
+
+def aws_info_module(argument_spec: dict, **kwargs):
+    """
+    validate options before boto3 and amazon.aws are imported, then create AnsibleAWSModule.
+
+    importing boto3 is most of module startup, invalid options fail without it.
+
+    inside `community.missing_collection.aws_info` lookup `AwsInfoLookupModule` is returned instead.
+
+    :param argument_spec: module options merged with `aws_info_argument_spec`
+    :param kwargs: passed to AnsibleAWSModule example mutually_exclusive, required_if
+    :return: AnsibleAWSModule
+    """
+    lookup = aws_feature_active('aws_info_lookup')
+    if lookup is not None:
+        return _aws_info_lookup_module(lookup, argument_spec, kwargs)
+    if ArgumentSpecValidator is not None:
+        _aws_info_validate(argument_spec, kwargs)
+    from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
+    return AnsibleAWSModule(argument_spec=argument_spec, **kwargs)
+
+
+def aws_info_retry(**kwargs):
+    """
+    amazon.aws is imported on first use, see `aws_info_module`.
+
+    :param kwargs: passed to AWSRetry.exponential_backoff example retries=5, delay=5
+    :return: retry decorator for `aws_info_run`
+    """
+    from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
+    return AWSRetry.exponential_backoff(**kwargs)
+
+
+def aws_info_retry_params(client) -> dict:
+    """
+    api parameters which make `retry_decorator` of `aws_info_run` retry single api call.
+
+    RetryingBotoClientWrapper retries only calls with aws_retry=True, raw clients of lookup reject it and use botocore retries.
+    paginators are never wrapped, their pages are retried by botocore only.
+
+    :param client: client given to `result` function of `aws_info_run`
+    :return: example {'aws_retry': True} or {}
+    """
+    try:
+        from ansible_collections.amazon.aws.plugins.module_utils.retries import RetryingBotoClientWrapper
+    except ImportError:
+        return {}
+    if isinstance(client, RetryingBotoClientWrapper):
+        return dict(aws_retry=True)
+    return {}
+
+
+# options which don't change result of single region / account or are part of cache key already.
+_CACHE_KEY_IGNORED_PARAMS = (
+    'access_key', 'secret_key', 'session_token', 'profile', 'region', 'aws_config', 'validate_certs', 'aws_ca_bundle',
+    'debug_botocore_endpoint_logs', 'regions', 'max_workers', 'account_ids', 'role_name', 'role_session_name',
+    'role_credentials_cache', 'cache', 'cache_dir', 'cache_ttl', 'cache_max_size', 'collect_metrics',
+    'rate_limit', 'rate_limit_operations',
+)
+
+
+class AwsInfoError(Exception):
+    """
+    failure of a single region or account, raised instead of exiting the module.
+
+    `fatal` failures ( invalid options ) are same for every region and fail the module.
+    """
+
+    def __init__(self, result: dict, fatal: bool = False):
+        super(AwsInfoError, self).__init__(result.get('msg'))
+        self.result = result
+        self.fatal = fatal
+
+
+class _AwsInfoWorkerModule(object):
+    """
+    module used by worker threads.
+
+    `fail_json` and `fail_json_aws` raise `AwsInfoError` so one region or account can't exit the module,
+    `aws_info_fail_usage` is the only fatal failure.
+    """
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+    def fail_json(self, msg=None, **kwargs):
+        kwargs['msg'] = msg
+        raise AwsInfoError(kwargs)
+
+    def fail_json_aws(self, exception, msg=None, **kwargs):
+        if msg is not None:
+            msg = '{0}: {1}'.format(msg, to_native(exception))
+        else:
+            msg = to_native(exception)
+        raise AwsInfoError(dict(msg=msg, **kwargs))
+
+
+def aws_info_fail_usage(module, msg: str):
+    """
+    fail module for invalid options or usage, also from worker threads where `fail_json` fails only one region or account.
+
+    :param module: AnsibleAWSModule or module of worker thread.
+    :param msg: example 'period must be greater than 0'
+    """
+    if isinstance(module, _AwsInfoWorkerModule):
+        raise AwsInfoError(dict(msg=msg), fatal=True)
+    module.fail_json(msg=msg)
+
+
+def _aws_region(module) -> str:
+    # amazon.aws and boto3 are imported after options are validated, see `aws_info_module`.
+    from ansible_collections.amazon.aws.plugins.module_utils.ec2 import get_aws_connection_info
+    region, _endpoint, _connect_kwargs = get_aws_connection_info(module, boto3=True)
+    return region
+
+
+def _aws_home_region(module) -> str:
+    # region for global apis like ec2 describe_regions and sts.
+    return _aws_region(module) or 'us-east-1'
+
+
+def _aws_all_regions(module, service: str) -> list:
+    # regions where service is available and which are enabled for the account.
+    import boto3
+    session = boto3.session.Session()
+    available = []
+    for partition in session.get_available_partitions():
+        available += session.get_available_regions(service, partition_name=partition)
+
+    try:
+        ec2 = module.client('ec2', region=_aws_home_region(module))
+        enabled = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
+    except (BotoCoreError, ClientError) as e:
+        module.warn('unable to get enabled regions, using all regions of {0}: {1}'.format(service, to_native(e)))
+        return available
+    return [r for r in available if r in enabled]
+
+
+def _aws_info_client(module, service: str, retry_decorator, region: str, credentials: dict):
+    extra_params = dict(credentials)
+    if region is not None:
+        extra_params['region'] = region
+    client = module.client(service, retry_decorator=retry_decorator, **extra_params)
+    metrics = aws_feature_active('aws_metrics')
+    if metrics is not None:
+        metrics.register(client)
+    limiter = aws_feature_active('aws_rate_limiter')
+    if limiter is not None:
+        # aws limits are per account and region.
+        limiter.register(client, (credentials.get('aws_access_key_id'), region))
+    return client
+
+
+def _aws_info_paginated_result(module, result, client) -> dict:
+    aws_pagination_next_token()
+    _return = result(client, module)
+    paginated, next_token = aws_pagination_next_token()
+    if paginated:
+        _return['next_token'] = next_token
+    return _return
+
+
+def _aws_info_cached_result(module, service: str, result, client, cache_key: str):
+    # client is created only when result isn't cached.
+    if cache_key is None:
+        return _aws_info_paginated_result(module, result, client())
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_cache_get
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_cache_set
+    cached = aws_cache_get(module.params['cache_dir'], cache_key, module.params['cache_ttl'])
+    if cached is not None:
+        cached['cache_hit'] = True
+        return cached
+    _return = _aws_info_paginated_result(module, result, client())
+    aws_cache_set(module.params['cache_dir'], cache_key, _return, module.params['cache_max_size'] * 1024 * 1024)
+    _return['cache_hit'] = False
+    return _return
+
+
+def _aws_info_result(module, service: str, result, client, cache_key: str, target: dict = None):
+    sink = aws_feature_active('aws_sink')
+    if sink is not None:
+        sink.set_target(target)
+    delta = aws_feature_active('aws_delta')
+    if delta is not None:
+        delta.set_target(target)
+    try:
+        return _aws_info_cached_result(module, service, result, client, cache_key)
+    except (BotoCoreError, ClientError) as e:
+        raise AwsInfoError(dict(msg='Failed to fetch aws {0} details: {1}'.format(service, to_native(e))))
+
+
+def _aws_caller_account(module) -> str:
+    # cache key of current credentials, account_ids are used as they are.
+    if not module.params.get('cache') or module.params.get('account_ids'):
+        return None
+    try:
+        sts = module.client('sts', retry_decorator=aws_info_retry(), region=_aws_home_region(module))
+        return sts.get_caller_identity()['Account']
+    except (BotoCoreError, ClientError) as e:
+        module.fail_json_aws(e, msg='Failed to get aws account id for cache')
+
+
+def _aws_info_cache_key(module, service: str, result, account_id: str, region: str):
+    if not module.params.get('cache'):
+        return None
+    if region is None:
+        region = _aws_region(module)
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_cache_key
+    return aws_cache_key(
+        account_id=account_id,
+        region=region,
+        service=service,
+        operation=result.__name__,
+        params=dict((k, v) for k, v in module.params.items() if k not in _CACHE_KEY_IGNORED_PARAMS),
+    )
+
+
+def _aws_info_credentials(module) -> tuple:
+    if not module.params.get('account_ids'):
+        return {None: {}}, {}
+    if not module.params.get('role_name'):
+        module.fail_json(msg='role_name is required with account_ids')
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_assume_role import aws_assume_roles
+    sts = module.client('sts', retry_decorator=aws_info_retry(), region=_aws_home_region(module))
+    return aws_assume_roles(
+        sts,
+        module.params['account_ids'],
+        module.params['role_name'],
+        module.params['role_session_name'],
+        cache_dir=module.params.get('role_credentials_cache'),
+        max_workers=module.params['max_workers'],
+    )
+
+
+def aws_info_run(module, service: str, result, retry_decorator=None) -> dict:
+    """
+    run `result` for given aws service in current region and account or on thread pool for all given `regions` / `account_ids`.
+
+    :param module: AnsibleAWSModule with `aws_info_argument_spec` options.
+    :param service: boto3 client name example 'ecs'
+    :param result: function( client, module ) which returns module result dict.
+    :param retry_decorator: passed to `module.client`
+    :return: result of `result` with `next_token` if paginator was used and `cache_hit` if `cache` is enabled
+             or {'regions': {region: result}, 'failed_regions': {region: error}}
+             or {'accounts': {account_id: result or regions}, 'failed_accounts': {account_id: error}}
+             with `_perf` if `collect_metrics` is enabled
+             and lists as {'added': [], 'changed': [], 'removed': [], 'unchanged': 0} if `since_state` is given.
+    """
+    if module.params.get('rate_limit') is None and not module.params.get('rate_limit_operations'):
+        return _aws_info_metrics_run(module, service, result, retry_decorator)
+
+    try:
+        operations = dict((k, float(v)) for k, v in (module.params.get('rate_limit_operations') or {}).items())
+    except (TypeError, ValueError):
+        module.fail_json(msg='rate_limit_operations values must be requests per second')
+    rates = list(operations.values())
+    if module.params.get('rate_limit') is not None:
+        rates.append(module.params['rate_limit'])
+    if any(rate <= 0 for rate in rates):
+        module.fail_json(msg='rate_limit and rate_limit_operations must be greater than 0')
+
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_rate_limiter import aws_rate_limiter_start
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_rate_limiter import aws_rate_limiter_stop
+    aws_rate_limiter_start(module.params.get('rate_limit'), operations)
+    try:
+        return _aws_info_metrics_run(module, service, result, retry_decorator)
+    finally:
+        aws_rate_limiter_stop()
+
+
+def _aws_info_metrics_run(module, service: str, result, retry_decorator) -> dict:
+    if not module.params.get('collect_metrics'):
+        return _aws_info_delta_run(module, service, result, retry_decorator)
+
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_json_default
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_metrics import aws_metrics_start
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_metrics import aws_metrics_stop
+    metrics = aws_metrics_start()
+    try:
+        _return = _aws_info_delta_run(module, service, result, retry_decorator)
+        start = time.perf_counter()
+        # same work as exit_json, result size shows cost of returning it to controller.
+        metrics.counters['result_bytes'] = len(json.dumps(_return, default=aws_json_default))
+        metrics.time('serialization', time.perf_counter() - start)
+    finally:
+        aws_metrics_stop()
+    _return['_perf'] = metrics.result()
+    return _return
+
+
+def _aws_info_delta_items(delta, value):
+    # every list returned by parsers becomes {'added': [], 'changed': [], 'removed': [], 'unchanged': 0}
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_delta import AwsDeltaItems
+    if isinstance(value, dict):
+        return dict(
+            (k, delta.result(v, k) if isinstance(v, AwsDeltaItems) else _aws_info_delta_items(delta, v))
+            for k, v in value.items()
+        )
+    return value
+
+
+def _aws_info_delta_run(module, service: str, result, retry_decorator) -> dict:
+    if not module.params.get('since_state'):
+        return _aws_info_dest_run(module, service, result, retry_decorator)
+    for option in ('dest', 'cache', 'max_items', 'starting_token'):
+        # partial or cached lists would show missing items as removed.
+        if module.params.get(option):
+            module.fail_json(msg='{0} can not be used with since_state'.format(option))
+
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_delta import aws_delta_close
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_delta import aws_delta_open
+    try:
+        delta = aws_delta_open(module.params['since_state'], id_key=module.params.get('since_state_id'))
+    except (IOError, OSError, ValueError, KeyError, TypeError) as e:
+        module.fail_json(msg='unable to read since_state {0}: {1}'.format(module.params['since_state'], to_native(e)))
+    try:
+        _return = _aws_info_delta_items(delta, _aws_info_dest_run(module, service, result, retry_decorator))
+        try:
+            delta.save()
+        except (IOError, OSError) as e:
+            module.fail_json(msg='unable to write since_state {0}: {1}'.format(module.params['since_state'], to_native(e)))
+    finally:
+        aws_delta_close()
+    _return['since_state'] = dict(path=module.params['since_state'], baseline=not delta.exists)
+    return _return
+
+
+def _aws_info_without_sink_items(value):
+    # items written to `dest` are removed from result, only their total count is returned.
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_sink import AwsSinkItems
+    if isinstance(value, dict):
+        return dict((k, _aws_info_without_sink_items(v)) for k, v in value.items() if not isinstance(v, AwsSinkItems))
+    return value
+
+
+def _aws_info_dest_run(module, service: str, result, retry_decorator) -> dict:
+    if not module.params.get('dest'):
+        return _aws_info_run(module, service, result, retry_decorator)
+    if module.params.get('cache'):
+        module.fail_json(msg='cache can not be used with dest')
+
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_sink import aws_sink_close
+    from ansible_collections.community.missing_collection.plugins.module_utils.aws_sink import aws_sink_open
+    sink = aws_sink_open(module.params['dest'], compress=module.params['dest_gzip'])
+    try:
+        _return = _aws_info_without_sink_items(_aws_info_run(module, service, result, retry_decorator))
+        _return.update(sink.commit())
+    finally:
+        # removes temporary file if module failed before commit.
+        sink.discard()
+        aws_sink_close()
+    return _return
+
+
+def _aws_info_run(module, service: str, result, retry_decorator) -> dict:
+    if not module.params.get('regions') and not module.params.get('account_ids'):
+        try:
+            return _aws_info_cached_result(
+                module,
+                service,
+                result,
+                partial(_aws_info_client, module, service, retry_decorator, None, {}),
+                _aws_info_cache_key(module, service, result, _aws_caller_account(module), None),
+            )
+        except (BotoCoreError, ClientError) as e:
+            # paginators of result are consumed lazily, errors can be raised outside of module's own try.
+            module.fail_json_aws(e, msg='Failed to fetch aws {0} details'.format(service))
+
+    regions = module.params.get('regions') or [None]
+    if regions == ['all']:
+        regions = _aws_all_regions(module, service)
+    credentials, failed_accounts = _aws_info_credentials(module)
+    caller_account = _aws_caller_account(module)
+
+    targets = [(account_id, region) for account_id in credentials for region in regions]
+    clients = dict(
+        (target, partial(_aws_info_client, module, service, retry_decorator, target[1], credentials[target[0]]))
+        for target in targets
+    )
+    if targets:
+        # invalid connection options fail the module here once instead of in every worker.
+        first_client = clients[targets[0]]()
+        clients[targets[0]] = lambda: first_client
+
+    from concurrent.futures import ThreadPoolExecutor
+    worker_module = _AwsInfoWorkerModule(module)
+    max_workers = max(1, min(module.params['max_workers'], len(targets)))
+
+    results = dict((account_id, dict(regions={}, failed_regions={})) for account_id in credentials)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = dict(
+            (
+                target,
+                executor.submit(
+                    _aws_info_result,
+                    worker_module,
+                    service,
+                    result,
+                    clients[target],
+                    _aws_info_cache_key(module, service, result, target[0] or caller_account, target[1]),
+                    dict((k, v) for k, v in zip(('account_id', 'region'), target) if v is not None),
+                )
+            )
+            for target in targets
+        )
+        for (account_id, region), future in futures.items():
+            try:
+                results[account_id]['regions'][region] = future.result()
+            except AwsInfoError as e:
+                if e.fatal:
+                    module.fail_json(**e.result)
+                results[account_id]['failed_regions'][region] = e.result
+                module.warn('{0}: {1}'.format(' '.join(k for k in (account_id, region) if k), e.result.get('msg')))
+
+    if not module.params.get('regions'):
+        # single region per account, don't nest results under regions.
+        for account_id in list(results):
+            if None in results[account_id]['failed_regions']:
+                failed_accounts[account_id] = results.pop(account_id)['failed_regions'][None]
+            else:
+                results[account_id] = results[account_id]['regions'][None]
+    if not module.params.get('account_ids'):
+        return results[None]
+    return dict(accounts=results, failed_accounts=failed_accounts)
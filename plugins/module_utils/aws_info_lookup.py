@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""run aws info modules inside lookup plugin on the controller, see `community.missing_collection.aws_info` lookup."""
+
+# lookup of current module run, None when module runs as ansible module.
+_ACTIVE = None
+
+
+class AwsInfoLookupExit(Exception):
+    """
+    raised by `exit_json` and `fail_json` instead of exiting, `result` is module result.
+    """
+
+    def __init__(self, result: dict):
+        super(AwsInfoLookupExit, self).__init__(result.get('msg'))
+        self.result = result
+
+
+class AwsInfoLookup(object):
+    """
+    options and connection of single lookup term, `aws_info_module` creates `AwsInfoLookupModule` from it.
+    """
+
+    def __init__(self, params: dict, region: str = None, profile: str = None):
+        """
+        :param params: module options given to lookup example {'list_aliases': True}
+        :param region: aws region or None for region of profile / environment.
+        :param profile: boto3 profile or None for default credentials.
+        """
+        self.params = params
+        self.region = region
+        self.profile = profile
+        # warnings of module run, lookup displays them.
+        self.warnings = []
+
+
+class AwsInfoLookupModule(object):
+    """
+    what aws info modules use of AnsibleAWSModule, clients are created from boto3 session of lookup.
+    """
+
+    def __init__(self, lookup: AwsInfoLookup, params: dict):
+        self._lookup = lookup
+        self.params = params
+        # read by amazon.aws get_aws_connection_info for `cache` and `regions`.
+        self.params.update(region=lookup.region, profile=lookup.profile, validate_certs=True)
+
+    def client(self, service: str, retry_decorator=None, region: str = None, **credentials):
+        import boto3
+        import botocore.config
+        # botocore standard retry mode instead of AWSRetry `retry_decorator`, it also backs off on throttling.
+        session = boto3.session.Session(profile_name=self._lookup.profile)
+        return session.client(
+            service,
+            region_name=region or self._lookup.region,
+            config=botocore.config.Config(retries=dict(mode='standard', max_attempts=10)),
+            **credentials
+        )
+
+    def warn(self, warning: str):
+        self._lookup.warnings.append(warning)
+
+    def exit_json(self, **kwargs):
+        raise AwsInfoLookupExit(kwargs)
+
+    def fail_json(self, msg=None, **kwargs):
+        kwargs.update(failed=True, msg=msg)
+        raise AwsInfoLookupExit(kwargs)
+
+    def fail_json_aws(self, exception, msg=None, **kwargs):
+        msg = '{0}: {1}'.format(msg, exception) if msg is not None else str(exception)
+        self.fail_json(msg=msg, **kwargs)
+
+
+def aws_info_lookup_start(lookup: AwsInfoLookup) -> AwsInfoLookup:
+    """
+    make `aws_info_module` of next module `main` return `AwsInfoLookupModule` instead of AnsibleAWSModule.
+
+    :return: active lookup.
+    """
+    global _ACTIVE
+    _ACTIVE = lookup
+    return _ACTIVE
+
+
+def aws_info_lookup_stop():
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def aws_info_lookup_active():
+    """
+    :return: active `AwsInfoLookup` or None if module runs as ansible module.
+    """
+    return _ACTIVE
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""opt-in performance counters of aws info modules, returned as `_perf`."""
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None     # not available on windows
+
+# error codes counted as throttles, same as AWSRetry and botocore standard retry mode.
+AWS_THROTTLE_CODES = frozenset((
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'TransactionInProgressException',
+    'RequestLimitExceeded',
+    'BandwidthLimitExceeded',
+    'LimitExceededException',
+    'RequestThrottled',
+    'SlowDown',
+    'PriorRequestNotComplete',
+    'EC2ThrottledException',
+))
+
+# collector of current module run, None when `collect_metrics` is disabled.
+_ACTIVE = None
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macos bytes.
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class AwsMetrics(object):
+    """
+    counters and phase timers shared by all threads of single module run.
+
+    network and parse time are taken from botocore events of registered clients,
+    fields / snake_case time and pages / items from `aws_response_parser`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = time.perf_counter()
+        self.counters = dict(api_calls=0, pages=0, items=0, retries=0, throttles=0)
+        self.timers = dict(network=0.0, parse=0.0, fields=0.0, snake_case=0.0, serialization=0.0)
+
+    def count(self, name: str, value: int = 1):
+        with self._lock:
+            self.counters[name] += value
+
+    def time(self, phase: str, seconds: float):
+        with self._lock:
+            self.timers[phase] += seconds
+
+    def register(self, client):
+        """
+        count calls, retries and throttles of boto3 `client` and time its network and parse phases.
+
+        :param client: boto3 client.
+        """
+        events = client.meta.events
+        events.register('before-send', self._before_send, unique_id='aws-metrics-before-send')
+        events.register('before-parse', self._before_parse, unique_id='aws-metrics-before-parse')
+        events.register('needs-retry', self._needs_retry, unique_id='aws-metrics-needs-retry')
+        events.register('after-call', self._after_call, unique_id='aws-metrics-after-call')
+        events.register('after-call-error', self._after_call, unique_id='aws-metrics-after-call-error')
+
+    def _before_send(self, **kwargs):
+        self._local.sent = time.perf_counter()
+
+    def _before_parse(self, **kwargs):
+        now = time.perf_counter()
+        self._local.parsing = now
+        self.time('network', now - getattr(self._local, 'sent', now))
+
+    def _needs_retry(self, attempts=1, response=None, **kwargs):
+        # emitted once per attempt after response is parsed, before retry handler decides.
+        parsing = getattr(self._local, 'parsing', None)
+        if parsing is not None:
+            self.time('parse', time.perf_counter() - parsing)
+            self._local.parsing = None
+        if attempts > 1:
+            self.count('retries')
+        if response is not None and response[1].get('Error', {}).get('Code') in AWS_THROTTLE_CODES:
+            self.count('throttles')
+
+    def _after_call(self, **kwargs):
+        self.count('api_calls')
+
+    def result(self) -> dict:
+        """
+        :return: example {'api_calls': 2, 'pages': 2, 'items': 150, 'retries': 0, 'throttles': 0,
+                 'wall_time': 1.2, 'phases': {'network': 0.9, ...}, 'peak_rss_kb': 51200}
+        """
+        _return = dict(self.counters)
+        _return['wall_time'] = round(time.perf_counter() - self._started, 6)
+        _return['phases'] = dict((k, round(v, 6)) for k, v in self.timers.items())
+        _return['peak_rss_kb'] = _peak_rss_kb()
+        return _return
+
+
+def aws_metrics_start() -> AwsMetrics:
+    """
+    start collecting metrics of current module run.
+
+    :return: active collector.
+    """
+    global _ACTIVE
+    _ACTIVE = AwsMetrics()
+    return _ACTIVE
+
+
+def aws_metrics_stop():
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def aws_metrics_active():
+    """
+    :return: active `AwsMetrics` or None if metrics are not collected.
+    """
+    return _ACTIVE
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""declarative api operations of aws info modules, one code path for calling, paginating and parsing all of them."""
+from collections import namedtuple
+
+try:
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:
+    pass    # Handled by AnsibleAWSModule
+
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_pagination_config
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_iterator
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_nested_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_dict_to_snake_dict
+
+# parser: 'list', 'nested_list' or 'dict'
+# params: {api parameter: module option name, {nested: option names}, [option names], int / bool constant or function( module )}
+#         parameters whose value is None are not passed.
+AwsOperation = namedtuple('AwsOperation', ('parser', 'api', 'result_key', 'resource_field', 'nested_resource_field', 'params'))
+
+
+def aws_list_operation(api: str, result_key: str, resource_field: str, **params) -> AwsOperation:
+    """
+    paginated or single api call which returns list of items.
+
+    :param api: boto3 client method example 'list_services'
+    :param result_key: module result key example 'service_arns'
+    :param resource_field: response key of items example 'serviceArns'
+    :param params: api parameters from module options example cluster='arn'
+    """
+    return AwsOperation('list', api, result_key, resource_field, None, params)
+
+
+def aws_nested_list_operation(api: str, result_key: str, resource_field: str, nested_resource_field: str, **params) -> AwsOperation:
+    """
+    same as `aws_list_operation` for items nested one level deeper example response['ApplicationsResponse']['Item']
+    """
+    return AwsOperation('nested_list', api, result_key, resource_field, nested_resource_field, params)
+
+
+def aws_dict_operation(api: str, result_key: str, resource_field: str = None, **params) -> AwsOperation:
+    """
+    single api call which returns one object.
+
+    :param resource_field: response key of object example 'taskDefinition' or None for whole response.
+    """
+    return AwsOperation('dict', api, result_key, resource_field, None, params)
+
+
+def _aws_operation_param(module, value):
+    if callable(value):
+        return value(module)
+    if isinstance(value, dict):
+        return dict((k, _aws_operation_param(module, v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_aws_operation_param(module, v) for v in value]
+    if isinstance(value, str):
+        return module.params[value]
+    # int / bool constant
+    return value
+
+
+def _aws_operation_response(client, module, operation: AwsOperation) -> tuple:
+    params = dict((k, _aws_operation_param(module, v)) for k, v in operation.params.items())
+    # optional options which aren't set are left out, botocore rejects None.
+    params = dict((k, v) for k, v in params.items() if v is not None)
+    paginate = operation.parser != 'dict' and client.can_paginate(operation.api)
+    if paginate:
+        return client.get_paginator(operation.api).paginate(PaginationConfig=aws_pagination_config(module), **params), True
+    params.update(aws_info_retry_params(client))
+    return getattr(client, operation.api)(**params), False
+
+
+def _aws_operation_max_items(module, paginate: bool):
+    # paginator stops itself with PaginationConfig MaxItems, single response is cut by parser.
+    if paginate:
+        return None
+    return module.params.get('max_items')
+
+
+def _aws_operation_result(client, module, operation: AwsOperation):
+    it, paginate = _aws_operation_response(client, module, operation)
+    if operation.parser == 'dict':
+        if operation.resource_field is not None:
+            it = it[operation.resource_field]
+        if not isinstance(it, dict):
+            # scalar field example health access status 'ENABLED'.
+            return it
+        return camel_dict_to_snake_dict(it)
+    if operation.parser == 'nested_list':
+        return aws_response_nested_list_parser(
+            paginate,
+            it,
+            operation.resource_field,
+            operation.nested_resource_field,
+            max_items=_aws_operation_max_items(module, paginate),
+            fields=module.params['fields'],
+        )
+    return aws_response_list_parser(
+        paginate, it, operation.resource_field, max_items=_aws_operation_max_items(module, paginate), fields=module.params['fields']
+    )
+
+
+def aws_operation_items(client, module, operation: AwsOperation):
+    """
+    snake_case items of list `operation` without `fields` projection and `dest`, example ids for follow up describe calls.
+
+    :return: iterator, api errors are raised while it is consumed.
+    """
+    it, paginate = _aws_operation_response(client, module, operation)
+    return aws_response_list_iterator(paginate, it, operation.resource_field, max_items=_aws_operation_max_items(module, paginate))
+
+
+def aws_operations_result(client, module, operations: dict, default: AwsOperation = None, error_msg: str = 'Failed to fetch aws details') -> dict:
+    """
+    call operation of first enabled boolean option, or `default` if none is enabled, and return its parsed result.
+
+    api errors, also while pages are fetched, fail the module with `error_msg`.
+
+    :param client: boto3 client.
+    :param module: AnsibleAWSModule with `aws_info.aws_info_argument_spec` options.
+    :param operations: {module option: AwsOperation} checked in given order.
+    :param default: operation when no option is enabled, module fails if it is None.
+    :param error_msg: example 'Failed to fetch Amazon Lightsail details'
+    :return: example {'service_arns': []}
+    """
+    for option, operation in operations.items():
+        if module.params.get(option):
+            break
+    else:
+        operation = default
+        if operation is None:
+            aws_info_fail_usage(module, 'unknown options are passed')
+    try:
+        return {operation.result_key: _aws_operation_result(client, module, operation)}
+    except (BotoCoreError, ClientError) as e:
+        module.fail_json_aws(e, msg=error_msg)
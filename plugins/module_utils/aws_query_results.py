@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""typed rows of sql query apis ( athena, redshift data ) as columns, or as row objects streamed to `dest`."""
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_feature_active
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_items_parser
+
+
+def aws_query_column_names(names: list) -> list:
+    """
+    unique column names, repeated name gets its position as suffix.
+
+    :param names: example ['id', 'count', 'count']
+    :return: example ['id', 'count', 'count_2']
+    """
+    _return = []
+    for i, name in enumerate(names):
+        _return.append(name if name not in _return else '{0}_{1}'.format(name, i))
+    return _return
+
+
+def _aws_query_rows(pages):
+    # same columns as `aws_query_result`, pages without column names reuse names of first page.
+    columns = None
+    for names, rows in pages:
+        if not columns:
+            columns = aws_query_column_names(names)
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def aws_query_result(pages):
+    """
+    columns of all query result pages, or row objects when `dest` or `since_state` is used so rows are never kept in memory.
+
+    :param pages: iterable of ( column names, rows ) where rows are lists of typed values in column order, consumed once.
+    :return: {column name: [values]} or parser result of row objects example [{'id': 1, 'name': 'test'}]
+    """
+    if aws_feature_active('aws_sink') is not None or aws_feature_active('aws_delta') is not None:
+        return aws_response_items_parser(_aws_query_rows(pages))
+    columns = None
+    values = []
+    for names, rows in pages:
+        if columns is None:
+            columns = aws_query_column_names(names)
+            values = [[] for _column in columns]
+        # transpose whole page at once instead of appending value by value.
+        for column, page_values in zip(values, zip(*rows)):
+            column.extend(page_values)
+    return dict(zip(columns or [], values))
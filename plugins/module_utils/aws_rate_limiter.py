@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""client side token bucket rate limit of aws api calls, shared by all threads of single module run."""
+import threading
+import time
+
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_metrics import AWS_THROTTLE_CODES
+
+# rate is multiplied by given factor on every throttle, like botocore adaptive retry mode.
+_DECREASE_FACTOR = 0.7
+# rate grows by given fraction of maximum rate per second without throttle.
+_INCREASE_PER_SECOND = 0.1
+# rate never drops below given requests per second.
+_MIN_RATE = 0.5
+
+# limiter of current module run, None when `rate_limit` is not used.
+_ACTIVE = None
+
+
+class AwsTokenBucket(object):
+    """
+    token bucket which lowers its rate on throttle and raises it back to `max_rate` while calls succeed.
+
+    `clock` and `sleep` can be replaced in tests.
+    """
+
+    clock = staticmethod(time.monotonic)
+    sleep = staticmethod(time.sleep)
+
+    def __init__(self, max_rate: float):
+        self.max_rate = float(max_rate)
+        self.rate = self.max_rate
+        self._lock = threading.Lock()
+        self._tokens = 1.0
+        self._refilled = self.clock()
+        self._adjusted = self._refilled
+
+    def _refill(self, now: float):
+        # bucket holds at most one second of calls, so idle time doesn't allow a burst above rate.
+        self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def acquire(self):
+        """block until call is allowed."""
+        while True:
+            with self._lock:
+                self._refill(self.clock())
+                # tolerance for float rounding of refill, else wait could be too small to ever advance clock.
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self.sleep(wait)
+
+    def throttled(self):
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.rate = max(_MIN_RATE, self.rate * _DECREASE_FACTOR)
+            self._tokens = min(self._tokens, 0.0)
+            self._adjusted = now
+
+    def succeeded(self):
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            now = self.clock()
+            self._refill(now)
+            self.rate = min(self.max_rate, self.rate + self.max_rate * _INCREASE_PER_SECOND * (now - self._adjusted))
+            self._adjusted = now
+
+
+class AwsRateLimiter(object):
+    """
+    one `AwsTokenBucket` per credentials, region and api operation, shared by every client registered on it.
+
+    aws limits are per account and region, so workers of different regions / accounts don't slow down each other.
+    """
+
+    def __init__(self, rate: float = None, operations: dict = None):
+        """
+        :param rate: maximum requests per second of every operation or None to limit only `operations`.
+        :param operations: maximum requests per second by api operation name example {'ListServices': 5}
+        """
+        self.rate = rate
+        self.operations = operations or {}
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def bucket(self, key: tuple, operation: str):
+        max_rate = self.operations.get(operation, self.rate)
+        if max_rate is None:
+            return None
+        with self._lock:
+            if (key, operation) not in self._buckets:
+                self._buckets[(key, operation)] = AwsTokenBucket(max_rate)
+            return self._buckets[(key, operation)]
+
+    def register(self, client, key: tuple):
+        """
+        limit every http request of boto3 `client`, including botocore retries.
+
+        :param client: boto3 client.
+        :param key: calls with same key share limit example ( access key id, region )
+        """
+        def before_sign(operation_name=None, **kwargs):
+            # emitted for every attempt, also when botocore retries.
+            bucket = self.bucket(key, operation_name)
+            if bucket is not None:
+                bucket.acquire()
+
+        def needs_retry(operation=None, response=None, **kwargs):
+            bucket = self.bucket(key, operation.name)
+            if bucket is None or response is None:
+                return
+            if response[1].get('Error', {}).get('Code') in AWS_THROTTLE_CODES:
+                bucket.throttled()
+            elif response[0].status_code < 300:
+                bucket.succeeded()
+
+        events = client.meta.events
+        events.register('before-sign', before_sign, unique_id='aws-rate-limit-before-sign')
+        events.register('needs-retry', needs_retry, unique_id='aws-rate-limit-needs-retry')
+
+
+def aws_rate_limiter_start(rate: float = None, operations: dict = None) -> AwsRateLimiter:
+    """
+    limit calls of all clients created by `aws_info_run` in current module run.
+
+    :param rate: see `AwsRateLimiter`
+    :param operations: see `AwsRateLimiter`
+    :return: active limiter.
+    """
+    global _ACTIVE
+    _ACTIVE = AwsRateLimiter(rate, operations)
+    return _ACTIVE
+
+
+def aws_rate_limiter_stop():
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def aws_rate_limiter_active():
+    """
+    :return: active `AwsRateLimiter` or None if calls are not limited.
+    """
+    return _ACTIVE
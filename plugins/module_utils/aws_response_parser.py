@@ -1,44 +1,302 @@
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
 
+r"""paginate, project and snake_case aws responses of info modules, one item at a time."""
+import sys
+import threading
+import time
 
-def aws_response_list_parser(paginate: bool, iterator, resource_field: str) -> list:
-    _return = []
-    try:
-        if paginate:
-            for response in iterator:
-                for _app in response[resource_field]:
-                    try:
-                        _return.append(camel_dict_to_snake_dict(_app))
-                    except AttributeError:
-                        _return.append(_app)
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_dict_to_snake_dict
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_to_snake
+
+_MODULE_UTILS = 'ansible_collections.community.missing_collection.plugins.module_utils.'
+
+# next token of last paginator consumed by parser in current thread.
+_PAGINATION = threading.local()
+
+
+def aws_feature_active(feature: str):
+    """
+    active object of optional feature without importing its module.
+
+    features are imported when they are started, module which isn't imported has nothing active.
+
+    :param feature: module name example 'aws_metrics' for `aws_metrics.aws_metrics_active()`
+    :return: example AwsMetrics or None
+    """
+    module = sys.modules.get(_MODULE_UTILS + feature)
+    if module is None:
+        return None
+    return getattr(module, feature + '_active')()
+
+
+def aws_response_fields(value):
+    """
+    argument spec type of `fields` option.
+
+    :param value: list of paths example ['ClusterArn', 'tags.key'] or jmespath expression example "{arn: ClusterArn}"
+    :return: validated value
+    """
+    if isinstance(value, str):
+        # imported on use, options are validated before botocore and its dependencies are loaded.
+        import jmespath
+        # raises jmespath ParseError which is ValueError
+        jmespath.compile(value)
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(path, str) and path for path in value):
+        return list(value)
+    raise TypeError('fields must be list of paths or jmespath expression')
+
+
+def aws_pagination_config(module) -> dict:
+    """
+    build botocore PaginationConfig from module options.
+
+    :param module: ansible module with `aws_info.aws_info_argument_spec` options.
+    :return: example {'MaxItems': 10, 'PageSize': 5}
+    """
+    _config = {}
+    if module.params.get('max_items') is not None:
+        _config['MaxItems'] = module.params['max_items']
+    if module.params.get('page_size') is not None:
+        _config['PageSize'] = module.params['page_size']
+    if module.params.get('starting_token') is not None:
+        _config['StartingToken'] = module.params['starting_token']
+    return _config
+
+
+def aws_pagination_next_token() -> tuple:
+    """
+    next token of last paginator consumed by parser in current thread and forget it.
+
+    :return: ( True, token or None if all pages are consumed ) or ( False, None ) if no paginator was consumed.
+    """
+    _return = getattr(_PAGINATION, 'next_token', (False, None))
+    _PAGINATION.next_token = (False, None)
+    return _return
+
+
+def _aws_response_item(item):
+    if isinstance(item, dict):
+        return camel_dict_to_snake_dict(item)
+    return item
+
+
+def _aws_response_timed_item(item, projection, metrics):
+    # same as untimed path of `_aws_response_items`, only used with `collect_metrics`.
+    if projection is not None:
+        start = time.perf_counter()
+        item = projection(item)
+        metrics.time('fields', time.perf_counter() - start)
+    start = time.perf_counter()
+    item = _aws_response_item(item)
+    metrics.time('snake_case', time.perf_counter() - start)
+    metrics.count('items')
+    return item
+
+
+def _fields_tree(paths: list) -> dict:
+    # ['Tags.Key', 'cluster_arn'] -> {'tags': {'key': None}, 'cluster_arn': None}
+    tree = {}
+    for path in paths:
+        node = tree
+        parts = [camel_to_snake(part) for part in path.split('.')]
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+            if node is None:
+                break
         else:
-            for _app in iterator[resource_field]:
-                try:
-                    _return.append(camel_dict_to_snake_dict(_app))
-                except AttributeError:
-                    _return.append(_app)
-        return _return
-    except KeyError:
-        return _return
+            # shorter path selects whole subtree
+            node[parts[-1]] = None
+    return tree
 
 
-# used in aws pinpoint module
-def aws_response_nested_list_parser(paginate: bool, iterator, resource_field: str, nested_resource_field: str) -> list:
-    _return = []
+def _project(item, tree: dict):
+    if isinstance(item, list):
+        return [_project(i, tree) for i in item]
+    if not isinstance(item, dict):
+        return item
+    projected = {}
+    for k, v in item.items():
+        subtree = tree.get(camel_to_snake(k), False)
+        if subtree is False:
+            continue
+        projected[k] = v if subtree is None else _project(v, subtree)
+    return projected
+
+
+def _projection(fields):
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        import jmespath
+        return jmespath.compile(fields).search
+    tree = _fields_tree(fields)
+    return lambda item: _project(item, tree)
+
+
+def _aws_response_items(responses, resource_field: str, nested_resource_field: str = None, max_items: int = None, fields=None):
+    if max_items is not None and max_items <= 0:
+        return
+    projection = _projection(fields)
+    metrics = aws_feature_active('aws_metrics')
+    count = 0
     try:
-        if paginate:
-            for response in iterator:
-                for _app in response[resource_field][nested_resource_field]:
-                    try:
-                        _return.append(camel_dict_to_snake_dict(_app))
-                    except AttributeError:
-                        _return.append(_app)
-        else:
-            for _app in iterator[resource_field][nested_resource_field]:
-                try:
-                    _return.append(camel_dict_to_snake_dict(_app))
-                except AttributeError:
-                    _return.append(_app)
-        return _return
+        for response in responses:
+            if metrics is not None:
+                metrics.count('pages')
+            items = response[resource_field]
+            if nested_resource_field is not None:
+                items = items[nested_resource_field]
+            for item in items:
+                if metrics is not None:
+                    yield _aws_response_timed_item(item, projection, metrics)
+                else:
+                    if projection is not None:
+                        # before snake_case conversion so unused subtrees are never converted.
+                        item = projection(item)
+                    yield _aws_response_item(item)
+                count += 1
+                if max_items is not None and count >= max_items:
+                    # stop consuming paginator so no more pages are requested.
+                    return
     except KeyError:
-        return _return
+        pass
+    if hasattr(responses, 'resume_token'):
+        # set by botocore when PaginationConfig MaxItems stopped pagination.
+        _PAGINATION.next_token = (True, responses.resume_token)
+
+
+def aws_response_list_iterator(paginate: bool, iterator, resource_field: str, max_items: int = None, fields=None):
+    """
+    yield snake_case items of `resource_field` one at a time.
+
+    :param paginate: True if iterator is botocore page iterator else single response.
+    :param iterator: botocore page iterator or response dict.
+    :param resource_field: example 'clusterArns'
+    :param max_items: stop after yielding given number of items.
+    :param fields: list of paths or jmespath expression applied on each item, see `aws_response_fields`.
+    """
+    return _aws_response_items(iterator if paginate else (iterator,), resource_field, max_items=max_items, fields=fields)
+
+
+def _aws_response_result(items) -> list:
+    # with `dest` items are streamed to file and only their count is kept.
+    sink = aws_feature_active('aws_sink')
+    if sink is not None:
+        return sink.write(items)
+    # with `since_state` only added and changed items are kept.
+    delta = aws_feature_active('aws_delta')
+    if delta is not None:
+        return delta.compare(items)
+    return list(items)
+
+
+def aws_response_items_parser(items) -> list:
+    """
+    same as `aws_response_list_parser` for items which are already converted, example rows of sql query whose column names are data.
+
+    :param items: iterable of items, streamed to `dest` or compared with `since_state` one at a time.
+    """
+    return _aws_response_result(items)
+
+
+def aws_response_list_parser(paginate: bool, iterator, resource_field: str, max_items: int = None, fields=None) -> list:
+    return _aws_response_result(aws_response_list_iterator(paginate, iterator, resource_field, max_items=max_items, fields=fields))
+
+
+# used in aws pinpoint module
+def aws_response_nested_list_iterator(paginate: bool, iterator, resource_field: str, nested_resource_field: str, max_items: int = None, fields=None):
+    return _aws_response_items(
+        iterator if paginate else (iterator,),
+        resource_field,
+        nested_resource_field=nested_resource_field,
+        max_items=max_items,
+        fields=fields
+    )
+
+
+def aws_response_nested_list_parser(paginate: bool, iterator, resource_field: str, nested_resource_field: str, max_items: int = None, fields=None) -> list:
+    return _aws_response_result(aws_response_nested_list_iterator(paginate, iterator, resource_field, nested_resource_field, max_items=max_items, fields=fields))
+
+
+def aws_response_batch_parser(describe, parameter: str, ids: list, resource_field: str, batch_size: int, max_workers: int = 10, fields=None) -> list:
+    """
+    describe `ids` in chunks of `batch_size` concurrently instead of one describe call per id.
+
+    first api error is raised after all chunks are done, so caller can fail module from its own thread.
+
+    :param describe: boto3 client method with fixed arguments example partial(client.describe_services, cluster='test')
+    :param parameter: name of ids argument of `describe` example 'services'
+    :param ids: example ['arn:aws:ecs:eu-central-1:123456789012:service/test/test']
+    :param resource_field: example 'services'
+    :param batch_size: maximum ids accepted by `describe` in single call.
+    :param max_workers: maximum number of describe calls at same time.
+    :param fields: list of paths or jmespath expression applied on each item, see `aws_response_fields`.
+    :return: snake_case items of all chunks in order of `ids`
+    """
+    chunks = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    if len(chunks) <= 1:
+        responses = [describe(**{parameter: chunk}) for chunk in chunks]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            responses = list(executor.map(lambda chunk: describe(**{parameter: chunk}), chunks))
+    return _aws_response_result(
+        item for response in responses for item in aws_response_list_iterator(False, response, resource_field, fields=fields)
+    )
+
+
+def aws_response_segment_pages(segment_pages, segments: int, max_workers: int = 10):
+    """
+    yield pages of parallel scan segments as they arrive, for apis with Segment / TotalSegments example glue get_partitions.
+
+    pages of different segments are interleaved, bounded queue makes slow consumer ( `dest` file ) throttle segment scans
+    instead of buffering all pages. first api error is raised and remaining scans are stopped, same as closing generator.
+
+    :param segment_pages: function( segment number ) which returns botocore page iterator of segment.
+    :param segments: total number of segments.
+    :param max_workers: maximum number of segments scanned at same time.
+    """
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+    pages = queue.Queue(maxsize=2 * max(1, max_workers))
+    stop = threading.Event()
+    done = object()
+
+    def _put(error, page) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put((error, page), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _scan(segment: int):
+        error = None
+        try:
+            if stop.is_set():
+                return
+            for page in segment_pages(segment):
+                if not _put(None, page):
+                    return
+        except Exception as e:
+            error = e
+        _put(error, done)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, segments))) as executor:
+        try:
+            for segment in range(segments):
+                executor.submit(_scan, segment)
+            remaining = segments
+            while remaining:
+                error, page = pages.get()
+                if page is done:
+                    remaining -= 1
+                    if error is not None:
+                        raise error
+                    continue
+                yield page
+        finally:
+            stop.set()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""stream items of aws info modules to newline delimited json file instead of module result."""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_cache import aws_json_default
+
+# sink of current module run, None when `dest` is not used.
+_ACTIVE = None
+
+
+class AwsSinkItems(list):
+    """
+    empty list returned by parsers instead of items written to sink, `count` is number of written items.
+
+    it is still a list so module code which returns it doesn't need to know about sink.
+    """
+
+    def __init__(self, count: int):
+        super(AwsSinkItems, self).__init__()
+        self.count = count
+
+
+class _HashingFile(object):
+    # counts and hashes bytes as they are stored, so checksum matches `sha256sum dest`.
+
+    def __init__(self, f):
+        self._f = f
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data):
+        self._f.write(data)
+        self.size += len(data)
+        self.sha256.update(data)
+        return len(data)
+
+    def flush(self):
+        self._f.flush()
+
+
+class AwsNdjsonSink(object):
+    """
+    write one json document per line to temporary file next to `dest`, `commit` replaces `dest` with it.
+
+    safe to use from many threads, every line is written under lock.
+    """
+
+    def __init__(self, dest: str, compress: bool = False):
+        self.dest = dest
+        self.compress = compress
+        self.count = 0
+        self._lock = threading.Lock()
+        self._target = threading.local()
+        dest_dir = os.path.dirname(os.path.abspath(dest))
+        if not os.path.isdir(dest_dir):
+            os.makedirs(dest_dir)
+        fd, self._tmp = tempfile.mkstemp(dir=dest_dir, prefix='.' + os.path.basename(dest), suffix='.tmp')
+        self._raw = os.fdopen(fd, 'wb')
+        self._hashing = _HashingFile(self._raw)
+        if compress:
+            # mtime=0 so same items give same checksum.
+            self._file = gzip.GzipFile(filename='', mode='wb', fileobj=self._hashing, mtime=0)
+        else:
+            self._file = self._hashing
+
+    def set_target(self, target: dict):
+        """
+        wrap items written by current thread as {**target, 'item': item}.
+
+        :param target: example {'account_id': '123456789012', 'region': 'eu-central-1'} or None to write items as they are.
+        """
+        self._target.value = target
+
+    def write(self, items) -> AwsSinkItems:
+        """
+        :param items: iterable of json serializable items, consumed one at a time.
+        :return: empty list with number of written items as `count`.
+        """
+        target = getattr(self._target, 'value', None)
+        count = 0
+        for item in items:
+            if target:
+                item = dict(target, item=item)
+            line = (json.dumps(item, default=aws_json_default) + '\n').encode('utf-8')
+            with self._lock:
+                self._file.write(line)
+                self.count += 1
+            count += 1
+        return AwsSinkItems(count)
+
+    def commit(self) -> dict:
+        """
+        close file and atomically replace `dest`.
+
+        :return: example {'dest': '/tmp/jobs.ndjson', 'count': 10, 'size': 1024, 'checksum': 'sha256 hex digest'}
+        """
+        if self.compress:
+            self._file.close()
+        self._raw.close()
+        os.replace(self._tmp, self.dest)
+        return dict(dest=self.dest, count=self.count, size=self._hashing.size, checksum=self._hashing.sha256.hexdigest())
+
+    def discard(self):
+        """remove temporary file, `dest` is not changed. does nothing after `commit`."""
+        try:
+            if self.compress:
+                self._file.close()
+        finally:
+            self._raw.close()
+        if os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+
+def aws_sink_open(dest: str, compress: bool = False) -> AwsNdjsonSink:
+    """
+    make parsers of current module run write items to `dest`.
+
+    :param dest: path of newline delimited json file.
+    :param compress: gzip file.
+    :return: active sink.
+    """
+    global _ACTIVE
+    _ACTIVE = AwsNdjsonSink(dest, compress=compress)
+    return _ACTIVE
+
+
+def aws_sink_close():
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def aws_sink_active():
+    """
+    :return: active `AwsNdjsonSink` or None if items are returned in module result.
+    """
+    return _ACTIVE
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""read all shards of dynamodb / kinesis stream concurrently in lineage order, resuming from per shard checkpoints."""
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    pass    # Handled by AnsibleAWSModule
+
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+
+_CHECKPOINT_VERSION = 1
+
+
+def aws_stream_checkpoints_load(path: str, stream: str) -> dict:
+    """
+    :param path: checkpoint file, missing file means no checkpoints.
+    :param stream: arn / name of stream, checkpoints of other stream are refused.
+    :return: {shard id: {'sequence_number': last read sequence number, 'finished': True if closed shard was read to its end}}
+    :raise ValueError: if file isn't a checkpoint file of `stream`.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        state = json.load(f)
+    if not isinstance(state, dict) or state.get('version') != _CHECKPOINT_VERSION:
+        raise ValueError('{0} is not a checkpoint file of version {1}'.format(path, _CHECKPOINT_VERSION))
+    if state.get('stream') != stream:
+        raise ValueError('{0} has checkpoints of {1}'.format(path, state.get('stream')))
+    return state['shards']
+
+
+def aws_stream_checkpoints_save(path: str, stream: str, checkpoints: dict):
+    """
+    atomically replace checkpoint file.
+    """
+    checkpoint_dir = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(checkpoint_dir):
+        os.makedirs(checkpoint_dir)
+    fd, tmp = tempfile.mkstemp(dir=checkpoint_dir, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(dict(version=_CHECKPOINT_VERSION, stream=stream, shards=checkpoints), f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _shard_parents(shard: dict) -> list:
+    # merged kinesis shards have two parents.
+    return [p for p in (shard.get('ParentShardId'), shard.get('AdjacentParentShardId')) if p]
+
+
+class _AwsStreamRead(object):
+    # records, checkpoints and limits shared by shard workers.
+
+    def __init__(self, checkpoints: dict, max_records: int, max_shard_records: int, deadline: float, sequence_number, item):
+        self.checkpoints = checkpoints
+        self.records = {}
+        # {shard id: MillisBehindLatest of last get_records}, only reported by kinesis.
+        self.behind = {}
+        self.warnings = []
+        self.stopped = None
+        self._remaining = max_records
+        self._max_shard_records = max_shard_records
+        self._deadline = deadline
+        self._sequence_number = sequence_number
+        self._item = item
+        self._lock = threading.Lock()
+
+    def stop(self) -> bool:
+        # True once record limit or time budget is reached, checked before every api call.
+        with self._lock:
+            if self.stopped is None and time.monotonic() >= self._deadline:
+                self.stopped = 'time_budget'
+            return self.stopped is not None
+
+    def wait(self, seconds: float):
+        # sleep, but not beyond time budget.
+        time.sleep(max(0, min(seconds, self._deadline - time.monotonic())))
+
+    def shard_full(self, shard_id: str) -> bool:
+        return self._max_shard_records is not None and len(self.records.get(shard_id, [])) >= self._max_shard_records
+
+    def add(self, shard_id: str, records: list) -> int:
+        """
+        keep records up to record limits and move checkpoint of shard to last kept record.
+
+        :return: number of kept records.
+        """
+        with self._lock:
+            kept = records
+            if self._max_shard_records is not None:
+                kept = kept[:max(0, self._max_shard_records - len(self.records.get(shard_id, [])))]
+            if self._remaining is not None:
+                kept = kept[:max(0, self._remaining)]
+                self._remaining -= len(kept)
+                if self._remaining <= 0 and self.stopped is None:
+                    self.stopped = 'max_records'
+            if kept:
+                self.records.setdefault(shard_id, []).extend(self._item(record) for record in kept)
+                self.checkpoints.setdefault(shard_id, {})['sequence_number'] = self._sequence_number(kept[-1])
+        return len(kept)
+
+
+def _aws_stream_shard_iterator(client, stream: dict, shard_id: str, checkpoint: dict, iterator: dict, read: _AwsStreamRead) -> str:
+    if not checkpoint.get('sequence_number'):
+        return client.get_shard_iterator(ShardId=shard_id, **dict(stream, **iterator), **aws_info_retry_params(client))['ShardIterator']
+    try:
+        return client.get_shard_iterator(
+            ShardId=shard_id,
+            ShardIteratorType='AFTER_SEQUENCE_NUMBER',
+            SequenceNumber=checkpoint['sequence_number'],
+            **stream,
+            **aws_info_retry_params(client)
+        )['ShardIterator']
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'TrimmedDataAccessException':
+            raise
+    # records after checkpoint were removed by stream retention, continue with oldest record.
+    read.warnings.append('checkpoint of shard {0} is older than stream retention, records were skipped'.format(shard_id))
+    return client.get_shard_iterator(ShardId=shard_id, ShardIteratorType='TRIM_HORIZON', **stream, **aws_info_retry_params(client))['ShardIterator']
+
+
+def _aws_stream_read_shard(client, stream: dict, shard: dict, iterator: dict, limit: int, min_interval: float, read: _AwsStreamRead) -> bool:
+    """
+    :return: True if closed shard was read to its end, so its children can be read.
+    """
+    shard_id = shard['ShardId']
+    closed = 'EndingSequenceNumber' in shard.get('SequenceNumberRange', {})
+    if read.stop():
+        return False
+    iterator = _aws_stream_shard_iterator(client, stream, shard_id, read.checkpoints.get(shard_id, {}), iterator, read)
+    params = dict(Limit=limit) if limit else {}
+    last_call = None
+    while iterator:
+        if last_call is not None and min_interval:
+            read.wait(last_call + min_interval - time.monotonic())
+        if read.stop() or read.shard_full(shard_id):
+            return False
+        last_call = time.monotonic()
+        response = client.get_records(ShardIterator=iterator, **params, **aws_info_retry_params(client))
+        records = response.get('Records', [])
+        if 'MillisBehindLatest' in response:
+            read.behind[shard_id] = response['MillisBehindLatest']
+        if read.add(shard_id, records) < len(records):
+            return False
+        iterator = response.get('NextShardIterator')
+        # open shard is read until it is caught up, kinesis reports how far behind it is and can return empty batches before.
+        caught_up = response['MillisBehindLatest'] == 0 if 'MillisBehindLatest' in response else not records
+        if not closed and caught_up:
+            return False
+    read.checkpoints.setdefault(shard_id, {})['finished'] = True
+    return True
+
+
+def aws_stream_read(
+    client,
+    stream: dict,
+    shards: list,
+    checkpoints: dict,
+    sequence_number,
+    item,
+    iterator_type: str = 'TRIM_HORIZON',
+    iterator_params: dict = None,
+    max_records: int = 1000,
+    max_shard_records: int = None,
+    time_budget: float = 30.0,
+    limit: int = None,
+    min_interval: float = None,
+    max_workers: int = 10,
+) -> dict:
+    """
+    read shards concurrently, a child shard is read only after its parents were read to their end.
+
+    api errors are raised after running shard reads are done.
+
+    :param client: boto3 dynamodbstreams or kinesis client.
+    :param stream: stream argument of get_shard_iterator example {'StreamArn': 'arn'}
+    :param shards: shards of describe_stream / list_shards as returned by boto3.
+    :param checkpoints: see `aws_stream_checkpoints_load`, updated in place.
+    :param sequence_number: function( record ) which returns sequence number of boto3 record.
+    :param item: function( record ) which converts boto3 record to result item.
+    :param iterator_type: shard iterator type for shards without checkpoint example 'TRIM_HORIZON'
+    :param iterator_params: extra get_shard_iterator arguments of `iterator_type` example {'Timestamp': datetime}
+    :param max_records: stop after given number of records of all shards, None for no limit.
+    :param max_shard_records: stop reading shard after given number of its records, None for no limit.
+    :param time_budget: stop calling aws after given seconds.
+    :param limit: maximum records per get_records call.
+    :param min_interval: minimum seconds between get_records calls of same shard, kinesis allows 5 per second.
+    :param max_workers: maximum number of shards read at same time.
+    :return: {'records': items in shard lineage order, 'shard_records': {shard id: items},
+              'shards': {shard id: {'records': count, 'finished': bool, 'millis_behind_latest': if reported}},
+              'stopped': 'max_records', 'time_budget' or None if all shards are caught up or full, 'checkpoints': updated checkpoints,
+              'warnings': []}
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    shard_ids = set(shard['ShardId'] for shard in shards)
+    # checkpoints of shards removed by stream retention are dropped.
+    checkpoints = dict((k, v) for k, v in checkpoints.items() if k in shard_ids)
+    read = _AwsStreamRead(checkpoints, max_records, max_shard_records, time.monotonic() + time_budget, sequence_number, item)
+    iterator = dict(iterator_params or {}, ShardIteratorType=iterator_type)
+    # parents removed by stream retention can't be read anymore.
+    done = set(shard_id for shard_id, checkpoint in checkpoints.items() if checkpoint.get('finished'))
+    pending = [shard for shard in shards if shard['ShardId'] not in done]
+    order = []
+    futures = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while True:
+            for shard in list(pending):
+                if all(parent in done or parent not in shard_ids for parent in _shard_parents(shard)):
+                    pending.remove(shard)
+                    order.append(shard['ShardId'])
+                    futures[executor.submit(
+                        _aws_stream_read_shard, client, stream, shard, iterator, limit, min_interval, read
+                    )] = shard['ShardId']
+            if not futures:
+                break
+            finished, _running = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                shard_id = futures.pop(future)
+                if future.result():
+                    done.add(shard_id)
+
+    shards = {}
+    for shard_id in order:
+        shards[shard_id] = dict(records=len(read.records.get(shard_id, [])), finished=bool(checkpoints.get(shard_id, {}).get('finished')))
+        if shard_id in read.behind:
+            shards[shard_id]['millis_behind_latest'] = read.behind[shard_id]
+    return dict(
+        records=[record for shard_id in order for record in read.records.get(shard_id, [])],
+        shard_records=dict((shard_id, read.records.get(shard_id, [])) for shard_id in order),
+        shards=shards,
+        stopped=read.stopped,
+        checkpoints=checkpoints,
+        warnings=read.warnings,
+    )
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""
+camelCase to snake_case conversion of aws responses.
+
+same output as ansible camel_dict_to_snake_dict( reversible=False ) but
+key translations are cached and nested structures are walked with a stack.
+"""
+from ansible.module_utils.common.dict_transformations import _camel_to_snake
+
+# aws responses reuse few dozen keys, user defined keys ( tags, parameters ) are bounded by size.
+_SNAKE_KEYS_MAX_SIZE = 4096
+_SNAKE_KEYS = {}
+
+
+def camel_to_snake(name: str) -> str:
+    """
+    convert and cache single key.
+
+    :param name: example "CreationTime"
+    :return: example "creation_time"
+    """
+    try:
+        return _SNAKE_KEYS[name]
+    except KeyError:
+        pass
+    if len(_SNAKE_KEYS) >= _SNAKE_KEYS_MAX_SIZE:
+        _SNAKE_KEYS.clear()
+    _SNAKE_KEYS[name] = snake = _camel_to_snake(name)
+    return snake
+
+
+def _is_snake_leaf(camel_dict: dict) -> bool:
+    # dict which has only snake_case keys and no nested dict / list only needs shallow copy.
+    for k, v in camel_dict.items():
+        if isinstance(v, (dict, list)):
+            return False
+        try:
+            if _SNAKE_KEYS[k] != k:
+                return False
+        except KeyError:
+            if camel_to_snake(k) != k:
+                return False
+    return True
+
+
+def camel_dict_to_snake_dict(camel_dict: dict) -> dict:
+    """
+    convert keys of dict and all nested dicts to snake_case.
+
+    :param camel_dict: example {"ClusterName": "a", "Tags": [{"Key": "b", "Value": "c"}]}
+    :return: new dict, example {"cluster_name": "a", "tags": [{"key": "b", "value": "c"}]}
+    """
+    if _is_snake_leaf(camel_dict):
+        # copy so callers can change result without changing response or cached entry.
+        return dict(camel_dict)
+
+    keys = _SNAKE_KEYS
+    snake_dict = {}
+    stack = [(camel_dict, snake_dict)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(target, dict):
+            for k, v in source.items():
+                try:
+                    k = keys[k]
+                except KeyError:
+                    k = camel_to_snake(k)
+                if isinstance(v, dict):
+                    if _is_snake_leaf(v):
+                        target[k] = dict(v)
+                        continue
+                    target[k] = {}
+                    stack.append((v, target[k]))
+                elif isinstance(v, list):
+                    target[k] = []
+                    stack.append((v, target[k]))
+                else:
+                    target[k] = v
+        else:
+            for v in source:
+                if isinstance(v, dict):
+                    if _is_snake_leaf(v):
+                        target.append(dict(v))
+                        continue
+                    target.append({})
+                    stack.append((v, target[-1]))
+                elif isinstance(v, list):
+                    target.append([])
+                    stack.append((v, target[-1]))
+                else:
+                    target.append(v)
+    return snake_dict
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 def convert_str_to_datetime(time: str):
@@ -12,3 +12,23 @@ def convert_str_to_datetime(time: str):
         return datetime.strptime(time, "%Y-%m-%d")
     except ValueError:
         return None
+
+
+def convert_str_to_epoch(time: str, default: int = None) -> int:
+    """
+    convert epoch seconds or ISO 8601 string time to epoch seconds, naive times are UTC.
+
+    :param time: example "1609459200" or "2021-01-01T00:00:00Z"
+    :param default: returned if time is None.
+    :return: example 1609459200
+    :raise ValueError: if time is neither epoch seconds nor ISO 8601.
+    """
+    if time is None:
+        return default
+    if time.isdigit():
+        return int(time)
+    # python < 3.11 doesn't parse Z suffix.
+    parsed = datetime.fromisoformat(time.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -90,30 +91,28 @@ workspace:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_AMP_OPERATIONS = dict(
+    list_workspace=aws_list_operation('list_workspaces', 'workspaces', 'workspaces', alias='alias'),
+    describe_workspace=aws_dict_operation('describe_workspace', 'workspace', 'workspace', workspaceId='workspace_id'),
+)
 
-def _amp(client, module):
-    try:
-        if client.can_paginate('list_workspaces'):
-            paginator = client.get_paginator('list_workspaces')
-            return paginator.paginate(
-                alias=module.params['alias']
-            ), True
-        else:
-            return client.list_workspaces(
-                alias=module.params['alias']
-            ), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws amp details')
+
+def _amp_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _AMP_OPERATIONS,
+        error_msg='Failed to fetch aws amp details',
+    )
 
 
 def main():
@@ -123,29 +122,16 @@ def main():
         workspace_id=dict(required=False),
         describe_workspace=dict(required=False, type=bool)
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         mutually_exclusive=[
             ('list_workspace', 'describe_workspace')
         ]
     )
 
-    amp = module.client('amp', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _amp(amp, module)
-
-    if module.params['list_workspace']:
-        module.exit_json(workspaces=aws_response_list_parser(paginate, _it, 'workspaces'))
-    elif module.params['describe_workspace']:
-        try:
-            _des = amp.describe_workspace(
-                workspaceId=module.params['workspace_id']
-            )
-            module.exit_json(workspace=camel_dict_to_snake_dict(_des['workspace']))
-        except amp.exceptions.ResourceNotFoundException:
-            module.fail_json(msg="workspace not found")
-    else:
-        module.fail_json(msg="unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'amp', _amp_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
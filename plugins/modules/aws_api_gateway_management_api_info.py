@@ -31,6 +31,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -58,31 +59,26 @@ connection:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import (
-    camel_dict_to_snake_dict,
+
+_APIGATEWAYMANAGEMENTAPI_OPERATIONS = dict(
+    get_connection=aws_dict_operation('get_connection', 'connection', ConnectionId='connection_id'),
 )
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
 
 
-def _apigatewaymanagementapi(client, module):
-    try:
-        if module.params["get_connection"]:
-            return (
-                client.get_connection(ConnectionId=module.params["connection_id"]),
-                False,
-            )
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(
-            e, msg="Failed to fetch aws api gateway management api details"
-        )
+def _apigatewaymanagementapi_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _APIGATEWAYMANAGEMENTAPI_OPERATIONS,
+        error_msg='Failed to fetch aws api gateway management api details',
+    )
 
 
 def main():
@@ -90,22 +86,15 @@ def main():
         connection_id=dict(required=False),
         get_connection=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[("get_connection", True, ["connection_id"])],
         mutually_exclusive=[],
     )
 
-    _gateway = module.client(
-        "apigatewaymanagementapi", retry_decorator=AWSRetry.exponential_backoff()
-    )
-    _it, _ = _apigatewaymanagementapi(_gateway, module)
-
-    if module.params["get_connection"]:
-        module.exit_json(connection=camel_dict_to_snake_dict(_it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'apigatewaymanagementapi', _apigatewaymanagementapi_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == "__main__":
@@ -60,6 +60,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -229,77 +230,33 @@ vpc_links:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_API_GATEWAY_V2_OPERATIONS = dict(
+    get_api=aws_dict_operation('get_api', 'api', ApiId='api_id'),
+    get_deployments=aws_list_operation('get_deployments', 'deployments', 'Items', ApiId='api_id'),
+    get_api_mappings=aws_list_operation('get_api_mappings', 'mappings', 'Items', DomainName='domain_name'),
+    get_stages=aws_list_operation('get_stages', 'stages', 'Items', ApiId='api_id'),
+    get_routes=aws_list_operation('get_routes', 'routes', 'Items', ApiId='api_id'),
+    get_vpc_links=aws_list_operation('get_vpc_links', 'vpc_links', 'Items'),
+)
 
-def _api_gateway_v2(client, module):
-    try:
-        if module.params['get_api']:
-            return client.get_api(
-                ApiId=module.params['api_id']
-            ), False
-        elif module.params['get_deployments']:
-            if client.can_paginate('get_deployments'):
-                paginator = client.get_paginator('get_deployments')
-                return paginator.paginate(
-                    ApiId=module.params['api_id']
-                ), True
-            else:
-                return client.get_deployments(
-                    ApiId=module.params['api_id']
-                ), False
-        elif module.params['get_api_mappings']:
-            if client.can_paginate('get_api_mappings'):
-                paginator = client.get_paginator('get_api_mappings')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name']
-                ), True
-            else:
-                return client.get_api_mappings(
-                    DomainName=module.params['domain_name']
-                ), False
-        elif module.params['get_stages']:
-            if client.can_paginate('get_stages'):
-                paginator = client.get_paginator('get_stages')
-                return paginator.paginate(
-                    ApiId=module.params['api_id']
-                ), True
-            else:
-                return client.get_stages(
-                    ApiId=module.params['api_id']
-                ), False
-        elif module.params['get_routes']:
-            if client.can_paginate('get_routes'):
-                paginator = client.get_paginator('get_routes')
-                return paginator.paginate(
-                    ApiId=module.params['api_id']
-                ), True
-            else:
-                return client.get_routes(
-                    ApiId=module.params['api_id']
-                ), False
-        elif module.params['get_vpc_links']:
-            if client.can_paginate('get_vpc_links'):
-                paginator = client.get_paginator('get_vpc_links')
-                return paginator.paginate(), True
-            else:
-                return client.get_vpc_links(), False
-        else:
-            if client.can_paginate('get_apis'):
-                paginator = client.get_paginator('get_apis')
-                return paginator.paginate(), True
-            else:
-                return client.get_apis(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws api gateway v2 details')
+
+def _api_gateway_v2_result(_gateway, module) -> dict:
+    return aws_operations_result(
+        _gateway,
+        module,
+        _API_GATEWAY_V2_OPERATIONS,
+        default=aws_list_operation('get_apis', 'apis', 'Items'),
+        error_msg='Failed to fetch aws api gateway v2 details',
+    )
 
 
 def main():
@@ -313,8 +270,9 @@ def main():
         get_routes=dict(required=False, type=bool),
         get_vpc_links=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('get_api', True, ['api_id']),
@@ -335,23 +293,7 @@ def main():
         ],
     )
 
-    _gateway = module.client('apigatewayv2', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _api_gateway_v2(_gateway, module)
-
-    if module.params['get_api']:
-        module.exit_json(api=camel_dict_to_snake_dict(_it))
-    elif module.params['get_deployments']:
-        module.exit_json(deployments=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['get_api_mappings']:
-        module.exit_json(mappings=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['get_stages']:
-        module.exit_json(stages=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['get_routes']:
-        module.exit_json(routes=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['get_vpc_links']:
-        module.exit_json(vpc_links=aws_response_list_parser(paginate, _it, 'Items'))
-    else:
-        module.exit_json(apis=aws_response_list_parser(paginate, _it, 'Items'))
+    module.exit_json(**aws_info_run(module, 'apigatewayv2', _api_gateway_v2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -36,6 +36,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -109,47 +110,34 @@ event_integration:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _appintegrations(client, module):
-    try:
-        if module.params['list_event_integration_associations']:
-            if client.can_paginate('list_event_integration_associations'):
-                paginator = client.get_paginator('list_event_integration_associations')
-                return paginator.paginate(
-                    EventIntegrationName=module.params['name']
-                ), True
-            else:
-                return client.list_event_integration_associations(
-                    EventIntegrationName=module.params['name']
-                ), False
-        elif module.params['describe_event_integration']:
-            if client.can_paginate('get_event_integration'):
-                paginator = client.get_paginator('get_event_integration')
-                return paginator.paginate(
-                    Name=module.params['name']
-                ), True
-            else:
-                return client.get_event_integration(
-                    Name=module.params['name']
-                ), False
-        else:
-            if client.can_paginate('list_event_integrations'):
-                paginator = client.get_paginator('list_event_integrations')
-                return paginator.paginate(), True
-            else:
-                return client.list_event_integrations(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws app integrations details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_APPINTEGRATIONS_OPERATIONS = dict(
+    list_event_integration_associations=aws_list_operation(
+        'list_event_integration_associations',
+        'event_integration_associations',
+        'EventIntegrationAssociations',
+        EventIntegrationName='name',
+    ),
+    describe_event_integration=aws_dict_operation('get_event_integration', 'event_integration', Name='name'),
+)
+
+
+def _appintegrations_result(appintegrations, module) -> dict:
+    return aws_operations_result(
+        appintegrations,
+        module,
+        _APPINTEGRATIONS_OPERATIONS,
+        default=aws_list_operation('list_event_integrations', 'event_integrations', 'EventIntegrations'),
+        error_msg='Failed to fetch aws app integrations details',
+    )
 
 
 def main():
@@ -158,8 +146,9 @@ def main():
         list_event_integration_associations=dict(required=False, type=bool),
         describe_event_integration=dict(required=False, type=bool)
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('list_event_integration_associations', True, ['name']),
@@ -173,15 +162,7 @@ def main():
     # remove below warning once service become GA
     module.warn("aws app integration service is preview on 25-12-2020")
 
-    appintegrations = module.client('appintegrations', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _appintegrations(appintegrations, module)
-
-    if module.params['list_event_integration_associations']:
-        module.exit_json(event_integration_associations=aws_response_list_parser(paginate, _it, 'EventIntegrationAssociations'))
-    elif module.params['describe_event_integration']:
-        module.exit_json(event_integration=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(event_integrations=aws_response_list_parser(paginate, _it, 'EventIntegrations'))
+    module.exit_json(**aws_info_run(module, 'appintegrations', _appintegrations_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
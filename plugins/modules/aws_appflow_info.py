@@ -44,6 +44,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -203,51 +204,34 @@ connector_configurations:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_APPFLOW_OPERATIONS = dict(
+    describe_flow=aws_dict_operation('describe_flow', 'flow', flowName='name'),
+    describe_connectors=aws_dict_operation(
+        'describe_connectors',
+        'connector_configurations',
+        'connectorConfigurations',
+        connectorTypes='describe_connector_types',
+    ),
+)
 
-def _appflow(client, module):
-    try:
-        if module.params['describe_flow']:
-            if client.can_paginate('describe_flow'):
-                paginator = client.get_paginator('describe_flow')
-                return paginator.paginate(
-                    flowName=module.params['name']
-                ), True
-            else:
-                return client.describe_flow(
-                    flowName=module.params['name']
-                ), False
-        elif module.params['describe_connectors']:
-            if client.can_paginate('describe_connectors'):
-                paginator = client.get_paginator('describe_connectors')
-                return paginator.paginate(
-                    connectorTypes=module.params['describe_connector_types']
-                ), True
-            else:
-                return client.describe_connectors(
-                    connectorTypes=module.params['describe_connector_types']
-                ), False
-        else:
-            if client.can_paginate('list_flows'):
-                paginator = client.get_paginator('list_flows')
-                return paginator.paginate(
-                    maxResults=100          # default value is not set, minor bug in boto3
-                ), True
-            else:
-                return client.list_flows(
-                    maxResults=100          # default value is not set, minor bug in boto3
-                ), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws appflow details')
+
+def _appflow_result(appflow, module) -> dict:
+    return aws_operations_result(
+        appflow,
+        module,
+        _APPFLOW_OPERATIONS,
+        default=aws_list_operation('list_flows', 'flows', 'flows', maxResults=100),
+        error_msg='Failed to fetch aws appflow details',
+    )
 
 
 def main():
@@ -257,8 +241,9 @@ def main():
         describe_connectors=dict(required=False, type=bool),
         describe_connector_types=dict(required=False, type=list)
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_flow', True, ['name']),
@@ -269,15 +254,7 @@ def main():
         ],
     )
 
-    appflow = module.client('appflow', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _appflow(appflow, module)
-
-    if module.params['describe_flow']:
-        module.exit_json(flow=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_connectors']:
-        module.exit_json(connector_configurations=camel_dict_to_snake_dict(_it['connectorConfigurations']))
-    else:
-        module.exit_json(flows=aws_response_list_parser(paginate, _it, 'flows'))
+    module.exit_json(**aws_info_run(module, 'appflow', _appflow_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
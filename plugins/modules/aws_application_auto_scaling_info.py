@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -146,62 +147,34 @@ scheduled_actions:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _app_autoscaling(client, module):
-    try:
-        if module.params['describe_scalable_targets']:
-            if client.can_paginate('describe_scalable_targets'):
-                paginator = client.get_paginator('describe_scalable_targets')
-                return paginator.paginate(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), True
-            else:
-                return client.describe_scalable_targets(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), False
-        elif module.params['describe_scaling_activities']:
-            if client.can_paginate('describe_scaling_activities'):
-                paginator = client.get_paginator('describe_scaling_activities')
-                return paginator.paginate(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), True
-            else:
-                return client.describe_scaling_activities(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), False
-        elif module.params['describe_scaling_policies']:
-            if client.can_paginate('describe_scaling_policies'):
-                paginator = client.get_paginator('describe_scaling_policies')
-                return paginator.paginate(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), True
-            else:
-                return client.describe_scaling_policies(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), False
-        elif module.params['describe_scheduled_actions']:
-            if client.can_paginate('describe_scheduled_actions'):
-                paginator = client.get_paginator('describe_scheduled_actions')
-                return paginator.paginate(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), True
-            else:
-                return client.describe_scheduled_actions(
-                    ServiceNamespace=module.params['service_namespace'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws application autoscaling details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_APP_AUTOSCALING_OPERATIONS = dict(
+    describe_scalable_targets=aws_list_operation('describe_scalable_targets', 'scalable_targets', 'ScalableTargets', ServiceNamespace='service_namespace'),
+    describe_scaling_activities=aws_list_operation(
+        'describe_scaling_activities',
+        'scaling_activities',
+        'ScalingActivities',
+        ServiceNamespace='service_namespace',
+    ),
+    describe_scaling_policies=aws_list_operation('describe_scaling_policies', 'scaling_policies', 'ScalingPolicies', ServiceNamespace='service_namespace'),
+    describe_scheduled_actions=aws_list_operation('describe_scheduled_actions', 'scheduled_actions', 'ScheduledActions', ServiceNamespace='service_namespace'),
+)
+
+
+def _app_autoscaling_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _APP_AUTOSCALING_OPERATIONS,
+        error_msg='Failed to fetch aws application autoscaling details',
+    )
 
 
 def main():
@@ -212,8 +185,9 @@ def main():
         describe_scaling_policies=dict(required=False, type=bool),
         describe_scheduled_actions=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_scalable_targets', True, ['service_namespace']),
@@ -231,19 +205,7 @@ def main():
         ],
     )
 
-    client = module.client('application-autoscaling', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _app_autoscaling(client, module)
-
-    if module.params['describe_scalable_targets']:
-        module.exit_json(scalable_targets=aws_response_list_parser(paginate, _it, 'ScalableTargets'))
-    elif module.params['describe_scaling_activities']:
-        module.exit_json(scaling_activities=aws_response_list_parser(paginate, _it, 'ScalingActivities'))
-    elif module.params['describe_scaling_policies']:
-        module.exit_json(scaling_policies=aws_response_list_parser(paginate, _it, 'ScalingPolicies'))
-    elif module.params['describe_scheduled_actions']:
-        module.exit_json(scheduled_actions=aws_response_list_parser(paginate, _it, 'ScheduledActions'))
-    else:
-        module.fail_json("unknown options passed to module")
+    module.exit_json(**aws_info_run(module, 'application-autoscaling', _app_autoscaling_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
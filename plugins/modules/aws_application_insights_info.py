@@ -53,6 +53,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -153,68 +154,36 @@ list_log_patterns:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _app_insights(client, module):
-    try:
-        if module.params['list_components']:
-            if client.can_paginate('list_components'):
-                paginator = client.get_paginator('list_components')
-                return paginator.paginate(
-                    ResourceGroupName=module.params['name']
-                ), True
-            else:
-                return client.list_components(
-                    ResourceGroupName=module.params['name']
-                ), False
-        elif module.params['list_configuration_history']:
-            if client.can_paginate('list_configuration_history'):
-                paginator = client.get_paginator('list_configuration_history')
-                return paginator.paginate(
-                    ResourceGroupName=module.params['name'],
-                    EventStatus=module.params['list_configuration_history_event_status']
-                ), True
-            else:
-                return client.list_configuration_history(
-                    ResourceGroupName=module.params['name'],
-                    EventStatus=module.params['list_configuration_history_event_status']
-                ), False
-        elif module.params['list_log_pattern_sets']:
-            if client.can_paginate('list_log_pattern_sets'):
-                paginator = client.get_paginator('list_log_pattern_sets')
-                return paginator.paginate(
-                    ResourceGroupName=module.params['name'],
-                ), True
-            else:
-                return client.list_log_pattern_sets(
-                    ResourceGroupName=module.params['name'],
-                ), False
-        elif module.params['list_log_patterns']:
-            if client.can_paginate('list_log_patterns'):
-                paginator = client.get_paginator('list_log_patterns')
-                return paginator.paginate(
-                    ResourceGroupName=module.params['name'],
-                ), True
-            else:
-                return client.list_log_patterns(
-                    ResourceGroupName=module.params['name'],
-                ), False
-        else:
-            if client.can_paginate('list_applications'):
-                paginator = client.get_paginator('list_applications')
-                return paginator.paginate(), True
-            else:
-                return client.list_applications(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws application insights details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_APP_INSIGHTS_OPERATIONS = dict(
+    list_components=aws_list_operation('list_components', 'component_list', 'ApplicationComponentList', ResourceGroupName='name'),
+    list_configuration_history=aws_list_operation(
+        'list_configuration_history',
+        'event_list',
+        'EventList',
+        ResourceGroupName='name',
+        EventStatus='list_configuration_history_event_status',
+    ),
+    list_log_pattern_sets=aws_list_operation('list_log_pattern_sets', 'log_pattern_sets', 'LogPatternSets', ResourceGroupName='name'),
+    list_log_patterns=aws_list_operation('list_log_patterns', 'log_patterns', 'LogPatterns', ResourceGroupName='name'),
+)
+
+
+def _app_insights_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _APP_INSIGHTS_OPERATIONS,
+        default=aws_list_operation('list_applications', 'application_list', 'ApplicationInfoList'),
+        error_msg='Failed to fetch aws application insights details',
+    )
 
 
 def main():
@@ -226,8 +195,9 @@ def main():
         list_log_pattern_sets=dict(required=False, type=bool),
         list_log_patterns=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('list_components', True, ['name']),
@@ -245,19 +215,7 @@ def main():
         ],
     )
 
-    client = module.client('application-insights', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _app_insights(client, module)
-
-    if module.params['list_components']:
-        module.exit_json(component_list=aws_response_list_parser(paginate, _it, 'ApplicationComponentList'))
-    elif module.params['list_configuration_history']:
-        module.exit_json(event_list=aws_response_list_parser(paginate, _it, 'EventList'))
-    elif module.params['list_log_pattern_sets']:
-        module.exit_json(log_pattern_sets=aws_response_list_parser(paginate, _it, 'LogPatternSets'))
-    elif module.params['list_log_patterns']:
-        module.exit_json(log_patterns=aws_response_list_parser(paginate, _it, 'LogPatterns'))
-    else:
-        module.exit_json(application_list=aws_response_list_parser(paginate, _it, 'ApplicationInfoList'))
+    module.exit_json(**aws_info_run(module, 'application-insights', _app_insights_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
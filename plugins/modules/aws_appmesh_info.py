@@ -66,6 +66,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -225,90 +226,38 @@ gateway_routes:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_APPMESH_OPERATIONS = dict(
+    list_virtual_routers=aws_list_operation('list_virtual_routers', 'virtual_routers', 'virtualRouters', meshName='name'),
+    list_routes=aws_list_operation('list_routes', 'routes', 'routes', meshName='name', virtualRouterName='virtual_router_name'),
+    list_virtual_nodes=aws_list_operation('list_virtual_nodes', 'virtual_nodes', 'virtualNodes', meshName='name'),
+    list_virtual_gateways=aws_list_operation('list_virtual_gateways', 'virtual_gateways', 'virtualGateways', meshName='name'),
+    list_virtual_services=aws_list_operation('list_virtual_services', 'virtual_services', 'virtualServices', meshName='name'),
+    list_gateway_routes=aws_list_operation(
+        'list_gateway_routes',
+        'gateway_routes',
+        'gatewayRoutes',
+        meshName='name',
+        virtualGatewayName='virtual_gateway_name',
+    ),
+)
 
-def _appmesh(client, module):
-    try:
-        if module.params['list_virtual_routers']:
-            if client.can_paginate('list_virtual_routers'):
-                paginator = client.get_paginator('list_virtual_routers')
-                return paginator.paginate(
-                    meshName=module.params['name']
-                ), True
-            else:
-                return client.list_virtual_routers(
-                    meshName=module.params['name']
-                ), False
-        elif module.params['list_routes']:
-            if client.can_paginate('list_routes'):
-                paginator = client.get_paginator('list_routes')
-                return paginator.paginate(
-                    meshName=module.params['name'],
-                    virtualRouterName=module.params['virtual_router_name']
-                ), True
-            else:
-                return client.list_routes(
-                    meshName=module.params['name'],
-                    virtualRouterName=module.params['virtual_router_name']
-                ), False
-        elif module.params['list_virtual_nodes']:
-            if client.can_paginate('list_virtual_nodes'):
-                paginator = client.get_paginator('list_virtual_nodes')
-                return paginator.paginate(
-                    meshName=module.params['name']
-                ), True
-            else:
-                return client.list_virtual_nodes(
-                    meshName=module.params['name']
-                ), False
-        elif module.params['list_virtual_gateways']:
-            if client.can_paginate('list_virtual_gateways'):
-                paginator = client.get_paginator('list_virtual_gateways')
-                return paginator.paginate(
-                    meshName=module.params['name']
-                ), True
-            else:
-                return client.list_virtual_gateways(
-                    meshName=module.params['name']
-                ), False
-        elif module.params['list_virtual_services']:
-            if client.can_paginate('list_virtual_services'):
-                paginator = client.get_paginator('list_virtual_services')
-                return paginator.paginate(
-                    meshName=module.params['name']
-                ), True
-            else:
-                return client.list_virtual_services(
-                    meshName=module.params['name']
-                ), False
-        elif module.params['list_gateway_routes']:
-            if client.can_paginate('list_gateway_routes'):
-                paginator = client.get_paginator('list_gateway_routes')
-                return paginator.paginate(
-                    meshName=module.params['name'],
-                    virtualGatewayName=module.params['virtual_gateway_name']
-                ), True
-            else:
-                return client.list_gateway_routes(
-                    meshName=module.params['name'],
-                    virtualGatewayName=module.params['virtual_gateway_name']
-                ), False
-        else:
-            if client.can_paginate('list_meshes'):
-                paginator = client.get_paginator('list_meshes')
-                return paginator.paginate(), True
-            else:
-                return client.list_meshes(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws appmesh details')
+
+def _appmesh_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _APPMESH_OPERATIONS,
+        default=aws_list_operation('list_meshes', 'meshes', 'meshes'),
+        error_msg='Failed to fetch aws appmesh details',
+    )
 
 
 def main():
@@ -323,8 +272,9 @@ def main():
         virtual_gateway_name=dict(required=False),
         list_gateway_routes=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('list_virtual_routers', True, ['name']),
@@ -345,23 +295,7 @@ def main():
         ],
     )
 
-    client = module.client('appmesh', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _appmesh(client, module)
-
-    if module.params['list_virtual_routers']:
-        module.exit_json(virtual_routers=aws_response_list_parser(paginate, _it, 'virtualRouters'))
-    elif module.params['list_routes']:
-        module.exit_json(routes=aws_response_list_parser(paginate, _it, 'routes'))
-    elif module.params['list_virtual_nodes']:
-        module.exit_json(virtual_nodes=aws_response_list_parser(paginate, _it, 'virtualNodes'))
-    elif module.params['list_virtual_gateways']:
-        module.exit_json(virtual_gateways=aws_response_list_parser(paginate, _it, 'virtualGateways'))
-    elif module.params['list_virtual_services']:
-        module.exit_json(virtual_services=aws_response_list_parser(paginate, _it, 'virtualServices'))
-    elif module.params['list_gateway_routes']:
-        module.exit_json(gateway_routes=aws_response_list_parser(paginate, _it, 'gatewayRoutes'))
-    else:
-        module.exit_json(meshes=aws_response_list_parser(paginate, _it, 'meshes'))
+    module.exit_json(**aws_info_run(module, 'appmesh', _appmesh_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -126,55 +127,34 @@ services:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _apprunner(module):
-    try:
-        apprunner = module.client('apprunner')
-
-        if module.params['list_auto_scaling_configurations']:
-            if apprunner.can_paginate('list_auto_scaling_configurations'):
-                paginator = apprunner.get_paginator('list_auto_scaling_configurations')
-                return paginator.paginate(
-                    LatestOnly=False
-                ), True
-            else:
-                return apprunner.list_auto_scaling_configurations(
-                    LatestOnly=False
-                ), False
-        elif module.params['list_connections']:
-            if apprunner.can_paginate('list_connections'):
-                paginator = apprunner.get_paginator('list_connections')
-                return paginator.paginate(), True
-            else:
-                return apprunner.list_connections(), False
-        elif module.params['list_operations']:
-            if apprunner.can_paginate('list_operations'):
-                paginator = apprunner.get_paginator('list_operations')
-                return paginator.paginate(
-                    ServiceArn=module.params['arn']
-                ), True
-            else:
-                return apprunner.list_operations(
-                    ServiceArn=module.params['arn']
-                ), False
-        elif module.params['list_services']:
-            if apprunner.can_paginate('list_services'):
-                paginator = apprunner.get_paginator('list_services')
-                return paginator.paginate(), True
-            else:
-                return apprunner.list_services(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws apprunner details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_APPRUNNER_OPERATIONS = dict(
+    list_auto_scaling_configurations=aws_list_operation(
+        'list_auto_scaling_configurations',
+        'auto_scaling_configuration_summary',
+        'AutoScalingConfigurationSummaryList',
+        LatestOnly=False,
+    ),
+    list_connections=aws_list_operation('list_connections', 'connection_summary', 'ConnectionSummaryList'),
+    list_operations=aws_list_operation('list_operations', 'operation_summary', 'OperationSummaryList', ServiceArn='arn'),
+    list_services=aws_list_operation('list_services', 'services', 'ServiceSummaryList'),
+)
+
+
+def _apprunner_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _APPRUNNER_OPERATIONS,
+        error_msg='Failed to fetch aws apprunner details',
+    )
 
 
 def main():
@@ -185,8 +165,9 @@ def main():
         list_operations=dict(required=False, type=bool),
         list_services=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -202,16 +183,7 @@ def main():
         ],
     )
 
-    _it, _paginate = _apprunner(module)
-    if _it is not None:
-        if module.params['list_auto_scaling_configurations']:
-            module.exit_json(auto_scaling_configuration_summary=aws_response_list_parser(_paginate, _it, 'AutoScalingConfigurationSummaryList'))
-        elif module.params['list_connections']:
-            module.exit_json(connection_summary=aws_response_list_parser(_paginate, _it, 'ConnectionSummaryList'))
-        elif module.params['list_operations']:
-            module.exit_json(operation_summary=aws_response_list_parser(_paginate, _it, 'OperationSummaryList'))
-        elif module.params['list_services']:
-            module.exit_json(services=aws_response_list_parser(_paginate, _it, 'ServiceSummaryList'))
+    module.exit_json(**aws_info_run(module, 'apprunner', _apprunner_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
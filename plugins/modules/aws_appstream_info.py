@@ -69,6 +69,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -228,84 +229,31 @@ users:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_APPSTREAM_OPERATIONS = dict(
+    describe_fleets=aws_list_operation('describe_fleets', 'fleets', 'Fleets', Names='names'),
+    describe_stacks=aws_list_operation('describe_stacks', 'stacks', 'Stacks', Names='names'),
+    describe_directory_configs=aws_list_operation('describe_directory_configs', 'directory_configs', 'DirectoryConfigs', DirectoryNames='names'),
+    describe_image_builders=aws_list_operation('describe_image_builders', 'image_builders', 'ImageBuilders', Names='names'),
+    describe_images=aws_list_operation('describe_images', 'images', 'Images', Names='names', Type='image_type'),
+    describe_users=aws_list_operation('describe_users', 'users', 'Users', AuthenticationType='authentication_type'),
+)
 
-def _appstream(client, module):
-    try:
-        if module.params['describe_fleets']:
-            if client.can_paginate('describe_fleets'):
-                paginator = client.get_paginator('describe_fleets')
-                return paginator.paginate(
-                    Names=module.params['names']
-                ), True
-            else:
-                return client.describe_fleets(
-                    Names=module.params['names']
-                ), False
-        elif module.params['describe_stacks']:
-            if client.can_paginate('describe_stacks'):
-                paginator = client.get_paginator('describe_stacks')
-                return paginator.paginate(
-                    Names=module.params['names']
-                ), True
-            else:
-                return client.describe_stacks(
-                    Names=module.params['names']
-                ), False
-        elif module.params['describe_directory_configs']:
-            if client.can_paginate('describe_directory_configs'):
-                paginator = client.get_paginator('describe_directory_configs')
-                return paginator.paginate(
-                    DirectoryNames=module.params['names']
-                ), True
-            else:
-                return client.describe_directory_configs(
-                    DirectoryNames=module.params['names']
-                ), False
-        elif module.params['describe_image_builders']:
-            if client.can_paginate('describe_image_builders'):
-                paginator = client.get_paginator('describe_image_builders')
-                return paginator.paginate(
-                    Names=module.params['names']
-                ), True
-            else:
-                return client.describe_image_builders(
-                    Names=module.params['names']
-                ), False
-        elif module.params['describe_images']:
-            if client.can_paginate('describe_images'):
-                paginator = client.get_paginator('describe_images')
-                return paginator.paginate(
-                    Names=module.params['names'],
-                    Type=module.params['image_type']
-                ), True
-            else:
-                return client.describe_images(
-                    Names=module.params['names'],
-                    Type=module.params['image_type']
-                ), False
-        elif module.params['describe_users']:
-            if client.can_paginate('describe_users'):
-                paginator = client.get_paginator('describe_users')
-                return paginator.paginate(
-                    AuthenticationType=module.params['authentication_type']
-                ), True
-            else:
-                return client.describe_users(
-                    AuthenticationType=module.params['authentication_type']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws appstream details')
+
+def _appstream_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _APPSTREAM_OPERATIONS,
+        error_msg='Failed to fetch aws appstream details',
+    )
 
 
 def main():
@@ -320,8 +268,9 @@ def main():
         authentication_type=dict(required=False, choices=['API', 'SAML', 'USERPOOL'], default='USERPOOL'),
         describe_users=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_fleets', True, ['names']),
@@ -343,23 +292,7 @@ def main():
         ],
     )
 
-    client = module.client('appstream', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _appstream(client, module)
-
-    if module.params['describe_fleets']:
-        module.exit_json(fleets=aws_response_list_parser(paginate, _it, 'Fleets'))
-    elif module.params['describe_stacks']:
-        module.exit_json(stacks=aws_response_list_parser(paginate, _it, 'Stacks'))
-    elif module.params['describe_directory_configs']:
-        module.exit_json(directory_configs=aws_response_list_parser(paginate, _it, 'DirectoryConfigs'))
-    elif module.params['describe_image_builders']:
-        module.exit_json(image_builders=aws_response_list_parser(paginate, _it, 'ImageBuilders'))
-    elif module.params['describe_images']:
-        module.exit_json(images=aws_response_list_parser(paginate, _it, 'Images'))
-    elif module.params['describe_users']:
-        module.exit_json(users=aws_response_list_parser(paginate, _it, 'Users'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'appstream', _appstream_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
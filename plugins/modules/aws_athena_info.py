@@ -45,11 +45,41 @@ options:
       - name of the athena database.
     required: false
     type: str
+  run_query:
+    description:
+      - do you want to run I(query_string) and fetch its result?
+      - query status is polled with backoff until it finishes or I(query_timeout) expires, result pages are fetched one at a time.
+      - values are converted using column types of result, decimals with more than 15 digits stay strings.
+      - result is returned as columns, or with I(dest) every row is written as json object so result isn't kept in memory.
+    required: false
+    type: bool
+  query_string:
+    description:
+      - sql query run by I(run_query), in database I(database_name) of catalog I(name) if given.
+    required: false
+    type: str
+  work_group:
+    description:
+      - athena work group of I(run_query), default work group of account if not given.
+    required: false
+    type: str
+  output_location:
+    description:
+      - s3 location of query result files of I(run_query) example C(s3://bucket/athena/), required if I(work_group) has none.
+    required: false
+    type: str
+  query_timeout:
+    description:
+      - seconds to wait for I(run_query) to finish, query is cancelled after it.
+    required: false
+    type: int
+    default: 900
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -77,6 +107,22 @@ EXAMPLES = """
   aws_athena_info:
     list_work_groups: true
   register: __wg
+
+- name: "run athena query"
+  aws_athena_info:
+    run_query: true
+    query_string: "SELECT elb_name, count(*) AS requests FROM elb_logs GROUP BY elb_name"
+    database_name: 'sampledb'
+    output_location: 's3://test-bucket/athena/'
+  register: __q
+
+- name: "write large athena query result to file"
+  aws_athena_info:
+    run_query: true
+    query_string: "SELECT * FROM elb_logs"
+    database_name: 'sampledb'
+    work_group: 'primary'
+    dest: '/tmp/elb_logs.ndjson'
 """
 
 RETURN = """
@@ -139,59 +185,182 @@ work_groups:
         "state": "ENABLED"
     }
   ]
+
+query_results:
+  description: values of every result column of query by column name, in row order.
+  returned: when I(run_query) and success, without I(dest)
+  type: dict
+  sample: {
+    "elb_name": ["elb_demo_001", "elb_demo_002"],
+    "requests": [10, 12]
+  }
+
+query_execution:
+  description: id, state and statistics of query.
+  returned: when I(run_query) and success
+  type: dict
+  sample: {
+    "query_execution_id": "7b4e8e4c-ffe8-4d8c-8ab7-1f2e1e7c6a51",
+    "state": "SUCCEEDED",
+    "statistics": {
+        "data_scanned_in_bytes": 1024,
+        "engine_execution_time_in_millis": 800,
+        "total_execution_time_in_millis": 950
+    }
+  }
 """
 
+import json
+import time
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_query_results import aws_query_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_dict_to_snake_dict
+
+_QUERY_POLL_INTERVAL = 0.5
+_QUERY_POLL_INTERVAL_MAX = 5.0
+_INT_TYPES = frozenset(('tinyint', 'smallint', 'integer', 'int', 'bigint'))
+_FLOAT_TYPES = frozenset(('double', 'float', 'real'))
+# decimals with more digits aren't exact as float.
+_FLOAT_DIGITS = 15
+
+
+_ATHENA_OPERATIONS = dict(
+    list_databases=aws_list_operation('list_databases', 'databases', 'DatabaseList', CatalogName='name'),
+    list_database_tables=aws_list_operation(
+        'list_table_metadata',
+        'tables',
+        'TableMetadataList',
+        CatalogName='name',
+        DatabaseName='database_name',
+    ),
+    list_work_groups=aws_list_operation('list_work_groups', 'work_groups', 'WorkGroups'),
+)
+
+_ATHENA_LIST_DATA_CATALOGS = aws_list_operation('list_data_catalogs', 'catalogs', 'DataCatalogsSummary')
+
 
+def _column_converter(column: dict):
+    # athena returns every value as string, None keeps it.
+    _type = column.get('Type', 'varchar').lower()
+    if _type in _INT_TYPES:
+        return int
+    if _type in _FLOAT_TYPES:
+        return float
+    if _type == 'boolean':
+        return lambda value: value == 'true'
+    if _type == 'decimal':
+        if column.get('Scale') == 0:
+            return int
+        if column.get('Precision', 38) <= _FLOAT_DIGITS:
+            return float
+    if _type == 'json':
+        return json.loads
+    return None
 
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _athena(module):
+
+def _query_row(converters: list, row: dict) -> list:
+    # null values have no VarCharValue.
+    return [
+        None if 'VarCharValue' not in data else data['VarCharValue'] if converter is None else converter(data['VarCharValue'])
+        for converter, data in zip(converters, row['Data'])
+    ]
+
+
+def _query_execution(athena, module) -> dict:
+    params = dict(QueryString=module.params['query_string'])
+    context = dict((k, module.params[v]) for k, v in (('Catalog', 'name'), ('Database', 'database_name')) if module.params[v])
+    if context:
+        params['QueryExecutionContext'] = context
+    if module.params['work_group']:
+        params['WorkGroup'] = module.params['work_group']
+    if module.params['output_location']:
+        params['ResultConfiguration'] = dict(OutputLocation=module.params['output_location'])
+
+    execution_id = athena.start_query_execution(**params)['QueryExecutionId']
+    deadline = time.monotonic() + module.params['query_timeout']
+    interval = _QUERY_POLL_INTERVAL
+    execution = None
     try:
-        athena = module.client('athena')
-
-        if module.params['list_databases']:
-            if athena.can_paginate('list_databases'):
-                paginator = athena.get_paginator('list_databases')
-                return paginator.paginate(
-                    CatalogName=module.params['name']
-                ), True
-            else:
-                return athena.list_databases(
-                    CatalogName=module.params['name']
-                ), False
-        elif module.params['list_database_tables']:
-            if athena.can_paginate('list_table_metadata'):
-                paginator = athena.get_paginator('list_table_metadata')
-                return paginator.paginate(
-                    CatalogName=module.params['name'],
-                    DatabaseName=module.params['database_name']
-                ), True
-            else:
-                return athena.list_table_metadata(
-                    CatalogName=module.params['name'],
-                    DatabaseName=module.params['database_name']
-                ), False
-        elif module.params['list_work_groups']:
-            if athena.can_paginate('list_work_groups'):
-                paginator = athena.get_paginator('list_work_groups')
-                return paginator.paginate(), True
-            else:
-                return athena.list_work_groups(), False
-        else:
-            if athena.can_paginate('list_data_catalogs'):
-                paginator = athena.get_paginator('list_data_catalogs')
-                return paginator.paginate(), True
-            else:
-                return athena.list_data_catalogs(), False
+        while True:
+            execution = athena.get_query_execution(QueryExecutionId=execution_id)['QueryExecution']
+            if execution['Status']['State'] not in ('QUEUED', 'RUNNING'):
+                break
+            if time.monotonic() > deadline:
+                module.fail_json(msg='athena query {0} did not finish in {1} seconds'.format(execution_id, module.params['query_timeout']))
+            time.sleep(interval)
+            interval = min(interval * 2, _QUERY_POLL_INTERVAL_MAX)
+    finally:
+        # module failed while query runs, don't leave it running and scanning data.
+        if execution is None or execution['Status']['State'] in ('QUEUED', 'RUNNING'):
+            try:
+                athena.stop_query_execution(QueryExecutionId=execution_id)
+            except (BotoCoreError, ClientError):
+                pass
+    if execution['Status']['State'] != 'SUCCEEDED':
+        module.fail_json(msg='athena query {0} ended with state {1}: {2}'.format(
+            execution_id, execution['Status']['State'], execution['Status'].get('StateChangeReason')
+        ))
+    return execution
+
+
+def _query_has_header(execution: dict) -> bool:
+    # DDL and SELECT results start with column labels row, other DML ( INSERT, CTAS ) results don't.
+    if execution.get('StatementType') == 'DDL':
+        return True
+    return execution.get('StatementType') == 'DML' and execution.get('SubstatementType', 'SELECT') == 'SELECT'
+
+
+def _query_pages(athena, module, execution: dict):
+    config = dict(PageSize=module.params['page_size']) if module.params.get('page_size') else {}
+    names = converters = None
+    skip_header = _query_has_header(execution)
+    for page in athena.get_paginator('get_query_results').paginate(QueryExecutionId=execution['QueryExecutionId'], PaginationConfig=config):
+        rows = page['ResultSet'].get('Rows', [])
+        if converters is None:
+            columns = page['ResultSet']['ResultSetMetadata']['ColumnInfo']
+            names = [column['Name'] for column in columns]
+            converters = [_column_converter(column) for column in columns]
+            # header is only first row of first page, data row with same values as labels is kept.
+            if skip_header:
+                rows = rows[1:]
+        yield names, [_query_row(converters, row) for row in rows]
+
+
+def _run_query_result(athena, module) -> dict:
+    try:
+        execution = _query_execution(athena, module)
+        _return = dict(query_results=aws_query_result(_query_pages(athena, module, execution)))
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws athena details')
+        module.fail_json_aws(e, msg='Failed to run aws athena query')
+    _return['query_execution'] = dict(
+        query_execution_id=execution['QueryExecutionId'],
+        state=execution['Status']['State'],
+        statistics=camel_dict_to_snake_dict(execution.get('Statistics', {})),
+    )
+    return _return
+
+
+def _athena_result(athena, module) -> dict:
+    if module.params['run_query']:
+        return _run_query_result(athena, module)
+    return aws_operations_result(
+        athena,
+        module,
+        _ATHENA_OPERATIONS,
+        default=_ATHENA_LIST_DATA_CATALOGS,
+        error_msg='Failed to fetch aws athena details',
+    )
 
 
 def main():
@@ -201,32 +370,30 @@ def main():
         database_name=dict(required=False),
         list_database_tables=dict(required=False, type=bool),
         list_work_groups=dict(required=False, type=bool),
+        run_query=dict(required=False, type=bool),
+        query_string=dict(required=False),
+        work_group=dict(required=False),
+        output_location=dict(required=False),
+        query_timeout=dict(required=False, type=int, default=900),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
             ('list_databases', True, ['name']),
-            ('list_database_tables', True, ['name', 'database_name'])
+            ('list_database_tables', True, ['name', 'database_name']),
+            ('run_query', True, ['query_string']),
         ),
         mutually_exclusive=[
-            ('list_databases', 'list_database_tables', 'list_work_groups'),
+            ('list_databases', 'list_database_tables', 'list_work_groups', 'run_query'),
             ('name', 'list_work_groups'),
             ('database_name', 'list_work_groups')
         ],
     )
 
-    _it, _paginate = _athena(module)
-    if _it is not None:
-        if module.params['list_databases']:
-            module.exit_json(databases=aws_response_list_parser(_paginate, _it, 'DatabaseList'))
-        elif module.params['list_database_tables']:
-            module.exit_json(tables=aws_response_list_parser(_paginate, _it, 'TableMetadataList'))
-        elif module.params['list_work_groups']:
-            module.exit_json(work_groups=aws_response_list_parser(_paginate, _it, 'WorkGroups'))
-        else:
-            module.exit_json(catalogs=aws_response_list_parser(_paginate, _it, 'DataCatalogsSummary'))
+    module.exit_json(**aws_info_run(module, 'athena', _athena_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
@@ -52,6 +52,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -201,64 +202,31 @@ delegations:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_AUDITMANAGER_OPERATIONS = dict(
+    list_assessment_frameworks=aws_list_operation('list_assessment_frameworks', 'framework_metadata_list', 'frameworkMetadataList', frameworkType='type'),
+    list_assessment_reports=aws_list_operation('list_assessment_reports', 'assessment_reports', 'assessmentReports'),
+    list_controls=aws_list_operation('list_controls', 'control_metadata_list', 'controlMetadataList', controlType='type'),
+    list_notifications=aws_list_operation('list_notifications', 'notifications', 'notifications'),
+    list_delegations=aws_list_operation('get_delegations', 'delegations', 'delegations'),
+)
 
-def _auditmanager(client, module):
-    try:
-        if module.params['list_assessment_frameworks']:
-            if client.can_paginate('list_assessment_frameworks'):
-                paginator = client.get_paginator('list_assessment_frameworks')
-                return paginator.paginate(
-                    frameworkType=module.params['type']
-                ), True
-            else:
-                return client.list_assessment_frameworks(
-                    frameworkType=module.params['type']
-                ), False
-        elif module.params['list_assessment_reports']:
-            if client.can_paginate('list_assessment_reports'):
-                paginator = client.get_paginator('list_assessment_reports')
-                return paginator.paginate(), True
-            else:
-                return client.list_assessment_reports(), False
-        elif module.params['list_controls']:
-            if client.can_paginate('list_controls'):
-                paginator = client.get_paginator('list_controls')
-                return paginator.paginate(
-                    controlType=module.params['type']
-                ), True
-            else:
-                return client.list_controls(
-                    controlType=module.params['type']
-                ), False
-        elif module.params['list_notifications']:
-            if client.can_paginate('list_notifications'):
-                paginator = client.get_paginator('list_notifications')
-                return paginator.paginate(), True
-            else:
-                return client.list_notifications(), False
-        elif module.params['list_delegations']:
-            if client.can_paginate('get_delegations'):
-                paginator = client.get_paginator('get_delegations')
-                return paginator.paginate(), True
-            else:
-                return client.get_delegations(), False
-        else:
-            if client.can_paginate('list_assessments'):
-                paginator = client.get_paginator('list_assessments')
-                return paginator.paginate(), True
-            else:
-                return client.list_assessments(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws audit manager details')
+
+def _auditmanager_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _AUDITMANAGER_OPERATIONS,
+        default=aws_list_operation('list_assessments', 'assessments', 'assessmentMetadata'),
+        error_msg='Failed to fetch aws audit manager details',
+    )
 
 
 def main():
@@ -270,8 +238,9 @@ def main():
         list_notifications=dict(required=False, type=bool),
         list_delegations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('list_assessment_frameworks', True, ['type']),
@@ -288,21 +257,7 @@ def main():
         ],
     )
 
-    client = module.client('auditmanager', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _auditmanager(client, module)
-
-    if module.params['list_assessment_frameworks']:
-        module.exit_json(framework_metadata_list=aws_response_list_parser(paginate, _it, 'frameworkMetadataList'))
-    elif module.params['list_assessment_reports']:
-        module.exit_json(assessment_reports=aws_response_list_parser(paginate, _it, 'assessmentReports'))
-    elif module.params['list_controls']:
-        module.exit_json(control_metadata_list=aws_response_list_parser(paginate, _it, 'controlMetadataList'))
-    elif module.params['list_notifications']:
-        module.exit_json(notifications=aws_response_list_parser(paginate, _it, 'notifications'))
-    elif module.params['list_delegations']:
-        module.exit_json(delegations=aws_response_list_parser(paginate, _it, 'delegations'))
-    else:
-        module.exit_json(assessments=aws_response_list_parser(paginate, _it, 'assessmentMetadata'))
+    module.exit_json(**aws_info_run(module, 'auditmanager', _auditmanager_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -85,6 +85,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -266,94 +267,63 @@ scaling_policies:
     ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_AUTOSCALING_OPERATIONS = dict(
+    describe_auto_scaling_groups=aws_list_operation(
+        'describe_auto_scaling_groups',
+        'auto_scaling_groups',
+        'AutoScalingGroups',
+        AutoScalingGroupNames='asg_names',
+    ),
+    describe_auto_scaling_instances=aws_list_operation(
+        'describe_auto_scaling_instances',
+        'auto_scaling_instances',
+        'AutoScalingInstances',
+        InstanceIds='instance_ids',
+    ),
+    describe_launch_configurations=aws_list_operation(
+        'describe_launch_configurations',
+        'launch_configurations',
+        'LaunchConfigurations',
+        LaunchConfigurationNames='launch_config_names',
+    ),
+    describe_load_balancers=aws_list_operation('describe_load_balancers', 'load_balancers', 'LoadBalancers', AutoScalingGroupName='asg_name'),
+    describe_load_balancer_target_groups=aws_list_operation(
+        'describe_load_balancer_target_groups',
+        'load_balancer_target_groups',
+        'LoadBalancerTargetGroups',
+        AutoScalingGroupName='asg_name',
+    ),
+    describe_notification_configurations=aws_list_operation(
+        'describe_notification_configurations',
+        'notification_configurations',
+        'NotificationConfigurations',
+        AutoScalingGroupNames='asg_names',
+    ),
+    describe_policies=aws_list_operation(
+        'describe_policies',
+        'scaling_policies',
+        'ScalingPolicies',
+        AutoScalingGroupName='asg_name',
+        PolicyTypes='policy_types',
+    ),
+)
 
-def _autoscaling(client, module):
-    try:
-        if module.params['describe_auto_scaling_groups']:
-            if client.can_paginate('describe_auto_scaling_groups'):
-                paginator = client.get_paginator('describe_auto_scaling_groups')
-                return paginator.paginate(
-                    AutoScalingGroupNames=module.params['asg_names']
-                ), True
-            else:
-                return client.describe_auto_scaling_groups(
-                    AutoScalingGroupNames=module.params['asg_names']
-                ), False
-        elif module.params['describe_auto_scaling_instances']:
-            if client.can_paginate('describe_auto_scaling_instances'):
-                paginator = client.get_paginator('describe_auto_scaling_instances')
-                return paginator.paginate(
-                    InstanceIds=module.params['instance_ids']
-                ), True
-            else:
-                return client.describe_auto_scaling_instances(
-                    InstanceIds=module.params['instance_ids']
-                ), False
-        elif module.params['describe_launch_configurations']:
-            if client.can_paginate('describe_launch_configurations'):
-                paginator = client.get_paginator('describe_launch_configurations')
-                return paginator.paginate(
-                    LaunchConfigurationNames=module.params['launch_config_names']
-                ), True
-            else:
-                return client.describe_auto_scaling_instances(
-                    LaunchConfigurationNames=module.params['launch_config_names']
-                ), False
-        elif module.params['describe_load_balancers']:
-            if client.can_paginate('describe_load_balancers'):
-                paginator = client.get_paginator('describe_load_balancers')
-                return paginator.paginate(
-                    AutoScalingGroupName=module.params['asg_name']
-                ), True
-            else:
-                return client.describe_load_balancers(
-                    AutoScalingGroupName=module.params['asg_name']
-                ), False
-        elif module.params['describe_load_balancer_target_groups']:
-            if client.can_paginate('describe_load_balancer_target_groups'):
-                paginator = client.get_paginator('describe_load_balancer_target_groups')
-                return paginator.paginate(
-                    AutoScalingGroupName=module.params['asg_name']
-                ), True
-            else:
-                return client.describe_load_balancer_target_groups(
-                    AutoScalingGroupName=module.params['asg_name']
-                ), False
-        elif module.params['describe_notification_configurations']:
-            if client.can_paginate('describe_notification_configurations'):
-                paginator = client.get_paginator('describe_notification_configurations')
-                return paginator.paginate(
-                    AutoScalingGroupNames=module.params['asg_names']
-                ), True
-            else:
-                return client.describe_notification_configurations(
-                    AutoScalingGroupNames=module.params['asg_names']
-                ), False
-        elif module.params['describe_policies']:
-            if client.can_paginate('describe_policies'):
-                paginator = client.get_paginator('describe_policies')
-                return paginator.paginate(
-                    AutoScalingGroupName=module.params['asg_name'],
-                    PolicyTypes=module.params['policy_types'],
-                ), True
-            else:
-                return client.describe_policies(
-                    AutoScalingGroupName=module.params['asg_name'],
-                    PolicyTypes=module.params['policy_types'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws audit manager details')
+
+def _autoscaling_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _AUTOSCALING_OPERATIONS,
+        error_msg='Failed to fetch aws audit manager details',
+    )
 
 
 def main():
@@ -371,8 +341,9 @@ def main():
         describe_notification_configurations=dict(required=False, type=bool),
         describe_policies=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_auto_scaling_groups', True, ['asg_names']),
@@ -396,25 +367,7 @@ def main():
         ],
     )
 
-    client = module.client('autoscaling', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _autoscaling(client, module)
-
-    if module.params['describe_auto_scaling_groups']:
-        module.exit_json(auto_scaling_groups=aws_response_list_parser(paginate, _it, 'AutoScalingGroups'))
-    elif module.params['describe_auto_scaling_instances']:
-        module.exit_json(auto_scaling_instances=aws_response_list_parser(paginate, _it, 'AutoScalingInstances'))
-    elif module.params['describe_launch_configurations']:
-        module.exit_json(launch_configurations=aws_response_list_parser(paginate, _it, 'LaunchConfigurations'))
-    elif module.params['describe_load_balancers']:
-        module.exit_json(load_balancers=aws_response_list_parser(paginate, _it, 'LoadBalancers'))
-    elif module.params['describe_load_balancer_target_groups']:
-        module.exit_json(load_balancer_target_groups=aws_response_list_parser(paginate, _it, 'LoadBalancerTargetGroups'))
-    elif module.params['describe_notification_configurations']:
-        module.exit_json(notification_configurations=aws_response_list_parser(paginate, _it, 'NotificationConfigurations'))
-    elif module.params['describe_policies']:
-        module.exit_json(scaling_policies=aws_response_list_parser(paginate, _it, 'ScalingPolicies'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'autoscaling', _autoscaling_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -130,44 +131,33 @@ scaling_plan_resources:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _autoscaling(client, module):
-    try:
-        if module.params['describe_scaling_plans']:
-            if client.can_paginate('describe_scaling_plans'):
-                paginator = client.get_paginator('describe_scaling_plans')
-                return paginator.paginate(
-                    ScalingPlanNames=module.params['scaling_plan_names']
-                ), True
-            else:
-                return client.describe_scaling_plans(
-                    ScalingPlanNames=module.params['scaling_plan_names']
-                ), False
-        elif module.params['describe_scaling_plan_resources']:
-            if client.can_paginate('describe_scaling_plan_resources'):
-                paginator = client.get_paginator('describe_scaling_plan_resources')
-                return paginator.paginate(
-                    ScalingPlanName=module.params['scaling_plan_name'],
-                    ScalingPlanVersion=module.params['scaling_plan_version'],
-                ), True
-            else:
-                return client.describe_scaling_plan_resources(
-                    ScalingPlanName=module.params['scaling_plan_name'],
-                    ScalingPlanVersion=module.params['scaling_plan_version'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws autoscaling plans details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_AUTOSCALING_OPERATIONS = dict(
+    describe_scaling_plans=aws_list_operation('describe_scaling_plans', 'scaling_plans', 'ScalingPlans', ScalingPlanNames='scaling_plan_names'),
+    describe_scaling_plan_resources=aws_list_operation(
+        'describe_scaling_plan_resources',
+        'scaling_plan_resources',
+        'ScalingPlanResources',
+        ScalingPlanName='scaling_plan_name',
+        ScalingPlanVersion='scaling_plan_version',
+    ),
+)
+
+
+def _autoscaling_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _AUTOSCALING_OPERATIONS,
+        error_msg='Failed to fetch aws autoscaling plans details',
+    )
 
 
 def main():
@@ -178,8 +168,9 @@ def main():
         describe_scaling_plans=dict(required=False, type=bool),
         describe_scaling_plan_resources=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_scaling_plans', True, ['scaling_plan_names']),
@@ -193,15 +184,7 @@ def main():
         ],
     )
 
-    client = module.client('autoscaling-plans', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _autoscaling(client, module)
-
-    if module.params['describe_scaling_plans']:
-        module.exit_json(scaling_plans=aws_response_list_parser(paginate, _it, 'ScalingPlans'))
-    elif module.params['describe_scaling_plan_resources']:
-        module.exit_json(scaling_plan_resources=aws_response_list_parser(paginate, _it, 'ScalingPlanResources'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'autoscaling-plans', _autoscaling_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -126,6 +126,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -173,6 +174,22 @@ EXAMPLES = """
   aws_backup_info:
     list_copy_jobs: true
     list_copy_jobs_by_state: 'COMPLETED'
+
+- name: "go through all backup jobs, 1000 at a time"
+  aws_backup_info:
+    list_backup_jobs: true
+    max_items: 1000
+    starting_token: "{{ __b_jobs_page.next_token | default(omit) }}"
+  register: __b_jobs_page
+  until: __b_jobs_page.next_token is none
+  retries: 1000
+  delay: 0
+
+- name: "write all backup jobs to compressed file instead of result"
+  aws_backup_info:
+    list_backup_jobs: true
+    dest: '/tmp/backup_jobs.ndjson.gz'
+    dest_gzip: true
 """
 
 RETURN = """
@@ -332,114 +349,73 @@ copy_jobs:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_BACKUP_OPERATIONS = dict(
+    list_backup_selections=aws_list_operation(
+        'list_backup_selections',
+        'backup_plan_selections',
+        'BackupSelectionsList',
+        BackupPlanId='backup_plan_id',
+    ),
+    list_backup_plan_versions=aws_list_operation(
+        'list_backup_plan_versions',
+        'backup_plan_versions',
+        'BackupPlanVersionsList',
+        BackupPlanId='backup_plan_id',
+    ),
+    list_backup_plan_templates=aws_list_operation('list_backup_plan_templates', 'backup_plan_templates', 'BackupPlanTemplatesList'),
+    list_backup_vaults=aws_list_operation('list_backup_vaults', 'backup_vaults', 'BackupVaultList'),
+    list_backup_jobs=aws_list_operation(
+        'list_backup_jobs',
+        'backup_jobs',
+        'BackupJobs',
+        ByResourceArn='list_backup_jobs_by_resource_arn',
+        ByState='list_backup_jobs_by_state',
+        ByBackupVaultName='list_backup_jobs_by_backup_vault_name',
+        # TODO: make created after/before parameter work
+        # ByCreatedBefore='list_backup_jobs_by_created_before',
+        # ByCreatedAfter='list_backup_jobs_by_created_after',
+        ByResourceType='list_backup_jobs_by_resource_type',
+        ByAccountId='list_backup_jobs_by_account_id',
+    ),
+    list_copy_jobs=aws_list_operation(
+        'list_copy_jobs',
+        'copy_jobs',
+        'CopyJobs',
+        ByResourceArn='list_copy_jobs_by_resource_arn',
+        ByState='list_copy_jobs_by_state',
+        # TODO: make created after/before parameter work
+        # ByCreatedBefore='list_backup_jobs_by_created_before',
+        # ByCreatedAfter='list_backup_jobs_by_created_after',
+        ByResourceType='list_copy_jobs_by_resource_type',
+        ByAccountId='list_copy_jobs_by_account_id',
+        ByDestinationVaultArn='list_copy_jobs_by_destination_vault_arn',
+    ),
+)
 
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _backup(module):
-    try:
-        backup = module.client('backup')
+_BACKUP_LIST_BACKUP_PLANS = aws_list_operation(
+    'list_backup_plans',
+    'backup_plans',
+    'BackupPlansList',
+    IncludeDeleted='list_backup_plans_include_deleted',
+)
 
-        if module.params['list_backup_selections']:
-            if backup.can_paginate('list_backup_selections'):
-                paginator = backup.get_paginator('list_backup_selections')
-                return paginator.paginate(
-                    BackupPlanId=module.params['backup_plan_id']
-                ), True
-            else:
-                return backup.list_backup_selections(
-                    BackupPlanId=module.params['backup_plan_id']
-                ), False
-        elif module.params['list_backup_plan_versions']:
-            if backup.can_paginate('list_backup_plan_versions'):
-                paginator = backup.get_paginator('list_backup_plan_versions')
-                return paginator.paginate(
-                    BackupPlanId=module.params['backup_plan_id']
-                ), True
-            else:
-                return backup.list_backup_plan_versions(
-                    BackupPlanId=module.params['backup_plan_id']
-                ), False
-        elif module.params['list_backup_plan_templates']:
-            if backup.can_paginate('list_backup_plan_templates'):
-                paginator = backup.get_paginator('list_backup_plan_templates')
-                return paginator.paginate(), True
-            else:
-                return backup.list_backup_plan_templates(), False
-        elif module.params['list_backup_vaults']:
-            if backup.can_paginate('list_backup_vaults'):
-                paginator = backup.get_paginator('list_backup_vaults')
-                return paginator.paginate(), True
-            else:
-                return backup.list_backup_vaults(), False
-        elif module.params['list_backup_jobs']:
-            if backup.can_paginate('list_backup_jobs'):
-                paginator = backup.get_paginator('list_backup_jobs')
-                return paginator.paginate(
-                    ByResourceArn=module.params['list_backup_jobs_by_resource_arn'],
-                    ByState=module.params['list_backup_jobs_by_state'],
-                    ByBackupVaultName=module.params['list_backup_jobs_by_backup_vault_name'],
-                    # TODO: make created after/before parameter work
-                    # ByCreatedBefore=module.params['list_backup_jobs_by_created_before'],
-                    # ByCreatedAfter=module.params['list_backup_jobs_by_created_after'],
-                    ByResourceType=module.params['list_backup_jobs_by_resource_type'],
-                    ByAccountId=module.params['list_backup_jobs_by_account_id']
-                ), True
-            else:
-                return backup.list_backup_jobs(
-                    ByResourceArn=module.params['list_backup_jobs_by_resource_arn'],
-                    ByState=module.params['list_backup_jobs_by_state'],
-                    ByBackupVaultName=module.params['list_backup_jobs_by_backup_vault_name'],
-                    # TODO: make created after/before parameter work
-                    # ByCreatedBefore=module.params['list_backup_jobs_by_created_before'],
-                    # ByCreatedAfter=module.params['list_backup_jobs_by_created_after'],
-                    ByResourceType=module.params['list_backup_jobs_by_resource_type'],
-                    ByAccountId=module.params['list_backup_jobs_by_account_id']
-                ), False
-        elif module.params['list_copy_jobs']:
-            if backup.can_paginate('list_copy_jobs'):
-                paginator = backup.get_paginator('list_copy_jobs')
-                return paginator.paginate(
-                    ByResourceArn=module.params['list_copy_jobs_by_resource_arn'],
-                    ByState=module.params['list_copy_jobs_by_state'],
-                    # TODO: make created after/before parameter work
-                    # ByCreatedBefore=module.params['list_backup_jobs_by_created_before'],
-                    # ByCreatedAfter=module.params['list_backup_jobs_by_created_after'],
-                    ByResourceType=module.params['list_copy_jobs_by_resource_type'],
-                    ByAccountId=module.params['list_copy_jobs_by_account_id'],
-                    ByDestinationVaultArn=module.params['list_copy_jobs_by_destination_vault_arn']
-                ), True
-            else:
-                return backup.list_copy_jobs(
-                    ByResourceArn=module.params['list_copy_jobs_by_resource_arn'],
-                    ByState=module.params['list_copy_jobs_by_state'],
-                    # TODO: make created after/before parameter work
-                    # ByCreatedBefore=module.params['list_backup_jobs_by_created_before'],
-                    # ByCreatedAfter=module.params['list_backup_jobs_by_created_after'],
-                    ByResourceType=module.params['list_copy_jobs_by_resource_type'],
-                    ByAccountId=module.params['list_copy_jobs_by_account_id'],
-                    ByDestinationVaultArn=module.params['list_copy_jobs_by_destination_vault_arn']
-                ), False
-        else:
-            if backup.can_paginate('list_backup_plans'):
-                paginator = backup.get_paginator('list_backup_plans')
-                return paginator.paginate(
-                    IncludeDeleted=module.params['list_backup_plans_include_deleted']
-                ), True
-            else:
-                return backup.list_backup_plans(
-                    IncludeDeleted=module.params['list_backup_plans_include_deleted']
-                ), False
 
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws backup details')
+def _backup_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _BACKUP_OPERATIONS,
+        default=_BACKUP_LIST_BACKUP_PLANS,
+        error_msg='Failed to fetch aws backup details',
+    )
 
 
 def main():
@@ -471,8 +447,9 @@ def main():
         list_copy_jobs_by_account_id=dict(required=False, default=''),
         list_copy_jobs_by_destination_vault_arn=dict(required=False, default=''),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -518,23 +495,7 @@ def main():
         ],
     )
 
-    _it, _paginate = _backup(module)
-    if _it is not None:
-        if module.params['backup_plan_id'] is not None:
-            if module.params['list_backup_selections']:
-                module.exit_json(backup_plan_selections=aws_response_list_parser(_paginate, _it, 'BackupSelectionsList'))
-            elif module.params['list_backup_plan_versions']:
-                module.exit_json(backup_plan_versions=aws_response_list_parser(_paginate, _it, 'BackupPlanVersionsList'))
-        elif module.params['list_backup_plan_templates']:
-            module.exit_json(backup_plan_templates=aws_response_list_parser(_paginate, _it, 'BackupPlanTemplatesList'))
-        elif module.params['list_backup_vaults']:
-            module.exit_json(backup_vaults=aws_response_list_parser(_paginate, _it, 'BackupVaultList'))
-        elif module.params['list_backup_jobs']:
-            module.exit_json(backup_jobs=aws_response_list_parser(_paginate, _it, 'BackupJobs'))
-        elif module.params['list_copy_jobs']:
-            module.exit_json(copy_jobs=aws_response_list_parser(_paginate, _it, 'CopyJobs'))
-        else:
-            module.exit_json(backup_plans=aws_response_list_parser(_paginate, _it, 'BackupPlansList'))
+    module.exit_json(**aws_info_run(module, 'backup', _backup_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
@@ -93,6 +93,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -234,76 +235,41 @@ compute_environments:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_BATCH_OPERATIONS = dict(
+    list_jobs=aws_list_operation('list_jobs', 'job_summary_list', 'jobSummaryList', jobQueue='job_queue', jobStatus='job_status'),
+    describe_jobs=aws_list_operation('describe_jobs', 'jobs', 'jobs', jobs='job_ids'),
+    describe_job_queues=aws_list_operation('describe_job_queues', 'job_queues', 'jobQueues', jobQueues='job_queues'),
+    describe_job_definitions=aws_list_operation(
+        'describe_job_definitions',
+        'job_definitions',
+        'jobDefinitions',
+        jobDefinitions='job_definition_arns',
+        status='job_definition_status',
+    ),
+    describe_compute_environments=aws_list_operation(
+        'describe_compute_environments',
+        'compute_environments',
+        'computeEnvironments',
+        computeEnvironments='compute_environment_arns',
+    ),
+)
 
-def _batch(client, module):
-    try:
-        if module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    jobQueue=module.params['job_queue'],
-                    jobStatus=module.params['job_status'],
-                ), True
-            else:
-                return client.list_jobs(
-                    jobQueue=module.params['job_queue'],
-                    jobStatus=module.params['job_status'],
-                ), False
-        elif module.params['describe_jobs']:
-            if client.can_paginate('describe_jobs'):
-                paginator = client.get_paginator('describe_jobs')
-                return paginator.paginate(
-                    jobs=module.params['job_ids'],
-                ), True
-            else:
-                return client.describe_jobs(
-                    jobs=module.params['job_ids'],
-                ), False
-        elif module.params['describe_job_queues']:
-            if client.can_paginate('describe_job_queues'):
-                paginator = client.get_paginator('describe_job_queues')
-                return paginator.paginate(
-                    jobQueues=module.params['job_queues'],
-                ), True
-            else:
-                return client.describe_job_queues(
-                    jobQueues=module.params['job_queues'],
-                ), False
-        elif module.params['describe_job_definitions']:
-            if client.can_paginate('describe_job_definitions'):
-                paginator = client.get_paginator('describe_job_definitions')
-                return paginator.paginate(
-                    jobDefinitions=module.params['job_definition_arns'],
-                    status=module.params['job_definition_status'],
-                ), True
-            else:
-                return client.describe_job_definitions(
-                    jobDefinitions=module.params['job_definition_arns'],
-                    status=module.params['job_definition_status'],
-                ), False
-        elif module.params['describe_compute_environments']:
-            if client.can_paginate('describe_compute_environments'):
-                paginator = client.get_paginator('describe_compute_environments')
-                return paginator.paginate(
-                    computeEnvironments=module.params['compute_environment_arns'],
-                ), True
-            else:
-                return client.describe_compute_environments(
-                    computeEnvironments=module.params['compute_environment_arns'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws batch details')
+
+def _batch_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _BATCH_OPERATIONS,
+        error_msg='Failed to fetch aws batch details',
+    )
 
 
 def main():
@@ -325,8 +291,9 @@ def main():
         describe_job_definitions=dict(required=False, type=bool),
         describe_compute_environments=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('list_jobs', True, ['job_queue']),
@@ -343,21 +310,7 @@ def main():
         ],
     )
 
-    client = module.client('batch', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _batch(client, module)
-
-    if module.params['list_jobs']:
-        module.exit_json(job_summary_list=aws_response_list_parser(paginate, _it, 'jobSummaryList'))
-    elif module.params['describe_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, _it, 'jobs'))
-    elif module.params['describe_job_queues']:
-        module.exit_json(job_queues=aws_response_list_parser(paginate, _it, 'jobQueues'))
-    elif module.params['describe_job_definitions']:
-        module.exit_json(job_definitions=aws_response_list_parser(paginate, _it, 'jobDefinitions'))
-    elif module.params['describe_compute_environments']:
-        module.exit_json(compute_environments=aws_response_list_parser(paginate, _it, 'computeEnvironments'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'batch', _batch_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
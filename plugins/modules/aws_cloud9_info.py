@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -120,57 +121,30 @@ memberships:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cloud9(client, module):
-    try:
-        if module.params['describe_environments']:
-            if client.can_paginate('describe_environments'):
-                paginator = client.get_paginator('describe_environments')
-                return paginator.paginate(
-                    environmentIds=module.params['environment_ids']
-                ), True
-            else:
-                return client.describe_environments(
-                    environmentIds=module.params['environment_ids']
-                ), False
-        elif module.params['describe_environment_status']:
-            if client.can_paginate('describe_environment_status'):
-                paginator = client.get_paginator('describe_environment_status')
-                return paginator.paginate(
-                    environmentId=module.params['environment_id']
-                ), True
-            else:
-                return client.describe_environment_status(
-                    environmentId=module.params['environment_id']
-                ), False
-        elif module.params['describe_environment_memberships']:
-            if client.can_paginate('describe_environment_memberships'):
-                paginator = client.get_paginator('describe_environment_memberships')
-                return paginator.paginate(
-                    environmentId=module.params['environment_id']
-                ), True
-            else:
-                return client.describe_environment_memberships(
-                    environmentId=module.params['environment_id']
-                ), False
-        else:
-            if client.can_paginate('list_environments'):
-                paginator = client.get_paginator('list_environments')
-                return paginator.paginate(), True
-            else:
-                return client.list_environments(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloud9 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CLOUD9_OPERATIONS = dict(
+    describe_environments=aws_list_operation('describe_environments', 'environments', 'environments', environmentIds='environment_ids'),
+    describe_environment_status=aws_dict_operation('describe_environment_status', 'status', environmentId='environment_id'),
+    describe_environment_memberships=aws_list_operation('describe_environment_memberships', 'memberships', 'memberships', environmentId='environment_id'),
+)
+
+
+def _cloud9_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUD9_OPERATIONS,
+        default=aws_list_operation('list_environments', 'environment_ids', 'environmentIds'),
+        error_msg='Failed to fetch aws cloud9 details',
+    )
 
 
 def main():
@@ -181,8 +155,9 @@ def main():
         describe_environment_status=dict(required=False, type=bool),
         describe_environment_memberships=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_environments', True, ['environment_ids']),
@@ -198,17 +173,7 @@ def main():
         ],
     )
 
-    client = module.client('cloud9', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloud9(client, module)
-
-    if module.params['describe_environments']:
-        module.exit_json(environments=aws_response_list_parser(paginate, _it, 'environments'))
-    elif module.params['describe_environment_status']:
-        module.exit_json(status=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_environment_memberships']:
-        module.exit_json(memberships=aws_response_list_parser(paginate, _it, 'memberships'))
-    else:
-        module.exit_json(environment_ids=aws_response_list_parser(paginate, _it, 'environmentIds'))
+    module.exit_json(**aws_info_run(module, 'cloud9', _cloud9_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
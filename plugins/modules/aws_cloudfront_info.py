@@ -77,6 +77,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -104,11 +105,22 @@ EXAMPLES = """
   aws_cloudfront_info:
     list_field_level_encryption_profiles: true
 
-- name: "list of all field level encryption profiles"
+- name: "list of invalidations of distribution"
   aws_cloudfront_info:
     id: "{{ _dl.distribution_list[0].id }}"
     list_invalidations: true
 
+- name: "invalidations created or changed since last run"
+  aws_cloudfront_info:
+    id: "{{ _dl.distribution_list[0].id }}"
+    list_invalidations: true
+    since_state: "/var/lib/ansible/cloudfront_invalidations.json"
+  register: _invalidations
+
+- name: "new invalidations"
+  debug:
+    msg: "{{ _invalidations.invalidation_list.added }}"
+
 - name: "list of all key groups"
   aws_cloudfront_info:
     list_key_groups: true
@@ -294,118 +306,61 @@ streaming_distribution_list:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_nested_list_operation
 
 
-def aws_cloudfornt_parser(paginate: bool, iterator, resource_field: str, nested_resource_field: str) -> list:
-    _return = []
-    __l_list = []
+_CLOUDFRONT_OPERATIONS = dict(
+    list_cache_policies=aws_nested_list_operation('list_cache_policies', 'cache_policy_list', 'CachePolicyList', 'Items', Type='type'),
+    list_cloud_front_origin_access_identities=aws_nested_list_operation(
+        'list_cloud_front_origin_access_identities',
+        'cloud_front_origin_access_identity_list',
+        'CloudFrontOriginAccessIdentityList',
+        'Items',
+    ),
+    list_field_level_encryption_configs=aws_nested_list_operation(
+        'list_field_level_encryption_configs',
+        'field_level_encryption_list',
+        'FieldLevelEncryptionList',
+        'Items',
+    ),
+    list_field_level_encryption_profiles=aws_nested_list_operation(
+        'list_field_level_encryption_profiles',
+        'field_level_encryption_profile_list',
+        'FieldLevelEncryptionProfileList',
+        'Items',
+    ),
+    list_invalidations=aws_nested_list_operation('list_invalidations', 'invalidation_list', 'InvalidationList', 'Items', DistributionId='id'),
+    list_key_groups=aws_nested_list_operation('list_key_groups', 'key_group_list', 'KeyGroupList', 'Items'),
+    list_origin_request_policies=aws_nested_list_operation(
+        'list_origin_request_policies',
+        'origin_request_policy_list',
+        'OriginRequestPolicyList',
+        'Items',
+        Type='type',
+    ),
+    list_public_keys=aws_nested_list_operation('list_public_keys', 'public_key_list', 'PublicKeyList', 'Items'),
+    list_streaming_distributions=aws_nested_list_operation(
+        'list_streaming_distributions',
+        'streaming_distribution_list',
+        'StreamingDistributionList',
+        'Items',
+    ),
+)
 
-    try:
-        if paginate:
-            for app in iterator:
-                __l_list += app[resource_field][nested_resource_field]
 
-            iterator = {
-                resource_field: __l_list
-            }
-
-            for _app in iterator[resource_field]:
-                _return.append(camel_dict_to_snake_dict(_app))
-        else:
-            for item in iterator[resource_field][nested_resource_field]:
-                _return.append(camel_dict_to_snake_dict(item))
-    except KeyError:
-        # no need to handle empty response from aws
-        # or
-        # nested_resource_field is missing
-        pass
-    return _return
-
-
-def _cloudfront(client, module) -> tuple:
-    try:
-        if module.params['list_cache_policies']:
-            if client.can_paginate('list_cache_policies'):
-                paginator = client.get_paginator('list_cache_policies')
-                return paginator.paginate(
-                    Type=module.params['type']
-                ), True
-            else:
-                return client.list_cache_policies(
-                    Type=module.params['type']
-                ), False
-        elif module.params['list_cloud_front_origin_access_identities']:
-            if client.can_paginate('list_cloud_front_origin_access_identities'):
-                paginator = client.get_paginator('list_cloud_front_origin_access_identities')
-                return paginator.paginate(), True
-            else:
-                return client.list_cloud_front_origin_access_identities(), False
-        elif module.params['list_field_level_encryption_configs']:
-            if client.can_paginate('list_field_level_encryption_configs'):
-                paginator = client.get_paginator('list_field_level_encryption_configs')
-                return paginator.paginate(), True
-            else:
-                return client.list_field_level_encryption_configs(), False
-        elif module.params['list_field_level_encryption_profiles']:
-            if client.can_paginate('list_field_level_encryption_profiles'):
-                paginator = client.get_paginator('list_field_level_encryption_profiles')
-                return paginator.paginate(), True
-            else:
-                return client.list_field_level_encryption_profiles(), False
-        elif module.params['list_invalidations']:
-            if client.can_paginate('list_invalidations'):
-                paginator = client.get_paginator('list_invalidations')
-                return paginator.paginate(
-                    DistributionId=module.params['id']
-                ), True
-            else:
-                return client.list_invalidations(
-                    DistributionId=module.params['id']
-                ), False
-        elif module.params['list_key_groups']:
-            if client.can_paginate('list_key_groups'):
-                paginator = client.get_paginator('list_key_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_key_groups(), False
-        elif module.params['list_origin_request_policies']:
-            if client.can_paginate('list_origin_request_policies'):
-                paginator = client.get_paginator('list_origin_request_policies')
-                return paginator.paginate(
-                    Type=module.params['type']
-                ), True
-            else:
-                return client.list_origin_request_policies(
-                    Type=module.params['type']
-                ), False
-        elif module.params['list_public_keys']:
-            if client.can_paginate('list_public_keys'):
-                paginator = client.get_paginator('list_public_keys')
-                return paginator.paginate(), True
-            else:
-                return client.list_public_keys(), False
-        elif module.params['list_streaming_distributions']:
-            if client.can_paginate('list_streaming_distributions'):
-                paginator = client.get_paginator('list_streaming_distributions')
-                return paginator.paginate(), True
-            else:
-                return client.list_streaming_distributions(), False
-        else:
-            if client.can_paginate('list_distributions'):
-                paginator = client.get_paginator('list_distributions')
-                return paginator.paginate(), True
-            else:
-                return client.list_distributions(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloudfront details')
+def _cloudfront_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUDFRONT_OPERATIONS,
+        default=aws_nested_list_operation('list_distributions', 'distribution_list', 'DistributionList', 'Items'),
+        error_msg='Failed to fetch aws cloudfront details',
+    )
 
 
 def main():
@@ -422,8 +377,9 @@ def main():
         list_public_keys=dict(required=False, type=bool),
         list_streaming_distributions=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('list_cache_policies', True, ['type']),
@@ -445,36 +401,7 @@ def main():
         ],
     )
 
-    client = module.client('cloudfront', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudfront(client, module)
-
-    if module.params['list_cache_policies']:
-        module.exit_json(cache_policy_list=aws_cloudfornt_parser(paginate, _it, 'CachePolicyList', 'Items'))
-    elif module.params['list_cloud_front_origin_access_identities']:
-        module.exit_json(
-            cloud_front_origin_access_identity_list=aws_cloudfornt_parser(
-                paginate,
-                _it,
-                'CloudFrontOriginAccessIdentityList',
-                'Items'
-            )
-        )
-    elif module.params['list_field_level_encryption_configs']:
-        module.exit_json(field_level_encryption_list=aws_cloudfornt_parser(paginate, _it, 'FieldLevelEncryptionList', 'Items'))
-    elif module.params['list_field_level_encryption_profiles']:
-        module.exit_json(field_level_encryption_profile_list=aws_cloudfornt_parser(paginate, _it, 'FieldLevelEncryptionProfileList', 'Items'))
-    elif module.params['list_invalidations']:
-        module.exit_json(invalidation_list=aws_cloudfornt_parser(paginate, _it, 'InvalidationList', 'Items'))
-    elif module.params['list_key_groups']:
-        module.exit_json(key_group_list=aws_cloudfornt_parser(paginate, _it, 'KeyGroupList', 'Items'))
-    elif module.params['list_origin_request_policies']:
-        module.exit_json(origin_request_policy_list=aws_cloudfornt_parser(paginate, _it, 'OriginRequestPolicyList', 'Items'))
-    elif module.params['list_public_keys']:
-        module.exit_json(public_key_list=aws_cloudfornt_parser(paginate, _it, 'PublicKeyList', 'Items'))
-    elif module.params['list_streaming_distributions']:
-        module.exit_json(streaming_distribution_list=aws_cloudfornt_parser(paginate, _it, 'StreamingDistributionList', 'Items'))
-    else:
-        module.exit_json(distribution_list=aws_cloudfornt_parser(paginate, _it, 'DistributionList', 'Items'))
+    module.exit_json(**aws_info_run(module, 'cloudfront', _cloudfront_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
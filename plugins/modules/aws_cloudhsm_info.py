@@ -62,6 +62,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -178,58 +179,33 @@ luna_client:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cloudhsm(client, module):
-    try:
-        if module.params['list_hsms']:
-            if client.can_paginate('list_hsms'):
-                paginator = client.get_paginator('list_hsms')
-                return paginator.paginate(), True
-            else:
-                return client.list_hsms(), False
-        elif module.params['list_hapgs']:
-            if client.can_paginate('list_hapgs'):
-                paginator = client.get_paginator('list_hapgs')
-                return paginator.paginate(), True
-            else:
-                return client.list_hapgs(), False
-        elif module.params['list_luna_clients']:
-            if client.can_paginate('list_luna_clients'):
-                paginator = client.get_paginator('list_luna_clients')
-                return paginator.paginate(), True
-            else:
-                return client.list_luna_clients(), False
-        elif module.params['describe_hapg']:
-            return client.describe_hapg(
-                HapgArn=module.params['arn']
-            ), False
-        elif module.params['describe_hsm']:
-            return client.describe_hsm(
-                HsmArn=module.params['arn'],
-            ), False
-        elif module.params['describe_luna_client']:
-            return client.describe_luna_client(
-                ClientArn=module.params['arn'],
-                CertificateFingerprint=module.params['certificate_fingerprint'],
-            ), False
-        else:
-            if client.can_paginate('list_available_zones'):
-                paginator = client.get_paginator('list_available_zones')
-                return paginator.paginate(), True
-            else:
-                return client.list_available_zones(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloudhsm details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CLOUDHSM_OPERATIONS = dict(
+    list_hsms=aws_list_operation('list_hsms', 'hsm_list', 'HsmList'),
+    list_hapgs=aws_list_operation('list_hapgs', 'hapg_list', 'HapgList'),
+    list_luna_clients=aws_list_operation('list_luna_clients', 'luna_client_list', 'ClientList'),
+    describe_hapg=aws_dict_operation('describe_hapg', 'hapg', HapgArn='arn'),
+    describe_hsm=aws_dict_operation('describe_hsm', 'hsm', HsmArn='arn'),
+    describe_luna_client=aws_dict_operation('describe_luna_client', 'luna_client', ClientArn='arn', CertificateFingerprint='certificate_fingerprint'),
+)
+
+
+def _cloudhsm_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUDHSM_OPERATIONS,
+        default=aws_list_operation('list_available_zones', 'az_list', 'AZList'),
+        error_msg='Failed to fetch aws cloudhsm details',
+    )
 
 
 def main():
@@ -243,8 +219,9 @@ def main():
         describe_hsm=dict(required=False, type=bool),
         describe_luna_client=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_hapg', True, ['arn']),
@@ -263,23 +240,7 @@ def main():
         ],
     )
 
-    client = module.client('cloudhsm', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudhsm(client, module)
-
-    if module.params['list_hsms']:
-        module.exit_json(hsm_list=aws_response_list_parser(paginate, _it, 'HsmList'))
-    elif module.params['list_hapgs']:
-        module.exit_json(hapg_list=aws_response_list_parser(paginate, _it, 'HapgList'))
-    elif module.params['list_luna_clients']:
-        module.exit_json(luna_client_list=aws_response_list_parser(paginate, _it, 'ClientList'))
-    elif module.params['describe_hapg']:
-        module.exit_json(hapg=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_hsm']:
-        module.exit_json(hsm=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_luna_client']:
-        module.exit_json(luna_client=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(az_list=aws_response_list_parser(paginate, _it, 'AZList'))
+    module.exit_json(**aws_info_run(module, 'cloudhsm', _cloudhsm_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -97,52 +98,27 @@ backups:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cloudhsm(client, module):
-    try:
-        if module.params['describe_clusters']:
-            if client.can_paginate('describe_clusters'):
-                paginator = client.get_paginator('describe_clusters')
-                return paginator.paginate(
-                    Filters={
-                        'clusterIds': module.params['cluster_ids']
-                    }
-                ), True
-            else:
-                return client.describe_clusters(
-                    Filters={
-                        'clusterIds': module.params['cluster_ids']
-                    }
-                ), False
-        elif module.params['describe_backups']:
-            if client.can_paginate('describe_backups'):
-                paginator = client.get_paginator('describe_backups')
-                return paginator.paginate(
-                    Filters={
-                        'clusterIds': module.params['cluster_ids']
-                    },
-                    SortAscending=True
-                ), True
-            else:
-                return client.describe_backups(
-                    Filters={
-                        'clusterIds': module.params['cluster_ids']
-                    },
-                    SortAscending=True
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloudhsm v2 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CLOUDHSM_OPERATIONS = dict(
+    describe_clusters=aws_list_operation('describe_clusters', 'clusters', 'Clusters', Filters={'clusterIds': 'cluster_ids'}),
+    describe_backups=aws_list_operation('describe_backups', 'backups', 'Backups', Filters={'clusterIds': 'cluster_ids'}, SortAscending=True),
+)
+
+
+def _cloudhsm_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUDHSM_OPERATIONS,
+        error_msg='Failed to fetch aws cloudhsm v2 details',
+    )
 
 
 def main():
@@ -151,8 +127,9 @@ def main():
         describe_clusters=dict(required=False, type=bool),
         describe_backups=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_clusters', True, ['cluster_ids']),
@@ -161,15 +138,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('cloudhsmv2', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudhsm(client, module)
-
-    if module.params['describe_clusters']:
-        module.exit_json(clusters=aws_response_list_parser(paginate, _it, 'Clusters'))
-    elif module.params['describe_backups']:
-        module.exit_json(backups=aws_response_list_parser(paginate, _it, 'Backups'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'cloudhsmv2', _cloudhsm_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
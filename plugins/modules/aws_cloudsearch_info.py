@@ -106,6 +106,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -350,139 +351,82 @@ suggesters:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_CLOUDSEARCH_OPERATIONS = dict(
+    describe_analysis_schemes=aws_list_operation(
+        'describe_analysis_schemes',
+        'analysis_schemes',
+        'AnalysisSchemes',
+        DomainName='domain_name',
+        AnalysisSchemeNames='analysis_scheme_names',
+        Deployed='deployed',
+    ),
+    describe_availability_options=aws_dict_operation(
+        'describe_availability_options',
+        'availability_options',
+        'AvailabilityOptions',
+        DomainName='domain_name',
+        Deployed='deployed',
+    ),
+    describe_domain_endpoint_options=aws_dict_operation(
+        'describe_domain_endpoint_options',
+        'domain_endpoint_options',
+        'DomainEndpointOptions',
+        DomainName='domain_name',
+        Deployed='deployed',
+    ),
+    describe_domains=aws_list_operation('describe_domains', 'domain_status_list', 'DomainStatusList', DomainNames='domain_names'),
+    describe_expressions=aws_list_operation(
+        'describe_expressions',
+        'expressions',
+        'Expressions',
+        DomainName='domain_name',
+        Deployed='deployed',
+        ExpressionNames='expression_names',
+    ),
+    describe_index_fields=aws_list_operation(
+        'describe_index_fields',
+        'index_fields',
+        'IndexFields',
+        DomainName='domain_name',
+        Deployed='deployed',
+        FieldNames='field_names',
+    ),
+    describe_scaling_parameters=aws_dict_operation('describe_scaling_parameters', 'scaling_parameters', 'ScalingParameters', DomainName='domain_name'),
+    describe_service_access_policies=aws_dict_operation(
+        'describe_service_access_policies',
+        'access_policies',
+        'AccessPolicies',
+        DomainName='domain_name',
+        Deployed='deployed',
+    ),
+    describe_suggesters=aws_list_operation(
+        'describe_suggesters',
+        'suggesters',
+        'Suggesters',
+        DomainName='domain_name',
+        Deployed='deployed',
+        SuggesterNames='suggester_names',
+    ),
+)
 
-def _cloudsearch(client, module):
-    try:
-        if module.params['describe_analysis_schemes']:
-            if client.can_paginate('describe_analysis_schemes'):
-                paginator = client.get_paginator('describe_analysis_schemes')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    AnalysisSchemeNames=module.params['analysis_scheme_names'],
-                    Deployed=module.params['deployed'],
-                ), True
-            else:
-                return client.describe_analysis_schemes(
-                    DomainName=module.params['domain_name'],
-                    AnalysisSchemeNames=module.params['analysis_scheme_names'],
-                    Deployed=module.params['deployed'],
-                ), False
-        elif module.params['describe_availability_options']:
-            if client.can_paginate('describe_availability_options'):
-                paginator = client.get_paginator('describe_availability_options')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                ), True
-            else:
-                return client.describe_availability_options(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                ), False
-        elif module.params['describe_domain_endpoint_options']:
-            if client.can_paginate('describe_domain_endpoint_options'):
-                paginator = client.get_paginator('describe_domain_endpoint_options')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                ), True
-            else:
-                return client.describe_domain_endpoint_options(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                ), False
-        elif module.params['describe_domains']:
-            if client.can_paginate('describe_domains'):
-                paginator = client.get_paginator('describe_domains')
-                return paginator.paginate(
-                    DomainNames=module.params['domain_names'],
-                ), True
-            else:
-                return client.describe_domains(
-                    DomainNames=module.params['domain_names'],
-                ), False
-        elif module.params['describe_expressions']:
-            if client.can_paginate('describe_expressions'):
-                paginator = client.get_paginator('describe_expressions')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                    ExpressionNames=module.params['expression_names'],
-                ), True
-            else:
-                return client.describe_expressions(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                    ExpressionNames=module.params['expression_names'],
-                ), False
-        elif module.params['describe_index_fields']:
-            if client.can_paginate('describe_index_fields'):
-                paginator = client.get_paginator('describe_index_fields')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                    FieldNames=module.params['field_names'],
-                ), True
-            else:
-                return client.describe_index_fields(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                    FieldNames=module.params['field_names'],
-                ), False
-        elif module.params['describe_scaling_parameters']:
-            if client.can_paginate('describe_scaling_parameters'):
-                paginator = client.get_paginator('describe_scaling_parameters')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                ), True
-            else:
-                return client.describe_scaling_parameters(
-                    DomainName=module.params['domain_name'],
-                ), False
-        elif module.params['describe_service_access_policies']:
-            if client.can_paginate('describe_service_access_policies'):
-                paginator = client.get_paginator('describe_service_access_policies')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                ), True
-            else:
-                return client.describe_service_access_policies(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                ), False
-        elif module.params['describe_suggesters']:
-            if client.can_paginate('describe_suggesters'):
-                paginator = client.get_paginator('describe_suggesters')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                    SuggesterNames=module.params['suggester_names'],
-                ), True
-            else:
-                return client.describe_suggesters(
-                    DomainName=module.params['domain_name'],
-                    Deployed=module.params['deployed'],
-                    SuggesterNames=module.params['suggester_names'],
-                ), False
-        else:
-            if client.can_paginate('list_domain_names'):
-                paginator = client.get_paginator('list_domain_names')
-                return paginator.paginate(), True
-            else:
-                return client.list_domain_names(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloudsearch details')
+
+def _cloudsearch_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUDSEARCH_OPERATIONS,
+        default=aws_dict_operation('list_domain_names', 'domain_names', 'DomainNames'),
+        error_msg='Failed to fetch aws cloudsearch details',
+    )
 
 
 def main():
@@ -504,8 +448,9 @@ def main():
         describe_service_access_policies=dict(required=False, type=bool),
         describe_suggesters=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=[
             ('describe_analysis_schemes', True, ['domain_name', 'analysis_scheme_names']),
@@ -533,29 +478,7 @@ def main():
         ],
     )
 
-    client = module.client('cloudsearch', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudsearch(client, module)
-
-    if module.params['describe_analysis_schemes']:
-        module.exit_json(analysis_schemes=aws_response_list_parser(paginate, _it, 'AnalysisSchemes'))
-    elif module.params['describe_availability_options']:
-        module.exit_json(availability_options=camel_dict_to_snake_dict(_it['AvailabilityOptions']))
-    elif module.params['describe_domain_endpoint_options']:
-        module.exit_json(domain_endpoint_options=camel_dict_to_snake_dict(_it['DomainEndpointOptions']))
-    elif module.params['describe_domains']:
-        module.exit_json(domain_status_list=aws_response_list_parser(paginate, _it, 'DomainStatusList'))
-    elif module.params['describe_expressions']:
-        module.exit_json(expressions=aws_response_list_parser(paginate, _it, 'Expressions'))
-    elif module.params['describe_index_fields']:
-        module.exit_json(index_fields=aws_response_list_parser(paginate, _it, 'IndexFields'))
-    elif module.params['describe_scaling_parameters']:
-        module.exit_json(scaling_parameters=camel_dict_to_snake_dict(_it['ScalingParameters']))
-    elif module.params['describe_service_access_policies']:
-        module.exit_json(access_policies=camel_dict_to_snake_dict(_it['AccessPolicies']))
-    elif module.params['describe_suggesters']:
-        module.exit_json(suggesters=aws_response_list_parser(paginate, _it, 'Suggesters'))
-    else:
-        module.exit_json(domain_names=camel_dict_to_snake_dict(_it['DomainNames']))
+    module.exit_json(**aws_info_run(module, 'cloudsearch', _cloudsearch_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
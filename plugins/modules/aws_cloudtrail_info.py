@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -153,43 +154,31 @@ event_selector:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cloudtrail(client, module):
-    try:
-        if module.params['get_trail']:
-            return client.get_trail(
-                Name=module.params['name']
-            ), False
-        elif module.params['get_trail_status']:
-            return client.get_trail_status(
-                Name=module.params['name']
-            ), False
-        elif module.params['get_insight_selectors']:
-            return client.get_insight_selectors(
-                TrailName=module.params['name']
-            ), False
-        elif module.params['get_event_selectors']:
-            return client.get_event_selectors(
-                TrailName=module.params['name']
-            ), False
-        else:
-            if client.can_paginate('list_trails'):
-                paginator = client.get_paginator('list_trails')
-                return paginator.paginate(), True
-            else:
-                return client.list_trails(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloudtrail details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CLOUDTRAIL_OPERATIONS = dict(
+    get_trail=aws_dict_operation('get_trail', 'trail', 'Trail', Name='name'),
+    get_trail_status=aws_dict_operation('get_trail_status', 'status', Name='name'),
+    get_insight_selectors=aws_dict_operation('get_insight_selectors', 'insight_selector', TrailName='name'),
+    get_event_selectors=aws_dict_operation('get_event_selectors', 'event_selector', TrailName='name'),
+)
+
+
+def _cloudtrail_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUDTRAIL_OPERATIONS,
+        default=aws_list_operation('list_trails', 'trails', 'Trails'),
+        error_msg='Failed to fetch aws cloudtrail details',
+    )
 
 
 def main():
@@ -200,8 +189,9 @@ def main():
         get_insight_selectors=dict(required=False, type=bool),
         get_event_selectors=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -220,19 +210,7 @@ def main():
         ],
     )
 
-    client = module.client('cloudtrail', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudtrail(client, module)
-
-    if module.params['get_trail']:
-        module.exit_json(trail=camel_dict_to_snake_dict(_it['Trail']))
-    elif module.params['get_trail_status']:
-        module.exit_json(status=camel_dict_to_snake_dict(_it))
-    elif module.params['get_insight_selectors']:
-        module.exit_json(insight_selector=camel_dict_to_snake_dict(_it))
-    elif module.params['get_event_selectors']:
-        module.exit_json(event_selector=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(trails=aws_response_list_parser(paginate, _it, 'Trails'))
+    module.exit_json(**aws_info_run(module, 'cloudtrail', _cloudtrail_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
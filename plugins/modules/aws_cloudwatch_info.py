@@ -65,11 +65,61 @@ options:
       - do you want to fetch details about cloudwatch anomaly detectors for given I(name_space) and I(metric_name)?
     required: false
     type: bool
+  get_metric_data:
+    description:
+      - do you want to fetch datapoints of I(metric_queries) from I(start_time) to I(end_time)?
+      - queries are packed into GetMetricData calls of up to 500 queries, time range is split into windows of I(metrics_window) seconds.
+      - calls of all chunks and windows run concurrently on I(max_workers) threads.
+      - queries with C(expression) are sent in one call with all other queries, so at most 500 queries can be used with expressions.
+    required: false
+    type: bool
+  metric_queries:
+    description:
+      - metrics to fetch, every query is a dictionary with
+      - C(id) unique id starting with lowercase letter, C(m<index>) if not given.
+      - C(namespace), C(metric_name), C(dimensions) dictionary of dimension names and values, C(stat) default C(Average) and C(unit)
+        of metric, or C(expression) metric math expression on ids of other queries.
+      - C(period) seconds, I(period) if not given. C(label) and C(return_data) as in GetMetricData.
+    required: false
+    type: list
+    elements: dict
+  start_time:
+    description:
+      - start of I(get_metric_data) time range, epoch seconds or ISO 8601 example C(2021-01-01T00:00:00Z).
+      - one day before I(end_time) if not given.
+    required: false
+    type: str
+  end_time:
+    description:
+      - end of I(get_metric_data) time range, epoch seconds or ISO 8601, now if not given.
+    required: false
+    type: str
+  period:
+    description:
+      - default period in seconds of I(metric_queries).
+    required: false
+    type: int
+    default: 300
+  metrics_window:
+    description:
+      - seconds of time range fetched by single GetMetricData call, rounded to multiple of I(period), whole time range if not given.
+      - I(start_time) is rounded down to multiple of I(period), so windows start on period boundaries.
+    required: false
+    type: int
+  rollups:
+    description:
+      - statistics computed over all returned values of every query.
+    required: false
+    type: list
+    elements: str
+    choices: ['min', 'max', 'avg', 'sum', 'count', 'p50', 'p90', 'p95', 'p99']
+    default: []
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -96,6 +146,48 @@ EXAMPLES = """
     describe_anomaly_detectors: true
     name_space: 'AWS/EC2'
     metric_name: 'CPUUtilization'
+
+- name: "cpu of instances for last week, fetched per day"
+  aws_cloudwatch_info:
+    get_metric_data: true
+    metric_queries:
+      - namespace: 'AWS/EC2'
+        metric_name: 'CPUUtilization'
+        dimensions:
+          InstanceId: 'i-0123456789abcdef0'
+        stat: 'Maximum'
+      - namespace: 'AWS/EC2'
+        metric_name: 'CPUUtilization'
+        dimensions:
+          InstanceId: 'i-0123456789abcdef1'
+        stat: 'Maximum'
+    start_time: '2021-01-01T00:00:00Z'
+    end_time: '2021-01-08T00:00:00Z'
+    period: 3600
+    metrics_window: 86400
+    rollups: ['max', 'avg', 'p95']
+
+- name: "requests and error rate of load balancer"
+  aws_cloudwatch_info:
+    get_metric_data: true
+    metric_queries:
+      - id: 'requests'
+        namespace: 'AWS/ApplicationELB'
+        metric_name: 'RequestCount'
+        dimensions:
+          LoadBalancer: 'app/test/123'
+        stat: 'Sum'
+      - id: 'errors'
+        namespace: 'AWS/ApplicationELB'
+        metric_name: 'HTTPCode_Target_5XX_Count'
+        dimensions:
+          LoadBalancer: 'app/test/123'
+        stat: 'Sum'
+        return_data: false
+      - id: 'error_rate'
+        expression: '100 * errors / requests'
+    start_time: '2021-01-01T00:00:00Z'
+    end_time: '2021-01-02T00:00:00Z'
 """
 
 RETURN = """
@@ -145,59 +237,198 @@ anomaly_detectors:
         'state_value': 'PENDING_TRAINING'
     },
   ]
+metric_data:
+  description:
+    - datapoints of every returned query by id, as columns of epoch seconds and values in ascending time.
+    - C(status_code) is C(PartialData) if any call didn't return all datapoints of query.
+  returned: when `get_metric_data` is defined and success
+  type: dict
+  sample: {
+    'm0': {
+        'label': 'CPUUtilization',
+        'status_code': 'Complete',
+        'timestamps': [1609459200, 1609459500],
+        'values': [10.5, 12.0],
+        'rollups': {'max': 12.0, 'avg': 11.25, 'p95': 12.0}
+    }
+  }
 """
 
+import time
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible.module_utils._text import to_native
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.utils import convert_str_to_epoch
+
+# GetMetricData accepts up to 500 queries per call.
+_METRIC_QUERIES_PER_CALL = 500
+
+
+_CLOUDWATCH_OPERATIONS = dict(
+    get_dashboard=aws_dict_operation('get_dashboard', 'dashboard', DashboardName='dashboard_name'),
+    describe_anomaly_detectors=aws_list_operation(
+        'describe_anomaly_detectors',
+        'anomaly_detectors',
+        'AnomalyDetectors',
+        Namespace='name_space',
+        MetricName='metric_name',
+    ),
+)
+
+_CLOUDWATCH_LIST_DASHBOARDS = aws_list_operation('list_dashboards', 'dashboards', 'DashboardEntries')
+
+# describe_alarms returns composite and metric alarms in separate lists of same pages.
+_CLOUDWATCH_DESCRIBE_ALARMS = [
+    aws_list_operation(
+        'describe_alarms',
+        result_key,
+        resource_field,
+        AlarmNames='alarm_names',
+        AlarmTypes='alarm_types',
+        StateValue='alarm_state',
+    )
+    for result_key, resource_field in (('composite_alarms', 'CompositeAlarms'), ('metric_alarms', 'MetricAlarms'))
+]
 
 
-def _cloudtrail(client, module):
+def _metric_data_query(query: dict, index: int, period: int) -> dict:
+    _return = dict(Id=query.get('id') or 'm{0}'.format(index))
+    if query.get('expression'):
+        _return['Expression'] = query['expression']
+        if query.get('period'):
+            _return['Period'] = query['period']
+    else:
+        metric = dict(Namespace=query['namespace'], MetricName=query['metric_name'])
+        metric['Dimensions'] = [dict(Name=k, Value=str(v)) for k, v in sorted((query.get('dimensions') or {}).items())]
+        _return['MetricStat'] = dict(Metric=metric, Period=query.get('period') or period, Stat=query.get('stat') or 'Average')
+        if query.get('unit'):
+            _return['MetricStat']['Unit'] = query['unit']
+    if query.get('label'):
+        _return['Label'] = query['label']
+    if query.get('return_data') is not None:
+        _return['ReturnData'] = query['return_data']
+    return _return
+
+
+def _metric_data_calls(module) -> list:
+    period = module.params['period']
+    if period <= 0:
+        aws_info_fail_usage(module, 'period must be greater than 0')
+    if module.params['metrics_window'] is not None and module.params['metrics_window'] <= 0:
+        aws_info_fail_usage(module, 'metrics_window must be greater than 0')
+    if any(query.get('period') is not None and query['period'] <= 0 for query in module.params['metric_queries']):
+        aws_info_fail_usage(module, 'period of metric_queries must be greater than 0')
     try:
-        if module.params['describe_alarms']:
-            if client.can_paginate('describe_alarms'):
-                paginator = client.get_paginator('describe_alarms')
-                return paginator.paginate(
-                    AlarmNames=module.params['alarm_names'],
-                    AlarmTypes=module.params['alarm_types'],
-                    StateValue=module.params['alarm_state']
-                ), True
-            else:
-                return client.describe_alarms(
-                    AlarmNames=module.params['alarm_names'],
-                    AlarmTypes=module.params['alarm_types'],
-                    StateValue=module.params['alarm_state']
-                ), False
-        elif module.params['get_dashboard']:
-            return client.get_dashboard(
-                DashboardName=module.params['dashboard_name'],
-            ), False
-        elif module.params['describe_anomaly_detectors']:
-            if client.can_paginate('describe_anomaly_detectors'):
-                paginator = client.get_paginator('describe_anomaly_detectors')
-                return paginator.paginate(
-                    Namespace=module.params['name_space'],
-                    MetricName=module.params['metric_name'],
-                ), True
-            else:
-                return client.describe_anomaly_detectors(
-                    Namespace=module.params['name_space'],
-                    MetricName=module.params['metric_name'],
-                ), False
+        queries = [_metric_data_query(query, i, period) for i, query in enumerate(module.params['metric_queries'])]
+    except (KeyError, AttributeError) as e:
+        aws_info_fail_usage(module, 'metric_queries need expression or namespace and metric_name: {0}'.format(to_native(e)))
+    if len(set(query['Id'] for query in queries)) != len(queries):
+        aws_info_fail_usage(module, 'ids of metric_queries must be unique')
+    if any('Expression' in query for query in queries) and len(queries) > _METRIC_QUERIES_PER_CALL:
+        aws_info_fail_usage(module, 'at most {0} metric_queries can be used with expressions'.format(_METRIC_QUERIES_PER_CALL))
+
+    end = convert_str_to_epoch(module.params['end_time'], int(time.time()))
+    start = convert_str_to_epoch(module.params['start_time'], end - 86400)
+    if start >= end:
+        aws_info_fail_usage(module, 'start_time must be before end_time')
+    # windows on period boundaries, so no datapoint is split between two calls.
+    start -= start % period
+    step = module.params['metrics_window'] or (end - start)
+    step = max(period, step - step % period)
+    chunks = [queries[i:i + _METRIC_QUERIES_PER_CALL] for i in range(0, len(queries), _METRIC_QUERIES_PER_CALL)]
+    return [
+        dict(MetricDataQueries=chunk, StartTime=window, EndTime=min(window + step, end), ScanBy='TimestampAscending')
+        for window in range(start, end, step)
+        for chunk in chunks
+    ]
+
+
+def _metric_data_call(client, call: dict) -> list:
+    results = []
+    for page in client.get_paginator('get_metric_data').paginate(**call):
+        results += page.get('MetricDataResults', [])
+    return results
+
+
+def _metric_rollups(values: list, rollups: list) -> dict:
+    # builtins work on whole column, values are sorted once for all percentiles.
+    if not values:
+        return dict((rollup, 0 if rollup == 'count' else None) for rollup in rollups)
+    ordered = sorted(values) if any(rollup.startswith('p') for rollup in rollups) else None
+    _return = {}
+    for rollup in rollups:
+        if rollup == 'min':
+            _return[rollup] = min(values)
+        elif rollup == 'max':
+            _return[rollup] = max(values)
+        elif rollup == 'sum':
+            _return[rollup] = sum(values)
+        elif rollup == 'avg':
+            _return[rollup] = sum(values) / len(values)
+        elif rollup == 'count':
+            _return[rollup] = len(values)
         else:
-            if client.can_paginate('list_dashboards'):
-                paginator = client.get_paginator('list_dashboards')
-                return paginator.paginate(), True
-            else:
-                return client.list_dashboards(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cloudwatch details')
+            # nearest rank percentile
+            rank = int(rollup[1:]) * len(ordered)
+            _return[rollup] = ordered[max(0, -(-rank // 100) - 1)]
+    return _return
+
+
+def _metric_data_result(client, module) -> dict:
+    calls = _metric_data_calls(module)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max(1, min(module.params['max_workers'], len(calls)))) as executor:
+        futures = [executor.submit(_metric_data_call, client, call) for call in calls]
+        try:
+            # calls are in window order, so columns are in ascending time.
+            responses = [future.result() for future in futures]
+        except (BotoCoreError, ClientError) as e:
+            module.fail_json_aws(e, msg='Failed to fetch aws cloudwatch metric data')
+
+    metric_data = {}
+    for results in responses:
+        for result in results:
+            data = metric_data.setdefault(result['Id'], dict(label=result.get('Label'), status_code='Complete', timestamps=[], values=[]))
+            data['timestamps'] += [int(timestamp.timestamp()) for timestamp in result.get('Timestamps', [])]
+            data['values'] += result.get('Values', [])
+            if result.get('StatusCode', 'Complete') != 'Complete':
+                data['status_code'] = 'PartialData'
+    if module.params['rollups']:
+        for data in metric_data.values():
+            data['rollups'] = _metric_rollups(data['values'], module.params['rollups'])
+    return dict(metric_data=metric_data)
+
+
+def _cloudtrail_result(client, module) -> dict:
+    if module.params['get_metric_data']:
+        try:
+            return _metric_data_result(client, module)
+        except ValueError as e:
+            aws_info_fail_usage(module, 'invalid start_time or end_time: {0}'.format(to_native(e)))
+    if module.params['describe_alarms']:
+        alarms = {}
+        for operation in _CLOUDWATCH_DESCRIBE_ALARMS:
+            alarms.update(aws_operations_result(client, module, {}, default=operation, error_msg='Failed to fetch aws cloudwatch details'))
+        return dict(alarms=alarms)
+    return aws_operations_result(
+        client,
+        module,
+        _CLOUDWATCH_OPERATIONS,
+        default=_CLOUDWATCH_LIST_DASHBOARDS,
+        error_msg='Failed to fetch aws cloudwatch details',
+    )
 
 
 def main():
@@ -211,21 +442,37 @@ def main():
         describe_alarms=dict(required=False, type=bool),
         get_dashboard=dict(required=False, type=bool),
         describe_anomaly_detectors=dict(required=False, type=bool),
+        get_metric_data=dict(required=False, type=bool),
+        metric_queries=dict(required=False, type='list', elements='dict'),
+        start_time=dict(required=False, type=str),
+        end_time=dict(required=False, type=str),
+        period=dict(required=False, type=int, default=300),
+        metrics_window=dict(required=False, type=int),
+        rollups=dict(
+            required=False,
+            type='list',
+            elements='str',
+            choices=['min', 'max', 'avg', 'sum', 'count', 'p50', 'p90', 'p95', 'p99'],
+            default=[],
+        ),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
             ('describe_alarms', True, ['alarm_names', 'alarm_types', 'alarm_state']),
             ('get_dashboard', True, ['dashboard_name']),
             ('describe_anomaly_detectors', True, ['name_space', 'metric_name']),
+            ('get_metric_data', True, ['metric_queries']),
         ),
         mutually_exclusive=[
             (
                 'describe_alarms',
                 'get_dashboard',
-                'describe_anomaly_detectors'
+                'describe_anomaly_detectors',
+                'get_metric_data',
             ),
             (
                 'alarm_names',
@@ -234,24 +481,7 @@ def main():
         ],
     )
 
-    client = module.client('cloudwatch', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudtrail(client, module)
-
-    if module.params['describe_alarms']:
-        composite_alarms = aws_response_list_parser(paginate, _it, 'CompositeAlarms')
-        metric_alarms = aws_response_list_parser(paginate, _it, 'MetricAlarms')
-        module.exit_json(
-            alarms={
-                "composite_alarms": composite_alarms,
-                "metric_alarms": metric_alarms
-            }
-        )
-    elif module.params['get_dashboard']:
-        module.exit_json(dashboard=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_anomaly_detectors']:
-        module.exit_json(anomaly_detectors=aws_response_list_parser(paginate, _it, 'AnomalyDetectors'))
-    else:
-        module.exit_json(dashboards=aws_response_list_parser(paginate, _it, 'DashboardEntries'))
+    module.exit_json(**aws_info_run(module, 'cloudwatch', _cloudtrail_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
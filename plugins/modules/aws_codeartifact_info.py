@@ -72,6 +72,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -193,74 +194,46 @@ repository:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_CODEARTIFACT_OPERATIONS = dict(
+    list_repositories=aws_list_operation('list_repositories', 'repositories', 'repositories', repositoryPrefix='prefix'),
+    list_repositories_in_domain=aws_list_operation(
+        'list_repositories_in_domain',
+        'repositories',
+        'repositories',
+        domain='domain',
+        repositoryPrefix='prefix',
+    ),
+    list_packages=aws_list_operation(
+        'list_packages',
+        'packages',
+        'packages',
+        domain='domain',
+        format='format',
+        repository='repository',
+        packagePrefix='prefix',
+    ),
+    describe_domain=aws_dict_operation('describe_domain', 'domain', 'domain', domain='domain'),
+    describe_repository=aws_dict_operation('describe_repository', 'repository', 'repository', domain='domain', repository='repository'),
+)
 
-def _cloudtrail(client, module):
-    try:
-        if module.params['list_repositories']:
-            if client.can_paginate('list_repositories'):
-                paginator = client.get_paginator('list_repositories')
-                return paginator.paginate(
-                    repositoryPrefix=module.params['prefix']
-                ), True
-            else:
-                return client.list_repositories(
-                    repositoryPrefix=module.params['prefix']
-                ), False
-        elif module.params['list_repositories_in_domain']:
-            if client.can_paginate('list_repositories_in_domain'):
-                paginator = client.get_paginator('list_repositories_in_domain')
-                return paginator.paginate(
-                    domain=module.params['domain'],
-                    repositoryPrefix=module.params['prefix']
-                ), True
-            else:
-                return client.list_repositories_in_domain(
-                    domain=module.params['domain'],
-                    repositoryPrefix=module.params['prefix']
-                ), False
-        elif module.params['list_packages']:
-            if client.can_paginate('list_packages'):
-                paginator = client.get_paginator('list_packages')
-                return paginator.paginate(
-                    domain=module.params['domain'],
-                    format=module.params['format'],
-                    repository=module.params['repository'],
-                    packagePrefix=module.params['prefix'],
-                ), True
-            else:
-                return client.list_packages(
-                    domain=module.params['domain'],
-                    format=module.params['format'],
-                    repository=module.params['repository'],
-                    packagePrefix=module.params['prefix'],
-                ), False
-        elif module.params['describe_domain']:
-            return client.describe_domain(
-                domain=module.params['domain'],
-            ), False
-        elif module.params['describe_repository']:
-            return client.describe_repository(
-                domain=module.params['domain'],
-                repository=module.params['repository'],
-            ), False
-        else:
-            if client.can_paginate('list_domains'):
-                paginator = client.get_paginator('list_domains')
-                return paginator.paginate(), True
-            else:
-                return client.list_domains(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws code artifact details')
+
+def _codeartifact_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODEARTIFACT_OPERATIONS,
+        default=aws_list_operation('list_domains', 'domains', 'domains'),
+        error_msg='Failed to fetch aws code artifact details',
+    )
 
 
 def main():
@@ -276,8 +249,9 @@ def main():
         describe_domain=dict(required=False, type=bool),
         describe_repository=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -298,19 +272,7 @@ def main():
         ],
     )
 
-    client = module.client('codeartifact', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cloudtrail(client, module)
-
-    if module.params['list_repositories'] or module.params['list_repositories_in_domain']:
-        module.exit_json(repositories=aws_response_list_parser(paginate, _it, 'repositories'))
-    elif module.params['list_packages']:
-        module.exit_json(packages=aws_response_list_parser(paginate, _it, 'packages'))
-    elif module.params['describe_domain']:
-        module.exit_json(domain=camel_dict_to_snake_dict(_it['domain']))
-    elif module.params['describe_repository']:
-        module.exit_json(repository=camel_dict_to_snake_dict(_it['repository']))
-    else:
-        module.exit_json(domains=aws_response_list_parser(paginate, _it, 'domains'))
+    module.exit_json(**aws_info_run(module, 'codeartifact', _codeartifact_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -100,6 +100,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -215,136 +216,53 @@ projects:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_CODEBUILD_OPERATIONS = dict(
+    list_projects=aws_list_operation('list_projects', 'project_ids', 'projects', sortBy='sort_by', sortOrder='sort_order'),
+    list_shared_projects=aws_list_operation('list_shared_projects', 'project_ids', 'projects', sortBy='sort_by', sortOrder='sort_order'),
+    list_report_groups=aws_list_operation('list_report_groups', 'report_group_ids', 'reportGroups', sortBy='sort_by', sortOrder='sort_order'),
+    list_shared_report_groups=aws_list_operation(
+        'list_shared_report_groups',
+        'report_group_ids',
+        'reportGroups',
+        sortBy='sort_by',
+        sortOrder='sort_order',
+    ),
+    list_reports=aws_list_operation(
+        'list_reports',
+        'report_arns',
+        'reports',
+        filter={'status': 'report_filter_status'},
+        sortOrder='sort_order',
+    ),
+    list_reports_for_report_group=aws_list_operation(
+        'list_reports_for_report_group',
+        'report_arns',
+        'reports',
+        reportGroupArn='report_group_arn',
+        filter={'status': 'report_filter_status'},
+        sortOrder='sort_order',
+    ),
+    list_builds=aws_list_operation('list_builds', 'build_ids', 'ids', sortOrder='sort_order'),
+    list_builds_for_project=aws_list_operation('list_builds_for_project', 'build_ids', 'ids', projectName='project_name', sortOrder='sort_order'),
+    describe_projects=aws_list_operation('batch_get_projects', 'projects', 'projects', names='project_names'),
+)
 
-def _codebuild(client, module):
-    try:
-        if module.params['list_projects']:
-            if client.can_paginate('list_projects'):
-                paginator = client.get_paginator('list_projects')
-                return paginator.paginate(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_projects(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_shared_projects']:
-            if client.can_paginate('list_shared_projects'):
-                paginator = client.get_paginator('list_shared_projects')
-                return paginator.paginate(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_shared_projects(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_report_groups']:
-            if client.can_paginate('list_report_groups'):
-                paginator = client.get_paginator('list_report_groups')
-                return paginator.paginate(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_report_groups(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_shared_report_groups']:
-            if client.can_paginate('list_shared_report_groups'):
-                paginator = client.get_paginator('list_shared_report_groups')
-                return paginator.paginate(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_shared_report_groups(
-                    sortBy=module.params['sort_by'],
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_reports']:
-            if client.can_paginate('list_reports'):
-                paginator = client.get_paginator('list_reports')
-                return paginator.paginate(
-                    filter={
-                        'status': module.params['report_filter_status']
-                    },
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_reports(
-                    filter={
-                        'status': module.params['report_filter_status']
-                    },
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_reports_for_report_group']:
-            if client.can_paginate('list_reports_for_report_group'):
-                paginator = client.get_paginator('list_reports_for_report_group')
-                return paginator.paginate(
-                    reportGroupArn=module.params['report_group_arn'],
-                    filter={
-                        'status': module.params['report_filter_status']
-                    },
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_reports_for_report_group(
-                    reportGroupArn=module.params['report_group_arn'],
-                    filter={
-                        'status': module.params['report_filter_status']
-                    },
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_builds']:
-            if client.can_paginate('list_builds'):
-                paginator = client.get_paginator('list_builds')
-                return paginator.paginate(
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_builds(
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['list_builds_for_project']:
-            if client.can_paginate('list_builds_for_project'):
-                paginator = client.get_paginator('list_builds_for_project')
-                return paginator.paginate(
-                    projectName=module.params['project_name'],
-                    sortOrder=module.params['sort_order']
-                ), True
-            else:
-                return client.list_builds_for_project(
-                    projectName=module.params['project_name'],
-                    sortOrder=module.params['sort_order']
-                ), False
-        elif module.params['describe_projects']:
-            if client.can_paginate('batch_get_projects'):
-                paginator = client.get_paginator('batch_get_projects')
-                return paginator.paginate(
-                    names=module.params['project_names'],
-                ), True
-            else:
-                return client.batch_get_projects(
-                    names=module.params['project_names'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws code build details')
+
+def _codebuild_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODEBUILD_OPERATIONS,
+        error_msg='Failed to fetch aws code build details',
+    )
 
 
 def main():
@@ -365,8 +283,9 @@ def main():
         list_builds_for_project=dict(required=False, type=bool),
         describe_projects=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -393,21 +312,7 @@ def main():
         ],
     )
 
-    client = module.client('codebuild', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codebuild(client, module)
-
-    if module.params['list_projects'] or module.params['list_shared_projects']:
-        module.exit_json(project_ids=aws_response_list_parser(paginate, _it, 'projects'))
-    elif module.params['list_report_groups'] or module.params['list_shared_report_groups']:
-        module.exit_json(report_group_ids=aws_response_list_parser(paginate, _it, 'reportGroups'))
-    elif module.params['list_reports'] or module.params['list_reports_for_report_group']:
-        module.exit_json(report_arns=aws_response_list_parser(paginate, _it, 'reports'))
-    elif module.params['list_builds'] or module.params['list_builds_for_project']:
-        module.exit_json(build_ids=aws_response_list_parser(paginate, _it, 'ids'))
-    elif module.params['describe_projects']:
-        module.exit_json(projects=aws_response_list_parser(paginate, _it, 'projects'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'codebuild', _codebuild_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
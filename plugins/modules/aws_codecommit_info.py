@@ -72,6 +72,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -161,77 +162,31 @@ triggers:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _codecommit(client, module):
-    try:
-        if module.params['list_repositories']:
-            if client.can_paginate('list_repositories'):
-                paginator = client.get_paginator('list_repositories')
-                return paginator.paginate(
-                    sortBy=module.params['sort_by'],
-                    order=module.params['sort_order']
-                ), True
-            else:
-                return client.list_repositories(
-                    sortBy=module.params['sort_by'],
-                    order=module.params['sort_order']
-                ), False
-        elif module.params['list_branches']:
-            if client.can_paginate('list_branches'):
-                paginator = client.get_paginator('list_branches')
-                return paginator.paginate(
-                    repositoryName=module.params['name'],
-                ), True
-            else:
-                return client.list_branches(
-                    repositoryName=module.params['name'],
-                ), False
-        elif module.params['list_pull_requests']:
-            if client.can_paginate('list_pull_requests'):
-                paginator = client.get_paginator('list_pull_requests')
-                return paginator.paginate(
-                    repositoryName=module.params['name'],
-                    pullRequestStatus=module.params['status']
-                ), True
-            else:
-                return client.list_pull_requests(
-                    repositoryName=module.params['name'],
-                    pullRequestStatus=module.params['status']
-                ), False
-        elif module.params['describe_repository']:
-            if client.can_paginate('get_repository'):
-                paginator = client.get_paginator('get_repository')
-                return paginator.paginate(
-                    repositoryName=module.params['name'],
-                ), True
-            else:
-                return client.get_repository(
-                    repositoryName=module.params['name'],
-                ), False
-        elif module.params['describe_repository_triggers']:
-            if client.can_paginate('get_repository_triggers'):
-                paginator = client.get_paginator('get_repository_triggers')
-                return paginator.paginate(
-                    repositoryName=module.params['name'],
-                ), True
-            else:
-                return client.get_repository_triggers(
-                    repositoryName=module.params['name'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws code commit details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CODECOMMIT_OPERATIONS = dict(
+    list_repositories=aws_list_operation('list_repositories', 'repositories', 'repositories', sortBy='sort_by', order='sort_order'),
+    list_branches=aws_list_operation('list_branches', 'branches', 'branches', repositoryName='name'),
+    list_pull_requests=aws_list_operation('list_pull_requests', 'pull_request_ids', 'pullRequestIds', repositoryName='name', pullRequestStatus='status'),
+    describe_repository=aws_dict_operation('get_repository', 'repository_metadata', 'repositoryMetadata', repositoryName='name'),
+    describe_repository_triggers=aws_list_operation('get_repository_triggers', 'triggers', 'triggers', repositoryName='name'),
+)
+
+
+def _codecommit_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODECOMMIT_OPERATIONS,
+        error_msg='Failed to fetch aws code commit details',
+    )
 
 
 def main():
@@ -246,8 +201,9 @@ def main():
         describe_repository=dict(required=False, type=bool),
         describe_repository_triggers=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -267,21 +223,7 @@ def main():
         ],
     )
 
-    client = module.client('codecommit', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codecommit(client, module)
-
-    if module.params['list_repositories']:
-        module.exit_json(repositories=aws_response_list_parser(paginate, _it, 'repositories'))
-    elif module.params['list_branches']:
-        module.exit_json(branches=aws_response_list_parser(paginate, _it, 'branches'))
-    elif module.params['list_pull_requests']:
-        module.exit_json(pull_request_ids=aws_response_list_parser(paginate, _it, 'pullRequestIds'))
-    elif module.params['describe_repository']:
-        module.exit_json(repository_metadata=camel_dict_to_snake_dict(_it['repositoryMetadata']))
-    elif module.params['describe_repository_triggers']:
-        module.exit_json(triggers=aws_response_list_parser(paginate, _it, 'triggers'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'codecommit', _codecommit_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -74,6 +74,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -195,77 +196,51 @@ repository_association_summaries:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_CODEGURU_OPERATIONS = dict(
+    describe_code_review=aws_dict_operation('describe_code_review', 'code_review', 'CodeReview', CodeReviewArn='arn'),
+    list_code_reviews=aws_list_operation(
+        'list_code_reviews',
+        'code_review_summaries',
+        'CodeReviewSummaries',
+        ProviderTypes='provider_types',
+        States='states',
+        RepositoryNames='repository_names',
+        Type='type',
+    ),
+    list_recommendation_feedback=aws_list_operation(
+        'list_recommendation_feedback',
+        'recommendation_feedback_summaries',
+        'RecommendationFeedbackSummaries',
+        CodeReviewArn='arn',
+    ),
+    list_recommendations=aws_list_operation('list_recommendations', 'recommendation_summaries', 'RecommendationSummaries', CodeReviewArn='arn'),
+    list_repository_associations=aws_list_operation(
+        'list_repository_associations',
+        'repository_association_summaries',
+        'RepositoryAssociationSummaries',
+        ProviderTypes='provider_types',
+        States='states',
+        Names='repository_names',
+    ),
+)
 
-def _codeguru(client, module):
-    try:
-        if module.params['describe_code_review']:
-            return client.describe_code_review(
-                CodeReviewArn=module.params['arn']
-            ), False
-        elif module.params['list_code_reviews']:
-            if client.can_paginate('list_code_reviews'):
-                paginator = client.get_paginator('list_code_reviews')
-                return paginator.paginate(
-                    ProviderTypes=module.params['provider_types'],
-                    States=module.params['states'],
-                    RepositoryNames=module.params['repository_names'],
-                    Type=module.params['type']
-                ), True
-            else:
-                return client.list_code_reviews(
-                    ProviderTypes=module.params['provider_types'],
-                    States=module.params['states'],
-                    RepositoryNames=module.params['repository_names'],
-                    Type=module.params['type']
-                ), False
-        elif module.params['list_recommendation_feedback']:
-            if client.can_paginate('list_recommendation_feedback'):
-                paginator = client.get_paginator('list_recommendation_feedback')
-                return paginator.paginate(
-                    CodeReviewArn=module.params['arn']
-                ), True
-            else:
-                return client.list_recommendation_feedback(
-                    CodeReviewArn=module.params['arn']
-                ), False
-        elif module.params['list_recommendations']:
-            if client.can_paginate('list_recommendations'):
-                paginator = client.get_paginator('list_recommendations')
-                return paginator.paginate(
-                    CodeReviewArn=module.params['arn']
-                ), True
-            else:
-                return client.list_recommendations(
-                    CodeReviewArn=module.params['arn']
-                ), False
-        elif module.params['list_repository_associations']:
-            if client.can_paginate('list_repository_associations'):
-                paginator = client.get_paginator('list_repository_associations')
-                return paginator.paginate(
-                    ProviderTypes=module.params['provider_types'],
-                    States=module.params['states'],
-                    Names=module.params['repository_names'],
-                ), True
-            else:
-                return client.list_repository_associations(
-                    ProviderTypes=module.params['provider_types'],
-                    States=module.params['states'],
-                    Names=module.params['repository_names'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws codeguru reviewer details')
+
+def _codeguru_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODEGURU_OPERATIONS,
+        error_msg='Failed to fetch aws codeguru reviewer details',
+    )
 
 
 def main():
@@ -281,8 +256,9 @@ def main():
         list_recommendations=dict(required=False, type=bool),
         list_repository_associations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -303,21 +279,7 @@ def main():
         ],
     )
 
-    client = module.client('codeguru-reviewer', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codeguru(client, module)
-
-    if module.params['describe_code_review']:
-        module.exit_json(code_review=camel_dict_to_snake_dict(_it['CodeReview']))
-    elif module.params['list_code_reviews']:
-        module.exit_json(code_review_summaries=aws_response_list_parser(paginate, _it, 'CodeReviewSummaries'))
-    elif module.params['list_recommendation_feedback']:
-        module.exit_json(recommendation_feedback_summaries=aws_response_list_parser(paginate, _it, 'RecommendationFeedbackSummaries'))
-    elif module.params['list_recommendations']:
-        module.exit_json(recommendation_summaries=aws_response_list_parser(paginate, _it, 'RecommendationSummaries'))
-    elif module.params['list_repository_associations']:
-        module.exit_json(repository_association_summaries=aws_response_list_parser(paginate, _it, 'RepositoryAssociationSummaries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'codeguru-reviewer', _codeguru_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -78,6 +78,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -207,104 +208,70 @@ recommendations:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.utils import convert_str_to_datetime
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import (
-    camel_dict_to_snake_dict,
-)
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import (
-    aws_response_list_parser,
-)
-from ansible_collections.community.missing_collection.plugins.module_utils.utils import (
-    convert_str_to_datetime,
+
+def _start_time(module):
+    return convert_str_to_datetime(module.params["start_time"])
+
+
+def _end_time(module):
+    return convert_str_to_datetime(module.params["end_time"])
+
+
+_CODEGURUPROFILER_OPERATIONS = dict(
+    list_profiling_groups=aws_list_operation(
+        "list_profiling_groups",
+        "profiling_groups",
+        "profilingGroups",
+        includeDescription="include_description",
+    ),
+    list_findings_reports=aws_list_operation(
+        "list_findings_reports",
+        "findings_report_summaries",
+        "findingsReportSummaries",
+        dailyReportsOnly="daily_reports_only",
+        endTime=_end_time,
+        profilingGroupName="profiling_group_name",
+        startTime=_start_time,
+    ),
+    describe_profiling_group=aws_dict_operation(
+        "describe_profiling_group",
+        "profiling_group",
+        "profilingGroup",
+        profilingGroupName="profiling_group_name",
+    ),
+    get_notification_configuration=aws_dict_operation(
+        "get_notification_configuration",
+        "notification_configuration",
+        "notificationConfiguration",
+        profilingGroupName="profiling_group_name",
+    ),
+    get_recommendations=aws_dict_operation(
+        "get_recommendations",
+        "recommendations",
+        locale="locale",
+        endTime=_end_time,
+        profilingGroupName="profiling_group_name",
+        startTime=_start_time,
+    ),
 )
 
 
-def _codeguruprofiler(client, module):
-    try:
-        if module.params["list_profiling_groups"]:
-            if client.can_paginate("list_profiling_groups"):
-                paginator = client.get_paginator("list_profiling_groups")
-                return (
-                    paginator.paginate(
-                        includeDescription=module.params["include_description"],
-                    ),
-                    True,
-                )
-            else:
-                return (
-                    client.list_profiling_groups(
-                        includeDescription=module.params["include_description"],
-                    ),
-                    False,
-                )
-        elif module.params["list_findings_reports"]:
-            _end_time = convert_str_to_datetime(module.params["end_time"])
-            _start_time = convert_str_to_datetime(module.params["start_time"])
-            if _start_time is None or _end_time is None:
-                module.fail_json(
-                    "date format is wrong, please use correct format. Example: '2020-06-01'"
-                )
-            if client.can_paginate("list_findings_reports"):
-                paginator = client.get_paginator("list_findings_reports")
-                return (
-                    paginator.paginate(
-                        dailyReportsOnly=module.params["daily_reports_only"],
-                        endTime=_end_time,
-                        profilingGroupName=module.params["profiling_group_name"],
-                        startTime=_start_time,
-                    ),
-                    True,
-                )
-            else:
-                return (
-                    client.list_findings_reports(
-                        dailyReportsOnly=module.params["daily_reports_only"],
-                        endTime=_end_time,
-                        profilingGroupName=module.params["profiling_group_name"],
-                        startTime=_start_time,
-                    ),
-                    False,
-                )
-        elif module.params["describe_profiling_group"]:
-            return (
-                client.describe_profiling_group(
-                    profilingGroupName=module.params["profiling_group_name"],
-                ),
-                False,
-            )
-        elif module.params["get_notification_configuration"]:
-            return (
-                client.get_notification_configuration(
-                    profilingGroupName=module.params["profiling_group_name"],
-                ),
-                False,
-            )
-        elif module.params["get_recommendations"]:
-            _end_time = convert_str_to_datetime(module.params["end_time"])
-            _start_time = convert_str_to_datetime(module.params["start_time"])
-            if _start_time is None or _end_time is None:
-                module.fail_json(
-                    "date format is wrong, please correct format. Example: '2020-06-01'"
-                )
-            return (
-                client.get_recommendations(
-                    locale=module.params["locale"],
-                    endTime=_end_time,
-                    profilingGroupName=module.params["profiling_group_name"],
-                    startTime=_start_time,
-                ),
-                False,
-            )
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg="Failed to fetch aws code guru profiler details")
+def _codeguruprofiler_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODEGURUPROFILER_OPERATIONS,
+        error_msg="Failed to fetch aws code guru profiler details",
+    )
 
 
 def main():
@@ -321,8 +288,9 @@ def main():
         get_notification_configuration=dict(required=False, type=bool),
         get_recommendations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ("list_profiling_groups", True, ["include_description"]),
@@ -355,35 +323,13 @@ def main():
         ],
     )
 
-    client = module.client(
-        "codeguruprofiler", retry_decorator=AWSRetry.exponential_backoff()
-    )
-    _it, paginate = _codeguruprofiler(client, module)
-
-    if module.params["list_profiling_groups"]:
-        module.exit_json(
-            profiling_groups=aws_response_list_parser(paginate, _it, "profilingGroups")
-        )
-    elif module.params["list_findings_reports"]:
-        module.exit_json(
-            findings_report_summaries=aws_response_list_parser(
-                paginate, _it, "findingsReportSummaries"
-            )
-        )
-    elif module.params["describe_profiling_group"]:
-        module.exit_json(
-            profiling_group=camel_dict_to_snake_dict(_it["profilingGroup"])
-        )
-    elif module.params["get_notification_configuration"]:
-        module.exit_json(
-            notification_configuration=camel_dict_to_snake_dict(
-                _it["notificationConfiguration"]
+    if module.params["list_findings_reports"] or module.params["get_recommendations"]:
+        if _start_time(module) is None or _end_time(module) is None:
+            module.fail_json(
+                msg="date format is wrong, please use correct format. Example: '2020-06-01'"
             )
-        )
-    elif module.params["get_recommendations"]:
-        module.exit_json(recommendations=camel_dict_to_snake_dict(_it))
-    else:
-        module.fail_json("unknown options are passed")
+
+    module.exit_json(**aws_info_run(module, "codeguruprofiler", _codeguruprofiler_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == "__main__":
@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -219,67 +220,32 @@ action_execution_details:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_CODEPIPELINE_OPERATIONS = dict(
+    get_pipeline=aws_dict_operation('get_pipeline', 'pipeline', 'pipeline', name='name'),
+    list_webhooks=aws_list_operation('list_webhooks', 'webhooks', 'webhooks'),
+    list_pipeline_executions=aws_list_operation('list_pipeline_executions', 'executions', 'pipelineExecutionSummaries', pipelineName='name'),
+    list_action_types=aws_list_operation('list_action_types', 'action_types', 'actionTypes', actionOwnerFilter='action_owner_filter'),
+    list_action_executions=aws_list_operation('list_action_executions', 'action_execution_details', 'actionExecutionDetails', pipelineName='name'),
+)
 
-def _codepipeline(client, module):
-    try:
-        if module.params['get_pipeline']:
-            return client.get_pipeline(
-                name=module.params['name']
-            ), False
-        elif module.params['list_webhooks']:
-            if client.can_paginate('list_webhooks'):
-                paginator = client.get_paginator('list_webhooks')
-                return paginator.paginate(), True
-            else:
-                return client.list_webhooks(), False
-        elif module.params['list_pipeline_executions']:
-            if client.can_paginate('list_pipeline_executions'):
-                paginator = client.get_paginator('list_pipeline_executions')
-                return paginator.paginate(
-                    pipelineName=module.params['name']
-                ), True
-            else:
-                return client.list_pipeline_executions(
-                    pipelineName=module.params['name']
-                ), False
-        elif module.params['list_action_types']:
-            if client.can_paginate('list_action_types'):
-                paginator = client.get_paginator('list_action_types')
-                return paginator.paginate(
-                    actionOwnerFilter=module.params['action_owner_filter']
-                ), True
-            else:
-                return client.list_action_types(
-                    actionOwnerFilter=module.params['action_owner_filter']
-                ), False
-        elif module.params['list_action_executions']:
-            if client.can_paginate('list_action_executions'):
-                paginator = client.get_paginator('list_action_executions')
-                return paginator.paginate(
-                    pipelineName=module.params['name']
-                ), True
-            else:
-                return client.list_action_executions(
-                    pipelineName=module.params['name']
-                ), False
-        else:
-            if client.can_paginate('list_pipelines'):
-                paginator = client.get_paginator('list_pipelines')
-                return paginator.paginate(), True
-            else:
-                return client.list_pipelines(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws codepipeline details')
+
+def _codepipeline_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODEPIPELINE_OPERATIONS,
+        default=aws_list_operation('list_pipelines', 'pipelines', 'pipelines'),
+        error_msg='Failed to fetch aws codepipeline details',
+    )
 
 
 def main():
@@ -292,8 +258,9 @@ def main():
         list_action_types=dict(required=False, type=bool),
         list_action_executions=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -312,21 +279,7 @@ def main():
         ],
     )
 
-    client = module.client('codepipeline', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codepipeline(client, module)
-
-    if module.params['get_pipeline']:
-        module.exit_json(pipeline=camel_dict_to_snake_dict(_it['pipeline']))
-    elif module.params['list_webhooks']:
-        module.exit_json(webhooks=aws_response_list_parser(paginate, _it, 'webhooks'))
-    elif module.params['list_pipeline_executions']:
-        module.exit_json(executions=aws_response_list_parser(paginate, _it, 'pipelineExecutionSummaries'))
-    elif module.params['list_action_types']:
-        module.exit_json(action_types=aws_response_list_parser(paginate, _it, 'actionTypes'))
-    elif module.params['list_action_executions']:
-        module.exit_json(action_execution_details=aws_response_list_parser(paginate, _it, 'actionExecutionDetails'))
-    else:
-        module.exit_json(pipelines=aws_response_list_parser(paginate, _it, 'pipelines'))
+    module.exit_json(**aws_info_run(module, 'codepipeline', _codepipeline_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
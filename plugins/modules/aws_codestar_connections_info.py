@@ -53,6 +53,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -134,47 +135,30 @@ host:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _codestar(client, module):
-    try:
-        if module.params['list_connections']:
-            if client.can_paginate('list_connections'):
-                paginator = client.get_paginator('list_connections')
-                return paginator.paginate(
-                    ProviderTypeFilter=module.params['provider_type_filter']
-                ), True
-            else:
-                return client.list_connections(
-                    ProviderTypeFilter=module.params['provider_type_filter']
-                ), False
-        elif module.params['list_hosts']:
-            if client.can_paginate('list_hosts'):
-                paginator = client.get_paginator('list_hosts')
-                return paginator.paginate(), True
-            else:
-                return client.list_hosts(), False
-        elif module.params['get_connection']:
-            return client.get_connection(
-                ConnectionArn=module.params['arn']
-            ), False
-        elif module.params['get_host']:
-            return client.get_host(
-                HostArn=module.params['arn']
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws codestar connections details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CODESTAR_OPERATIONS = dict(
+    list_connections=aws_list_operation('list_connections', 'connections', 'Connections', ProviderTypeFilter='provider_type_filter'),
+    list_hosts=aws_list_operation('list_hosts', 'hosts', 'Hosts'),
+    get_connection=aws_dict_operation('get_connection', 'connection', 'Connection', ConnectionArn='arn'),
+    get_host=aws_dict_operation('get_host', 'host', HostArn='arn'),
+)
+
+
+def _codestar_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODESTAR_OPERATIONS,
+        error_msg='Failed to fetch aws codestar connections details',
+    )
 
 
 def main():
@@ -186,8 +170,9 @@ def main():
         get_connection=dict(required=False, type=bool),
         get_host=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -204,19 +189,7 @@ def main():
         ],
     )
 
-    client = module.client('codestar-connections', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codestar(client, module)
-
-    if module.params['list_connections']:
-        module.exit_json(connections=aws_response_list_parser(paginate, _it, 'Connections'))
-    elif module.params['list_hosts']:
-        module.exit_json(hosts=aws_response_list_parser(paginate, _it, 'Hosts'))
-    elif module.params['get_connection']:
-        module.exit_json(connection=camel_dict_to_snake_dict(_it['Connection']))
-    elif module.params['get_host']:
-        module.exit_json(host=camel_dict_to_snake_dict(_it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'codestar-connections', _codestar_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
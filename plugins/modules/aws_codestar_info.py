@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -116,51 +117,30 @@ project:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _codestar(client, module):
-    try:
-        if module.params['list_resources']:
-            if client.can_paginate('list_resources'):
-                paginator = client.get_paginator('list_resources')
-                return paginator.paginate(
-                    projectId=module.params['id']
-                ), True
-            else:
-                return client.list_resources(
-                    projectId=module.params['id']
-                ), False
-        elif module.params['list_team_members']:
-            if client.can_paginate('list_team_members'):
-                paginator = client.get_paginator('list_team_members')
-                return paginator.paginate(
-                    projectId=module.params['id']
-                ), True
-            else:
-                return client.list_team_members(
-                    projectId=module.params['id']
-                ), False
-        elif module.params['describe_project']:
-            return client.describe_project(
-                id=module.params['id']
-            ), False
-        else:
-            if client.can_paginate('list_projects'):
-                paginator = client.get_paginator('list_projects')
-                return paginator.paginate(), True
-            else:
-                return client.list_projects(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws codestar details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CODESTAR_OPERATIONS = dict(
+    list_resources=aws_list_operation('list_resources', 'resources', 'resources', projectId='id'),
+    list_team_members=aws_list_operation('list_team_members', 'team_members', 'teamMembers', projectId='id'),
+    describe_project=aws_dict_operation('describe_project', 'project', id='id'),
+)
+
+
+def _codestar_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODESTAR_OPERATIONS,
+        default=aws_list_operation('list_projects', 'projects', 'projects'),
+        error_msg='Failed to fetch aws codestar details',
+    )
 
 
 def main():
@@ -170,8 +150,9 @@ def main():
         list_team_members=dict(required=False, type=bool),
         describe_project=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -188,17 +169,7 @@ def main():
         ],
     )
 
-    client = module.client('codestar', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codestar(client, module)
-
-    if module.params['list_resources']:
-        module.exit_json(resources=aws_response_list_parser(paginate, _it, 'resources'))
-    elif module.params['list_team_members']:
-        module.exit_json(team_members=aws_response_list_parser(paginate, _it, 'teamMembers'))
-    elif module.params['describe_project']:
-        module.exit_json(project=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(projects=aws_response_list_parser(paginate, _it, 'projects'))
+    module.exit_json(**aws_info_run(module, 'codestar', _codestar_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -112,43 +113,30 @@ rule:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _codestar(client, module):
-    try:
-        if module.params['list_event_types']:
-            if client.can_paginate('list_event_types'):
-                paginator = client.get_paginator('list_event_types')
-                return paginator.paginate(), True
-            else:
-                return client.list_event_types(), False
-        elif module.params['list_targets']:
-            if client.can_paginate('list_targets'):
-                paginator = client.get_paginator('list_targets')
-                return paginator.paginate(), True
-            else:
-                return client.list_targets(), False
-        elif module.params['describe_notification_rule']:
-            return client.describe_notification_rule(
-                Arn=module.params['arn']
-            ), False
-        else:
-            if client.can_paginate('list_notification_rules'):
-                paginator = client.get_paginator('list_notification_rules')
-                return paginator.paginate(), True
-            else:
-                return client.list_notification_rules(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws codestar notifications details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CODESTAR_OPERATIONS = dict(
+    list_event_types=aws_list_operation('list_event_types', 'event_types', 'EventTypes'),
+    list_targets=aws_list_operation('list_targets', 'targets', 'Targets'),
+    describe_notification_rule=aws_dict_operation('describe_notification_rule', 'rule', Arn='arn'),
+)
+
+
+def _codestar_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CODESTAR_OPERATIONS,
+        default=aws_list_operation('list_notification_rules', 'rules', 'NotificationRules'),
+        error_msg='Failed to fetch aws codestar notifications details',
+    )
 
 
 def main():
@@ -158,8 +146,9 @@ def main():
         list_targets=dict(required=False, type=bool),
         describe_notification_rule=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -174,17 +163,7 @@ def main():
         ],
     )
 
-    client = module.client('codestar-notifications', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _codestar(client, module)
-
-    if module.params['list_event_types']:
-        module.exit_json(event_types=aws_response_list_parser(paginate, _it, 'EventTypes'))
-    elif module.params['list_targets']:
-        module.exit_json(targets=aws_response_list_parser(paginate, _it, 'Targets'))
-    elif module.params['describe_notification_rule']:
-        module.exit_json(rule=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(rules=aws_response_list_parser(paginate, _it, 'NotificationRules'))
+    module.exit_json(**aws_info_run(module, 'codestar-notifications', _codestar_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
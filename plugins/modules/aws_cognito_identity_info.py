@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -135,51 +136,30 @@ identity:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cognito(client, module):
-    try:
-        if module.params['list_identities']:
-            if client.can_paginate('list_identities'):
-                paginator = client.get_paginator('list_identities')
-                return paginator.paginate(
-                    IdentityPoolId=module.params['id'],
-                    MaxResults=100,
-                ), True
-            else:
-                return client.list_identities(
-                    IdentityPoolId=module.params['id'],
-                    MaxResults=100,
-                ), False
-        elif module.params['describe_identity_pool']:
-            return client.describe_identity_pool(
-                IdentityPoolId=module.params['id'],
-            ), False
-        elif module.params['describe_identity']:
-            return client.describe_identity(
-                IdentityId=module.params['id']
-            ), False
-        else:
-            if client.can_paginate('list_identity_pools'):
-                paginator = client.get_paginator('list_identity_pools')
-                return paginator.paginate(
-                    MaxResults=60,
-                ), True
-            else:
-                return client.list_identity_pools(
-                    MaxResults=60,
-                ), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cognito identity details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_COGNITO_OPERATIONS = dict(
+    list_identities=aws_list_operation('list_identities', 'identities', 'Identities', IdentityPoolId='id', MaxResults=100),
+    describe_identity_pool=aws_dict_operation('describe_identity_pool', 'pool', IdentityPoolId='id'),
+    describe_identity=aws_dict_operation('describe_identity', 'identity', IdentityId='id'),
+)
+
+
+def _cognito_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _COGNITO_OPERATIONS,
+        default=aws_list_operation('list_identity_pools', 'pools', 'IdentityPools', MaxResults=60),
+        error_msg='Failed to fetch aws cognito identity details',
+    )
 
 
 def main():
@@ -189,8 +169,9 @@ def main():
         describe_identity_pool=dict(required=False, type=bool),
         describe_identity=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -207,17 +188,7 @@ def main():
         ],
     )
 
-    client = module.client('cognito-identity', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cognito(client, module)
-
-    if module.params['list_identities']:
-        module.exit_json(identities=aws_response_list_parser(paginate, _it, 'Identities'))
-    elif module.params['describe_identity_pool']:
-        module.exit_json(pool=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_identity']:
-        module.exit_json(identity=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(pools=aws_response_list_parser(paginate, _it, 'IdentityPools'))
+    module.exit_json(**aws_info_run(module, 'cognito-identity', _cognito_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
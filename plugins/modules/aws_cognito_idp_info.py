@@ -75,6 +75,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -247,116 +248,53 @@ users:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_COGNITO_OPERATIONS = dict(
+    list_devices=aws_list_operation('list_devices', 'devices', 'Devices', AccessToken='access_token'),
+    list_groups=aws_list_operation('list_groups', 'groups', 'Groups', UserPoolId='user_pool_id'),
+    list_identity_providers=aws_list_operation('list_identity_providers', 'providers', 'Providers', UserPoolId='user_pool_id'),
+    list_resource_servers=aws_list_operation(
+        'list_resource_servers',
+        'resource_servers',
+        'ResourceServers',
+        UserPoolId='user_pool_id',
+        MaxResults=50,          # hard limit from AWS
+    ),
+    list_user_import_jobs=aws_list_operation(
+        'list_user_import_jobs',
+        'user_import_jobs',
+        'UserImportJobs',
+        UserPoolId='user_pool_id',
+        MaxResults=60,          # hard limit from AWS
+    ),
+    list_user_pool_clients=aws_list_operation('list_user_pool_clients', 'user_pool_clients', 'UserPoolClients', UserPoolId='user_pool_id'),
+    list_users=aws_list_operation('list_users', 'users', 'Users', UserPoolId='user_pool_id'),
+    list_users_in_group=aws_list_operation('list_users_in_group', 'users', 'Users', UserPoolId='user_pool_id', GroupName='group_name'),
+)
 
-def _cognito(client, module):
-    try:
-        if module.params['list_devices']:
-            if client.can_paginate('list_devices'):
-                paginator = client.get_paginator('list_devices')
-                return paginator.paginate(
-                    AccessToken=module.params['access_token'],
-                ), True
-            else:
-                return client.list_devices(
-                    AccessToken=module.params['access_token'],
-                ), False
-        elif module.params['list_groups']:
-            if client.can_paginate('list_groups'):
-                paginator = client.get_paginator('list_groups')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                ), True
-            else:
-                return client.list_groups(
-                    UserPoolId=module.params['user_pool_id'],
-                ), False
-        elif module.params['list_identity_providers']:
-            if client.can_paginate('list_identity_providers'):
-                paginator = client.get_paginator('list_identity_providers')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                ), True
-            else:
-                return client.list_identity_providers(
-                    UserPoolId=module.params['user_pool_id'],
-                ), False
-        elif module.params['list_resource_servers']:
-            if client.can_paginate('list_resource_servers'):
-                paginator = client.get_paginator('list_resource_servers')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                    MaxResults=50           # hard limit from AWS
-                ), True
-            else:
-                return client.list_resource_servers(
-                    UserPoolId=module.params['user_pool_id'],
-                    MaxResults=50           # hard limit from AWS
-                ), False
-        elif module.params['list_user_import_jobs']:
-            if client.can_paginate('list_user_import_jobs'):
-                paginator = client.get_paginator('list_user_import_jobs')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                    MaxResults=60           # hard limit from AWS
-                ), True
-            else:
-                return client.list_user_import_jobs(
-                    UserPoolId=module.params['user_pool_id'],
-                    MaxResults=60           # hard limit from AWS
-                ), False
-        elif module.params['list_user_pool_clients']:
-            if client.can_paginate('list_user_pool_clients'):
-                paginator = client.get_paginator('list_user_pool_clients')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                ), True
-            else:
-                return client.list_user_pool_clients(
-                    UserPoolId=module.params['user_pool_id'],
-                ), False
-        elif module.params['list_users']:
-            if client.can_paginate('list_users'):
-                paginator = client.get_paginator('list_users')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                ), True
-            else:
-                return client.list_users(
-                    UserPoolId=module.params['user_pool_id'],
-                ), False
-        elif module.params['list_users_in_group']:
-            if client.can_paginate('list_users_in_group'):
-                paginator = client.get_paginator('list_users_in_group')
-                return paginator.paginate(
-                    UserPoolId=module.params['user_pool_id'],
-                    GroupName=module.params['group_name']
-                ), True
-            else:
-                return client.list_users_in_group(
-                    UserPoolId=module.params['user_pool_id'],
-                    GroupName=module.params['group_name']
-                ), False
-        else:
-            if client.can_paginate('list_user_pools'):
-                paginator = client.get_paginator('list_user_pools')
-                return paginator.paginate(
-                    MaxResults=60       # hard limit from AWS
-                ), True
-            else:
-                return client.list_user_pools(
-                    MaxResults=60       # hard limit from AWS
-                ), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cognito idp details')
+_COGNITO_LIST_USER_POOLS = aws_list_operation(
+    'list_user_pools',
+    'user_pools',
+    'UserPools',
+    MaxResults=60,              # hard limit from AWS
+)
+
+
+def _cognito_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _COGNITO_OPERATIONS,
+        default=_COGNITO_LIST_USER_POOLS,
+        error_msg='Failed to fetch aws cognito idp details',
+    )
 
 
 def main():
@@ -374,8 +312,9 @@ def main():
         list_users=dict(required=False, type=bool),
         list_users_in_group=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -403,25 +342,7 @@ def main():
         ],
     )
 
-    client = module.client('cognito-idp', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cognito(client, module)
-
-    if module.params['list_devices']:
-        module.exit_json(devices=aws_response_list_parser(paginate, _it, 'Devices'))
-    elif module.params['list_groups']:
-        module.exit_json(groups=aws_response_list_parser(paginate, _it, 'Groups'))
-    elif module.params['list_identity_providers']:
-        module.exit_json(providers=aws_response_list_parser(paginate, _it, 'Providers'))
-    elif module.params['list_resource_servers']:
-        module.exit_json(resource_servers=aws_response_list_parser(paginate, _it, 'ResourceServers'))
-    elif module.params['list_user_import_jobs']:
-        module.exit_json(user_import_jobs=aws_response_list_parser(paginate, _it, 'UserImportJobs'))
-    elif module.params['list_user_pool_clients']:
-        module.exit_json(user_pool_clients=aws_response_list_parser(paginate, _it, 'UserPoolClients'))
-    elif module.params['list_users'] or module.params['list_users_in_group']:
-        module.exit_json(users=aws_response_list_parser(paginate, _it, 'Users'))
-    else:
-        module.exit_json(user_pools=aws_response_list_parser(paginate, _it, 'UserPools'))
+    module.exit_json(**aws_info_run(module, 'cognito-idp', _cognito_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -55,6 +55,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -130,61 +131,44 @@ records:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cognito(client, module):
-    try:
-        if module.params['list_datasets']:
-            if client.can_paginate('list_datasets'):
-                paginator = client.get_paginator('list_datasets')
-                return paginator.paginate(
-                    IdentityPoolId=module.params['identity_pool_id'],
-                    IdentityId=module.params['identity_id'],
-                ), True
-            else:
-                return client.list_datasets(
-                    IdentityPoolId=module.params['identity_pool_id'],
-                    IdentityId=module.params['identity_id'],
-                ), False
-        elif module.params['list_identity_pool_usage']:
-            if client.can_paginate('list_identity_pool_usage'):
-                paginator = client.get_paginator('list_identity_pool_usage')
-                return paginator.paginate(), True
-            else:
-                return client.list_identity_pool_usage(), False
-        elif module.params['list_records']:
-            if client.can_paginate('list_records'):
-                paginator = client.get_paginator('list_records')
-                return paginator.paginate(
-                    IdentityPoolId=module.params['identity_pool_id'],
-                    IdentityId=module.params['identity_id'],
-                    DatasetName=module.params['dataset_name'],
-                ), True
-            else:
-                return client.list_records(
-                    IdentityPoolId=module.params['identity_pool_id'],
-                    IdentityId=module.params['identity_id'],
-                    DatasetName=module.params['dataset_name'],
-                ), False
-        elif module.params['describe_dataset']:
-            return client.describe_dataset(
-                IdentityPoolId=module.params['identity_pool_id'],
-                IdentityId=module.params['identity_id'],
-                DatasetName=module.params['dataset_name'],
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cognito sync details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_COGNITO_OPERATIONS = dict(
+    list_datasets=aws_list_operation('list_datasets', 'datasets', 'Datasets', IdentityPoolId='identity_pool_id', IdentityId='identity_id'),
+    list_identity_pool_usage=aws_list_operation('list_identity_pool_usage', 'identity_pool_usages', 'IdentityPoolUsages'),
+    list_records=aws_list_operation(
+        'list_records',
+        'records',
+        'Records',
+        IdentityPoolId='identity_pool_id',
+        IdentityId='identity_id',
+        DatasetName='dataset_name',
+    ),
+    describe_dataset=aws_dict_operation(
+        'describe_dataset',
+        'dataset',
+        'Dataset',
+        IdentityPoolId='identity_pool_id',
+        IdentityId='identity_id',
+        DatasetName='dataset_name',
+    ),
+)
+
+
+def _cognito_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _COGNITO_OPERATIONS,
+        error_msg='Failed to fetch aws cognito sync details',
+    )
 
 
 def main():
@@ -197,8 +181,9 @@ def main():
         list_records=dict(required=False, type=bool),
         describe_dataset=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -216,19 +201,7 @@ def main():
         ],
     )
 
-    client = module.client('cognito-sync', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cognito(client, module)
-
-    if module.params['list_datasets']:
-        module.exit_json(datasets=aws_response_list_parser(paginate, _it, 'Datasets'))
-    elif module.params['list_identity_pool_usage']:
-        module.exit_json(identity_pool_usages=aws_response_list_parser(paginate, _it, 'IdentityPoolUsages'))
-    elif module.params['list_records']:
-        module.exit_json(records=aws_response_list_parser(paginate, _it, 'Records'))
-    elif module.params['describe_dataset']:
-        module.exit_json(dataset=camel_dict_to_snake_dict(_it['Dataset']))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'cognito-sync', _cognito_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -77,6 +77,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -358,150 +359,78 @@ topics_detection_jobs:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_JOB_STATUS_FILTER = {'JobStatus': 'job_status'}
 
-def _comprehend(client, module):
-    try:
-        if module.params['list_document_classification_jobs']:
-            if client.can_paginate('list_document_classification_jobs'):
-                paginator = client.get_paginator('list_document_classification_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_document_classification_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_document_classifiers']:
-            if client.can_paginate('list_document_classifiers'):
-                paginator = client.get_paginator('list_document_classifiers')
-                return paginator.paginate(), True
-            else:
-                return client.list_document_classifiers(), False
-        elif module.params['list_dominant_language_detection_jobs']:
-            if client.can_paginate('list_dominant_language_detection_jobs'):
-                paginator = client.get_paginator('list_dominant_language_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_document_classifiers(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_entities_detection_jobs']:
-            if client.can_paginate('list_entities_detection_jobs'):
-                paginator = client.get_paginator('list_entities_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_entities_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_entity_recognizers']:
-            if client.can_paginate('list_entity_recognizers'):
-                paginator = client.get_paginator('list_entity_recognizers')
-                return paginator.paginate(), True
-            else:
-                return client.list_entity_recognizers(), False
-        elif module.params['list_events_detection_jobs']:
-            if client.can_paginate('list_events_detection_jobs'):
-                paginator = client.get_paginator('list_events_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_events_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_key_phrases_detection_jobs']:
-            if client.can_paginate('list_key_phrases_detection_jobs'):
-                paginator = client.get_paginator('list_key_phrases_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_key_phrases_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_pii_entities_detection_jobs']:
-            if client.can_paginate('list_pii_entities_detection_jobs'):
-                paginator = client.get_paginator('list_pii_entities_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_pii_entities_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_sentiment_detection_jobs']:
-            if client.can_paginate('list_sentiment_detection_jobs'):
-                paginator = client.get_paginator('list_sentiment_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_sentiment_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_topics_detection_jobs']:
-            if client.can_paginate('list_topics_detection_jobs'):
-                paginator = client.get_paginator('list_topics_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_topics_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        else:
-            if client.can_paginate('list_endpoints'):
-                paginator = client.get_paginator('list_endpoints')
-                return paginator.paginate(), True
-            else:
-                return client.list_endpoints(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws comprehend details')
+_COMPREHEND_OPERATIONS = dict(
+    list_document_classification_jobs=aws_list_operation(
+        'list_document_classification_jobs',
+        'document_classification_jobs',
+        'DocumentClassificationJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_document_classifiers=aws_list_operation('list_document_classifiers', 'document_classifiers', 'DocumentClassifierPropertiesList'),
+    list_dominant_language_detection_jobs=aws_list_operation(
+        'list_dominant_language_detection_jobs',
+        'language_detection_jobs',
+        'DominantLanguageDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_entities_detection_jobs=aws_list_operation(
+        'list_entities_detection_jobs',
+        'entities_detection_jobs',
+        'EntitiesDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_entity_recognizers=aws_list_operation('list_entity_recognizers', 'entity_recognizers', 'EntityRecognizerPropertiesList'),
+    list_events_detection_jobs=aws_list_operation(
+        'list_events_detection_jobs',
+        'events_detection_jobs',
+        'EventsDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_key_phrases_detection_jobs=aws_list_operation(
+        'list_key_phrases_detection_jobs',
+        'key_phrases_detection_jobs',
+        'KeyPhrasesDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_pii_entities_detection_jobs=aws_list_operation(
+        'list_pii_entities_detection_jobs',
+        'pii_entities_detection_jobs',
+        'PiiEntitiesDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_sentiment_detection_jobs=aws_list_operation(
+        'list_sentiment_detection_jobs',
+        'sentiment_detection_jobs',
+        'SentimentDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_topics_detection_jobs=aws_list_operation(
+        'list_topics_detection_jobs',
+        'topics_detection_jobs',
+        'TopicsDetectionJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+)
+
+
+def _comprehend_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _COMPREHEND_OPERATIONS,
+        default=aws_list_operation('list_endpoints', 'endpoints', 'EndpointPropertiesList'),
+        error_msg='Failed to fetch aws comprehend details',
+    )
 
 
 def main():
@@ -522,8 +451,9 @@ def main():
         list_sentiment_detection_jobs=dict(required=False, type=bool),
         list_topics_detection_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(),
@@ -543,31 +473,7 @@ def main():
         ],
     )
 
-    client = module.client('comprehend', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _comprehend(client, module)
-
-    if module.params['list_document_classification_jobs']:
-        module.exit_json(document_classification_jobs=aws_response_list_parser(paginate, _it, 'DocumentClassificationJobPropertiesList'))
-    elif module.params['list_document_classifiers']:
-        module.exit_json(document_classifiers=aws_response_list_parser(paginate, _it, 'DocumentClassifierPropertiesList'))
-    elif module.params['list_dominant_language_detection_jobs']:
-        module.exit_json(language_detection_jobs=aws_response_list_parser(paginate, _it, 'DominantLanguageDetectionJobPropertiesList'))
-    elif module.params['list_entities_detection_jobs']:
-        module.exit_json(entities_detection_jobs=aws_response_list_parser(paginate, _it, 'EntitiesDetectionJobPropertiesList'))
-    elif module.params['list_entity_recognizers']:
-        module.exit_json(entity_recognizers=aws_response_list_parser(paginate, _it, 'EntityRecognizerPropertiesList'))
-    elif module.params['list_events_detection_jobs']:
-        module.exit_json(events_detection_jobs=aws_response_list_parser(paginate, _it, 'EventsDetectionJobPropertiesList'))
-    elif module.params['list_key_phrases_detection_jobs']:
-        module.exit_json(key_phrases_detection_jobs=aws_response_list_parser(paginate, _it, 'KeyPhrasesDetectionJobPropertiesList'))
-    elif module.params['list_pii_entities_detection_jobs']:
-        module.exit_json(pii_entities_detection_jobs=aws_response_list_parser(paginate, _it, 'PiiEntitiesDetectionJobPropertiesList'))
-    elif module.params['list_sentiment_detection_jobs']:
-        module.exit_json(sentiment_detection_jobs=aws_response_list_parser(paginate, _it, 'SentimentDetectionJobPropertiesList'))
-    elif module.params['list_topics_detection_jobs']:
-        module.exit_json(topics_detection_jobs=aws_response_list_parser(paginate, _it, 'TopicsDetectionJobPropertiesList'))
-    else:
-        module.exit_json(endpoints=aws_response_list_parser(paginate, _it, 'EndpointPropertiesList'))
+    module.exit_json(**aws_info_run(module, 'comprehend', _comprehend_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
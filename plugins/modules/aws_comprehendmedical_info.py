@@ -47,6 +47,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -164,78 +165,51 @@ rx_norm_inference_jobs:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _comprehendmedical(client, module):
-    try:
-        if module.params['list_entities_detection_v2_jobs']:
-            if client.can_paginate('list_entities_detection_v2_jobs'):
-                paginator = client.get_paginator('list_entities_detection_v2_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_entities_detection_v2_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_icd10_cm_inference_jobs']:
-            if client.can_paginate('list_icd10_cm_inference_jobs'):
-                paginator = client.get_paginator('list_icd10_cm_inference_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_entities_detection_v2_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_phi_detection_jobs']:
-            if client.can_paginate('list_phi_detection_jobs'):
-                paginator = client.get_paginator('list_phi_detection_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_phi_detection_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        elif module.params['list_rx_norm_inference_jobs']:
-            if client.can_paginate('list_rx_norm_inference_jobs'):
-                paginator = client.get_paginator('list_rx_norm_inference_jobs')
-                return paginator.paginate(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), True
-            else:
-                return client.list_rx_norm_inference_jobs(
-                    Filter={
-                        'JobStatus': module.params['job_status']
-                    }
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws comprehendmedical details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_JOB_STATUS_FILTER = {'JobStatus': 'job_status'}
+
+_COMPREHENDMEDICAL_OPERATIONS = dict(
+    list_entities_detection_v2_jobs=aws_list_operation(
+        'list_entities_detection_v2_jobs',
+        'entities_detection_v2_jobs',
+        'ComprehendMedicalAsyncJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_icd10_cm_inference_jobs=aws_list_operation(
+        'list_icd10_cm_inference_jobs',
+        'icd10_cm_inference_jobs',
+        'ComprehendMedicalAsyncJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_phi_detection_jobs=aws_list_operation(
+        'list_phi_detection_jobs',
+        'phi_detection_jobs',
+        'ComprehendMedicalAsyncJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+    list_rx_norm_inference_jobs=aws_list_operation(
+        'list_rx_norm_inference_jobs',
+        'rx_norm_inference_jobs',
+        'ComprehendMedicalAsyncJobPropertiesList',
+        Filter=_JOB_STATUS_FILTER,
+    ),
+)
+
+
+def _comprehendmedical_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _COMPREHENDMEDICAL_OPERATIONS,
+        error_msg='Failed to fetch aws comprehendmedical details',
+    )
 
 
 def main():
@@ -250,8 +224,9 @@ def main():
         list_phi_detection_jobs=dict(required=False, type=bool),
         list_rx_norm_inference_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(),
@@ -265,19 +240,7 @@ def main():
         ],
     )
 
-    client = module.client('comprehendmedical', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _comprehendmedical(client, module)
-
-    if module.params['list_entities_detection_v2_jobs']:
-        module.exit_json(entities_detection_v2_jobs=aws_response_list_parser(paginate, _it, 'ComprehendMedicalAsyncJobPropertiesList'))
-    elif module.params['list_icd10_cm_inference_jobs']:
-        module.exit_json(icd10_cm_inference_jobs=aws_response_list_parser(paginate, _it, 'ComprehendMedicalAsyncJobPropertiesList'))
-    elif module.params['list_phi_detection_jobs']:
-        module.exit_json(phi_detection_jobs=aws_response_list_parser(paginate, _it, 'ComprehendMedicalAsyncJobPropertiesList'))
-    elif module.params['list_rx_norm_inference_jobs']:
-        module.exit_json(rx_norm_inference_jobs=aws_response_list_parser(paginate, _it, 'ComprehendMedicalAsyncJobPropertiesList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'comprehendmedical', _comprehendmedical_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
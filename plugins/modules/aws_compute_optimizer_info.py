@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -102,53 +103,40 @@ recommendation_export_jobs:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _compute(client, module):
-    try:
-        if module.params['get_auto_scaling_group_recommendations']:
-            if client.can_paginate('get_auto_scaling_group_recommendations'):
-                paginator = client.get_paginator('get_auto_scaling_group_recommendations')
-                return paginator.paginate(), True
-            else:
-                return client.get_auto_scaling_group_recommendations(), False
-        elif module.params['get_ebs_volume_recommendations']:
-            if client.can_paginate('get_ebs_volume_recommendations'):
-                paginator = client.get_paginator('get_ebs_volume_recommendations')
-                return paginator.paginate(), True
-            else:
-                return client.get_ebs_volume_recommendations(), False
-        elif module.params['get_ec2_instance_recommendations']:
-            if client.can_paginate('get_ec2_instance_recommendations'):
-                paginator = client.get_paginator('get_ec2_instance_recommendations')
-                return paginator.paginate(), True
-            else:
-                return client.get_ec2_instance_recommendations(), False
-        elif module.params['get_lambda_function_recommendations']:
-            if client.can_paginate('get_lambda_function_recommendations'):
-                paginator = client.get_paginator('get_lambda_function_recommendations')
-                return paginator.paginate(), True
-            else:
-                return client.get_lambda_function_recommendations(), False
-        elif module.params['describe_recommendation_export_jobs']:
-            if client.can_paginate('describe_recommendation_export_jobs'):
-                paginator = client.get_paginator('describe_recommendation_export_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.describe_recommendation_export_jobs(), False
-        else:
-            return client.get_enrollment_status(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws compute optimizer details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_COMPUTE_OPERATIONS = dict(
+    get_auto_scaling_group_recommendations=aws_list_operation(
+        'get_auto_scaling_group_recommendations',
+        'auto_scaling_group_recommendations',
+        'autoScalingGroupRecommendations',
+    ),
+    get_ebs_volume_recommendations=aws_list_operation('get_ebs_volume_recommendations', 'volume_recommendations', 'volumeRecommendations'),
+    get_ec2_instance_recommendations=aws_list_operation('get_ec2_instance_recommendations', 'instance_recommendations', 'instanceRecommendations'),
+    get_lambda_function_recommendations=aws_list_operation(
+        'get_lambda_function_recommendations',
+        'lambda_function_recommendations',
+        'lambdaFunctionRecommendations',
+    ),
+    describe_recommendation_export_jobs=aws_list_operation('describe_recommendation_export_jobs', 'recommendation_export_jobs', 'recommendationExportJobs'),
+)
+
+
+def _compute_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _COMPUTE_OPERATIONS,
+        default=aws_dict_operation('get_enrollment_status', 'status'),
+        error_msg='Failed to fetch aws compute optimizer details',
+    )
 
 
 def main():
@@ -159,8 +147,9 @@ def main():
         get_lambda_function_recommendations=dict(required=False, type=bool),
         describe_recommendation_export_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(),
@@ -175,21 +164,7 @@ def main():
         ],
     )
 
-    client = module.client('compute-optimizer', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _compute(client, module)
-
-    if module.params['get_auto_scaling_group_recommendations']:
-        module.exit_json(auto_scaling_group_recommendations=aws_response_list_parser(paginate, _it, 'autoScalingGroupRecommendations'))
-    elif module.params['get_ebs_volume_recommendations']:
-        module.exit_json(volume_recommendations=aws_response_list_parser(paginate, _it, 'volumeRecommendations'))
-    elif module.params['get_ec2_instance_recommendations']:
-        module.exit_json(instance_recommendations=aws_response_list_parser(paginate, _it, 'instanceRecommendations'))
-    elif module.params['get_lambda_function_recommendations']:
-        module.exit_json(lambda_function_recommendations=aws_response_list_parser(paginate, _it, 'lambdaFunctionRecommendations'))
-    elif module.params['describe_recommendation_export_jobs']:
-        module.exit_json(recommendation_export_jobs=aws_response_list_parser(paginate, _it, 'recommendationExportJobs'))
-    else:
-        module.exit_json(status=camel_dict_to_snake_dict(_it))
+    module.exit_json(**aws_info_run(module, 'compute-optimizer', _compute_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -76,37 +77,27 @@ profiles:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _config(config, module):
-    try:
-        if module.params['list_configurations_profiles']:
-            if config.can_paginate('list_configurations_profiles'):
-                paginator = config.get_paginator('list_applications')
-                iterator = paginator.paginate(
-                    ApplicationId=module.params['id']
-                )
-                return iterator, True
-            else:
-                return config.list_applications(), False
-        else:
-            if config.can_paginate('list_applications'):
-                paginator = config.get_paginator('list_applications')
-                return paginator.paginate(), True
-            else:
-                return config.list_applications(), False
-
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws config details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CONFIG_OPERATIONS = dict(
+    list_configurations_profiles=aws_list_operation('list_configuration_profiles', 'profiles', 'Items', ApplicationId='id'),
+)
+
+
+def _config_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CONFIG_OPERATIONS,
+        default=aws_list_operation('list_applications', 'applications', 'Items'),
+        error_msg='Failed to fetch aws config details',
+    )
 
 
 def main():
@@ -114,8 +105,9 @@ def main():
         id=dict(required=False, aliases=['application_id']),
         list_configurations_profiles=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -123,12 +115,7 @@ def main():
         ),
     )
 
-    config = module.client('appconfig')
-    _it, paginate = _config(config, module)
-    if module.params['list_configurations_profiles']:
-        module.exit_json(profiles=aws_response_list_parser(paginate, _it, 'Items'))
-    else:
-        module.exit_json(applications=aws_response_list_parser(paginate, _it, 'Items'))
+    module.exit_json(**aws_info_run(module, 'appconfig', _config_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -73,34 +74,32 @@ segments:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _connect(client, module):
-    try:
-        if module.params['list_realtime_contact_analysis_segments']:
-            if client.can_paginate('list_realtime_contact_analysis_segments'):
-                paginator = client.get_paginator('list_realtime_contact_analysis_segments')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                    ContactId=module.params['contact_id'],
-                ), True
-            else:
-                return client.list_realtime_contact_analysis_segments(
-                    InstanceId=module.params['instance_id'],
-                    ContactId=module.params['contact_id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws connect contact lens details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CONNECT_OPERATIONS = dict(
+    list_realtime_contact_analysis_segments=aws_list_operation(
+        'list_realtime_contact_analysis_segments',
+        'segments',
+        'Segments',
+        InstanceId='instance_id',
+        ContactId='contact_id',
+    ),
+)
+
+
+def _connect_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CONNECT_OPERATIONS,
+        error_msg='Failed to fetch aws connect contact lens details',
+    )
 
 
 def main():
@@ -109,8 +108,9 @@ def main():
         contact_id=dict(required=False),
         list_realtime_contact_analysis_segments=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -119,13 +119,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('connect-contact-lens', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _connect(client, module)
-
-    if module.params['list_realtime_contact_analysis_segments']:
-        module.exit_json(segments=aws_response_list_parser(paginate, _it, 'Segments'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'connect-contact-lens', _connect_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
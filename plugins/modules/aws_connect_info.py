@@ -115,6 +115,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -409,198 +410,59 @@ users:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _connect(client, module):
-    try:
-        if module.params['list_approved_origins']:
-            if client.can_paginate('list_approved_origins'):
-                paginator = client.get_paginator('list_approved_origins')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_approved_origins(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_contact_flows']:
-            if client.can_paginate('list_contact_flows'):
-                paginator = client.get_paginator('list_contact_flows')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_contact_flows(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_hours_of_operations']:
-            if client.can_paginate('list_hours_of_operations'):
-                paginator = client.get_paginator('list_hours_of_operations')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_hours_of_operations(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_instance_attributes']:
-            if client.can_paginate('list_instance_attributes'):
-                paginator = client.get_paginator('list_instance_attributes')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_instance_attributes(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_integration_associations']:
-            if client.can_paginate('list_integration_associations'):
-                paginator = client.get_paginator('list_integration_associations')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_integration_associations(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_lambda_functions']:
-            if client.can_paginate('list_lambda_functions'):
-                paginator = client.get_paginator('list_lambda_functions')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_lambda_functions(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_lex_bots']:
-            if client.can_paginate('list_lex_bots'):
-                paginator = client.get_paginator('list_lex_bots')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_lex_bots(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_phone_numbers']:
-            if client.can_paginate('list_phone_numbers'):
-                paginator = client.get_paginator('list_phone_numbers')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_phone_numbers(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_prompts']:
-            if client.can_paginate('list_prompts'):
-                paginator = client.get_paginator('list_prompts')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_prompts(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_queues']:
-            if client.can_paginate('list_queues'):
-                paginator = client.get_paginator('list_queues')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_queues(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_quick_connects']:
-            if client.can_paginate('list_quick_connects'):
-                paginator = client.get_paginator('list_quick_connects')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_quick_connects(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_routing_profile_queues']:
-            if client.can_paginate('list_routing_profile_queues'):
-                paginator = client.get_paginator('list_routing_profile_queues')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                    RoutingProfileId=module.params['routing_profile_id'],
-                ), True
-            else:
-                return client.list_routing_profile_queues(
-                    InstanceId=module.params['instance_id'],
-                    RoutingProfileId=module.params['routing_profile_id'],
-                ), False
-        elif module.params['list_routing_profiles']:
-            if client.can_paginate('list_routing_profiles'):
-                paginator = client.get_paginator('list_routing_profiles')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_routing_profiles(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_security_keys']:
-            if client.can_paginate('list_security_keys'):
-                paginator = client.get_paginator('list_security_keys')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_security_keys(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_security_profiles']:
-            if client.can_paginate('list_security_profiles'):
-                paginator = client.get_paginator('list_security_profiles')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_security_profiles(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_user_hierarchy_groups']:
-            if client.can_paginate('list_user_hierarchy_groups'):
-                paginator = client.get_paginator('list_user_hierarchy_groups')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_user_hierarchy_groups(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        elif module.params['list_users']:
-            if client.can_paginate('list_users'):
-                paginator = client.get_paginator('list_users')
-                return paginator.paginate(
-                    InstanceId=module.params['instance_id'],
-                ), True
-            else:
-                return client.list_users(
-                    InstanceId=module.params['instance_id'],
-                ), False
-        else:
-            if client.can_paginate('list_instances'):
-                paginator = client.get_paginator('list_instances')
-                return paginator.paginate(), True
-            else:
-                return client.list_instances(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws connect details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CONNECT_OPERATIONS = dict(
+    list_approved_origins=aws_list_operation('list_approved_origins', 'approved_origins', 'Origins', InstanceId='instance_id'),
+    list_contact_flows=aws_list_operation('list_contact_flows', 'contact_flows', 'ContactFlowSummaryList', InstanceId='instance_id'),
+    list_hours_of_operations=aws_list_operation('list_hours_of_operations', 'hour_of_operations', 'HoursOfOperationSummaryList', InstanceId='instance_id'),
+    list_instance_attributes=aws_list_operation('list_instance_attributes', 'instance_attributes', 'Attributes', InstanceId='instance_id'),
+    list_integration_associations=aws_list_operation(
+        'list_integration_associations',
+        'integration_associations',
+        'IntegrationAssociationSummaryList',
+        InstanceId='instance_id',
+    ),
+    list_lambda_functions=aws_list_operation('list_lambda_functions', 'lambda_functions', 'LambdaFunctions', InstanceId='instance_id'),
+    list_lex_bots=aws_list_operation('list_lex_bots', 'lex_bots', 'LexBots', InstanceId='instance_id'),
+    list_phone_numbers=aws_list_operation('list_phone_numbers', 'phone_numbers', 'PhoneNumberSummaryList', InstanceId='instance_id'),
+    list_prompts=aws_list_operation('list_prompts', 'prompts', 'PromptSummaryList', InstanceId='instance_id'),
+    list_queues=aws_list_operation('list_queues', 'queues', 'QueueSummaryList', InstanceId='instance_id'),
+    list_quick_connects=aws_list_operation('list_quick_connects', 'quick_connects', 'QuickConnectSummaryList', InstanceId='instance_id'),
+    list_routing_profile_queues=aws_list_operation(
+        'list_routing_profile_queues',
+        'routing_profile_queues',
+        'RoutingProfileQueueConfigSummaryList',
+        InstanceId='instance_id',
+        RoutingProfileId='routing_profile_id',
+    ),
+    list_routing_profiles=aws_list_operation('list_routing_profiles', 'routing_profiles', 'RoutingProfileSummaryList', InstanceId='instance_id'),
+    list_security_keys=aws_list_operation('list_security_keys', 'security_keys', 'SecurityKeys', InstanceId='instance_id'),
+    list_security_profiles=aws_list_operation('list_security_profiles', 'security_profiles', 'SecurityProfileSummaryList', InstanceId='instance_id'),
+    list_user_hierarchy_groups=aws_list_operation(
+        'list_user_hierarchy_groups',
+        'user_hierarchy_groups',
+        'UserHierarchyGroupSummaryList',
+        InstanceId='instance_id',
+    ),
+    list_users=aws_list_operation('list_users', 'users', 'UserSummaryList', InstanceId='instance_id'),
+)
+
+
+def _connect_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CONNECT_OPERATIONS,
+        default=aws_list_operation('list_instances', 'instances', 'InstanceSummaryList'),
+        error_msg='Failed to fetch aws connect details',
+    )
 
 
 def main():
@@ -625,8 +487,9 @@ def main():
         list_user_hierarchy_groups=dict(required=False, type=bool),
         list_users=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -671,45 +534,7 @@ def main():
         ],
     )
 
-    client = module.client('connect', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _connect(client, module)
-
-    if module.params['list_approved_origins']:
-        module.exit_json(approved_origins=aws_response_list_parser(paginate, _it, 'Origins'))
-    elif module.params['list_contact_flows']:
-        module.exit_json(contact_flows=aws_response_list_parser(paginate, _it, 'ContactFlowSummaryList'))
-    elif module.params['list_hours_of_operations']:
-        module.exit_json(hour_of_operations=aws_response_list_parser(paginate, _it, 'HoursOfOperationSummaryList'))
-    elif module.params['list_instance_attributes']:
-        module.exit_json(instance_attributes=aws_response_list_parser(paginate, _it, 'Attributes'))
-    elif module.params['list_integration_associations']:
-        module.exit_json(integration_associations=aws_response_list_parser(paginate, _it, 'IntegrationAssociationSummaryList'))
-    elif module.params['list_lambda_functions']:
-        module.exit_json(lambda_functions=aws_response_list_parser(paginate, _it, 'LambdaFunctions'))
-    elif module.params['list_lex_bots']:
-        module.exit_json(lex_bots=aws_response_list_parser(paginate, _it, 'LexBots'))
-    elif module.params['list_phone_numbers']:
-        module.exit_json(phone_numbers=aws_response_list_parser(paginate, _it, 'PhoneNumberSummaryList'))
-    elif module.params['list_prompts']:
-        module.exit_json(prompts=aws_response_list_parser(paginate, _it, 'PromptSummaryList'))
-    elif module.params['list_queues']:
-        module.exit_json(queues=aws_response_list_parser(paginate, _it, 'QueueSummaryList'))
-    elif module.params['list_quick_connects']:
-        module.exit_json(quick_connects=aws_response_list_parser(paginate, _it, 'QuickConnectSummaryList'))
-    elif module.params['list_routing_profile_queues']:
-        module.exit_json(routing_profile_queues=aws_response_list_parser(paginate, _it, 'RoutingProfileQueueConfigSummaryList'))
-    elif module.params['list_routing_profiles']:
-        module.exit_json(routing_profiles=aws_response_list_parser(paginate, _it, 'RoutingProfileSummaryList'))
-    elif module.params['list_security_keys']:
-        module.exit_json(security_keys=aws_response_list_parser(paginate, _it, 'SecurityKeys'))
-    elif module.params['list_security_profiles']:
-        module.exit_json(security_profiles=aws_response_list_parser(paginate, _it, 'SecurityProfileSummaryList'))
-    elif module.params['list_user_hierarchy_groups']:
-        module.exit_json(user_hierarchy_groups=aws_response_list_parser(paginate, _it, 'UserHierarchyGroupSummaryList'))
-    elif module.params['list_users']:
-        module.exit_json(users=aws_response_list_parser(paginate, _it, 'UserSummaryList'))
-    else:
-        module.exit_json(instances=aws_response_list_parser(paginate, _it, 'InstanceSummaryList'))
+    module.exit_json(**aws_info_run(module, 'connect', _connect_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
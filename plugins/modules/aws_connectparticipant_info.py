@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -92,40 +93,28 @@ transcript:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _connect(client, module):
-    try:
-        if module.params['get_attachment']:
-            return client.get_attachment(
-                AttachmentId=module.params['attachment_id'],
-                ConnectionToken=module.params['connection_token'],
-            ), False
-        elif module.params['get_transcript']:
-            if client.can_paginate('get_transcript'):
-                paginator = client.get_paginator('get_transcript')
-                return paginator.paginate(
-                    ContactId=module.params['contact_id'],
-                    ConnectionToken=module.params['connection_token'],
-                ), True
-            else:
-                return client.get_transcript(
-                    ContactId=module.params['contact_id'],
-                    ConnectionToken=module.params['connection_token'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws connect participant details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_CONNECT_OPERATIONS = dict(
+    get_attachment=aws_dict_operation('get_attachment', 'attachment', AttachmentId='attachment_id', ConnectionToken='connection_token'),
+    get_transcript=aws_list_operation('get_transcript', 'transcript', 'Transcript', ContactId='contact_id', ConnectionToken='connection_token'),
+)
+
+
+def _connect_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CONNECT_OPERATIONS,
+        error_msg='Failed to fetch aws connect participant details',
+    )
 
 
 def main():
@@ -136,8 +125,9 @@ def main():
         get_attachment=dict(required=False, type=bool),
         get_transcript=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -152,15 +142,7 @@ def main():
         ],
     )
 
-    client = module.client('connectparticipant', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _connect(client, module)
-
-    if module.params['get_attachment']:
-        module.exit_json(attachment=camel_dict_to_snake_dict(_it))
-    elif module.params['get_transcript']:
-        module.exit_json(transcript=aws_response_list_parser(paginate, _it, 'Transcript'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'connectparticipant', _connect_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -19,6 +19,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -55,40 +56,35 @@ report_definitions:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _cur(client, module):
-    try:
-        if client.can_paginate('describe_report_definitions'):
-            paginator = client.get_paginator('describe_report_definitions')
-            return paginator.paginate(), True
-        else:
-            return client.describe_report_definitions(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws cur details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+def _cur_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        {},
+        default=aws_list_operation('describe_report_definitions', 'report_definitions', 'ReportDefinitions'),
+        error_msg='Failed to fetch aws cur details',
+    )
 
 
 def main():
     argument_spec = dict()
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[],
     )
 
-    client = module.client('cur', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _cur(client, module)
-
-    module.exit_json(report_definitions=aws_response_list_parser(paginate, _it, 'ReportDefinitions'))
+    module.exit_json(**aws_info_run(module, 'cur', _cur_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
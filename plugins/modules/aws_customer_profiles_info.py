@@ -60,6 +60,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -209,71 +210,33 @@ integration:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_CONNECT_OPERATIONS = dict(
+    list_account_integrations=aws_list_operation('list_account_integrations', 'account_integrations', 'Items', Uri='uri'),
+    list_integrations=aws_list_operation('list_integrations', 'integrations', 'Items', DomainName='domain_name'),
+    list_profile_object_type_templates=aws_list_operation('list_profile_object_type_templates', 'profile_object_type_templates', 'Items'),
+    list_profile_object_types=aws_list_operation('list_profile_object_types', 'profile_object_types', 'Items', DomainName='domain_name'),
+    get_domain=aws_dict_operation('get_domain', 'domain', DomainName='domain_name'),
+    get_integration=aws_dict_operation('get_integration', 'integration', DomainName='domain_name'),
+)
 
-def _connect(client, module):
-    try:
-        if module.params['list_account_integrations']:
-            if client.can_paginate('list_account_integrations'):
-                paginator = client.get_paginator('list_account_integrations')
-                return paginator.paginate(
-                    Uri=module.params['uri'],
-                ), True
-            else:
-                return client.list_account_integrations(
-                    Uri=module.params['uri'],
-                ), False
-        elif module.params['list_integrations']:
-            if client.can_paginate('list_integrations'):
-                paginator = client.get_paginator('list_integrations')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                ), True
-            else:
-                return client.list_integrations(
-                    DomainName=module.params['domain_name'],
-                ), False
-        elif module.params['list_profile_object_type_templates']:
-            if client.can_paginate('list_profile_object_type_templates'):
-                paginator = client.get_paginator('list_profile_object_type_templates')
-                return paginator.paginate(), True
-            else:
-                return client.list_profile_object_type_templates(), False
-        elif module.params['list_profile_object_types']:
-            if client.can_paginate('list_profile_object_types'):
-                paginator = client.get_paginator('list_profile_object_types')
-                return paginator.paginate(
-                    DomainName=module.params['domain_name'],
-                ), True
-            else:
-                return client.list_profile_object_types(
-                    DomainName=module.params['domain_name'],
-                ), False
-        elif module.params['get_domain']:
-            return client.get_domain(
-                DomainName=module.params['domain_name'],
-            ), False
-        elif module.params['get_integration']:
-            return client.get_integration(
-                DomainName=module.params['domain_name'],
-            ), False
-        else:
-            if client.can_paginate('list_domains'):
-                paginator = client.get_paginator('list_domains')
-                return paginator.paginate(), True
-            else:
-                return client.list_domains(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws connect customer profiles details')
+
+def _connect_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _CONNECT_OPERATIONS,
+        default=aws_list_operation('list_domains', 'domains', 'Items'),
+        error_msg='Failed to fetch aws connect customer profiles details',
+    )
 
 
 def main():
@@ -287,8 +250,9 @@ def main():
         get_domain=dict(required=False, type=bool),
         get_integration=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -310,23 +274,7 @@ def main():
         ],
     )
 
-    client = module.client('customer-profiles', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _connect(client, module)
-
-    if module.params['list_account_integrations']:
-        module.exit_json(account_integrations=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['list_integrations']:
-        module.exit_json(integrations=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['list_profile_object_type_templates']:
-        module.exit_json(profile_object_type_templates=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['list_profile_object_types']:
-        module.exit_json(profile_object_types=aws_response_list_parser(paginate, _it, 'Items'))
-    elif module.params['get_domain']:
-        module.exit_json(domain=camel_dict_to_snake_dict(_it))
-    elif module.params['get_integration']:
-        module.exit_json(integration=camel_dict_to_snake_dict(_it))
-    else:
-        module.exit_json(domains=aws_response_list_parser(paginate, _it, 'Items'))
+    module.exit_json(**aws_info_run(module, 'customer-profiles', _connect_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -60,6 +60,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -227,70 +228,31 @@ schedules:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_DATABREW_OPERATIONS = dict(
+    list_datasets=aws_list_operation('list_datasets', 'datasets', 'Datasets'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'Jobs', DatasetName='dataset_name', ProjectName='project_name'),
+    list_job_runs=aws_list_operation('list_job_runs', 'job_runs', 'JobRuns', Name='job_name'),
+    list_recipes=aws_list_operation('list_recipes', 'recipes', 'Recipes'),
+    list_schedules=aws_list_operation('list_schedules', 'schedules', 'Schedules', JobName='job_name'),
+)
 
-def _databrew(client, module):
-    try:
-        if module.params['list_datasets']:
-            if client.can_paginate('list_datasets'):
-                paginator = client.get_paginator('list_datasets')
-                return paginator.paginate(), True
-            else:
-                return client.list_datasets(), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    DatasetName=module.params['dataset_name'],
-                    ProjectName=module.params['project_name'],
-                ), True
-            else:
-                return client.list_jobs(
-                    DatasetName=module.params['dataset_name'],
-                    ProjectName=module.params['project_name'],
-                ), False
-        elif module.params['list_job_runs']:
-            if client.can_paginate('list_job_runs'):
-                paginator = client.get_paginator('list_job_runs')
-                return paginator.paginate(
-                    Name=module.params['job_name'],
-                ), True
-            else:
-                return client.list_job_runs(
-                    Name=module.params['job_name'],
-                ), False
-        elif module.params['list_recipes']:
-            if client.can_paginate('list_recipes'):
-                paginator = client.get_paginator('list_recipes')
-                return paginator.paginate(), True
-            else:
-                return client.list_recipes(), False
-        elif module.params['list_schedules']:
-            if client.can_paginate('list_schedules'):
-                paginator = client.get_paginator('list_schedules')
-                return paginator.paginate(
-                    JobName=module.params['job_name'],
-                ), True
-            else:
-                return client.list_schedules(
-                    JobName=module.params['job_name'],
-                ), False
-        else:
-            if client.can_paginate('list_projects'):
-                paginator = client.get_paginator('list_projects')
-                return paginator.paginate(), True
-            else:
-                return client.list_projects(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws glue databrew details')
+
+def _databrew_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DATABREW_OPERATIONS,
+        default=aws_list_operation('list_projects', 'projects', 'Projects'),
+        error_msg='Failed to fetch aws glue databrew details',
+    )
 
 
 def main():
@@ -304,8 +266,9 @@ def main():
         list_recipes=dict(required=False, type=bool),
         list_schedules=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -324,21 +287,7 @@ def main():
         ],
     )
 
-    client = module.client('databrew', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _databrew(client, module)
-
-    if module.params['list_datasets']:
-        module.exit_json(datasets=aws_response_list_parser(paginate, _it, 'Datasets'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, _it, 'Jobs'))
-    elif module.params['list_job_runs']:
-        module.exit_json(job_runs=aws_response_list_parser(paginate, _it, 'JobRuns'))
-    elif module.params['list_recipes']:
-        module.exit_json(recipes=aws_response_list_parser(paginate, _it, 'Recipes'))
-    elif module.params['list_schedules']:
-        module.exit_json(schedules=aws_response_list_parser(paginate, _it, 'Schedules'))
-    else:
-        module.exit_json(projects=aws_response_list_parser(paginate, _it, 'Projects'))
+    module.exit_json(**aws_info_run(module, 'databrew', _databrew_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -95,38 +96,27 @@ jobs:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _dataexchange(client, module):
-    try:
-        if module.params['list_data_sets']:
-            if client.can_paginate('list_data_sets'):
-                paginator = client.get_paginator('list_data_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_data_sets(), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    DataSetId=module.params['data_set_id'],
-                ), True
-            else:
-                return client.list_jobs(
-                    DataSetId=module.params['data_set_id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Data Exchange details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DATAEXCHANGE_OPERATIONS = dict(
+    list_data_sets=aws_list_operation('list_data_sets', 'datasets', 'DataSets'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'Jobs', DataSetId='data_set_id'),
+)
+
+
+def _dataexchange_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DATAEXCHANGE_OPERATIONS,
+        error_msg='Failed to fetch AWS Data Exchange details',
+    )
 
 
 def main():
@@ -135,8 +125,9 @@ def main():
         list_data_sets=dict(required=False, type=bool),
         list_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -150,15 +141,7 @@ def main():
         ],
     )
 
-    client = module.client('dataexchange', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _dataexchange(client, module)
-
-    if module.params['list_data_sets']:
-        module.exit_json(datasets=aws_response_list_parser(paginate, _it, 'DataSets'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, _it, 'Jobs'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'dataexchange', _dataexchange_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
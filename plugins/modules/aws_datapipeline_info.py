@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -71,36 +72,27 @@ pipeline_description_list:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _datapipeline(client, module):
-    try:
-        if module.params['describe_pipelines']:
-            if client.can_paginate('describe_pipelines'):
-                paginator = client.get_paginator('describe_pipelines')
-                return paginator.paginate(
-                    pipelineIds=module.params['ids']
-                ), True
-            else:
-                return client.describe_pipelines(
-                    pipelineIds=module.params['ids']
-                ), False
-        else:
-            if client.can_paginate('list_pipelines'):
-                paginator = client.get_paginator('list_pipelines')
-                return paginator.paginate(), True
-            else:
-                return client.list_pipelines(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Data Pipeline details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DATAPIPELINE_OPERATIONS = dict(
+    describe_pipelines=aws_list_operation('describe_pipelines', 'pipeline_description_list', 'pipelineDescriptionList', pipelineIds='ids'),
+)
+
+
+def _datapipeline_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DATAPIPELINE_OPERATIONS,
+        default=aws_list_operation('list_pipelines', 'pipelines', 'pipelineIdList'),
+        error_msg='Failed to fetch AWS Data Pipeline details',
+    )
 
 
 def main():
@@ -108,8 +100,9 @@ def main():
         ids=dict(required=False, type=list),
         describe_pipelines=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -118,13 +111,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('datapipeline', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _datapipeline(client, module)
-
-    if module.params['describe_pipelines']:
-        module.exit_json(pipeline_description_list=aws_response_list_parser(paginate, _it, 'pipelineDescriptionList'))
-    else:
-        module.exit_json(pipelines=aws_response_list_parser(paginate, _it, 'pipelineIdList'))
+    module.exit_json(**aws_info_run(module, 'datapipeline', _datapipeline_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
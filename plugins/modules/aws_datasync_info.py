@@ -60,6 +60,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -182,59 +183,32 @@ agent:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _datasync(client, module):
-    try:
-        if module.params['list_agents']:
-            if client.can_paginate('list_agents'):
-                paginator = client.get_paginator('list_agents')
-                return paginator.paginate(), True
-            else:
-                return client.list_agents(), False
-        elif module.params['list_locations']:
-            if client.can_paginate('list_locations'):
-                paginator = client.get_paginator('list_locations')
-                return paginator.paginate(), True
-            else:
-                return client.list_locations(), False
-        elif module.params['list_task_executions']:
-            if client.can_paginate('list_task_executions'):
-                paginator = client.get_paginator('list_task_executions')
-                return paginator.paginate(
-                    TaskArn=module.params['task_arn'],
-                ), True
-            else:
-                return client.list_task_executions(
-                    TaskArn=module.params['task_arn'],
-                ), False
-        elif module.params['list_tasks']:
-            if client.can_paginate('list_tasks'):
-                paginator = client.get_paginator('list_tasks')
-                return paginator.paginate(), True
-            else:
-                return client.list_tasks(), False
-        elif module.params['describe_task']:
-            return client.describe_task(
-                TaskArn=module.params['task_arn'],
-            ), False
-        elif module.params['describe_agent']:
-            return client.describe_agent(
-                AgentArn=module.params['agent_arn'],
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Data Sync details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DATASYNC_OPERATIONS = dict(
+    list_agents=aws_list_operation('list_agents', 'agents', 'Agents'),
+    list_locations=aws_list_operation('list_locations', 'locations', 'Locations'),
+    list_task_executions=aws_list_operation('list_task_executions', 'task_executions', 'TaskExecutions', TaskArn='task_arn'),
+    list_tasks=aws_list_operation('list_tasks', 'tasks', 'Tasks'),
+    describe_task=aws_dict_operation('describe_task', 'task', TaskArn='task_arn'),
+    describe_agent=aws_dict_operation('describe_agent', 'agent', AgentArn='agent_arn'),
+)
+
+
+def _datasync_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DATASYNC_OPERATIONS,
+        error_msg='Failed to fetch AWS Data Sync details',
+    )
 
 
 def main():
@@ -248,8 +222,9 @@ def main():
         describe_task=dict(required=False, type=bool),
         describe_agent=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -269,23 +244,7 @@ def main():
         ],
     )
 
-    client = module.client('datasync', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _datasync(client, module)
-
-    if module.params['list_agents']:
-        module.exit_json(agents=aws_response_list_parser(paginate, _it, 'Agents'))
-    elif module.params['list_locations']:
-        module.exit_json(locations=aws_response_list_parser(paginate, _it, 'Locations'))
-    elif module.params['list_task_executions']:
-        module.exit_json(task_executions=aws_response_list_parser(paginate, _it, 'TaskExecutions'))
-    elif module.params['list_tasks']:
-        module.exit_json(tasks=aws_response_list_parser(paginate, _it, 'Tasks'))
-    elif module.params['describe_task']:
-        module.exit_json(task=camel_dict_to_snake_dict(_it))
-    elif module.params['describe_agent']:
-        module.exit_json(agent=camel_dict_to_snake_dict(_it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'datasync', _datasync_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
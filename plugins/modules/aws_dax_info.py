@@ -84,6 +84,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -224,75 +225,37 @@ subnet_groups:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_DAX_OPERATIONS = dict(
+    describe_clusters=aws_list_operation('describe_clusters', 'clusters', 'Clusters', ClusterNames='cluster_names'),
+    describe_default_parameters=aws_list_operation('describe_default_parameters', 'parameters', 'Parameters'),
+    describe_events=aws_list_operation('describe_events', 'events', 'Events', SourceName='source_name', SourceType='source_type'),
+    describe_parameter_groups=aws_list_operation(
+        'describe_parameter_groups',
+        'parameter_groups',
+        'ParameterGroups',
+        ParameterGroupNames='parameter_group_names',
+    ),
+    describe_parameters=aws_dict_operation('describe_parameters', 'parameter', 'Parameters', ParameterGroupName='parameter_group_name'),
+    describe_subnet_groups=aws_list_operation('describe_subnet_groups', 'subnet_groups', 'SubnetGroups', SubnetGroupNames='subnet_group_names'),
+)
 
-def _dax(client, module):
-    try:
-        if module.params['describe_clusters']:
-            if client.can_paginate('describe_clusters'):
-                paginator = client.get_paginator('describe_clusters')
-                return paginator.paginate(
-                    ClusterNames=module.params['cluster_names'],
-                ), True
-            else:
-                return client.describe_clusters(
-                    ClusterNames=module.params['cluster_names'],
-                ), False
-        elif module.params['describe_default_parameters']:
-            if client.can_paginate('describe_default_parameters'):
-                paginator = client.get_paginator('describe_default_parameters')
-                return paginator.paginate(), True
-            else:
-                return client.describe_default_parameters(), False
-        elif module.params['describe_events']:
-            if client.can_paginate('describe_events'):
-                paginator = client.get_paginator('describe_events')
-                return paginator.paginate(
-                    SourceName=module.params['source_name'],
-                    SourceType=module.params['source_type'],
-                ), True
-            else:
-                return client.describe_events(
-                    SourceName=module.params['source_name'],
-                    SourceType=module.params['source_type'],
-                ), False
-        elif module.params['describe_parameter_groups']:
-            if client.can_paginate('describe_parameter_groups'):
-                paginator = client.get_paginator('describe_parameter_groups')
-                return paginator.paginate(
-                    ParameterGroupNames=module.params['parameter_group_names'],
-                ), True
-            else:
-                return client.describe_parameter_groups(
-                    ParameterGroupNames=module.params['parameter_group_names'],
-                ), False
-        elif module.params['describe_parameters']:
-            return client.describe_parameters(
-                ParameterGroupName=module.params['parameter_group_name'],
-            ), False
-        elif module.params['describe_subnet_groups']:
-            if client.can_paginate('describe_subnet_groups'):
-                paginator = client.get_paginator('describe_subnet_groups')
-                return paginator.paginate(
-                    SubnetGroupNames=module.params['subnet_group_names'],
-                ), True
-            else:
-                return client.describe_subnet_groups(
-                    SubnetGroupNames=module.params['subnet_group_names'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Dax details')
+
+def _dax_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DAX_OPERATIONS,
+        error_msg='Failed to fetch AWS Dax details',
+    )
 
 
 def main():
@@ -310,8 +273,9 @@ def main():
         describe_parameters=dict(required=False, type=bool),
         describe_subnet_groups=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -330,23 +294,7 @@ def main():
         ],
     )
 
-    client = module.client('dax', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _dax(client, module)
-
-    if module.params['describe_clusters']:
-        module.exit_json(clusters=aws_response_list_parser(paginate, _it, 'Clusters'))
-    elif module.params['describe_default_parameters']:
-        module.exit_json(parameters=aws_response_list_parser(paginate, _it, 'Parameters'))
-    elif module.params['describe_events']:
-        module.exit_json(events=aws_response_list_parser(paginate, _it, 'Events'))
-    elif module.params['describe_parameter_groups']:
-        module.exit_json(parameter_groups=aws_response_list_parser(paginate, _it, 'ParameterGroups'))
-    elif module.params['describe_parameters']:
-        module.exit_json(parameter=camel_dict_to_snake_dict(_it['Parameters']))
-    elif module.params['describe_subnet_groups']:
-        module.exit_json(subnet_groups=aws_response_list_parser(paginate, _it, 'SubnetGroups'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'dax', _dax_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
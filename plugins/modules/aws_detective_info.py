@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -103,42 +104,28 @@ members:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _detective(client, module):
-    try:
-        if module.params['list_invitations']:
-            if client.can_paginate('list_invitations'):
-                paginator = client.get_paginator('list_invitations')
-                return paginator.paginate(), True
-            else:
-                return client.list_invitations(), False
-        elif module.params['list_members']:
-            if client.can_paginate('list_members'):
-                paginator = client.get_paginator('list_members')
-                return paginator.paginate(
-                    GraphArn=module.params['graph_arn'],
-                ), True
-            else:
-                return client.list_members(
-                    GraphArn=module.params['graph_arn'],
-                ), False
-        else:
-            if client.can_paginate('list_graphs'):
-                paginator = client.get_paginator('list_graphs')
-                return paginator.paginate(), True
-            else:
-                return client.list_graphs(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS detective details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DETECTIVE_OPERATIONS = dict(
+    list_invitations=aws_list_operation('list_invitations', 'invitations', 'Invitations'),
+    list_members=aws_list_operation('list_members', 'members', 'MemberDetails', GraphArn='graph_arn'),
+)
+
+
+def _detective_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DETECTIVE_OPERATIONS,
+        default=aws_list_operation('list_graphs', 'graph_list', 'GraphList'),
+        error_msg='Failed to fetch AWS detective details',
+    )
 
 
 def main():
@@ -147,8 +134,9 @@ def main():
         list_invitations=dict(required=False, type=bool),
         list_members=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -162,15 +150,7 @@ def main():
         ],
     )
 
-    client = module.client('detective', retry_decorator=AWSRetry.exponential_backoff())
-    _it, paginate = _detective(client, module)
-
-    if module.params['list_invitations']:
-        module.exit_json(invitations=aws_response_list_parser(paginate, _it, 'Invitations'))
-    elif module.params['list_members']:
-        module.exit_json(members=aws_response_list_parser(paginate, _it, 'MemberDetails'))
-    else:
-        module.exit_json(graph_list=aws_response_list_parser(paginate, _it, 'GraphList'))
+    module.exit_json(**aws_info_run(module, 'detective', _detective_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -160,6 +160,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -271,216 +272,53 @@ EXAMPLES = """
 RETURN = """
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _devicefarm(client, module):
-    try:
-        if module.params['list_artifacts']:
-            if client.can_paginate('list_artifacts'):
-                paginator = client.get_paginator('list_artifacts')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                    type=module.params['artifact_type'],
-                ), True
-            else:
-                return client.list_artifacts(
-                    arn=module.params['arn'],
-                    type=module.params['artifact_type'],
-                ), False
-        elif module.params['list_device_instances']:
-            if client.can_paginate('list_device_instances'):
-                paginator = client.get_paginator('list_device_instances')
-                return paginator.paginate(), True
-            else:
-                return client.list_device_instances(), False
-        elif module.params['list_device_pools']:
-            if client.can_paginate('list_device_pools'):
-                paginator = client.get_paginator('list_device_pools')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                    type=module.params['device_pool_type'],
-                ), True
-            else:
-                return client.list_device_pools(
-                    arn=module.params['arn'],
-                    type=module.params['device_pool_type'],
-                ), False
-        elif module.params['list_devices']:
-            if client.can_paginate('list_devices'):
-                paginator = client.get_paginator('list_devices')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_devices(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_instance_profiles']:
-            if client.can_paginate('list_instance_profiles'):
-                paginator = client.get_paginator('list_instance_profiles')
-                return paginator.paginate(), True
-            else:
-                return client.list_instance_profiles(), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_jobs(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_network_profiles']:
-            if client.can_paginate('list_network_profiles'):
-                paginator = client.get_paginator('list_network_profiles')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                    type=module.params['network_profile_type'],
-                ), True
-            else:
-                return client.list_network_profiles(
-                    arn=module.params['arn'],
-                    type=module.params['network_profile_type'],
-                ), False
-        elif module.params['list_offering_promotions']:
-            if client.can_paginate('list_offering_promotions'):
-                paginator = client.get_paginator('list_offering_promotions')
-                return paginator.paginate(), True
-            else:
-                return client.list_offering_promotions(), False
-        elif module.params['list_offering_transactions']:
-            if client.can_paginate('list_offering_transactions'):
-                paginator = client.get_paginator('list_offering_transactions')
-                return paginator.paginate(), True
-            else:
-                return client.list_offering_transactions(), False
-        elif module.params['list_offerings']:
-            if client.can_paginate('list_offerings'):
-                paginator = client.get_paginator('list_offerings')
-                return paginator.paginate(), True
-            else:
-                return client.list_offerings(), False
-        elif module.params['list_remote_access_sessions']:
-            if client.can_paginate('list_remote_access_sessions'):
-                paginator = client.get_paginator('list_remote_access_sessions')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_remote_access_sessions(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_runs']:
-            if client.can_paginate('list_runs'):
-                paginator = client.get_paginator('list_runs')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_runs(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_samples']:
-            if client.can_paginate('list_samples'):
-                paginator = client.get_paginator('list_samples')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_samples(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_suites']:
-            if client.can_paginate('list_suites'):
-                paginator = client.get_paginator('list_suites')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_suites(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_test_grid_projects']:
-            if client.can_paginate('list_test_grid_projects'):
-                paginator = client.get_paginator('list_test_grid_projects')
-                return paginator.paginate(), True
-            else:
-                return client.list_test_grid_projects(), False
-        elif module.params['list_test_grid_session_actions']:
-            if client.can_paginate('list_test_grid_session_actions'):
-                paginator = client.get_paginator('list_test_grid_session_actions')
-                return paginator.paginate(
-                    sessionArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_test_grid_session_actions(
-                    sessionArn=module.params['arn'],
-                ), False
-        elif module.params['list_test_grid_session_artifacts']:
-            if client.can_paginate('list_test_grid_session_artifacts'):
-                paginator = client.get_paginator('list_test_grid_session_artifacts')
-                return paginator.paginate(
-                    sessionArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_test_grid_session_artifacts(
-                    sessionArn=module.params['arn'],
-                ), False
-        elif module.params['list_test_grid_sessions']:
-            if client.can_paginate('list_test_grid_sessions'):
-                paginator = client.get_paginator('list_test_grid_sessions')
-                return paginator.paginate(
-                    projectArn=module.params['arn'],
-                    status=module.params['test_grid_session_status'],
-                ), True
-            else:
-                return client.list_test_grid_sessions(
-                    projectArn=module.params['arn'],
-                    status=module.params['test_grid_session_status'],
-                ), False
-        elif module.params['list_tests']:
-            if client.can_paginate('list_tests'):
-                paginator = client.get_paginator('list_tests')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_tests(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_uploads']:
-            if client.can_paginate('list_uploads'):
-                paginator = client.get_paginator('list_uploads')
-                return paginator.paginate(
-                    arn=module.params['arn'],
-                ), True
-            else:
-                return client.list_uploads(
-                    arn=module.params['arn'],
-                ), False
-        elif module.params['list_vpce_configurations']:
-            if client.can_paginate('list_vpce_configurations'):
-                paginator = client.get_paginator('list_vpce_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_vpce_configurations(), False
-        else:
-            if client.can_paginate('list_projects'):
-                paginator = client.get_paginator('list_projects')
-                return paginator.paginate(), True
-            else:
-                return client.list_projects(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Device Farm details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DEVICEFARM_OPERATIONS = dict(
+    list_artifacts=aws_list_operation('list_artifacts', 'artifacts', 'artifacts', arn='arn', type='artifact_type'),
+    list_device_instances=aws_list_operation('list_device_instances', 'device_instances', 'deviceInstances'),
+    list_device_pools=aws_list_operation('list_device_pools', 'device_pools', 'devicePools', arn='arn', type='device_pool_type'),
+    list_devices=aws_list_operation('list_devices', 'devices', 'devices', arn='arn'),
+    list_instance_profiles=aws_list_operation('list_instance_profiles', 'instance_profiles', 'instanceProfiles'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'jobs', arn='arn'),
+    list_network_profiles=aws_list_operation('list_network_profiles', 'network_profiles', 'networkProfiles', arn='arn', type='network_profile_type'),
+    list_offering_promotions=aws_list_operation('list_offering_promotions', 'offering_promotions', 'offeringPromotions'),
+    list_offering_transactions=aws_list_operation('list_offering_transactions', 'offering_transactions', 'offeringTransactions'),
+    list_offerings=aws_list_operation('list_offerings', 'offerings', 'offerings'),
+    list_remote_access_sessions=aws_list_operation('list_remote_access_sessions', 'remote_access_sessions', 'remoteAccessSessions', arn='arn'),
+    list_runs=aws_list_operation('list_runs', 'runs', 'runs', arn='arn'),
+    list_samples=aws_list_operation('list_samples', 'samples', 'samples', arn='arn'),
+    list_suites=aws_list_operation('list_suites', 'suites', 'suites', arn='arn'),
+    list_test_grid_projects=aws_list_operation('list_test_grid_projects', 'test_grid_projects', 'testGridProjects'),
+    list_test_grid_session_actions=aws_list_operation('list_test_grid_session_actions', 'test_grid_session_actions', 'actions', sessionArn='arn'),
+    list_test_grid_session_artifacts=aws_list_operation('list_test_grid_session_artifacts', 'test_grid_session_artifacts', 'artifacts', sessionArn='arn'),
+    list_test_grid_sessions=aws_list_operation(
+        'list_test_grid_sessions',
+        'test_grid_sessions',
+        'testGridSessions',
+        projectArn='arn',
+        status='test_grid_session_status',
+    ),
+    list_tests=aws_list_operation('list_tests', 'tests', 'tests', arn='arn'),
+    list_uploads=aws_list_operation('list_uploads', 'uploads', 'uploads', arn='arn'),
+    list_vpce_configurations=aws_list_operation('list_vpce_configurations', 'vpce_configurations', 'vpceConfigurations'),
+)
+
+
+def _devicefarm_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DEVICEFARM_OPERATIONS,
+        default=aws_list_operation('list_projects', 'projects', 'projects'),
+        error_msg='Failed to fetch AWS Device Farm details',
+    )
 
 
 def main():
@@ -512,8 +350,9 @@ def main():
         list_uploads=dict(required=False, type=bool),
         list_vpce_configurations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -559,53 +398,7 @@ def main():
         ],
     )
 
-    client = module.client('devicefarm', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _devicefarm(client, module)
-
-    if module.params['list_artifacts']:
-        module.exit_json(artifacts=aws_response_list_parser(paginate, it, 'artifacts'))
-    elif module.params['list_device_instances']:
-        module.exit_json(device_instances=aws_response_list_parser(paginate, it, 'deviceInstances'))
-    elif module.params['list_device_pools']:
-        module.exit_json(device_pools=aws_response_list_parser(paginate, it, 'devicePools'))
-    elif module.params['list_devices']:
-        module.exit_json(devices=aws_response_list_parser(paginate, it, 'devices'))
-    elif module.params['list_instance_profiles']:
-        module.exit_json(instance_profiles=aws_response_list_parser(paginate, it, 'instanceProfiles'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'jobs'))
-    elif module.params['list_network_profiles']:
-        module.exit_json(network_profiles=aws_response_list_parser(paginate, it, 'networkProfiles'))
-    elif module.params['list_offering_promotions']:
-        module.exit_json(offering_promotions=aws_response_list_parser(paginate, it, 'offeringPromotions'))
-    elif module.params['list_offering_transactions']:
-        module.exit_json(offering_transactions=aws_response_list_parser(paginate, it, 'offeringTransactions'))
-    elif module.params['list_offerings']:
-        module.exit_json(offerings=aws_response_list_parser(paginate, it, 'offerings'))
-    elif module.params['list_remote_access_sessions']:
-        module.exit_json(remote_access_sessions=aws_response_list_parser(paginate, it, 'remoteAccessSessions'))
-    elif module.params['list_runs']:
-        module.exit_json(runs=aws_response_list_parser(paginate, it, 'runs'))
-    elif module.params['list_samples']:
-        module.exit_json(samples=aws_response_list_parser(paginate, it, 'samples'))
-    elif module.params['list_suites']:
-        module.exit_json(suites=aws_response_list_parser(paginate, it, 'suites'))
-    elif module.params['list_test_grid_projects']:
-        module.exit_json(test_grid_projects=aws_response_list_parser(paginate, it, 'testGridProjects'))
-    elif module.params['list_test_grid_session_actions']:
-        module.exit_json(test_grid_session_actions=aws_response_list_parser(paginate, it, 'actions'))
-    elif module.params['list_test_grid_session_artifacts']:
-        module.exit_json(test_grid_session_artifacts=aws_response_list_parser(paginate, it, 'artifacts'))
-    elif module.params['list_test_grid_sessions']:
-        module.exit_json(test_grid_sessions=aws_response_list_parser(paginate, it, 'testGridSessions'))
-    elif module.params['list_tests']:
-        module.exit_json(tests=aws_response_list_parser(paginate, it, 'tests'))
-    elif module.params['list_uploads']:
-        module.exit_json(uploads=aws_response_list_parser(paginate, it, 'uploads'))
-    elif module.params['list_vpce_configurations']:
-        module.exit_json(vpce_configurations=aws_response_list_parser(paginate, it, 'vpceConfigurations'))
-    else:
-        module.exit_json(projects=aws_response_list_parser(paginate, it, 'projects'))
+    module.exit_json(**aws_info_run(module, 'devicefarm', _devicefarm_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
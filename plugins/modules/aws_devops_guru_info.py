@@ -63,6 +63,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -100,48 +101,42 @@ EXAMPLES = """
 RETURN = """
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 from ansible_collections.community.missing_collection.plugins.module_utils.utils import convert_str_to_datetime
 
 
-def _devops_guru(client, module):
-    try:
-        if module.params['describe_account_overview']:
-            return client.describe_account_overview(
-                FromTime=convert_str_to_datetime(module.params['from_time'])
-            ), False
-        elif module.params['describe_anomaly']:
-            return client.describe_anomaly(
-                Id=module.params['id']
-            ), False
-        elif module.params['describe_insight']:
-            return client.describe_insight(
-                Id=module.params['id']
-            ), False
-        elif module.params['describe_resource_collection_health']:
-            if client.can_paginate('describe_resource_collection_health'):
-                paginator = client.get_paginator('describe_resource_collection_health')
-                return paginator.paginate(
-                    ResourceCollectionType=module.params['resource_collection_type']
-                ), True
-            else:
-                return client.describe_resource_collection_health(
-                    ResourceCollectionType=module.params['resource_collection_type']
-                ), False
-        elif module.params['describe_service_integration']:
-            return client.describe_service_integration(), False
-        else:
-            return client.describe_account_health(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Device Guru details')
+def _from_time(module):
+    return convert_str_to_datetime(module.params['from_time'])
+
+
+_DEVOPS_GURU_OPERATIONS = dict(
+    describe_account_overview=aws_dict_operation('describe_account_overview', 'overview', FromTime=_from_time),
+    describe_anomaly=aws_dict_operation('describe_anomaly', 'anomaly', Id='id'),
+    describe_insight=aws_dict_operation('describe_insight', 'insight', Id='id'),
+    describe_resource_collection_health=aws_list_operation(
+        'describe_resource_collection_health',
+        'cloud_formation',
+        'CloudFormation',
+        ResourceCollectionType='resource_collection_type',
+    ),
+    describe_service_integration=aws_dict_operation('describe_service_integration', 'service_integration', 'ServiceIntegration'),
+)
+
+
+def _devops_guru_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DEVOPS_GURU_OPERATIONS,
+        default=aws_dict_operation('describe_account_health', 'health'),
+        error_msg='Failed to fetch AWS Device Guru details',
+    )
 
 
 def main():
@@ -155,8 +150,9 @@ def main():
         describe_resource_collection_health=dict(required=False, type=bool),
         describe_service_integration=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -175,21 +171,7 @@ def main():
         ],
     )
 
-    client = module.client('devops-guru', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _devops_guru(client, module)
-
-    if module.params['describe_account_overview']:
-        module.exit_json(overview=camel_dict_to_snake_dict(it))
-    elif module.params['describe_anomaly']:
-        module.exit_json(anomaly=camel_dict_to_snake_dict(it))
-    elif module.params['describe_insight']:
-        module.exit_json(insight=camel_dict_to_snake_dict(it))
-    elif module.params['describe_resource_collection_health']:
-        module.exit_json(cloud_formation=aws_response_list_parser(paginate, it, 'CloudFormation'))
-    elif module.params['describe_service_integration']:
-        module.exit_json(service_integration=camel_dict_to_snake_dict(it['ServiceIntegration']))
-    else:
-        module.exit_json(health=camel_dict_to_snake_dict(it))
+    module.exit_json(**aws_info_run(module, 'devops-guru', _devops_guru_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
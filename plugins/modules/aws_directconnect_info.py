@@ -81,6 +81,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -192,123 +193,53 @@ virtual_interfaces:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_DIRECTCONNECT_OPERATIONS = dict(
+    describe_connections=aws_list_operation('describe_connections', 'connections', 'connections', connectionId='id'),
+    describe_connections_on_interconnect=aws_list_operation(
+        'describe_connections_on_interconnect',
+        'connections',
+        'connections',
+        interconnectId='id',
+    ),
+    describe_direct_connect_gateway_association_proposals=aws_list_operation(
+        'describe_direct_connect_gateway_association_proposals',
+        'direct_connect_gateway_association_proposals',
+        'directConnectGatewayAssociationProposals',
+        directConnectGatewayId='id',
+    ),
+    describe_direct_connect_gateway_attachments=aws_list_operation(
+        'describe_direct_connect_gateway_attachments',
+        'direct_connect_gateway_attachments',
+        'directConnectGatewayAttachments',
+        directConnectGatewayId='id',
+    ),
+    describe_hosted_connections=aws_list_operation('describe_hosted_connections', 'connections', 'connections', connectionId='id'),
+    describe_interconnects=aws_list_operation('describe_interconnects', 'interconnects', 'interconnects', interconnectId='id'),
+    describe_lags=aws_list_operation('describe_lags', 'lags', 'lags', lagId='id'),
+    describe_loa=aws_dict_operation('describe_loa', 'loa', connectionId='id'),
+    describe_locations=aws_list_operation('describe_locations', 'locations', 'locations'),
+    describe_virtual_gateways=aws_list_operation('describe_virtual_gateways', 'virtual_gateways', 'virtualGateways'),
+    describe_virtual_interfaces=aws_list_operation('describe_virtual_interfaces', 'virtual_interfaces', 'virtualInterfaces', connectionId='id'),
+)
 
-def _directconnect(client, module):
-    try:
-        if module.params['describe_connections']:
-            if client.can_paginate('describe_connections'):
-                paginator = client.get_paginator('describe_connections')
-                return paginator.paginate(
-                    connectionId=module.params['id'],
-                ), True
-            else:
-                return client.describe_connections(
-                    connectionId=module.params['id'],
-                ), False
-        elif module.params['describe_connections_on_interconnect']:
-            if client.can_paginate('describe_connections_on_interconnect'):
-                paginator = client.get_paginator('describe_connections_on_interconnect')
-                return paginator.paginate(
-                    interconnectId=module.params['id'],
-                ), True
-            else:
-                return client.describe_connections_on_interconnect(
-                    interconnectId=module.params['id'],
-                ), False
-        elif module.params['describe_direct_connect_gateway_association_proposals']:
-            if client.can_paginate('describe_direct_connect_gateway_association_proposals'):
-                paginator = client.get_paginator('describe_direct_connect_gateway_association_proposals')
-                return paginator.paginate(
-                    directConnectGatewayId=module.params['id'],
-                ), True
-            else:
-                return client.describe_direct_connect_gateway_association_proposals(
-                    directConnectGatewayId=module.params['id'],
-                ), False
-        elif module.params['describe_direct_connect_gateway_attachments']:
-            if client.can_paginate('describe_direct_connect_gateway_attachments'):
-                paginator = client.get_paginator('describe_direct_connect_gateway_attachments')
-                return paginator.paginate(
-                    directConnectGatewayId=module.params['id'],
-                ), True
-            else:
-                return client.describe_direct_connect_gateway_attachments(
-                    directConnectGatewayId=module.params['id'],
-                ), False
-        elif module.params['describe_hosted_connections']:
-            if client.can_paginate('describe_hosted_connections'):
-                paginator = client.get_paginator('describe_hosted_connections')
-                return paginator.paginate(
-                    connectionId=module.params['id'],
-                ), True
-            else:
-                return client.describe_hosted_connections(
-                    connectionId=module.params['id'],
-                ), False
-        elif module.params['describe_interconnects']:
-            if client.can_paginate('describe_interconnects'):
-                paginator = client.get_paginator('describe_interconnects')
-                return paginator.paginate(
-                    interconnectId=module.params['id'],
-                ), True
-            else:
-                return client.describe_interconnects(
-                    interconnectId=module.params['id'],
-                ), False
-        elif module.params['describe_lags']:
-            if client.can_paginate('describe_lags'):
-                paginator = client.get_paginator('describe_lags')
-                return paginator.paginate(
-                    lagId=module.params['id'],
-                ), True
-            else:
-                return client.describe_lags(
-                    lagId=module.params['id'],
-                ), False
-        elif module.params['describe_loa']:
-            return client.describe_loa(
-                connectionId=module.params['id'],
-            ), False
-        elif module.params['describe_locations']:
-            if client.can_paginate('describe_locations'):
-                paginator = client.get_paginator('describe_locations')
-                return paginator.paginate(), True
-            else:
-                return client.describe_locations(), False
-        elif module.params['describe_virtual_gateways']:
-            if client.can_paginate('describe_virtual_gateways'):
-                paginator = client.get_paginator('describe_virtual_gateways')
-                return paginator.paginate(), True
-            else:
-                return client.describe_virtual_gateways(), False
-        elif module.params['describe_virtual_interfaces']:
-            if client.can_paginate('describe_virtual_interfaces'):
-                paginator = client.get_paginator('describe_virtual_interfaces')
-                return paginator.paginate(
-                    connectionId=module.params['id'],
-                ), True
-            else:
-                return client.describe_virtual_interfaces(
-                    connectionId=module.params['id'],
-                ), False
-        else:
-            if client.can_paginate('describe_direct_connect_gateways'):
-                paginator = client.get_paginator('describe_direct_connect_gateways')
-                return paginator.paginate(), True
-            else:
-                return client.describe_direct_connect_gateways(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Direct Connect details')
+
+def _directconnect_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DIRECTCONNECT_OPERATIONS,
+        default=aws_list_operation('describe_direct_connect_gateways', 'direct_connect_gateways', 'directConnectGateways'),
+        error_msg='Failed to fetch AWS Direct Connect details',
+    )
 
 
 def main():
@@ -334,8 +265,9 @@ def main():
         describe_virtual_gateways=dict(required=False, type=bool),
         describe_virtual_interfaces=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -366,29 +298,7 @@ def main():
         ],
     )
 
-    client = module.client('directconnect', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _directconnect(client, module)
-
-    if module.params['describe_connections'] or module.params['describe_connections_on_interconnect'] or module.params['describe_hosted_connections']:
-        module.exit_json(connections=aws_response_list_parser(paginate, it, 'connections'))
-    elif module.params['describe_direct_connect_gateway_association_proposals']:
-        module.exit_json(direct_connect_gateway_association_proposals=aws_response_list_parser(paginate, it, 'directConnectGatewayAssociationProposals'))
-    elif module.params['describe_direct_connect_gateway_attachments']:
-        module.exit_json(direct_connect_gateway_attachments=aws_response_list_parser(paginate, it, 'directConnectGatewayAttachments'))
-    elif module.params['describe_interconnects']:
-        module.exit_json(interconnects=aws_response_list_parser(paginate, it, 'interconnects'))
-    elif module.params['describe_lags']:
-        module.exit_json(lags=aws_response_list_parser(paginate, it, 'lags'))
-    elif module.params['describe_loa']:
-        module.exit_json(loa=camel_dict_to_snake_dict(it))
-    elif module.params['describe_locations']:
-        module.exit_json(locations=aws_response_list_parser(paginate, it, 'locations'))
-    elif module.params['describe_virtual_gateways']:
-        module.exit_json(virtual_gateways=aws_response_list_parser(paginate, it, 'virtualGateways'))
-    elif module.params['describe_virtual_interfaces']:
-        module.exit_json(virtual_interfaces=aws_response_list_parser(paginate, it, 'virtualInterfaces'))
-    else:
-        module.exit_json(direct_connect_gateways=aws_response_list_parser(paginate, it, 'directConnectGateways'))
+    module.exit_json(**aws_info_run(module, 'directconnect', _directconnect_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
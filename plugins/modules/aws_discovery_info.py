@@ -62,6 +62,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -120,70 +121,36 @@ import_tasks:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _discovery(client, module):
-    try:
-        if module.params['list_configurations']:
-            if client.can_paginate('list_configurations'):
-                paginator = client.get_paginator('list_configurations')
-                return paginator.paginate(
-                    configurationType=module.params['configuration_type'],
-                ), True
-            else:
-                return client.list_configurations(
-                    configurationType=module.params['configuration_type'],
-                ), False
-        elif module.params['describe_agents']:
-            if client.can_paginate('describe_agents'):
-                paginator = client.get_paginator('describe_agents')
-                return paginator.paginate(), True
-            else:
-                return client.describe_agents(), False
-        elif module.params['describe_configurations']:
-            if client.can_paginate('describe_configurations'):
-                paginator = client.get_paginator('describe_configurations')
-                return paginator.paginate(
-                    configurationIds=module.params['ids'],
-                ), True
-            else:
-                return client.describe_configurations(
-                    configurationIds=module.params['ids'],
-                ), False
-        elif module.params['describe_continuous_exports']:
-            if client.can_paginate('describe_continuous_exports'):
-                paginator = client.get_paginator('describe_continuous_exports')
-                return paginator.paginate(), True
-            else:
-                return client.describe_continuous_exports(), False
-        elif module.params['describe_export_tasks']:
-            if client.can_paginate('describe_export_tasks'):
-                paginator = client.get_paginator('describe_export_tasks')
-                return paginator.paginate(
-                    exportIds=module.params['ids'],
-                ), True
-            else:
-                return client.describe_export_tasks(
-                    exportIds=module.params['ids'],
-                ), False
-        elif module.params['describe_import_tasks']:
-            if client.can_paginate('describe_import_tasks'):
-                paginator = client.get_paginator('describe_import_tasks')
-                return paginator.paginate(), True
-            else:
-                return client.describe_import_tasks(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Discovery details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DISCOVERY_OPERATIONS = dict(
+    list_configurations=aws_list_operation(
+        'list_configurations',
+        'configurations',
+        'configurations',
+        configurationType='configuration_type',
+    ),
+    describe_agents=aws_list_operation('describe_agents', 'agents', 'agentsInfo'),
+    describe_configurations=aws_list_operation('describe_configurations', 'configurations', 'configurations', configurationIds='ids'),
+    describe_continuous_exports=aws_list_operation('describe_continuous_exports', 'continuous_exports', 'descriptions'),
+    describe_export_tasks=aws_list_operation('describe_export_tasks', 'export_tasks', 'exportsInfo', exportIds='ids'),
+    describe_import_tasks=aws_list_operation('describe_import_tasks', 'import_tasks', 'tasks'),
+)
+
+
+def _discovery_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DISCOVERY_OPERATIONS,
+        error_msg='Failed to fetch AWS Discovery details',
+    )
 
 
 def main():
@@ -197,8 +164,9 @@ def main():
         describe_export_tasks=dict(required=False, type=bool),
         describe_import_tasks=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_configurations', True, ['ids']),
@@ -216,21 +184,7 @@ def main():
         ],
     )
 
-    client = module.client('discovery', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _discovery(client, module)
-
-    if module.params['list_configurations'] or module.params['describe_configurations']:
-        module.exit_json(configurations=aws_response_list_parser(paginate, it, 'configurations'))
-    elif module.params['describe_agents']:
-        module.exit_json(agents=aws_response_list_parser(paginate, it, 'agentsInfo'))
-    elif module.params['describe_continuous_exports']:
-        module.exit_json(continuous_exports=aws_response_list_parser(paginate, it, 'descriptions'))
-    elif module.params['describe_export_tasks']:
-        module.exit_json(export_tasks=aws_response_list_parser(paginate, it, 'exportsInfo'))
-    elif module.params['describe_import_tasks']:
-        module.exit_json(import_tasks=aws_response_list_parser(paginate, it, 'tasks'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'discovery', _discovery_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -47,6 +47,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -112,39 +113,28 @@ policies:
 
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _dlm(client, module):
-    try:
-        if module.params['get_lifecycle_policy']:
-            return client.get_lifecycle_policy(
-                PolicyId=module.params['id']
-            ), False
-        elif module.params['get_lifecycle_policies']:
-            if client.can_paginate('get_lifecycle_policies'):
-                paginator = client.get_paginator('get_lifecycle_policies')
-                return paginator.paginate(
-                    State=module.params['state'],
-                    ResourceTypes=module.params['resource_types'],
-                ), True
-            else:
-                return client.get_lifecycle_policies(
-                    State=module.params['state'],
-                    ResourceTypes=module.params['resource_types'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS DLM details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DLM_OPERATIONS = dict(
+    get_lifecycle_policy=aws_dict_operation('get_lifecycle_policy', 'policy', 'Policy', PolicyId='id'),
+    get_lifecycle_policies=aws_list_operation('get_lifecycle_policies', 'policies', 'Policies', State='state', ResourceTypes='resource_types'),
+)
+
+
+def _dlm_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DLM_OPERATIONS,
+        error_msg='Failed to fetch AWS DLM details',
+    )
 
 
 def main():
@@ -155,8 +145,9 @@ def main():
         get_lifecycle_policy=dict(required=False, type=bool),
         get_lifecycle_policies=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -171,15 +162,7 @@ def main():
         ],
     )
 
-    client = module.client('dlm', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _dlm(client, module)
-
-    if module.params['get_lifecycle_policy']:
-        module.exit_json(policy=camel_dict_to_snake_dict(it['Policy']))
-    elif module.params['get_lifecycle_policies']:
-        module.exit_json(policies=aws_response_list_parser(paginate, it, 'Policies'))
-    else:
-        module.fail_json_aws("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'dlm', _dlm_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -82,6 +82,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -174,90 +175,35 @@ schemas:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _dms(client, module):
-    try:
-        if module.params['describe_replication_instances']:
-            if client.can_paginate('describe_replication_instances'):
-                paginator = client.get_paginator('describe_replication_instances')
-                return paginator.paginate(), True
-            else:
-                return client.describe_replication_instances(), False
-        elif module.params['describe_certificates']:
-            if client.can_paginate('describe_certificates'):
-                paginator = client.get_paginator('describe_certificates')
-                return paginator.paginate(), True
-            else:
-                return client.describe_certificates(), False
-        elif module.params['describe_endpoints']:
-            if client.can_paginate('describe_endpoints'):
-                paginator = client.get_paginator('describe_endpoints')
-                return paginator.paginate(), True
-            else:
-                return client.describe_endpoints(), False
-        elif module.params['describe_event_categories']:
-            if client.can_paginate('describe_event_categories'):
-                paginator = client.get_paginator('describe_event_categories')
-                return paginator.paginate(), True
-            else:
-                return client.describe_event_categories(), False
-        elif module.params['describe_event_subscriptions']:
-            if client.can_paginate('describe_event_subscriptions'):
-                paginator = client.get_paginator('describe_event_subscriptions')
-                return paginator.paginate(), True
-            else:
-                return client.describe_event_subscriptions(), False
-        elif module.params['describe_events']:
-            if client.can_paginate('describe_events'):
-                paginator = client.get_paginator('describe_events')
-                return paginator.paginate(
-                    SourceType=module.params['source_type'],
-                ), True
-            else:
-                return client.describe_events(
-                    SourceType=module.params['source_type'],
-                ), False
-        elif module.params['describe_pending_maintenance_actions']:
-            if client.can_paginate('describe_pending_maintenance_actions'):
-                paginator = client.get_paginator('describe_pending_maintenance_actions')
-                return paginator.paginate(), True
-            else:
-                return client.describe_pending_maintenance_actions(), False
-        elif module.params['describe_replication_subnet_groups']:
-            if client.can_paginate('describe_replication_subnet_groups'):
-                paginator = client.get_paginator('describe_replication_subnet_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_replication_subnet_groups(), False
-        elif module.params['describe_replication_tasks']:
-            if client.can_paginate('describe_replication_tasks'):
-                paginator = client.get_paginator('describe_replication_tasks')
-                return paginator.paginate(), True
-            else:
-                return client.describe_replication_tasks(), False
-        elif module.params['describe_schemas']:
-            if client.can_paginate('describe_schemas'):
-                paginator = client.get_paginator('describe_schemas')
-                return paginator.paginate(
-                    EndpointArn=module.params['arn'],
-                ), True
-            else:
-                return client.describe_schemas(
-                    EndpointArn=module.params['arn'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS DMS details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DMS_OPERATIONS = dict(
+    describe_replication_instances=aws_list_operation('describe_replication_instances', 'replication_instances', 'ReplicationInstances'),
+    describe_certificates=aws_list_operation('describe_certificates', 'certificates', 'Certificates'),
+    describe_endpoints=aws_list_operation('describe_endpoints', 'endpoints', 'Endpoints'),
+    describe_event_categories=aws_list_operation('describe_event_categories', 'event_categories', 'EventCategoryGroupList'),
+    describe_event_subscriptions=aws_list_operation('describe_event_subscriptions', 'event_subscriptions', 'EventSubscriptionsList'),
+    describe_events=aws_list_operation('describe_events', 'events', 'Events', SourceType='source_type'),
+    describe_pending_maintenance_actions=aws_list_operation('describe_pending_maintenance_actions', 'pending_maintenance_actions', 'PendingMaintenanceActions'),
+    describe_replication_subnet_groups=aws_list_operation('describe_replication_subnet_groups', 'replication_subnet_groups', 'ReplicationSubnetGroups'),
+    describe_replication_tasks=aws_list_operation('describe_replication_tasks', 'replication_tasks', 'ReplicationTasks'),
+    describe_schemas=aws_list_operation('describe_schemas', 'schemas', 'Schemas', EndpointArn='arn'),
+)
+
+
+def _dms_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DMS_OPERATIONS,
+        error_msg='Failed to fetch AWS DMS details',
+    )
 
 
 def main():
@@ -275,8 +221,9 @@ def main():
         describe_replication_tasks=dict(required=False, type=bool),
         describe_schemas=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_schemas', True, ['arn']),
@@ -297,31 +244,7 @@ def main():
         ],
     )
 
-    client = module.client('dms', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _dms(client, module)
-
-    if module.params['describe_replication_instances']:
-        module.exit_json(replication_instances=aws_response_list_parser(paginate, it, 'ReplicationInstances'))
-    elif module.params['describe_certificates']:
-        module.exit_json(certificates=aws_response_list_parser(paginate, it, 'Certificates'))
-    elif module.params['describe_endpoints']:
-        module.exit_json(endpoints=aws_response_list_parser(paginate, it, 'Endpoints'))
-    elif module.params['describe_event_categories']:
-        module.exit_json(event_categories=aws_response_list_parser(paginate, it, 'EventCategoryGroupList'))
-    elif module.params['describe_event_subscriptions']:
-        module.exit_json(event_subscriptions=aws_response_list_parser(paginate, it, 'EventSubscriptionsList'))
-    elif module.params['describe_events']:
-        module.exit_json(events=aws_response_list_parser(paginate, it, 'Events'))
-    elif module.params['describe_pending_maintenance_actions']:
-        module.exit_json(pending_maintenance_actions=aws_response_list_parser(paginate, it, 'PendingMaintenanceActions'))
-    elif module.params['describe_replication_subnet_groups']:
-        module.exit_json(replication_subnet_groups=aws_response_list_parser(paginate, it, 'ReplicationSubnetGroups'))
-    elif module.params['describe_replication_tasks']:
-        module.exit_json(replication_tasks=aws_response_list_parser(paginate, it, 'ReplicationTasks'))
-    elif module.params['describe_schemas']:
-        module.exit_json(schemas=aws_response_list_parser(paginate, it, 'Schemas'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'dms', _dms_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
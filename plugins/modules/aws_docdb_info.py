@@ -89,6 +89,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -171,98 +172,62 @@ event_categories:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 from ansible_collections.community.missing_collection.plugins.module_utils.utils import convert_str_to_datetime
 
 
-def _docdb(client, module):
-    try:
-        if module.params['describe_db_cluster_parameter_groups']:
-            if client.can_paginate('describe_db_cluster_parameter_groups'):
-                paginator = client.get_paginator('describe_db_cluster_parameter_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_cluster_parameter_groups(), False
-        elif module.params['describe_certificates']:
-            if client.can_paginate('describe_certificates'):
-                paginator = client.get_paginator('describe_certificates')
-                return paginator.paginate(), True
-            else:
-                return client.describe_certificates(), False
-        elif module.params['describe_db_cluster_parameters']:
-            if client.can_paginate('describe_db_cluster_parameters'):
-                paginator = client.get_paginator('describe_db_cluster_parameters')
-                return paginator.paginate(
-                    DBClusterParameterGroupName=module.params['name'],
-                ), True
-            else:
-                return client.describe_db_cluster_parameters(
-                    DBClusterParameterGroupName=module.params['name'],
-                ), False
-        elif module.params['describe_db_cluster_snapshots']:
-            if client.can_paginate('describe_db_cluster_snapshots'):
-                paginator = client.get_paginator('describe_db_cluster_snapshots')
-                return paginator.paginate(
-                    SnapshotType=module.params['snapshot_type'],
-                ), True
-            else:
-                return client.describe_db_cluster_snapshots(
-                    SnapshotType=module.params['snapshot_type'],
-                ), False
-        elif module.params['describe_db_instances']:
-            if client.can_paginate('describe_db_instances'):
-                paginator = client.get_paginator('describe_db_instances')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_instances(), False
-        elif module.params['describe_db_subnet_groups']:
-            if client.can_paginate('describe_db_subnet_groups'):
-                paginator = client.get_paginator('describe_db_subnet_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_subnet_groups(), False
-        elif module.params['describe_event_categories']:
-            if client.can_paginate('describe_event_categories'):
-                paginator = client.get_paginator('describe_event_categories')
-                return paginator.paginate(
-                    SourceType=module.params['source_type'],
-                ), True
-            else:
-                return client.describe_event_categories(
-                    SourceType=module.params['source_type'],
-                ), False
-        elif module.params['describe_events']:
-            _end_time = convert_str_to_datetime(module.params['end_time'])
-            _start_time = convert_str_to_datetime(module.params['start_time'])
-            if _start_time is None or _end_time is None:
-                module.fail_json("date format is wrong, correct format: '2020-06-01'")
+def _start_time(module):
+    return convert_str_to_datetime(module.params['start_time'])
+
+
+def _end_time(module):
+    return convert_str_to_datetime(module.params['end_time'])
+
 
-            if client.can_paginate('describe_events'):
-                paginator = client.get_paginator('describe_events')
-                return paginator.paginate(
-                    EndTime=_end_time,
-                    StartTime=_start_time,
-                ), True
-            else:
-                return client.describe_events(
-                    EndTime=_end_time,
-                    StartTime=_start_time,
-                ), False
-        else:
-            if client.can_paginate('describe_db_clusters'):
-                paginator = client.get_paginator('describe_db_clusters')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_clusters(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Doc DB details')
+_DOCDB_OPERATIONS = dict(
+    describe_db_cluster_parameter_groups=aws_list_operation(
+        'describe_db_cluster_parameter_groups',
+        'db_cluster_parameter_groups',
+        'DBClusterParameterGroups',
+    ),
+    describe_certificates=aws_list_operation('describe_certificates', 'certificates', 'Certificates'),
+    describe_db_cluster_parameters=aws_list_operation(
+        'describe_db_cluster_parameters',
+        'parameters',
+        'Parameters',
+        DBClusterParameterGroupName='name',
+    ),
+    describe_db_cluster_snapshots=aws_list_operation(
+        'describe_db_cluster_snapshots',
+        'snapshots',
+        'DBClusterSnapshots',
+        SnapshotType='snapshot_type',
+    ),
+    describe_db_instances=aws_list_operation('describe_db_instances', 'instances', 'DBInstances'),
+    describe_db_subnet_groups=aws_list_operation('describe_db_subnet_groups', 'db_subnet_groups', 'DBSubnetGroups'),
+    describe_event_categories=aws_list_operation(
+        'describe_event_categories',
+        'event_categories',
+        'EventCategoriesMapList',
+        SourceType='source_type',
+    ),
+    describe_events=aws_list_operation('describe_events', 'events', 'Events', EndTime=_end_time, StartTime=_start_time),
+)
+
+
+def _docdb_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DOCDB_OPERATIONS,
+        default=aws_list_operation('describe_db_clusters', 'clusters', 'DBClusters'),
+        error_msg='Failed to fetch AWS Doc DB details',
+    )
 
 
 def main():
@@ -289,8 +254,9 @@ def main():
         describe_event_categories=dict(required=False, type=bool),
         describe_events=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_db_cluster_parameters', True, ['name']),
@@ -310,27 +276,11 @@ def main():
         ],
     )
 
-    client = module.client('docdb', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _docdb(client, module)
+    if module.params['describe_events']:
+        if _start_time(module) is None or _end_time(module) is None:
+            module.fail_json(msg="date format is wrong, correct format: '2020-06-01'")
 
-    if module.params['describe_db_cluster_parameter_groups']:
-        module.exit_json(db_cluster_parameter_groups=aws_response_list_parser(paginate, it, 'DBClusterParameterGroups'))
-    elif module.params['describe_certificates']:
-        module.exit_json(certificates=aws_response_list_parser(paginate, it, 'Certificates'))
-    elif module.params['describe_db_cluster_parameters']:
-        module.exit_json(parameters=aws_response_list_parser(paginate, it, 'Parameters'))
-    elif module.params['describe_db_cluster_snapshots']:
-        module.exit_json(snapshots=aws_response_list_parser(paginate, it, 'DBClusterSnapshots'))
-    elif module.params['describe_db_instances']:
-        module.exit_json(instances=aws_response_list_parser(paginate, it, 'DBInstances'))
-    elif module.params['describe_db_subnet_groups']:
-        module.exit_json(db_subnet_groups=aws_response_list_parser(paginate, it, 'DBSubnetGroups'))
-    elif module.params['describe_event_categories']:
-        module.exit_json(event_categories=aws_response_list_parser(paginate, it, 'EventCategoriesMapList'))
-    elif module.params['describe_events']:
-        module.exit_json(events=aws_response_list_parser(paginate, it, 'Events'))
-    else:
-        module.exit_json(clusters=aws_response_list_parser(paginate, it, 'DBClusters'))
+    module.exit_json(**aws_info_run(module, 'docdb', _docdb_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
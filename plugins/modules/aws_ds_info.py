@@ -75,6 +75,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -169,118 +170,35 @@ trusts:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _ds(client, module):
-    try:
-        if module.params['describe_directories']:
-            if client.can_paginate('describe_directories'):
-                paginator = client.get_paginator('describe_directories')
-                return paginator.paginate(), True
-            else:
-                return client.describe_directories(), False
-        elif module.params['list_certificates']:
-            if client.can_paginate('list_certificates'):
-                paginator = client.get_paginator('list_certificates')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.list_certificates(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['list_ip_routes']:
-            if client.can_paginate('list_ip_routes'):
-                paginator = client.get_paginator('list_ip_routes')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.list_ip_routes(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['list_log_subscriptions']:
-            if client.can_paginate('list_log_subscriptions'):
-                paginator = client.get_paginator('list_log_subscriptions')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.list_log_subscriptions(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['list_schema_extensions']:
-            if client.can_paginate('list_schema_extensions'):
-                paginator = client.get_paginator('list_schema_extensions')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.list_schema_extensions(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['describe_conditional_forwarders']:
-            if client.can_paginate('describe_conditional_forwarders'):
-                paginator = client.get_paginator('describe_conditional_forwarders')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_conditional_forwarders(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['describe_domain_controllers']:
-            if client.can_paginate('describe_domain_controllers'):
-                paginator = client.get_paginator('describe_domain_controllers')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_domain_controllers(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['describe_event_topics']:
-            if client.can_paginate('describe_event_topics'):
-                paginator = client.get_paginator('describe_event_topics')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_event_topics(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['describe_snapshots']:
-            if client.can_paginate('describe_snapshots'):
-                paginator = client.get_paginator('describe_snapshots')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_snapshots(
-                    DirectoryId=module.params['id'],
-                ), False
-        elif module.params['describe_trusts']:
-            if client.can_paginate('describe_trusts'):
-                paginator = client.get_paginator('describe_trusts')
-                return paginator.paginate(
-                    DirectoryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_trusts(
-                    DirectoryId=module.params['id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Directory Service details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DS_OPERATIONS = dict(
+    describe_directories=aws_list_operation('describe_directories', 'directories', 'DirectoryDescriptions'),
+    list_certificates=aws_list_operation('list_certificates', 'certificates', 'CertificatesInfo', DirectoryId='id'),
+    list_ip_routes=aws_list_operation('list_ip_routes', 'ip_routes', 'IpRoutesInfo', DirectoryId='id'),
+    list_log_subscriptions=aws_list_operation('list_log_subscriptions', 'log_subscriptions', 'LogSubscriptions', DirectoryId='id'),
+    list_schema_extensions=aws_list_operation('list_schema_extensions', 'schema_extensions', 'SchemaExtensionsInfo', DirectoryId='id'),
+    describe_conditional_forwarders=aws_list_operation('describe_conditional_forwarders', 'conditional_forwarders', 'ConditionalForwarders', DirectoryId='id'),
+    describe_domain_controllers=aws_list_operation('describe_domain_controllers', 'domain_controllers', 'DomainControllers', DirectoryId='id'),
+    describe_event_topics=aws_list_operation('describe_event_topics', 'event_topics', 'EventTopics', DirectoryId='id'),
+    describe_snapshots=aws_list_operation('describe_snapshots', 'snapshots', 'Snapshots', DirectoryId='id'),
+    describe_trusts=aws_list_operation('describe_trusts', 'trusts', 'Trusts', DirectoryId='id'),
+)
+
+
+def _ds_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DS_OPERATIONS,
+        error_msg='Failed to fetch AWS Directory Service details',
+    )
 
 
 def main():
@@ -297,8 +215,9 @@ def main():
         describe_snapshots=dict(required=False, type=bool),
         describe_trusts=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_certificates', True, ['id']),
@@ -327,31 +246,7 @@ def main():
         ],
     )
 
-    client = module.client('ds', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ds(client, module)
-
-    if module.params['describe_directories']:
-        module.exit_json(directories=aws_response_list_parser(paginate, it, 'DirectoryDescriptions'))
-    elif module.params['list_certificates']:
-        module.exit_json(certificates=aws_response_list_parser(paginate, it, 'CertificatesInfo'))
-    elif module.params['list_ip_routes']:
-        module.exit_json(ip_routes=aws_response_list_parser(paginate, it, 'IpRoutesInfo'))
-    elif module.params['list_log_subscriptions']:
-        module.exit_json(log_subscriptions=aws_response_list_parser(paginate, it, 'LogSubscriptions'))
-    elif module.params['list_schema_extensions']:
-        module.exit_json(schema_extensions=aws_response_list_parser(paginate, it, 'SchemaExtensionsInfo'))
-    elif module.params['describe_conditional_forwarders']:
-        module.exit_json(conditional_forwarders=aws_response_list_parser(paginate, it, 'ConditionalForwarders'))
-    elif module.params['describe_domain_controllers']:
-        module.exit_json(domain_controllers=aws_response_list_parser(paginate, it, 'DomainControllers'))
-    elif module.params['describe_event_topics']:
-        module.exit_json(event_topics=aws_response_list_parser(paginate, it, 'EventTopics'))
-    elif module.params['describe_snapshots']:
-        module.exit_json(snapshots=aws_response_list_parser(paginate, it, 'Snapshots'))
-    elif module.params['describe_trusts']:
-        module.exit_json(trusts=aws_response_list_parser(paginate, it, 'Trusts'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'ds', _ds_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -69,6 +69,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -141,73 +142,33 @@ global_table:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _dynamodb(client, module):
-    try:
-        if module.params['list_global_tables']:
-            if client.can_paginate('list_global_tables'):
-                paginator = client.get_paginator('list_global_tables')
-                return paginator.paginate(), True
-            else:
-                return client.list_global_tables(), False
-        elif module.params['list_exports']:
-            if client.can_paginate('list_exports'):
-                paginator = client.get_paginator('list_exports')
-                return paginator.paginate(
-                    TableArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_exports(
-                    TableArn=module.params['arn'],
-                ), False
-        elif module.params['list_contributor_insights']:
-            if client.can_paginate('list_contributor_insights'):
-                paginator = client.get_paginator('list_contributor_insights')
-                return paginator.paginate(
-                    TableName=module.params['name'],
-                ), True
-            else:
-                return client.list_contributor_insights(
-                    TableName=module.params['name'],
-                ), False
-        elif module.params['list_backups']:
-            if client.can_paginate('list_backups'):
-                paginator = client.get_paginator('list_backups')
-                return paginator.paginate(
-                    TableName=module.params['name'],
-                    BackupType=module.params['backup_type'],
-                ), True
-            else:
-                return client.list_backups(
-                    TableName=module.params['name'],
-                    BackupType=module.params['backup_type'],
-                ), False
-        elif module.params['describe_table']:
-            return client.describe_table(
-                TableName=module.params['name'],
-            ), False
-        elif module.params['describe_global_table']:
-            return client.describe_global_table(
-                GlobalTableName=module.params['name'],
-            ), False
-        else:
-            if client.can_paginate('list_tables'):
-                paginator = client.get_paginator('list_tables')
-                return paginator.paginate(), True
-            else:
-                return client.list_tables(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Dynamo DB details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_DYNAMODB_OPERATIONS = dict(
+    list_global_tables=aws_list_operation('list_global_tables', 'global_tables', 'GlobalTables'),
+    list_exports=aws_list_operation('list_exports', 'exports', 'ExportSummaries', TableArn='arn'),
+    list_contributor_insights=aws_list_operation('list_contributor_insights', 'contributor_insights', 'ContributorInsightsSummaries', TableName='name'),
+    list_backups=aws_list_operation('list_backups', 'backups', 'BackupSummaries', TableName='name', BackupType='backup_type'),
+    describe_table=aws_dict_operation('describe_table', 'table', 'Table', TableName='name'),
+    describe_global_table=aws_dict_operation('describe_global_table', 'global_table', 'GlobalTableDescription', GlobalTableName='name'),
+)
+
+
+def _dynamodb_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _DYNAMODB_OPERATIONS,
+        default=aws_list_operation('list_tables', 'tables', 'TableNames'),
+        error_msg='Failed to fetch AWS Dynamo DB details',
+    )
 
 
 def main():
@@ -226,8 +187,9 @@ def main():
         describe_table=dict(required=False, type=bool),
         describe_global_table=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_exports', True, ['arn']),
@@ -248,23 +210,7 @@ def main():
         ],
     )
 
-    client = module.client('dynamodb', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _dynamodb(client, module)
-
-    if module.params['list_global_tables']:
-        module.exit_json(global_tables=aws_response_list_parser(paginate, it, 'GlobalTables'))
-    elif module.params['list_exports']:
-        module.exit_json(exports=aws_response_list_parser(paginate, it, 'ExportSummaries'))
-    elif module.params['list_contributor_insights']:
-        module.exit_json(contributor_insights=aws_response_list_parser(paginate, it, 'ContributorInsightsSummaries'))
-    elif module.params['list_backups']:
-        module.exit_json(backups=aws_response_list_parser(paginate, it, 'BackupSummaries'))
-    elif module.params['describe_table']:
-        module.exit_json(table=camel_dict_to_snake_dict(it['Table']))
-    elif module.params['describe_global_table']:
-        module.exit_json(global_table=camel_dict_to_snake_dict(it['GlobalTableDescription']))
-    else:
-        module.exit_json(tables=aws_response_list_parser(paginate, it, 'TableNames'))
+    module.exit_json(**aws_info_run(module, 'dynamodb', _dynamodb_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
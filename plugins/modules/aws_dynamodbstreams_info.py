@@ -34,6 +34,7 @@ options:
   shard_iterator_type:
     description:
       - type of shard iterator.
+      - with I(read_stream) only C(TRIM_HORIZON) and C(LATEST) are allowed, used for shards without checkpoint. default C(TRIM_HORIZON).
     required: false
     type: str
     choices: ['TRIM_HORIZON', 'LATEST', 'AT_SEQUENCE_NUMBER', 'AFTER_SEQUENCE_NUMBER']
@@ -67,11 +68,41 @@ options:
       - do you want to get records for given I(shard_iterator)?
     required: false
     type: bool
+  read_stream:
+    description:
+      - do you want to read records of all shards of given stream I(stream_arn)?
+      - shards are read concurrently by I(max_workers) threads, child shards after a split are read once their parent is read to its end.
+      - open shards are read until no more records are returned.
+      - stops at I(max_records) or I(time_budget), whichever comes first.
+      - I(page_size) is maximum records per get_records call.
+      - records are written to I(dest) or compared with I(since_state) like items of other options.
+    required: false
+    type: bool
+  checkpoint_file:
+    description:
+      - file on target with last read sequence number of every shard, used with I(read_stream).
+      - reading continues after checkpoints and file is replaced with new checkpoints when module succeeds.
+      - can not be used with I(regions) or I(account_ids).
+    required: false
+    type: path
+  max_records:
+    description:
+      - maximum number of records returned by I(read_stream).
+    required: false
+    type: int
+    default: 1000
+  time_budget:
+    description:
+      - seconds after which I(read_stream) stops calling aws and returns records read so far.
+    required: false
+    type: float
+    default: 30
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -100,6 +131,14 @@ EXAMPLES = """
   aws_dynamodbstreams_info:
     get_records: true
     shard_iterator: 'test'
+
+- name: "read records of all shards, next run continues where this one stopped."
+  aws_dynamodbstreams_info:
+    read_stream: true
+    stream_arn: 'test-arn'
+    checkpoint_file: '/var/lib/ansible/test-stream.json'
+    max_records: 5000
+    time_budget: 60
 """
 
 RETURN = """
@@ -116,9 +155,18 @@ shard_iterator:
   returned: when `get_shard_iterator` is defined and success
   type: dict
 records:
-  description: get records for given iterator.
-  returned: when `get_records` is defined and success
+  description: get records for given iterator or records of all shards in shard lineage order.
+  returned: when `get_records` or `read_stream` is defined and success
   type: list
+shards:
+  description: number of read records of every read shard and if shard was read to its end.
+  returned: when `read_stream` is defined and success
+  type: dict
+  sample: {'shardId-00000001': {'records': 10, 'finished': true}}
+stopped:
+  description: C(max_records) or C(time_budget) if reading stopped before all shards were caught up, else null.
+  returned: when `read_stream` is defined and success
+  type: str
 """
 
 try:
@@ -126,49 +174,112 @@ try:
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible.module_utils._text import to_native
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_items_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_stream_reader import aws_stream_checkpoints_load
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_stream_reader import aws_stream_checkpoints_save
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_stream_reader import aws_stream_read
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_dict_to_snake_dict
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_to_snake
 
 
-def _dynamodbstreams(client, module):
+_DYNAMODBSTREAMS_OPERATIONS = dict(
+    list_streams=aws_list_operation('list_streams', 'streams', 'Streams', TableName='name'),
+    describe_stream=aws_dict_operation('describe_stream', 'stream', 'StreamDescription', StreamArn='stream_arn'),
+    get_shard_iterator=aws_dict_operation(
+        'get_shard_iterator',
+        'shard_iterator',
+        'ShardIterator',
+        StreamArn='stream_arn',
+        ShardId='shard_id',
+        ShardIteratorType='shard_iterator_type',
+        SequenceNumber='sequence_number',
+    ),
+    get_records=aws_list_operation('get_records', 'records', 'Records', ShardIterator='shard_iterator'),
+)
+
+
+def _stream_shards(client, stream_arn: str) -> list:
+    # describe_stream has no paginator, shards are paged by last evaluated shard id.
+    shards = []
+    params = dict(StreamArn=stream_arn)
+    while True:
+        description = client.describe_stream(**params, **aws_info_retry_params(client))['StreamDescription']
+        shards += description.get('Shards', [])
+        if not description.get('LastEvaluatedShardId'):
+            return shards
+        params['ExclusiveStartShardId'] = description['LastEvaluatedShardId']
+
+
+def _stream_record(record: dict) -> dict:
+    # attribute names of keys and images are table data, they are returned as they are.
+    item = camel_dict_to_snake_dict(dict((k, v) for k, v in record.items() if k != 'dynamodb'))
+    item['dynamodb'] = dict((camel_to_snake(k), v) for k, v in record.get('dynamodb', {}).items())
+    return item
+
+
+def _read_stream_result(client, module) -> dict:
+    if module.params['shard_iterator_type'] not in (None, 'TRIM_HORIZON', 'LATEST'):
+        aws_info_fail_usage(module, 'shard_iterator_type must be TRIM_HORIZON or LATEST with read_stream')
+    if module.params.get('cache'):
+        aws_info_fail_usage(module, 'cache can not be used with read_stream')
+    if module.params['checkpoint_file'] and (module.params.get('regions') or module.params.get('account_ids')):
+        # one file would be replaced by checkpoints of every region and account.
+        aws_info_fail_usage(module, 'checkpoint_file can not be used with regions or account_ids')
+
+    checkpoint_file = module.params['checkpoint_file']
+    checkpoints = {}
+    if checkpoint_file:
+        try:
+            checkpoints = aws_stream_checkpoints_load(checkpoint_file, module.params['stream_arn'])
+        except (IOError, OSError, ValueError, KeyError) as e:
+            module.fail_json(msg='unable to read checkpoint_file {0}: {1}'.format(checkpoint_file, to_native(e)))
+
     try:
-        if module.params['list_streams']:
-            if client.can_paginate('list_streams'):
-                paginator = client.get_paginator('list_streams')
-                return paginator.paginate(
-                    TableName=module.params['name'],
-                ), True
-            else:
-                return client.list_streams(
-                    TableName=module.params['name'],
-                ), False
-        elif module.params['describe_stream']:
-            return client.describe_stream(
-                StreamArn=module.params['stream_arn'],
-            ), False
-        elif module.params['get_shard_iterator']:
-            return client.describe_stream(
-                StreamArn=module.params['stream_arn'],
-                ShardId=module.params['shard_id'],
-                ShardIteratorType=module.params['shard_iterator_type'],
-                SequenceNumber=module.params['sequence_number'],
-            ), False
-        elif module.params['get_records']:
-            if client.can_paginate('get_records'):
-                paginator = client.get_paginator('get_records')
-                return paginator.paginate(
-                    ShardIterator=module.params['shard_iterator'],
-                ), True
-            else:
-                return client.get_records(
-                    ShardIterator=module.params['shard_iterator'],
-                ), False
-        else:
-            return None, False
+        read = aws_stream_read(
+            client,
+            dict(StreamArn=module.params['stream_arn']),
+            _stream_shards(client, module.params['stream_arn']),
+            checkpoints,
+            lambda record: record['dynamodb']['SequenceNumber'],
+            _stream_record,
+            iterator_type=module.params['shard_iterator_type'] or 'TRIM_HORIZON',
+            max_records=module.params['max_records'],
+            time_budget=module.params['time_budget'],
+            limit=module.params['page_size'],
+            max_workers=module.params['max_workers'],
+        )
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS dynamodbstreams details')
+        module.fail_json_aws(e, msg='Failed to read AWS dynamodbstreams records')
+
+    for warning in read['warnings']:
+        module.warn(warning)
+    if checkpoint_file:
+        try:
+            aws_stream_checkpoints_save(checkpoint_file, module.params['stream_arn'], read['checkpoints'])
+        except (IOError, OSError) as e:
+            module.fail_json(msg='unable to write checkpoint_file {0}: {1}'.format(checkpoint_file, to_native(e)))
+    return dict(records=aws_response_items_parser(read['records']), shards=read['shards'], stopped=read['stopped'])
+
+
+def _dynamodbstreams_result(client, module) -> dict:
+    if module.params['read_stream']:
+        return _read_stream_result(client, module)
+    return aws_operations_result(
+        client,
+        module,
+        _DYNAMODBSTREAMS_OPERATIONS,
+        error_msg='Failed to fetch AWS dynamodbstreams details',
+    )
 
 
 def main():
@@ -186,15 +297,21 @@ def main():
         describe_stream=dict(required=False, type=bool),
         get_shard_iterator=dict(required=False, type=bool),
         get_records=dict(required=False, type=bool),
+        read_stream=dict(required=False, type=bool),
+        checkpoint_file=dict(required=False, type='path'),
+        max_records=dict(required=False, type=int, default=1000),
+        time_budget=dict(required=False, type=float, default=30),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_streams', True, ['name']),
             ('describe_stream', True, ['stream_arn']),
             ('get_shard_iterator', True, ['stream_arn', 'shard_id', 'shard_iterator_type', 'sequence_number']),
             ('get_records', True, ['shard_iterator']),
+            ('read_stream', True, ['stream_arn']),
         ),
         mutually_exclusive=[
             (
@@ -202,23 +319,12 @@ def main():
                 'describe_stream',
                 'get_shard_iterator',
                 'get_records',
+                'read_stream',
             )
         ],
     )
 
-    client = module.client('dynamodbstreams', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _dynamodbstreams(client, module)
-
-    if module.params['list_streams']:
-        module.exit_json(streams=aws_response_list_parser(paginate, it, 'Streams'))
-    elif module.params['describe_stream']:
-        module.exit_json(stream=camel_dict_to_snake_dict(it['StreamDescription']))
-    elif module.params['get_shard_iterator']:
-        module.exit_json(shard_iterator=camel_dict_to_snake_dict(it['ShardIterator']))
-    elif module.params['get_records']:
-        module.exit_json(records=aws_response_list_parser(paginate, it, 'Records'))
-    else:
-        module.fail_json_aws("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'dynamodbstreams', _dynamodbstreams_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
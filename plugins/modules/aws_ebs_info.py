@@ -20,16 +20,42 @@ options:
       - id of the snapshot.
     required: false
     type: str
+  first_snapshot_id:
+    description:
+      - id of older snapshot of same volume, I(list_changed_blocks) and I(download_snapshot) use blocks changed since it.
+    required: false
+    type: str
+  image_file:
+    description:
+      - local raw image file written by I(download_snapshot).
+      - blocks are written into temporary file next to it, which replaces I(image_file) only after all blocks are written.
+      - new image is sparse file of volume size, or sparse copy of I(image_file) updated with changed blocks if I(first_snapshot_id) is given.
+    required: false
+    type: path
   list_snapshot_blocks:
     description:
       - do you want to get details of snapshot blocks for given I(id)?
     required: false
     type: bool
+  list_changed_blocks:
+    description:
+      - do you want to get blocks of snapshot I(id) which changed since I(first_snapshot_id) merged into contiguous extents?
+      - all written blocks of I(id) if I(first_snapshot_id) isn't given.
+    required: false
+    type: bool
+  download_snapshot:
+    description:
+      - do you want to write blocks of snapshot I(id) into I(image_file)?
+      - blocks are fetched on I(max_workers) threads and written through memory mapped file, checksum of every block is verified.
+      - with I(first_snapshot_id), I(image_file) must be image of I(first_snapshot_id) and only changed blocks are written.
+    required: false
+    type: bool
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -40,6 +66,26 @@ EXAMPLES = """
   aws_ebs_info:
     list_snapshot_blocks: true
     id: 'test-id'
+
+- name: "Gets changed blocks between two snapshots."
+  aws_ebs_info:
+    list_changed_blocks: true
+    first_snapshot_id: 'snap-0123456789abcdef0'
+    id: 'snap-0123456789abcdef1'
+
+- name: "Download snapshot into sparse raw image."
+  aws_ebs_info:
+    download_snapshot: true
+    id: 'snap-0123456789abcdef0'
+    image_file: '/var/backups/volume.img'
+    max_workers: 32
+
+- name: "Update image of older snapshot with blocks of newer one."
+  aws_ebs_info:
+    download_snapshot: true
+    first_snapshot_id: 'snap-0123456789abcdef0'
+    id: 'snap-0123456789abcdef1'
+    image_file: '/var/backups/volume.img'
 """
 
 RETURN = """
@@ -47,57 +93,298 @@ snapshot_blocks:
   description: detailed information about the snapshot blocks.
   returned: when `list_snapshot_blocks` and `id` are defined and success
   type: list
+changed_blocks:
+  description:
+    - summary of changed blocks, I(extents) are runs of contiguous changed blocks with their byte offset and length.
+    - blocks written in I(first_snapshot_id) and removed in I(id) are changed too.
+  returned: when `list_changed_blocks` and `id` are defined and success
+  type: dict
+  sample: {
+    'block_size': 524288,
+    'volume_size': 8,
+    'expiry_time': '2021-01-01T01:00:00+00:00',
+    'blocks': 3,
+    'bytes': 1572864,
+    'extents': [
+        {'start_block': 0, 'blocks': 2, 'offset': 0, 'length': 1048576},
+        {'start_block': 10, 'blocks': 1, 'offset': 5242880, 'length': 524288}
+    ]
+  }
+snapshot_image:
+  description: written image file, I(blocks) fetched from snapshot and I(zeroed_blocks) cleared because they were removed since I(first_snapshot_id).
+  returned: when `download_snapshot` and `id` are defined and success
+  type: dict
+  sample: {
+    'image_file': '/var/backups/volume.img',
+    'block_size': 524288,
+    'volume_size': 8,
+    'blocks': 2048,
+    'bytes': 1073741824,
+    'zeroed_blocks': 0
+  }
 """
 
+import base64
+import hashlib
+import itertools
+import mmap
+import os
+import shutil
+import tempfile
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible.module_utils._text import to_native
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_EBS_OPERATIONS = dict(
+    list_snapshot_blocks=aws_list_operation('list_snapshot_blocks', 'snapshot_blocks', 'Blocks', SnapshotId='id'),
+)
+
+
+_GIB = 1024 ** 3
+_COPY_CHUNK = 1024 * 1024
+# submitted blocks per worker, bounds memory of futures for volumes with millions of blocks.
+_BLOCKS_IN_FLIGHT = 4
+
+
+def _snapshot_block_pages(client, module):
+    """
+    :return: iterator of ( {'BlockSize', 'VolumeSize', 'ExpiryTime'}, [( block index, block token or None if block was removed )] ) per page.
+    """
+    # ebs apis have no paginators.
+    if module.params['first_snapshot_id']:
+        api, field = client.list_changed_blocks, 'ChangedBlocks'
+        params = dict(FirstSnapshotId=module.params['first_snapshot_id'], SecondSnapshotId=module.params['id'])
+    else:
+        api, field = client.list_snapshot_blocks, 'Blocks'
+        params = dict(SnapshotId=module.params['id'])
+    if module.params['page_size']:
+        params['MaxResults'] = module.params['page_size']
+    while True:
+        response = api(**params, **aws_info_retry_params(client))
+        info = dict((k, response[k]) for k in ('BlockSize', 'VolumeSize', 'ExpiryTime') if k in response)
+        yield info, [(block['BlockIndex'], block.get('BlockToken', block.get('SecondBlockToken'))) for block in response.get(field, [])]
+        if not response.get('NextToken'):
+            return
+        params['NextToken'] = response['NextToken']
+
+
+def _snapshot_blocks(client, module) -> tuple:
+    """
+    :return: ( info of last page, all blocks sorted by index ), see `_snapshot_block_pages`.
+    """
+    info = {}
+    blocks = []
+    for info, page in _snapshot_block_pages(client, module):
+        blocks += page
+    return info, sorted(blocks)
 
 
-def _ebs(client, module):
+def _block_extents(indexes: list, block_size: int) -> list:
+    extents = []
+    for index in indexes:
+        if extents and extents[-1]['start_block'] + extents[-1]['blocks'] == index:
+            extents[-1]['blocks'] += 1
+        else:
+            extents.append(dict(start_block=index, blocks=1))
+    for extent in extents:
+        extent.update(offset=extent['start_block'] * block_size, length=extent['blocks'] * block_size)
+    return extents
+
+
+def _changed_blocks_result(client, module) -> dict:
     try:
-        if module.params['list_snapshot_blocks']:
-            if client.can_paginate('list_snapshot_blocks'):
-                paginator = client.get_paginator('list_snapshot_blocks')
-                return paginator.paginate(
-                    SnapshotId=module.params['id'],
-                ), True
+        info, blocks = _snapshot_blocks(client, module)
+    except (BotoCoreError, ClientError) as e:
+        module.fail_json_aws(e, msg='Failed to list AWS ebs changed blocks')
+    block_size = info.get('BlockSize', 0)
+    return dict(changed_blocks=dict(
+        block_size=block_size,
+        volume_size=info.get('VolumeSize'),
+        expiry_time=info.get('ExpiryTime'),
+        blocks=len(blocks),
+        bytes=len(blocks) * block_size,
+        extents=_block_extents([index for index, _token in blocks], block_size),
+    ))
+
+
+class _BlockChecksumError(Exception):
+    """
+    downloaded block doesn't match checksum returned by aws.
+    """
+
+    def __init__(self, index: int, expected: str, actual: str):
+        super(_BlockChecksumError, self).__init__(
+            'checksum of block {0} does not match, expected {1} got {2}'.format(index, expected, actual)
+        )
+        self.index = index
+        self.expected = expected
+        self.actual = actual
+
+
+def _download_block(client, snapshot_id: str, index: int, token: str, block_size: int, image: mmap.mmap):
+    offset = index * block_size
+    if token is None:
+        image[offset:offset + block_size] = bytes(block_size)
+        return
+    response = client.get_snapshot_block(SnapshotId=snapshot_id, BlockIndex=index, BlockToken=token, **aws_info_retry_params(client))
+    data = response['BlockData'].read()
+    checksum = base64.b64encode(hashlib.sha256(data).digest()).decode('ascii')
+    if response.get('ChecksumAlgorithm', 'SHA256') != 'SHA256' or checksum != response.get('Checksum'):
+        raise _BlockChecksumError(index, response.get('Checksum'), checksum)
+    image[offset:offset + len(data)] = data
+
+
+def _copy_sparse(source: str, f):
+    # copy base image without allocating its holes, all zero chunks are skipped.
+    with open(source, 'rb') as src:
+        while True:
+            chunk = src.read(_COPY_CHUNK)
+            if not chunk:
+                break
+            if chunk.count(0) == len(chunk):
+                f.seek(len(chunk), os.SEEK_CUR)
             else:
-                return client.list_snapshot_blocks(
-                    SnapshotId=module.params['id'],
-                ), False
-        else:
-            return None, False
+                f.write(chunk)
+    f.truncate(f.tell())
+
+
+def _download_blocks(client, module, pages, image: mmap.mmap, block_size: int) -> tuple:
+    """
+    fetch blocks with at most `_BLOCKS_IN_FLIGHT` per worker submitted, no more blocks are submitted after first error.
+
+    :return: ( written blocks, zeroed blocks )
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    max_workers = max(1, module.params['max_workers'])
+    written = zeroed = 0
+    running = set()
+
+    def _done(futures):
+        for future in futures:
+            # raises first error, `with` waits for running blocks before it is reported.
+            future.result()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _info, blocks in pages:
+            for index, token in blocks:
+                if len(running) >= max_workers * _BLOCKS_IN_FLIGHT:
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+                    _done(finished)
+                running.add(executor.submit(_download_block, client, module.params['id'], index, token, block_size, image))
+                if token is None:
+                    zeroed += 1
+                else:
+                    written += 1
+        _done(wait(running)[0])
+    return written, zeroed
+
+
+def _download_snapshot_result(client, module) -> dict:
+    if module.params.get('regions') or module.params.get('account_ids'):
+        aws_info_fail_usage(module, 'download_snapshot can not be used with regions or account_ids')
+    if module.params.get('cache'):
+        aws_info_fail_usage(module, 'cache can not be used with download_snapshot')
+    image_file = module.params['image_file']
+    if module.params['first_snapshot_id'] and not os.path.isfile(image_file):
+        aws_info_fail_usage(module, 'image_file {0} of first_snapshot_id does not exist'.format(image_file))
+
+    # image_file is replaced only after all blocks are written, failed run leaves it as it was.
+    tmp = None
+    try:
+        pages = _snapshot_block_pages(client, module)
+        info, first_blocks = next(pages)
+        size = info['VolumeSize'] * _GIB
+        image_dir = os.path.dirname(os.path.abspath(image_file))
+        fd, tmp = tempfile.mkstemp(dir=image_dir, prefix='.' + os.path.basename(image_file), suffix='.tmp')
+        with os.fdopen(fd, 'w+b') as f:
+            if module.params['first_snapshot_id']:
+                _copy_sparse(image_file, f)
+            # blocks which aren't written stay holes of sparse file.
+            f.truncate(size)
+            image = mmap.mmap(f.fileno(), size)
+            try:
+                written, zeroed = _download_blocks(client, module, itertools.chain([(info, first_blocks)], pages), image, info['BlockSize'])
+                image.flush()
+            finally:
+                image.close()
+            os.fsync(f.fileno())
+        if os.path.exists(image_file):
+            shutil.copymode(image_file, tmp)
+        os.replace(tmp, image_file)
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS ebs details')
+        module.fail_json_aws(e, msg='Failed to download AWS ebs snapshot blocks')
+    except _BlockChecksumError as e:
+        module.fail_json(msg='block {0} of snapshot {1} is corrupt, checksum expected {2} got {3}'.format(e.index, module.params['id'], e.expected, e.actual))
+    except (IOError, OSError, ValueError) as e:
+        module.fail_json(msg='unable to write image_file {0}: {1}'.format(image_file, to_native(e)))
+    finally:
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+    return dict(snapshot_image=dict(
+        image_file=image_file,
+        block_size=info['BlockSize'],
+        volume_size=info['VolumeSize'],
+        blocks=written,
+        bytes=written * info['BlockSize'],
+        zeroed_blocks=zeroed,
+    ))
+
+
+def _ebs_result(client, module) -> dict:
+    if module.params['list_changed_blocks']:
+        return _changed_blocks_result(client, module)
+    if module.params['download_snapshot']:
+        return _download_snapshot_result(client, module)
+    return aws_operations_result(
+        client,
+        module,
+        _EBS_OPERATIONS,
+        error_msg='Failed to fetch AWS ebs details',
+    )
 
 
 def main():
     argument_spec = dict(
         id=dict(required=False),
+        first_snapshot_id=dict(required=False),
+        image_file=dict(required=False, type='path'),
         list_snapshot_blocks=dict(required=False, type=bool),
+        list_changed_blocks=dict(required=False, type=bool),
+        download_snapshot=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_snapshot_blocks', True, ['id']),
+            ('list_changed_blocks', True, ['id']),
+            ('download_snapshot', True, ['id', 'image_file']),
         ),
-        mutually_exclusive=[],
+        mutually_exclusive=[
+            (
+                'list_snapshot_blocks',
+                'list_changed_blocks',
+                'download_snapshot',
+            )
+        ],
     )
 
-    client = module.client('ebs', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ebs(client, module)
-
-    if module.params['list_snapshot_blocks']:
-        module.exit_json(snapshot_blocks=aws_response_list_parser(paginate, it, 'Blocks'))
-    else:
-        module.fail_json_aws("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'ebs', _ebs_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -42,11 +42,20 @@ options:
       - do you want to get list of ecr images for given I(id) and I(name)?
     required: false
     type: bool
+  expand:
+    description:
+      - with I(list_images), describe listed images in same task and return C(image_details) instead of C(images).
+      - images are described in batches of 100, up to I(max_workers) batches at same time.
+      - I(fields) is applied on details, I(max_items) limits listed images.
+    required: false
+    type: bool
+    default: false
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -68,6 +77,14 @@ EXAMPLES = """
     id: '{{ _reg.registry.registry_id }}'
     name: 'test-repository-name'
     tag_status: 'ANY'
+
+- name: "Gets details of all tagged images for given repository and registry."
+  aws_ecr_info:
+    list_images: true
+    expand: true
+    id: '{{ _reg.registry.registry_id }}'
+    name: 'test-repository-name'
+    tag_status: 'TAGGED'
 """
 
 RETURN = """
@@ -81,57 +98,75 @@ repositories:
   type: list
 images:
   description: list of images for given repository and registry.
-  returned: when `list_images`, `name` and `id` are defined and success
+  returned: when `list_images`, `name` and `id` are defined without `expand` and success
+  type: list
+image_details:
+  description: details of images for given repository and registry.
+  returned: when `list_images`, `expand`, `name` and `id` are defined and success
   type: list
 """
 
+from functools import partial
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _ecr(client, module):
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operation_items
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_batch_parser
+
+
+_ECR_OPERATIONS = dict(
+    describe_repositories=aws_list_operation('describe_repositories', 'repositories', 'repositories', registryId='id'),
+    list_images=aws_list_operation(
+        'list_images',
+        'images',
+        'imageIds',
+        registryId='id',
+        repositoryName='name',
+        filter={'tagStatus': 'tag_status'},
+    ),
+)
+
+
+def _ecr_image_details(client, module) -> list:
     try:
-        if module.params['describe_repositories']:
-            if client.can_paginate('describe_repositories'):
-                paginator = client.get_paginator('describe_repositories')
-                return paginator.paginate(
-                    registryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_repositories(
-                    registryId=module.params['id'],
-                ), False
-        elif module.params['list_images']:
-            if client.can_paginate('list_images'):
-                paginator = client.get_paginator('list_images')
-                return paginator.paginate(
-                    registryId=module.params['id'],
-                    repositoryName=module.params['name'],
-                    filter={
-                        'tagStatus': module.params['tag_status']
-                    }
-                ), True
-            else:
-                return client.list_images(
-                    registryId=module.params['id'],
-                    repositoryName=module.params['name'],
-                    filter={
-                        'tagStatus': module.params['tag_status']
-                    }
-                ), False
-        else:
-            return client.describe_registry(), False
+        # image with many tags is listed once per tag.
+        digests = list(dict.fromkeys(image['image_digest'] for image in aws_operation_items(client, module, _ECR_OPERATIONS['list_images'])))
+        return aws_response_batch_parser(
+            partial(client.describe_images, registryId=module.params['id'], repositoryName=module.params['name'], **aws_info_retry_params(client)),
+            'imageIds',
+            [dict(imageDigest=digest) for digest in digests],
+            'imageDetails',
+            100,
+            max_workers=module.params['max_workers'],
+            fields=module.params['fields'],
+        )
     except (BotoCoreError, ClientError) as e:
         module.fail_json_aws(e, msg='Failed to fetch AWS ECR details')
 
 
+def _ecr_result(client, module) -> dict:
+    if module.params['list_images'] and module.params['expand']:
+        return dict(image_details=_ecr_image_details(client, module))
+    return aws_operations_result(
+        client,
+        module,
+        _ECR_OPERATIONS,
+        default=aws_dict_operation('describe_registry', 'registry'),
+        error_msg='Failed to fetch AWS ECR details',
+    )
+
+
 def main():
     argument_spec = dict(
         id=dict(required=False),
@@ -139,9 +174,11 @@ def main():
         tag_status=dict(required=False, choices=['TAGGED', 'UNTAGGED', 'ANY'], default='ANY'),
         describe_repositories=dict(required=False, type=bool),
         list_images=dict(required=False, type=bool),
+        expand=dict(required=False, type=bool, default=False),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_repositories', True, ['id']),
@@ -150,15 +187,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('ecr', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ecr(client, module)
-
-    if module.params['describe_repositories']:
-        module.exit_json(repositories=aws_response_list_parser(paginate, it, 'repositories'))
-    elif module.params['list_images']:
-        module.exit_json(images=aws_response_list_parser(paginate, it, 'imageIds'))
-    else:
-        module.exit_json(registry=camel_dict_to_snake_dict(it))
+    module.exit_json(**aws_info_run(module, 'ecr', _ecr_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
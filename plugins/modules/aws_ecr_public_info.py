@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -77,48 +78,28 @@ images:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _ecr_public(client, module):
-    try:
-        if module.params['describe_repositories']:
-            if client.can_paginate('describe_repositories'):
-                paginator = client.get_paginator('describe_repositories')
-                return paginator.paginate(
-                    registryId=module.params['id'],
-                ), True
-            else:
-                return client.describe_repositories(
-                    registryId=module.params['id'],
-                ), False
-        elif module.params['describe_images']:
-            if client.can_paginate('describe_images'):
-                paginator = client.get_paginator('describe_images')
-                return paginator.paginate(
-                    registryId=module.params['id'],
-                    repositoryName=module.params['name'],
-                ), True
-            else:
-                return client.describe_images(
-                    registryId=module.params['id'],
-                    repositoryName=module.params['name'],
-                ), False
-        else:
-            if client.can_paginate('describe_registries'):
-                paginator = client.get_paginator('describe_registries')
-                return paginator.paginate(), True
-            else:
-                return client.describe_registries(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS ecr_public details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ECR_PUBLIC_OPERATIONS = dict(
+    describe_repositories=aws_list_operation('describe_repositories', 'repositories', 'repositories', registryId='id'),
+    describe_images=aws_list_operation('describe_images', 'images', 'imageDetails', registryId='id', repositoryName='name'),
+)
+
+
+def _ecr_public_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ECR_PUBLIC_OPERATIONS,
+        default=aws_list_operation('describe_registries', 'registries', 'registries'),
+        error_msg='Failed to fetch AWS ecr_public details',
+    )
 
 
 def main():
@@ -128,8 +109,9 @@ def main():
         describe_repositories=dict(required=False, type=bool),
         describe_images=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_repositories', True, ['id']),
@@ -138,15 +120,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('ecr-public', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ecr_public(client, module)
-
-    if module.params['describe_repositories']:
-        module.exit_json(repositories=aws_response_list_parser(paginate, it, 'repositories'))
-    elif module.params['describe_images']:
-        module.exit_json(images=aws_response_list_parser(paginate, it, 'imageDetails'))
-    else:
-        module.exit_json(registries=aws_response_list_parser(paginate, it, 'registries'))
+    module.exit_json(**aws_info_run(module, 'ecr-public', _ecr_public_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
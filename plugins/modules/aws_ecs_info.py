@@ -105,11 +105,21 @@ options:
       - do you want to get details of tasks for given cluster I(arn) and tasks I(arns)?
     required: false
     type: bool
+  expand:
+    description:
+      - describe listed arns in same task and return details instead of arns.
+      - works with no arguments ( clusters ), I(list_container_instances), I(list_services) and I(list_tasks).
+      - arns are described in batches of api limit ( 10 services or 100 clusters / container instances / tasks ), up to I(max_workers) batches at same time.
+      - I(fields) is applied on details, I(max_items) limits listed arns.
+    required: false
+    type: bool
+    default: false
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -120,6 +130,25 @@ EXAMPLES = """
   aws_ecs_info:
   register: _reg
 
+- name: "get list of cluster arns in multiple regions."
+  aws_ecs_info:
+    regions: ['eu-central-1', 'eu-west-1', 'us-east-1']
+
+- name: "get list of cluster arns in all regions."
+  aws_ecs_info:
+    regions: 'all'
+    max_workers: 5
+
+- name: "get details of all services of cluster without hitting describe services limit"
+  aws_ecs_info:
+    list_services: true
+    expand: true
+    arn: '{{ _reg.cluster_arns[0] }}'
+    launch_type: 'FARGATE'
+    rate_limit: 20
+    rate_limit_operations:
+      DescribeServices: 5
+
 - name: "get list of container instance arns"
   aws_ecs_info:
     list_container_instances: true
@@ -132,6 +161,13 @@ EXAMPLES = """
     arn: '{{ _reg.cluster_arns[0] }}'
     launch_type: 'EC2'
 
+- name: "get details of all services of cluster"
+  aws_ecs_info:
+    list_services: true
+    expand: true
+    arn: '{{ _reg.cluster_arns[0] }}'
+    launch_type: 'FARGATE'
+
 - name: "get list of task definition arns"
   aws_ecs_info:
     list_task_definitions: true
@@ -144,11 +180,32 @@ EXAMPLES = """
     launch_type: 'EC2'
     task_desired_status: 'RUNNING'
 
+- name: "get details of running tasks"
+  aws_ecs_info:
+    list_tasks: true
+    expand: true
+    arn: '{{ _reg.cluster_arns[0] }}'
+    launch_type: 'EC2'
+    task_desired_status: 'RUNNING'
+    fields: ['task_arn', 'last_status', 'containers.name']
+
 - name: "get details of clusters"
   aws_ecs_info:
     describe_clusters: true
     arns: ['test-arn']
 
+- name: "get only arn, name and status of clusters"
+  aws_ecs_info:
+    describe_clusters: true
+    arns: ['test-arn']
+    fields: ['cluster_arn', 'cluster_name', 'status']
+
+- name: "get arn and tag keys of clusters with jmespath"
+  aws_ecs_info:
+    describe_clusters: true
+    arns: ['test-arn']
+    fields: "{arn: clusterArn, tag_keys: tags[].key}"
+
 - name: "get details of container instances"
   aws_ecs_info:
     describe_container_instances: true
@@ -176,15 +233,15 @@ EXAMPLES = """
 RETURN = """
 cluster_arns:
   description: list of cluster arns.
-  returned: when no arguments are defined and success
+  returned: when no arguments are defined without `expand` and success
   type: list
 container_instance_arns:
   description: list of container instance arns
-  returned: when `list_container_instances` is defined and success
+  returned: when `list_container_instances` is defined without `expand` and success
   type: list
 service_arns:
   description: list of service arns.
-  returned: when `list_services` is defined and success
+  returned: when `list_services` is defined without `expand` and success
   type: list
 task_definition_arns:
   description: list of task definition arns.
@@ -192,19 +249,19 @@ task_definition_arns:
   type: list
 task_arns:
   description: list of task arns.
-  returned: when `list_tasks` is defined and success
+  returned: when `list_tasks` is defined without `expand` and success
   type: list
 clusters:
   description: details about clusters.
-  returned: when `describe_clusters` is defined and success
+  returned: when `describe_clusters` is defined or only `expand` is defined and success
   type: list
 container_instances:
   description: details about container instances.
-  returned: when `describe_container_instances` is defined and success
+  returned: when `describe_container_instances` is defined or `list_container_instances` and `expand` are defined and success
   type: list
 services:
   description: details about services.
-  returned: when `describe_services` is defined and success
+  returned: when `describe_services` is defined or `list_services` and `expand` are defined and success
   type: list
 task_definition:
   description: details about task definitions.
@@ -212,129 +269,99 @@ task_definition:
   type: dict
 tasks:
   description: details about tasks.
-  returned: when `describe_tasks` is defined and success
+  returned: when `describe_tasks` is defined or `list_tasks` and `expand` are defined and success
   type: list
 """
 
+from functools import partial
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_batch_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operation_items
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+_ECS_OPERATIONS = dict(
+    list_container_instances=aws_list_operation(
+        'list_container_instances',
+        'container_instance_arns',
+        'containerInstanceArns',
+        cluster='arn',
+        status='container_instance_status',
+    ),
+    list_services=aws_list_operation('list_services', 'service_arns', 'serviceArns', cluster='arn', launchType='launch_type'),
+    list_task_definitions=aws_list_operation('list_task_definitions', 'task_definition_arns', 'taskDefinitionArns', status='task_definition_status'),
+    list_tasks=aws_list_operation(
+        'list_tasks',
+        'task_arns',
+        'taskArns',
+        cluster='arn',
+        launchType='launch_type',
+        desiredStatus='task_desired_status',
+    ),
+    describe_clusters=aws_list_operation('describe_clusters', 'clusters', 'clusters', clusters='arns'),
+    describe_container_instances=aws_list_operation(
+        'describe_container_instances',
+        'container_instances',
+        'containerInstances',
+        containerInstances='arns',
+    ),
+    describe_services=aws_list_operation('describe_services', 'services', 'services', cluster='arn', services='names'),
+    describe_task_definition=aws_dict_operation('describe_task_definition', 'task_definition', 'taskDefinition', taskDefinition='arn'),
+    describe_tasks=aws_list_operation('describe_tasks', 'tasks', 'tasks', cluster='arn', tasks='arns'),
+)
+
+_ECS_LIST_CLUSTERS = aws_list_operation('list_clusters', 'cluster_arns', 'clusterArns')
 
+# arns listed by option ( None is clusters ) which `expand` describes: (describe api, arns parameter, resource field, result key, batch size)
+_ECS_EXPAND = {
+    None: ('describe_clusters', 'clusters', 'clusters', 'clusters', 100),
+    'list_container_instances': ('describe_container_instances', 'containerInstances', 'containerInstances', 'container_instances', 100),
+    'list_services': ('describe_services', 'services', 'services', 'services', 10),
+    'list_tasks': ('describe_tasks', 'tasks', 'tasks', 'tasks', 100),
+}
 
-def _ecs(client, module):
+
+def _ecs_expand(client, module) -> dict:
+    option = next((k for k in _ECS_EXPAND if k is not None and module.params[k]), None)
+    operation = _ECS_OPERATIONS[option] if option is not None else _ECS_LIST_CLUSTERS
+    api, parameter, resource_field, result_key, batch_size = _ECS_EXPAND[option]
+    describe = partial(getattr(client, api), **aws_info_retry_params(client))
+    if option is not None:
+        describe = partial(describe, cluster=module.params['arn'])
     try:
-        if module.params['list_container_instances']:
-            if client.can_paginate('list_container_instances'):
-                paginator = client.get_paginator('list_container_instances')
-                return paginator.paginate(
-                    cluster=module.params['arn'],
-                    status=module.params['container_instance_status'],
-                ), True
-            else:
-                return client.list_container_instances(
-                    cluster=module.params['arn'],
-                    status=module.params['container_instance_status'],
-                ), False
-        elif module.params['list_services']:
-            if client.can_paginate('list_services'):
-                paginator = client.get_paginator('list_services')
-                return paginator.paginate(
-                    cluster=module.params['arn'],
-                    launchType=module.params['launch_type'],
-                ), True
-            else:
-                return client.list_services(
-                    cluster=module.params['arn'],
-                    launchType=module.params['launch_type'],
-                ), False
-        elif module.params['list_task_definitions']:
-            if client.can_paginate('list_task_definitions'):
-                paginator = client.get_paginator('list_task_definitions')
-                return paginator.paginate(
-                    status=module.params['task_definition_status'],
-                ), True
-            else:
-                return client.list_task_definitions(
-                    status=module.params['task_definition_status'],
-                ), False
-        elif module.params['list_tasks']:
-            if client.can_paginate('list_tasks'):
-                paginator = client.get_paginator('list_tasks')
-                return paginator.paginate(
-                    cluster=module.params['arn'],
-                    launchType=module.params['launch_type'],
-                    desiredStatus=module.params['task_desired_status'],
-                ), True
-            else:
-                return client.list_tasks(
-                    cluster=module.params['arn'],
-                    launchType=module.params['launch_type'],
-                    desiredStatus=module.params['task_desired_status'],
-                ), False
-        elif module.params['describe_clusters']:
-            if client.can_paginate('describe_clusters'):
-                paginator = client.get_paginator('describe_clusters')
-                return paginator.paginate(
-                    clusters=module.params['arns'],
-                ), True
-            else:
-                return client.describe_clusters(
-                    clusters=module.params['arns'],
-                ), False
-        elif module.params['describe_container_instances']:
-            if client.can_paginate('describe_container_instances'):
-                paginator = client.get_paginator('describe_container_instances')
-                return paginator.paginate(
-                    containerInstances=module.params['arns'],
-                ), True
-            else:
-                return client.describe_container_instances(
-                    containerInstances=module.params['arns'],
-                ), False
-        elif module.params['describe_services']:
-            if client.can_paginate('describe_services'):
-                paginator = client.get_paginator('describe_services')
-                return paginator.paginate(
-                    cluster=module.params['arn'],
-                    services=module.params['names'],
-                ), True
-            else:
-                return client.describe_services(
-                    cluster=module.params['arn'],
-                    services=module.params['names'],
-                ), False
-        elif module.params['describe_task_definition']:
-            return client.describe_task_definition(
-                taskDefinition=module.params['arn'],
-            ), False
-        elif module.params['describe_tasks']:
-            if client.can_paginate('describe_tasks'):
-                paginator = client.get_paginator('describe_tasks')
-                return paginator.paginate(
-                    cluster=module.params['arn'],
-                    tasks=module.params['arns'],
-                ), True
-            else:
-                return client.describe_tasks(
-                    cluster=module.params['arn'],
-                    tasks=module.params['arns'],
-                ), False
-        else:
-            if client.can_paginate('list_clusters'):
-                paginator = client.get_paginator('list_clusters')
-                return paginator.paginate(), True
-            else:
-                return client.list_clusters(), False
+        arns = list(aws_operation_items(client, module, operation))
+        return {
+            result_key: aws_response_batch_parser(
+                describe,
+                parameter,
+                arns,
+                resource_field,
+                batch_size,
+                max_workers=module.params['max_workers'],
+                fields=module.params['fields'],
+            )
+        }
     except (BotoCoreError, ClientError) as e:
         module.fail_json_aws(e, msg='Failed to fetch AWS ECS details')
 
 
+def _ecs_result(client, module) -> dict:
+    if module.params['expand'] and not any(module.params[k] for k in _ECS_OPERATIONS if k not in _ECS_EXPAND):
+        return _ecs_expand(client, module)
+    return aws_operations_result(client, module, _ECS_OPERATIONS, default=_ECS_LIST_CLUSTERS, error_msg='Failed to fetch AWS ECS details')
+
+
 def main():
     argument_spec = dict(
         arn=dict(required=False),
@@ -369,9 +396,11 @@ def main():
         describe_services=dict(required=False, type=bool),
         describe_task_definition=dict(required=False, type=bool),
         describe_tasks=dict(required=False, type=bool),
+        expand=dict(required=False, type=bool, default=False),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_container_instances', True, ['arn']),
@@ -398,29 +427,7 @@ def main():
         ],
     )
 
-    client = module.client('ecs', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ecs(client, module)
-
-    if module.params['list_container_instances']:
-        module.exit_json(container_instance_arns=aws_response_list_parser(paginate, it, 'containerInstanceArns'))
-    elif module.params['list_services']:
-        module.exit_json(service_arns=aws_response_list_parser(paginate, it, 'serviceArns'))
-    elif module.params['list_task_definitions']:
-        module.exit_json(task_definition_arns=aws_response_list_parser(paginate, it, 'taskDefinitionArns'))
-    elif module.params['list_tasks']:
-        module.exit_json(task_arns=aws_response_list_parser(paginate, it, 'taskArns'))
-    elif module.params['describe_clusters']:
-        module.exit_json(clusters=aws_response_list_parser(paginate, it, 'clusters'))
-    elif module.params['describe_container_instances']:
-        module.exit_json(container_instances=aws_response_list_parser(paginate, it, 'containerInstances'))
-    elif module.params['describe_services']:
-        module.exit_json(services=aws_response_list_parser(paginate, it, 'services'))
-    elif module.params['describe_task_definition']:
-        module.exit_json(task_definition=camel_dict_to_snake_dict(it['taskDefinition']))
-    elif module.params['describe_tasks']:
-        module.exit_json(tasks=aws_response_list_parser(paginate, it, 'tasks'))
-    else:
-        module.exit_json(cluster_arns=aws_response_list_parser(paginate, it, 'clusterArns'))
+    module.exit_json(**aws_info_run(module, 'ecs', _ecs_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
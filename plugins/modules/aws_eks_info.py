@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -74,6 +75,13 @@ EXAMPLES = """
   aws_eks_info:
     name: "{{ __all.clusters[1] }}"
     describe_cluster: true
+
+- name: "describe cluster once per 10 minutes for all hosts"
+  aws_eks_info:
+    name: "{{ __all.clusters[1] }}"
+    describe_cluster: true
+    cache: true
+    cache_ttl: 600
 """
 
 RETURN = """
@@ -137,44 +145,33 @@ cluster:
   }
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-
-
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _eks(eks, module):
-    try:
-        if module.params['list_fargate_profiles']:
-            paginator = eks.get_paginator('list_fargate_profiles')
-            iterator = paginator.paginate(
-                clusterName=module.params['name']
-            )
-        elif module.params['list_nodegroups']:
-            paginator = eks.get_paginator('list_nodegroups')
-            iterator = paginator.paginate(
-                clusterName=module.params['name']
-            )
-        elif module.params['list_addons']:
-            paginator = eks.get_paginator('list_addons')
-            iterator = paginator.paginate(
-                clusterName=module.params['name']
-            )
-        elif module.params['describe_cluster']:
-            return eks.describe_cluster(
-                name=module.params['name']
-            )
-        else:
-            paginator = eks.get_paginator('list_clusters')
-            iterator = paginator.paginate()
-        return iterator
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws eks details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_EKS_OPERATIONS = dict(
+    list_fargate_profiles=aws_list_operation('list_fargate_profiles', 'fargate_profile_names', 'fargateProfileNames', clusterName='name'),
+    list_nodegroups=aws_list_operation('list_nodegroups', 'node_groups', 'nodegroups', clusterName='name'),
+    list_addons=aws_list_operation('list_addons', 'addons', 'addons', clusterName='name'),
+    describe_cluster=aws_dict_operation('describe_cluster', 'cluster', 'cluster', name='name'),
+)
+
+_EKS_LIST_CLUSTERS = aws_list_operation('list_clusters', 'clusters', 'clusters')
+
+
+def _eks_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _EKS_OPERATIONS,
+        default=_EKS_LIST_CLUSTERS,
+        error_msg='Failed to fetch aws eks details',
+    )
 
 
 def main():
@@ -185,10 +182,10 @@ def main():
         list_addons=dict(required=False, type=bool),
         describe_cluster=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
-
         required_if=(
             ('list_fargate_profiles', True, ['name']),
             ('list_nodegroups', True, ['name']),
@@ -200,30 +197,7 @@ def main():
         ],
     )
 
-    eks = module.client('eks')
-
-    __default_return = []
-
-    _it = _eks(eks, module)
-    if _it is not None:
-        if module.params['list_fargate_profiles']:
-            for response in _it:
-                __default_return += response['fargateProfileNames']
-                module.exit_json(fargate_profile_names=__default_return)
-        elif module.params['list_nodegroups']:
-            for response in _it:
-                __default_return += response['nodegroups']
-                module.exit_json(node_groups=__default_return)
-        elif module.params['list_addons']:
-            for response in _it:
-                __default_return += response['addons']
-                module.exit_json(addons=__default_return)
-        elif module.params['describe_cluster']:
-            module.exit_json(cluster=camel_dict_to_snake_dict(_it['cluster']))
-        else:
-            for response in _it:
-                __default_return += response['clusters']
-                module.exit_json(clusters=__default_return)
+    module.exit_json(**aws_info_run(module, 'eks', _eks_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
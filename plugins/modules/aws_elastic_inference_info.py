@@ -47,6 +47,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -83,44 +84,33 @@ accelerator_offerings:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _elastic_inference(client, module):
-    try:
-        if module.params['describe_accelerators']:
-            if client.can_paginate('describe_accelerators'):
-                paginator = client.get_paginator('describe_accelerators')
-                return paginator.paginate(
-                    acceleratorIds=module.params['ids'],
-                ), True
-            else:
-                return client.describe_accelerators(
-                    acceleratorIds=module.params['ids'],
-                ), False
-        elif module.params['describe_accelerator_types']:
-            return client.describe_accelerator_types(), False
-        elif module.params['describe_accelerator_offerings']:
-            if client.can_paginate('describe_accelerator_offerings'):
-                paginator = client.get_paginator('describe_accelerator_offerings')
-                return paginator.paginate(
-                    locationType=module.params['location_type'],
-                ), True
-            else:
-                return client.describe_accelerator_offerings(
-                    locationType=module.params['location_type'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elastic Inference details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ELASTIC_INFERENCE_OPERATIONS = dict(
+    describe_accelerators=aws_list_operation('describe_accelerators', 'accelerators', 'acceleratorSet', acceleratorIds='ids'),
+    describe_accelerator_types=aws_list_operation('describe_accelerator_types', 'accelerator_types', 'acceleratorTypes'),
+    describe_accelerator_offerings=aws_list_operation(
+        'describe_accelerator_offerings',
+        'accelerator_offerings',
+        'acceleratorTypeOfferings',
+        locationType='location_type',
+    ),
+)
+
+
+def _elastic_inference_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ELASTIC_INFERENCE_OPERATIONS,
+        error_msg='Failed to fetch AWS Elastic Inference details',
+    )
 
 
 def main():
@@ -135,8 +125,9 @@ def main():
         describe_accelerator_types=dict(required=False, type=bool),
         describe_accelerator_offerings=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_accelerators', True, ['ids']),
@@ -150,17 +141,7 @@ def main():
         ],
     )
 
-    client = module.client('elastic-inference', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _elastic_inference(client, module)
-
-    if module.params['describe_accelerators']:
-        module.exit_json(accelerators=aws_response_list_parser(paginate, it, 'acceleratorSet'))
-    elif module.params['describe_accelerator_types']:
-        module.exit_json(accelerator_types=aws_response_list_parser(paginate, it, 'acceleratorTypes'))
-    elif module.params['describe_accelerator_offerings']:
-        module.exit_json(accelerator_offerings=aws_response_list_parser(paginate, it, 'acceleratorTypeOfferings'))
-    else:
-        module.fail_json_aws("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'elastic-inference', _elastic_inference_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
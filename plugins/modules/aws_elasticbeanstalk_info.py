@@ -71,6 +71,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -160,83 +161,50 @@ events:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _elasticbeanstalk(client, module):
-    try:
-        if module.params['describe_application_versions']:
-            if client.can_paginate('describe_application_versions'):
-                paginator = client.get_paginator('describe_application_versions')
-                return paginator.paginate(
-                    ApplicationName=module.params['name'],
-                ), True
-            else:
-                return client.describe_application_versions(
-                    ApplicationName=module.params['name'],
-                ), False
-        elif module.params['describe_applications']:
-            if client.can_paginate('describe_applications'):
-                paginator = client.get_paginator('describe_applications')
-                return paginator.paginate(
-                    ApplicationNames=module.params['names'],
-                ), True
-            else:
-                return client.describe_applications(
-                    ApplicationNames=module.params['names'],
-                ), False
-        elif module.params['describe_configuration_options']:
-            return client.describe_configuration_options(
-                ApplicationName=module.params['name'],
-            ), False
-        elif module.params['describe_configuration_settings']:
-            return client.describe_configuration_options(
-                ApplicationName=module.params['name'],
-            ), False
-        elif module.params['describe_environment_health']:
-            return client.describe_environment_health(
-                EnvironmentName=module.params['name'],
-            ), False
-        elif module.params['describe_environment_managed_actions']:
-            if client.can_paginate('describe_environment_managed_actions'):
-                paginator = client.get_paginator('describe_environment_managed_actions')
-                return paginator.paginate(
-                    EnvironmentName=module.params['name'],
-                ), True
-            else:
-                return client.describe_environment_managed_actions(
-                    EnvironmentName=module.params['name'],
-                ), False
-        elif module.params['describe_environment_resources']:
-            return client.describe_environment_resources(
-                EnvironmentName=module.params['name'],
-            ), False
-        elif module.params['describe_events']:
-            if client.can_paginate('describe_events'):
-                paginator = client.get_paginator('describe_events')
-                return paginator.paginate(
-                    ApplicationName=module.params['name'],
-                ), True
-            else:
-                return client.describe_events(
-                    ApplicationName=module.params['name'],
-                ), False
-        else:
-            if client.can_paginate('describe_environments'):
-                paginator = client.get_paginator('describe_environments')
-                return paginator.paginate(), True
-            else:
-                return client.describe_environments(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elastic Beanstalk details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ELASTICBEANSTALK_OPERATIONS = dict(
+    describe_application_versions=aws_list_operation('describe_application_versions', 'application_versions', 'ApplicationVersions', ApplicationName='name'),
+    describe_applications=aws_list_operation('describe_applications', 'applications', 'Applications', ApplicationNames='names'),
+    describe_configuration_options=aws_dict_operation('describe_configuration_options', 'configuration_options', ApplicationName='name'),
+    describe_configuration_settings=aws_dict_operation(
+        'describe_configuration_options',
+        'configuration_settings',
+        'ConfigurationSettings',
+        ApplicationName='name',
+    ),
+    describe_environment_health=aws_dict_operation('describe_environment_health', 'environment_health', EnvironmentName='name'),
+    describe_environment_managed_actions=aws_list_operation(
+        'describe_environment_managed_actions',
+        'environment_managed_actions',
+        'ManagedActions',
+        EnvironmentName='name',
+    ),
+    describe_environment_resources=aws_dict_operation(
+        'describe_environment_resources',
+        'environment_resources',
+        'EnvironmentResources',
+        EnvironmentName='name',
+    ),
+    describe_events=aws_list_operation('describe_events', 'events', 'Events', ApplicationName='name'),
+)
+
+
+def _elasticbeanstalk_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ELASTICBEANSTALK_OPERATIONS,
+        default=aws_list_operation('describe_environments', 'environments', 'Environments'),
+        error_msg='Failed to fetch AWS Elastic Beanstalk details',
+    )
 
 
 def main():
@@ -252,8 +220,9 @@ def main():
         describe_environment_resources=dict(required=False, type=bool),
         describe_events=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_application_versions', True, ['name']),
@@ -279,27 +248,7 @@ def main():
         ],
     )
 
-    client = module.client('elasticbeanstalk', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _elasticbeanstalk(client, module)
-
-    if module.params['describe_application_versions']:
-        module.exit_json(application_versions=aws_response_list_parser(paginate, it, 'ApplicationVersions'))
-    elif module.params['describe_applications']:
-        module.exit_json(applications=aws_response_list_parser(paginate, it, 'Applications'))
-    elif module.params['describe_configuration_options']:
-        module.exit_json(configuration_options=camel_dict_to_snake_dict(it))
-    elif module.params['describe_configuration_settings']:
-        module.exit_json(configuration_settings=camel_dict_to_snake_dict(it['ConfigurationSettings']))
-    elif module.params['describe_environment_health']:
-        module.exit_json(environment_health=camel_dict_to_snake_dict(it))
-    elif module.params['describe_environment_managed_actions']:
-        module.exit_json(environment_managed_actions=aws_response_list_parser(paginate, it, 'ManagedActions'))
-    elif module.params['describe_environment_resources']:
-        module.exit_json(environment_resources=camel_dict_to_snake_dict(it['EnvironmentResources']))
-    elif module.params['describe_events']:
-        module.exit_json(events=aws_response_list_parser(paginate, it, 'Events'))
-    else:
-        module.exit_json(environments=aws_response_list_parser(paginate, it, 'Environments'))
+    module.exit_json(**aws_info_run(module, 'elasticbeanstalk', _elasticbeanstalk_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
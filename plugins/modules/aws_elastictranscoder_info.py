@@ -47,6 +47,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -86,52 +87,29 @@ jobs:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _elastictranscoder(client, module):
-    try:
-        if module.params['list_presets']:
-            if client.can_paginate('list_presets'):
-                paginator = client.get_paginator('list_presets')
-                return paginator.paginate(), True
-            else:
-                return client.list_presets(), False
-        elif module.params['list_jobs_by_pipeline']:
-            if client.can_paginate('list_jobs_by_pipeline'):
-                paginator = client.get_paginator('list_jobs_by_pipeline')
-                return paginator.paginate(
-                    PipelineId=module.params['id'],
-                ), True
-            else:
-                return client.list_jobs_by_pipeline(
-                    PipelineId=module.params['id'],
-                ), False
-        elif module.params['list_jobs_by_status']:
-            if client.can_paginate('list_jobs_by_status'):
-                paginator = client.get_paginator('list_jobs_by_status')
-                return paginator.paginate(
-                    Status=module.params['status'],
-                ), True
-            else:
-                return client.list_jobs_by_status(
-                    Status=module.params['status'],
-                ), False
-        else:
-            if client.can_paginate('list_pipelines'):
-                paginator = client.get_paginator('list_pipelines')
-                return paginator.paginate(), True
-            else:
-                return client.list_pipelines(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elastic Transcoder details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ELASTICTRANSCODER_OPERATIONS = dict(
+    list_presets=aws_list_operation('list_presets', 'presets', 'Presets'),
+    list_jobs_by_pipeline=aws_list_operation('list_jobs_by_pipeline', 'jobs', 'Jobs', PipelineId='id'),
+    list_jobs_by_status=aws_list_operation('list_jobs_by_status', 'jobs', 'Jobs', Status='status'),
+)
+
+
+def _elastictranscoder_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ELASTICTRANSCODER_OPERATIONS,
+        default=aws_list_operation('list_pipelines', 'pipelines', 'Pipelines'),
+        error_msg='Failed to fetch AWS Elastic Transcoder details',
+    )
 
 
 def main():
@@ -146,8 +124,9 @@ def main():
         list_jobs_by_pipeline=dict(required=False, type=bool),
         list_jobs_by_status=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_jobs_by_pipeline', True, ['id']),
@@ -161,15 +140,7 @@ def main():
         ],
     )
 
-    client = module.client('elastictranscoder', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _elastictranscoder(client, module)
-
-    if module.params['list_presets']:
-        module.exit_json(presets=aws_response_list_parser(paginate, it, 'Presets'))
-    elif module.params['list_jobs_by_pipeline'] or module.params['list_jobs_by_status']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'Jobs'))
-    else:
-        module.exit_json(pipelines=aws_response_list_parser(paginate, it, 'Pipelines'))
+    module.exit_json(**aws_info_run(module, 'elastictranscoder', _elastictranscoder_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -51,6 +51,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -109,66 +110,30 @@ target_groups:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _elbv2(client, module):
-    try:
-        if module.params['describe_listeners']:
-            if client.can_paginate('describe_listeners'):
-                paginator = client.get_paginator('describe_listeners')
-                return paginator.paginate(
-                    LoadBalancerArn=module.params['arn']
-                ), True
-            else:
-                return client.describe_listeners(
-                    LoadBalancerArn=module.params['arn']
-                ), False
-        elif module.params['describe_listener_certificates']:
-            if client.can_paginate('describe_listener_certificates'):
-                paginator = client.get_paginator('describe_listener_certificates')
-                return paginator.paginate(
-                    ListenerArn=module.params['arn']
-                ), True
-            else:
-                return client.describe_listener_certificates(
-                    ListenerArn=module.params['arn']
-                ), False
-        elif module.params['describe_rules']:
-            if client.can_paginate('describe_rules'):
-                paginator = client.get_paginator('describe_rules')
-                return paginator.paginate(
-                    ListenerArn=module.params['arn']
-                ), True
-            else:
-                return client.describe_rules(
-                    ListenerArn=module.params['arn']
-                ), False
-        elif module.params['describe_target_groups']:
-            if client.can_paginate('describe_target_groups'):
-                paginator = client.get_paginator('describe_target_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_target_groups(), False
-        else:
-            if client.can_paginate('describe_load_balancers'):
-                paginator = client.get_paginator('describe_load_balancers')
-                return paginator.paginate(
-                    Names=module.params['names']
-                ), True
-            else:
-                return client.describe_load_balancers(
-                    Names=module.params['names']
-                ), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS ElBv2 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ELBV2_OPERATIONS = dict(
+    describe_listeners=aws_list_operation('describe_listeners', 'listeners', 'Listeners', LoadBalancerArn='arn'),
+    describe_listener_certificates=aws_list_operation('describe_listener_certificates', 'listener_certificates', 'Certificates', ListenerArn='arn'),
+    describe_rules=aws_list_operation('describe_rules', 'rules', 'Rules', ListenerArn='arn'),
+    describe_target_groups=aws_list_operation('describe_target_groups', 'target_groups', 'TargetGroups'),
+)
+
+
+def _elbv2_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ELBV2_OPERATIONS,
+        default=aws_list_operation('describe_load_balancers', 'load_balancers', 'LoadBalancers', Names='names'),
+        error_msg='Failed to fetch AWS ElBv2 details',
+    )
 
 
 def main():
@@ -180,8 +145,9 @@ def main():
         describe_rules=dict(required=False, type=bool),
         describe_target_groups=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_listeners', True, ['arn']),
@@ -198,19 +164,7 @@ def main():
         ],
     )
 
-    client = module.client('elbv2', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _elbv2(client, module)
-
-    if module.params['describe_listeners']:
-        module.exit_json(listeners=aws_response_list_parser(paginate, it, 'Listeners'))
-    elif module.params['describe_listener_certificates']:
-        module.exit_json(listener_certificates=aws_response_list_parser(paginate, it, 'Certificates'))
-    elif module.params['describe_rules']:
-        module.exit_json(rules=aws_response_list_parser(paginate, it, 'Rules'))
-    elif module.params['describe_target_groups']:
-        module.exit_json(target_groups=aws_response_list_parser(paginate, it, 'TargetGroups'))
-    else:
-        module.exit_json(load_balancers=aws_response_list_parser(paginate, it, 'LoadBalancers'))
+    module.exit_json(**aws_info_run(module, 'elbv2', _elbv2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
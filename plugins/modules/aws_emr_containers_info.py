@@ -49,6 +49,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -86,50 +87,34 @@ managed_endpoints:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _emr_containers(client, module):
-    try:
-        if module.params['list_job_runs']:
-            if client.can_paginate('list_job_runs'):
-                paginator = client.get_paginator('list_job_runs')
-                return paginator.paginate(
-                    virtualClusterId=module.params['id'],
-                    states=module.params['job_run_states']
-                ), True
-            else:
-                return client.list_job_runs(
-                    virtualClusterId=module.params['id'],
-                    states=module.params['job_run_states']
-                ), False
-        elif module.params['list_managed_endpoints']:
-            if client.can_paginate('list_managed_endpoints'):
-                paginator = client.get_paginator('list_managed_endpoints')
-                return paginator.paginate(
-                    virtualClusterId=module.params['id'],
-                    states=module.params['managed_endpoint_states']
-                ), True
-            else:
-                return client.list_managed_endpoints(
-                    virtualClusterId=module.params['id'],
-                    states=module.params['managed_endpoint_states']
-                ), False
-        else:
-            if client.can_paginate('list_virtual_clusters'):
-                paginator = client.get_paginator('list_virtual_clusters')
-                return paginator.paginate(), True
-            else:
-                return client.list_virtual_clusters(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon EMR Containers details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_EMR_CONTAINERS_OPERATIONS = dict(
+    list_job_runs=aws_list_operation('list_job_runs', 'job_runs', 'jobRuns', virtualClusterId='id', states='job_run_states'),
+    list_managed_endpoints=aws_list_operation(
+        'list_managed_endpoints',
+        'managed_endpoints',
+        'endpoints',
+        virtualClusterId='id',
+        states='managed_endpoint_states',
+    ),
+)
+
+
+def _emr_containers_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _EMR_CONTAINERS_OPERATIONS,
+        default=aws_list_operation('list_virtual_clusters', 'clusters', 'virtualClusters'),
+        error_msg='Failed to fetch Amazon EMR Containers details',
+    )
 
 
 def main():
@@ -148,8 +133,9 @@ def main():
         list_job_runs=dict(required=False, type=bool),
         list_managed_endpoints=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_job_runs', True, ['id']),
@@ -163,15 +149,7 @@ def main():
         ],
     )
 
-    client = module.client('emr-containers', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _emr_containers(client, module)
-
-    if module.params['list_job_runs']:
-        module.exit_json(job_runs=aws_response_list_parser(paginate, it, 'jobRuns'))
-    elif module.params['list_managed_endpoints']:
-        module.exit_json(managed_endpoints=aws_response_list_parser(paginate, it, 'endpoints'))
-    else:
-        module.exit_json(clusters=aws_response_list_parser(paginate, it, 'virtualClusters'))
+    module.exit_json(**aws_info_run(module, 'emr-containers', _emr_containers_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
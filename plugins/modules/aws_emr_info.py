@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -120,76 +121,31 @@ studios:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _emr(client, module):
-    try:
-        if module.params['list_bootstrap_actions']:
-            if client.can_paginate('list_bootstrap_actions'):
-                paginator = client.get_paginator('list_bootstrap_actions')
-                return paginator.paginate(
-                    ClusterId=module.params['id']
-                ), True
-            else:
-                return client.list_bootstrap_actions(
-                    ClusterId=module.params['id']
-                ), False
-        elif module.params['list_instance_fleets']:
-            if client.can_paginate('list_instance_fleets'):
-                paginator = client.get_paginator('list_instance_fleets')
-                return paginator.paginate(
-                    ClusterId=module.params['id']
-                ), True
-            else:
-                return client.list_instance_fleets(
-                    ClusterId=module.params['id']
-                ), False
-        elif module.params['list_instance_groups']:
-            if client.can_paginate('list_instance_groups'):
-                paginator = client.get_paginator('list_instance_groups')
-                return paginator.paginate(
-                    ClusterId=module.params['id']
-                ), True
-            else:
-                return client.list_instance_groups(
-                    ClusterId=module.params['id']
-                ), False
-        elif module.params['list_steps']:
-            if client.can_paginate('list_steps'):
-                paginator = client.get_paginator('list_steps')
-                return paginator.paginate(
-                    ClusterId=module.params['id']
-                ), True
-            else:
-                return client.list_steps(
-                    ClusterId=module.params['id']
-                ), False
-        elif module.params['list_studios']:
-            if client.can_paginate('list_studios'):
-                paginator = client.get_paginator('list_studios')
-                return paginator.paginate(), True
-            else:
-                return client.list_studios(), False
-        else:
-            if client.can_paginate('list_clusters'):
-                paginator = client.get_paginator('list_clusters')
-                return paginator.paginate(
-                    ClusterStates=module.params['cluster_states']
-                ), True
-            else:
-                return client.list_clusters(
-                    ClusterStates=module.params['cluster_states']
-                ), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS EMR details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_EMR_OPERATIONS = dict(
+    list_bootstrap_actions=aws_list_operation('list_bootstrap_actions', 'bootstrap_actions', 'BootstrapActions', ClusterId='id'),
+    list_instance_fleets=aws_list_operation('list_instance_fleets', 'instance_fleets', 'InstanceFleets', ClusterId='id'),
+    list_instance_groups=aws_list_operation('list_instance_groups', 'instance_groups', 'InstanceGroups', ClusterId='id'),
+    list_steps=aws_list_operation('list_steps', 'steps', 'Steps', ClusterId='id'),
+    list_studios=aws_list_operation('list_studios', 'studios', 'Studios'),
+)
+
+
+def _emr_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _EMR_OPERATIONS,
+        default=aws_list_operation('list_clusters', 'clusters', 'Clusters', ClusterStates='cluster_states'),
+        error_msg='Failed to fetch AWS EMR details',
+    )
 
 
 def main():
@@ -206,8 +162,9 @@ def main():
         list_steps=dict(required=False, type=bool),
         list_studios=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_bootstrap_actions', True, ['id']),
@@ -225,21 +182,7 @@ def main():
         ],
     )
 
-    client = module.client('emr', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _emr(client, module)
-
-    if module.params['list_bootstrap_actions']:
-        module.exit_json(bootstrap_actions=aws_response_list_parser(paginate, it, 'BootstrapActions'))
-    elif module.params['list_instance_fleets']:
-        module.exit_json(instance_fleets=aws_response_list_parser(paginate, it, 'InstanceFleets'))
-    elif module.params['list_instance_groups']:
-        module.exit_json(instance_groups=aws_response_list_parser(paginate, it, 'InstanceGroups'))
-    elif module.params['list_steps']:
-        module.exit_json(steps=aws_response_list_parser(paginate, it, 'Steps'))
-    elif module.params['list_studios']:
-        module.exit_json(studios=aws_response_list_parser(paginate, it, 'Studios'))
-    else:
-        module.exit_json(clusters=aws_response_list_parser(paginate, it, 'Clusters'))
+    module.exit_json(**aws_info_run(module, 'emr', _emr_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -84,45 +85,30 @@ domain_config:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _es(client, module):
-    try:
-        if module.params['list_packages_for_domain']:
-            if client.can_paginate('list_packages_for_domain'):
-                paginator = client.get_paginator('list_packages_for_domain')
-                return paginator.paginate(
-                    DomainName=module.params['name'],
-                ), True
-            else:
-                return client.list_packages_for_domain(
-                    DomainName=module.params['name'],
-                ), False
-        elif module.params['describe_elasticsearch_domain']:
-            return client.describe_elasticsearch_domain(
-                DomainName=module.params['name'],
-            ), False
-        elif module.params['describe_elasticsearch_domain_config']:
-            return client.describe_elasticsearch_domain_config(
-                DomainName=module.params['name'],
-            ), False
-        else:
-            if client.can_paginate('list_domain_names'):
-                paginator = client.get_paginator('list_domain_names')
-                return paginator.paginate(), True
-            else:
-                return client.list_domain_names(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon ES details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ES_OPERATIONS = dict(
+    list_packages_for_domain=aws_list_operation('list_packages_for_domain', 'packages', 'DomainPackageDetailsList', DomainName='name'),
+    describe_elasticsearch_domain=aws_dict_operation('describe_elasticsearch_domain', 'domain_status', 'DomainStatus', DomainName='name'),
+    describe_elasticsearch_domain_config=aws_dict_operation('describe_elasticsearch_domain_config', 'domain_config', 'DomainConfig', DomainName='name'),
+)
+
+
+def _es_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ES_OPERATIONS,
+        default=aws_list_operation('list_domain_names', 'domain_names', 'DomainNames'),
+        error_msg='Failed to fetch Amazon ES details',
+    )
 
 
 def main():
@@ -132,8 +118,9 @@ def main():
         describe_elasticsearch_domain=dict(required=False, type=bool),
         describe_elasticsearch_domain_config=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_packages_for_domain', True, ['name']),
@@ -149,17 +136,7 @@ def main():
         ],
     )
 
-    client = module.client('es', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _es(client, module)
-
-    if module.params['list_packages_for_domain']:
-        module.exit_json(packages=aws_response_list_parser(paginate, it, 'DomainPackageDetailsList'))
-    elif module.params['describe_elasticsearch_domain']:
-        module.exit_json(domain_status=camel_dict_to_snake_dict(it['DomainStatus']))
-    elif module.params['describe_elasticsearch_domain_config']:
-        module.exit_json(domain_config=camel_dict_to_snake_dict(it['DomainConfig']))
-    else:
-        module.exit_json(domain_names=aws_response_list_parser(paginate, it, 'DomainNames'))
+    module.exit_json(**aws_info_run(module, 'es', _es_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -60,6 +60,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -133,92 +134,37 @@ rules:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _events(client, module):
-    try:
-        if module.params['list_archives']:
-            if client.can_paginate('list_archives'):
-                paginator = client.get_paginator('list_archives')
-                return paginator.paginate(
-                    NamePrefix=module.params['name_prefix'],
-                ), True
-            else:
-                return client.list_archives(
-                    NamePrefix=module.params['name_prefix'],
-                ), False
-        elif module.params['list_event_buses']:
-            if client.can_paginate('list_event_buses'):
-                paginator = client.get_paginator('list_event_buses')
-                return paginator.paginate(
-                    NamePrefix=module.params['name_prefix'],
-                ), True
-            else:
-                return client.list_event_buses(
-                    NamePrefix=module.params['name_prefix'],
-                ), False
-        elif module.params['list_event_sources']:
-            if client.can_paginate('list_event_sources'):
-                paginator = client.get_paginator('list_event_sources')
-                return paginator.paginate(
-                    NamePrefix=module.params['name_prefix'],
-                ), True
-            else:
-                return client.list_event_sources(
-                    NamePrefix=module.params['name_prefix'],
-                ), False
-        elif module.params['list_partner_event_source_accounts']:
-            if client.can_paginate('list_partner_event_source_accounts'):
-                paginator = client.get_paginator('list_partner_event_source_accounts')
-                return paginator.paginate(
-                    EventSourceName=module.params['event_source_name'],
-                ), True
-            else:
-                return client.list_partner_event_source_accounts(
-                    EventSourceName=module.params['event_source_name'],
-                ), False
-        elif module.params['list_partner_event_sources']:
-            if client.can_paginate('list_partner_event_sources'):
-                paginator = client.get_paginator('list_partner_event_sources')
-                return paginator.paginate(
-                    NamePrefix=module.params['name_prefix'],
-                ), True
-            else:
-                return client.list_partner_event_sources(
-                    NamePrefix=module.params['name_prefix'],
-                ), False
-        elif module.params['list_replays']:
-            if client.can_paginate('list_replays'):
-                paginator = client.get_paginator('list_replays')
-                return paginator.paginate(
-                    NamePrefix=module.params['name_prefix'],
-                ), True
-            else:
-                return client.list_replays(
-                    NamePrefix=module.params['name_prefix'],
-                ), False
-        elif module.params['list_rules']:
-            if client.can_paginate('list_rules'):
-                paginator = client.get_paginator('list_rules')
-                return paginator.paginate(
-                    NamePrefix=module.params['name_prefix'],
-                ), True
-            else:
-                return client.list_rules(
-                    NamePrefix=module.params['name_prefix'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon EventBridge Details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_EVENTS_OPERATIONS = dict(
+    list_archives=aws_list_operation('list_archives', 'archives', 'Archives', NamePrefix='name_prefix'),
+    list_event_buses=aws_list_operation('list_event_buses', 'event_buses', 'EventBuses', NamePrefix='name_prefix'),
+    list_event_sources=aws_list_operation('list_event_sources', 'event_sources', 'EventSources', NamePrefix='name_prefix'),
+    list_partner_event_source_accounts=aws_list_operation(
+        'list_partner_event_source_accounts',
+        'partner_event_source_accounts',
+        'PartnerEventSourceAccounts',
+        EventSourceName='event_source_name',
+    ),
+    list_partner_event_sources=aws_list_operation('list_partner_event_sources', 'partner_event_sources', 'PartnerEventSources', NamePrefix='name_prefix'),
+    list_replays=aws_list_operation('list_replays', 'replays', 'Replays', NamePrefix='name_prefix'),
+    list_rules=aws_list_operation('list_rules', 'rules', 'Rules', NamePrefix='name_prefix'),
+)
+
+
+def _events_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _EVENTS_OPERATIONS,
+        error_msg='Failed to fetch Amazon EventBridge Details',
+    )
 
 
 def main():
@@ -233,8 +179,9 @@ def main():
         list_replays=dict(required=False, type=bool),
         list_rules=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_archives', True, ['name_prefix']),
@@ -258,25 +205,7 @@ def main():
         ],
     )
 
-    client = module.client('events', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _events(client, module)
-
-    if module.params['list_archives']:
-        module.exit_json(archives=aws_response_list_parser(paginate, it, 'Archives'))
-    elif module.params['list_event_buses']:
-        module.exit_json(event_buses=aws_response_list_parser(paginate, it, 'EventBuses'))
-    elif module.params['list_event_sources']:
-        module.exit_json(event_sources=aws_response_list_parser(paginate, it, 'EventSources'))
-    elif module.params['list_partner_event_source_accounts']:
-        module.exit_json(partner_event_source_accounts=aws_response_list_parser(paginate, it, 'PartnerEventSourceAccounts'))
-    elif module.params['list_partner_event_sources']:
-        module.exit_json(partner_event_sources=aws_response_list_parser(paginate, it, 'PartnerEventSources'))
-    elif module.params['list_replays']:
-        module.exit_json(replays=aws_response_list_parser(paginate, it, 'Replays'))
-    elif module.params['list_rules']:
-        module.exit_json(rules=aws_response_list_parser(paginate, it, 'Rules'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'events', _events_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
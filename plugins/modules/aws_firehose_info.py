@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -56,31 +57,28 @@ delivery_stream:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _firehose(client, module):
-    try:
-        if module.params['describe_delivery_stream']:
-            return client.describe_delivery_stream(
-                DeliveryStreamName=module.params['name'],
-            ), False
-        else:
-            if client.can_paginate('list_delivery_streams'):
-                paginator = client.get_paginator('list_delivery_streams')
-                return paginator.paginate(), True
-            else:
-                return client.list_delivery_streams(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Firehose Details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_FIREHOSE_OPERATIONS = dict(
+    describe_delivery_stream=aws_dict_operation('describe_delivery_stream', 'delivery_stream', 'DeliveryStreamDescription', DeliveryStreamName='name'),
+)
+
+
+def _firehose_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _FIREHOSE_OPERATIONS,
+        default=aws_list_operation('list_delivery_streams', 'delivery_stream_names', 'DeliveryStreamNames'),
+        error_msg='Failed to fetch Amazon Firehose Details',
+    )
 
 
 def main():
@@ -88,8 +86,9 @@ def main():
         name=dict(required=False),
         describe_delivery_stream=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_delivery_stream', True, ['name']),
@@ -97,13 +96,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('firehose', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _firehose(client, module)
-
-    if module.params['describe_delivery_stream']:
-        module.exit_json(delivery_stream=camel_dict_to_snake_dict(it['DeliveryStreamDescription']))
-    else:
-        module.exit_json(delivery_stream_names=aws_response_list_parser(paginate, it, 'DeliveryStreamNames'))
+    module.exit_json(**aws_info_run(module, 'firehose', _firehose_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -56,6 +56,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -109,68 +110,30 @@ protocols_lists:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _fms(client, module):
-    try:
-        if module.params['list_apps_lists']:
-            if client.can_paginate('list_apps_lists'):
-                paginator = client.get_paginator('list_apps_lists')
-                return paginator.paginate(
-                    DefaultLists=module.params['default_lists'],
-                    MaxResults=100
-                ), True
-            else:
-                return client.list_apps_lists(
-                    DefaultLists=module.params['default_lists'],
-                    MaxResults=100
-                ), False
-        elif module.params['list_policies']:
-            if client.can_paginate('list_policies'):
-                paginator = client.get_paginator('list_policies')
-                return paginator.paginate(), True
-            else:
-                return client.list_policies(), False
-        elif module.params['list_compliance_status']:
-            if client.can_paginate('list_compliance_status'):
-                paginator = client.get_paginator('list_compliance_status')
-                return paginator.paginate(
-                    PolicyId=module.params['policy_id']
-                ), True
-            else:
-                return client.list_compliance_status(
-                    PolicyId=module.params['policy_id']
-                ), False
-        elif module.params['list_member_accounts']:
-            if client.can_paginate('list_member_accounts'):
-                paginator = client.get_paginator('list_member_accounts')
-                return paginator.paginate(), True
-            else:
-                return client.list_member_accounts(), False
-        elif module.params['list_protocols_lists']:
-            if client.can_paginate('list_protocols_lists'):
-                paginator = client.get_paginator('list_protocols_lists')
-                return paginator.paginate(
-                    DefaultLists=module.params['default_lists'],
-                    MaxResults=100
-                ), True
-            else:
-                return client.list_protocols_lists(
-                    DefaultLists=module.params['default_lists'],
-                    MaxResults=100
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon FMS details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_FMS_OPERATIONS = dict(
+    list_apps_lists=aws_list_operation('list_apps_lists', 'apps_lists', 'AppsLists', DefaultLists='default_lists', MaxResults=100),
+    list_policies=aws_list_operation('list_policies', 'policies', 'PolicyList'),
+    list_compliance_status=aws_list_operation('list_compliance_status', 'compliance_status', 'PolicyComplianceStatusList', PolicyId='policy_id'),
+    list_member_accounts=aws_list_operation('list_member_accounts', 'member_accounts', 'MemberAccounts'),
+    list_protocols_lists=aws_list_operation('list_protocols_lists', 'protocols_lists', 'ProtocolsLists', DefaultLists='default_lists', MaxResults=100),
+)
+
+
+def _fms_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _FMS_OPERATIONS,
+        error_msg='Failed to fetch Amazon FMS details',
+    )
 
 
 def main():
@@ -183,8 +146,9 @@ def main():
         list_member_accounts=dict(required=False, type=bool),
         list_protocols_lists=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_compliance_status', True, ['policy_id']),
@@ -200,21 +164,7 @@ def main():
         ],
     )
 
-    client = module.client('fms', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _fms(client, module)
-
-    if module.params['list_apps_lists']:
-        module.exit_json(apps_lists=aws_response_list_parser(paginate, it, 'AppsLists'))
-    elif module.params['list_policies']:
-        module.exit_json(policies=aws_response_list_parser(paginate, it, 'PolicyList'))
-    elif module.params['list_compliance_status']:
-        module.exit_json(compliance_status=aws_response_list_parser(paginate, it, 'PolicyComplianceStatusList'))
-    elif module.params['list_member_accounts']:
-        module.exit_json(member_accounts=aws_response_list_parser(paginate, it, 'MemberAccounts'))
-    elif module.params['list_protocols_lists']:
-        module.exit_json(protocols_lists=aws_response_list_parser(paginate, it, 'ProtocolsLists'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'fms', _fms_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
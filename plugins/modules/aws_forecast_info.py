@@ -50,6 +50,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -111,62 +112,36 @@ predictors:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _forecast(client, module):
-    try:
-        if module.params['list_dataset_groups']:
-            if client.can_paginate('list_dataset_groups'):
-                paginator = client.get_paginator('list_dataset_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_dataset_groups(), False
-        elif module.params['list_dataset_import_jobs']:
-            if client.can_paginate('list_dataset_import_jobs'):
-                paginator = client.get_paginator('list_dataset_import_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_dataset_import_jobs(), False
-        elif module.params['list_datasets']:
-            if client.can_paginate('list_datasets'):
-                paginator = client.get_paginator('list_datasets')
-                return paginator.paginate(), True
-            else:
-                return client.list_datasets(), False
-        elif module.params['list_forecast_export_jobs']:
-            if client.can_paginate('list_forecast_export_jobs'):
-                paginator = client.get_paginator('list_forecast_export_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_forecast_export_jobs(), False
-        elif module.params['list_predictor_backtest_export_jobs']:
-            if client.can_paginate('list_predictor_backtest_export_jobs'):
-                paginator = client.get_paginator('list_predictor_backtest_export_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_predictor_backtest_export_jobs(), False
-        elif module.params['list_predictors']:
-            if client.can_paginate('list_predictors'):
-                paginator = client.get_paginator('list_predictors')
-                return paginator.paginate(), True
-            else:
-                return client.list_predictors(), False
-        else:
-            if client.can_paginate('list_forecasts'):
-                paginator = client.get_paginator('list_forecasts')
-                return paginator.paginate(), True
-            else:
-                return client.list_forecasts(), False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon forecast details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_FORECAST_OPERATIONS = dict(
+    list_dataset_groups=aws_list_operation('list_dataset_groups', 'dataset_groups', 'DatasetGroups'),
+    list_dataset_import_jobs=aws_list_operation('list_dataset_import_jobs', 'dataset_import_jobs', 'DatasetImportJobs'),
+    list_datasets=aws_list_operation('list_datasets', 'datasets', 'Datasets'),
+    list_forecast_export_jobs=aws_list_operation('list_forecast_export_jobs', 'forecast_export_jobs', 'ForecastExportJobs'),
+    list_predictor_backtest_export_jobs=aws_list_operation(
+        'list_predictor_backtest_export_jobs',
+        'predictor_backtest_export_jobs',
+        'PredictorBacktestExportJobs',
+    ),
+    list_predictors=aws_list_operation('list_predictors', 'predictors', 'Predictors'),
+)
+
+
+def _forecast_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _FORECAST_OPERATIONS,
+        default=aws_list_operation('list_forecasts', 'forecasts', 'Forecasts'),
+        error_msg='Failed to fetch Amazon forecast details',
+    )
 
 
 def main():
@@ -178,8 +153,9 @@ def main():
         list_predictor_backtest_export_jobs=dict(required=False, type=bool),
         list_predictors=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -194,23 +170,7 @@ def main():
         ],
     )
 
-    client = module.client('forecast', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _forecast(client, module)
-
-    if module.params['list_dataset_groups']:
-        module.exit_json(dataset_groups=aws_response_list_parser(paginate, it, 'DatasetGroups'))
-    elif module.params['list_dataset_import_jobs']:
-        module.exit_json(dataset_import_jobs=aws_response_list_parser(paginate, it, 'DatasetImportJobs'))
-    elif module.params['list_datasets']:
-        module.exit_json(datasets=aws_response_list_parser(paginate, it, 'Datasets'))
-    elif module.params['list_forecast_export_jobs']:
-        module.exit_json(forecast_export_jobs=aws_response_list_parser(paginate, it, 'ForecastExportJobs'))
-    elif module.params['list_predictor_backtest_export_jobs']:
-        module.exit_json(predictor_backtest_export_jobs=aws_response_list_parser(paginate, it, 'PredictorBacktestExportJobs'))
-    elif module.params['list_predictors']:
-        module.exit_json(predictors=aws_response_list_parser(paginate, it, 'Predictors'))
-    else:
-        module.exit_json(forecasts=aws_response_list_parser(paginate, it, 'Forecasts'))
+    module.exit_json(**aws_info_run(module, 'forecast', _forecast_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -70,6 +70,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -153,80 +154,34 @@ variables:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _frauddetector(client, module):
-    try:
-        if module.params['get_detectors']:
-            if client.can_paginate('get_detectors'):
-                paginator = client.get_paginator('get_detectors')
-                return paginator.paginate(), True
-            else:
-                return client.get_detectors(), False
-        elif module.params['get_entity_types']:
-            if client.can_paginate('get_entity_types'):
-                paginator = client.get_paginator('get_entity_types')
-                return paginator.paginate(), True
-            else:
-                return client.get_entity_types(), False
-        elif module.params['get_event_types']:
-            if client.can_paginate('get_event_types'):
-                paginator = client.get_paginator('get_event_types')
-                return paginator.paginate(), True
-            else:
-                return client.get_event_types(), False
-        elif module.params['get_external_models']:
-            if client.can_paginate('get_external_models'):
-                paginator = client.get_paginator('get_external_models')
-                return paginator.paginate(), True
-            else:
-                return client.get_external_models(), False
-        elif module.params['get_labels']:
-            if client.can_paginate('get_labels'):
-                paginator = client.get_paginator('get_labels')
-                return paginator.paginate(), True
-            else:
-                return client.get_labels(), False
-        elif module.params['get_models']:
-            if client.can_paginate('get_models'):
-                paginator = client.get_paginator('get_models')
-                return paginator.paginate(), True
-            else:
-                return client.get_models(), False
-        elif module.params['get_outcomes']:
-            if client.can_paginate('get_outcomes'):
-                paginator = client.get_paginator('get_outcomes')
-                return paginator.paginate(), True
-            else:
-                return client.get_outcomes(), False
-        elif module.params['get_rules']:
-            if client.can_paginate('get_rules'):
-                paginator = client.get_paginator('get_rules')
-                return paginator.paginate(
-                    detectorId=module.params['detector_id'],
-                ), True
-            else:
-                return client.get_rules(
-                    detectorId=module.params['detector_id'],
-                ), False
-        elif module.params['get_variables']:
-            if client.can_paginate('get_variables'):
-                paginator = client.get_paginator('get_variables')
-                return paginator.paginate(), True
-            else:
-                return client.get_variables(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon frauddetector details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_FRAUDDETECTOR_OPERATIONS = dict(
+    get_detectors=aws_list_operation('get_detectors', 'detectors', 'detectors'),
+    get_entity_types=aws_list_operation('get_entity_types', 'entity_types', 'entityTypes'),
+    get_event_types=aws_list_operation('get_event_types', 'event_types', 'eventTypes'),
+    get_external_models=aws_list_operation('get_external_models', 'external_models', 'externalModels'),
+    get_labels=aws_list_operation('get_labels', 'labels', 'labels'),
+    get_models=aws_list_operation('get_models', 'models', 'models'),
+    get_outcomes=aws_list_operation('get_outcomes', 'outcomes', 'outcomes'),
+    get_rules=aws_list_operation('get_rules', 'rules', 'ruleDetails', detectorId='detector_id'),
+    get_variables=aws_list_operation('get_variables', 'variables', 'variables'),
+)
+
+
+def _frauddetector_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _FRAUDDETECTOR_OPERATIONS,
+        error_msg='Failed to fetch Amazon frauddetector details',
+    )
 
 
 def main():
@@ -242,8 +197,9 @@ def main():
         get_rules=dict(required=False, type=bool),
         get_variables=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_rules', True, ['detector_id']),
@@ -263,29 +219,7 @@ def main():
         ],
     )
 
-    client = module.client('frauddetector', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _frauddetector(client, module)
-
-    if module.params['get_detectors']:
-        module.exit_json(detectors=aws_response_list_parser(paginate, it, 'detectors'))
-    elif module.params['get_entity_types']:
-        module.exit_json(entity_types=aws_response_list_parser(paginate, it, 'entityTypes'))
-    elif module.params['get_event_types']:
-        module.exit_json(event_types=aws_response_list_parser(paginate, it, 'eventTypes'))
-    elif module.params['get_external_models']:
-        module.exit_json(external_models=aws_response_list_parser(paginate, it, 'externalModels'))
-    elif module.params['get_labels']:
-        module.exit_json(labels=aws_response_list_parser(paginate, it, 'labels'))
-    elif module.params['get_models']:
-        module.exit_json(models=aws_response_list_parser(paginate, it, 'models'))
-    elif module.params['get_outcomes']:
-        module.exit_json(outcomes=aws_response_list_parser(paginate, it, 'outcomes'))
-    elif module.params['get_rules']:
-        module.exit_json(rules=aws_response_list_parser(paginate, it, 'ruleDetails'))
-    elif module.params['get_variables']:
-        module.exit_json(variables=aws_response_list_parser(paginate, it, 'variables'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'frauddetector', _frauddetector_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -42,6 +42,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -79,52 +80,28 @@ data_repository_tasks:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _fsx(client, module):
-    try:
-        if module.params['describe_backups']:
-            if client.can_paginate('describe_backups'):
-                paginator = client.get_paginator('describe_backups')
-                return paginator.paginate(
-                    BackupIds=module.params['ids'],
-                ), True
-            else:
-                return client.describe_backups(
-                    BackupIds=module.params['ids'],
-                ), False
-        elif module.params['describe_file_systems']:
-            if client.can_paginate('describe_file_systems'):
-                paginator = client.get_paginator('describe_file_systems')
-                return paginator.paginate(
-                    FileSystemIds=module.params['ids'],
-                ), True
-            else:
-                return client.describe_file_systems(
-                    FileSystemIds=module.params['ids'],
-                ), False
-        elif module.params['describe_data_repository_tasks']:
-            if client.can_paginate('describe_data_repository_tasks'):
-                paginator = client.get_paginator('describe_data_repository_tasks')
-                return paginator.paginate(
-                    TaskIds=module.params['ids'],
-                ), True
-            else:
-                return client.describe_data_repository_tasks(
-                    TaskIds=module.params['ids'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon fsx details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_FSX_OPERATIONS = dict(
+    describe_backups=aws_list_operation('describe_backups', 'backups', 'Backups', BackupIds='ids'),
+    describe_file_systems=aws_list_operation('describe_file_systems', 'file_systems', 'FileSystems', FileSystemIds='ids'),
+    describe_data_repository_tasks=aws_list_operation('describe_data_repository_tasks', 'data_repository_tasks', 'DataRepositoryTasks', TaskIds='ids'),
+)
+
+
+def _fsx_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _FSX_OPERATIONS,
+        error_msg='Failed to fetch Amazon fsx details',
+    )
 
 
 def main():
@@ -134,8 +111,9 @@ def main():
         describe_file_systems=dict(required=False, type=bool),
         describe_data_repository_tasks=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -147,17 +125,7 @@ def main():
         ],
     )
 
-    client = module.client('fsx', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _fsx(client, module)
-
-    if module.params['describe_backups']:
-        module.exit_json(backups=aws_response_list_parser(paginate, it, 'Backups'))
-    elif module.params['describe_file_systems']:
-        module.exit_json(file_systems=aws_response_list_parser(paginate, it, 'FileSystems'))
-    elif module.params['describe_data_repository_tasks']:
-        module.exit_json(data_repository_tasks=aws_response_list_parser(paginate, it, 'DataRepositoryTasks'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'fsx', _fsx_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -74,6 +74,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -136,76 +137,41 @@ scripts:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _gamelift(client, module):
-    try:
-        if module.params['list_aliases']:
-            if client.can_paginate('list_aliases'):
-                paginator = client.get_paginator('list_aliases')
-                return paginator.paginate(
-                    RoutingStrategyType=module.params['routing_strategy_type'],
-                ), True
-            else:
-                return client.list_aliases(
-                    RoutingStrategyType=module.params['routing_strategy_type'],
-                ), False
-        elif module.params['list_builds']:
-            if client.can_paginate('list_builds'):
-                paginator = client.get_paginator('list_builds')
-                return paginator.paginate(
-                    Status=module.params['status'],
-                ), True
-            else:
-                return client.list_builds(
-                    Status=module.params['status'],
-                ), False
-        elif module.params['list_fleets']:
-            if client.can_paginate('list_fleets'):
-                paginator = client.get_paginator('list_fleets')
-                return paginator.paginate(
-                    BuildId=module.params['build_id'],
-                ), True
-            else:
-                return client.list_fleets(
-                    BuildId=module.params['build_id'],
-                ), False
-        elif module.params['list_game_server_groups']:
-            if client.can_paginate('list_game_server_groups'):
-                paginator = client.get_paginator('list_game_server_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_game_server_groups(), False
-        elif module.params['list_game_servers']:
-            if client.can_paginate('list_game_servers'):
-                paginator = client.get_paginator('list_game_servers')
-                return paginator.paginate(
-                    GameServerGroupName=module.params['game_server_group_name'],
-                    SortOrder='ASCENDING'
-                ), True
-            else:
-                return client.list_game_servers(
-                    GameServerGroupName=module.params['game_server_group_name'],
-                    SortOrder='ASCENDING'
-                ), False
-        elif module.params['list_scripts']:
-            if client.can_paginate('list_scripts'):
-                paginator = client.get_paginator('list_scripts')
-                return paginator.paginate(), True
-            else:
-                return client.list_scripts(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon gamelift details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+def _sort_ascending(module):
+    return 'ASCENDING'
+
+
+_GAMELIFT_OPERATIONS = dict(
+    list_aliases=aws_list_operation('list_aliases', 'aliases', 'Aliases', RoutingStrategyType='routing_strategy_type'),
+    list_builds=aws_list_operation('list_builds', 'builds', 'Builds', Status='status'),
+    list_fleets=aws_list_operation('list_fleets', 'fleets', 'FleetIds', BuildId='build_id'),
+    list_game_server_groups=aws_list_operation('list_game_server_groups', 'game_server_groups', 'GameServerGroups'),
+    list_game_servers=aws_list_operation(
+        'list_game_servers',
+        'game_servers',
+        'GameServers',
+        GameServerGroupName='game_server_group_name',
+        SortOrder=_sort_ascending,
+    ),
+    list_scripts=aws_list_operation('list_scripts', 'scripts', 'Scripts'),
+)
+
+
+def _gamelift_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _GAMELIFT_OPERATIONS,
+        error_msg='Failed to fetch Amazon gamelift details',
+    )
 
 
 def main():
@@ -221,8 +187,9 @@ def main():
         list_game_servers=dict(required=False, type=bool),
         list_scripts=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_fleets', True, ['build_id']),
@@ -240,23 +207,7 @@ def main():
         ],
     )
 
-    client = module.client('gamelift', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _gamelift(client, module)
-
-    if module.params['list_aliases']:
-        module.exit_json(aliases=aws_response_list_parser(paginate, it, 'Aliases'))
-    elif module.params['list_builds']:
-        module.exit_json(builds=aws_response_list_parser(paginate, it, 'Builds'))
-    elif module.params['list_fleets']:
-        module.exit_json(fleets=aws_response_list_parser(paginate, it, 'FleetIds'))
-    elif module.params['list_game_server_groups']:
-        module.exit_json(game_server_groups=aws_response_list_parser(paginate, it, 'GameServerGroups'))
-    elif module.params['list_game_servers']:
-        module.exit_json(game_servers=aws_response_list_parser(paginate, it, 'GameServers'))
-    elif module.params['list_scripts']:
-        module.exit_json(scripts=aws_response_list_parser(paginate, it, 'Scripts'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'gamelift', _gamelift_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
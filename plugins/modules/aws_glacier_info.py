@@ -52,6 +52,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -98,56 +99,29 @@ jobs:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _glacier(client, module):
-    try:
-        if module.params['list_vaults']:
-            if client.can_paginate('list_vaults'):
-                paginator = client.get_paginator('list_vaults')
-                return paginator.paginate(), True
-            else:
-                return client.list_vaults(), False
-        elif module.params['list_provisioned_capacity']:
-            if client.can_paginate('list_provisioned_capacity'):
-                paginator = client.get_paginator('list_provisioned_capacity')
-                return paginator.paginate(), True
-            else:
-                return client.list_provisioned_capacity(), False
-        elif module.params['list_multipart_uploads']:
-            if client.can_paginate('list_multipart_uploads'):
-                paginator = client.get_paginator('list_multipart_uploads')
-                return paginator.paginate(
-                    vaultName=module.params['name'],
-                ), True
-            else:
-                return client.list_multipart_uploads(
-                    vaultName=module.params['name'],
-                ), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    vaultName=module.params['name'],
-                    statuscode=module.params['status'],
-                ), True
-            else:
-                return client.list_jobs(
-                    vaultName=module.params['name'],
-                    statuscode=module.params['status'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon glacier details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_GLACIER_OPERATIONS = dict(
+    list_vaults=aws_list_operation('list_vaults', 'vaults', 'VaultList'),
+    list_provisioned_capacity=aws_list_operation('list_provisioned_capacity', 'provisioned_capacity', 'ProvisionedCapacityList'),
+    list_multipart_uploads=aws_list_operation('list_multipart_uploads', 'multipart_uploads', 'UploadsList', vaultName='name'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'JobList', vaultName='name', statuscode='status'),
+)
+
+
+def _glacier_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _GLACIER_OPERATIONS,
+        error_msg='Failed to fetch Amazon glacier details',
+    )
 
 
 def main():
@@ -159,8 +133,9 @@ def main():
         list_multipart_uploads=dict(required=False, type=bool),
         list_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_multipart_uploads', True, ['name']),
@@ -176,19 +151,7 @@ def main():
         ],
     )
 
-    client = module.client('glacier', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _glacier(client, module)
-
-    if module.params['list_vaults']:
-        module.exit_json(vaults=aws_response_list_parser(paginate, it, 'VaultList'))
-    elif module.params['list_provisioned_capacity']:
-        module.exit_json(provisioned_capacity=aws_response_list_parser(paginate, it, 'ProvisionedCapacityList'))
-    elif module.params['list_multipart_uploads']:
-        module.exit_json(multipart_uploads=aws_response_list_parser(paginate, it, 'UploadsList'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'JobList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'glacier', _glacier_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
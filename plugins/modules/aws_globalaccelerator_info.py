@@ -68,6 +68,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -147,90 +148,43 @@ listeners:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _globalaccelerator(client, module):
-    try:
-        if module.params['list_accelerators']:
-            if client.can_paginate('list_accelerators'):
-                paginator = client.get_paginator('list_accelerators')
-                return paginator.paginate(), True
-            else:
-                return client.list_accelerators(), False
-        elif module.params['list_byoip_cidrs']:
-            if client.can_paginate('list_byoip_cidrs'):
-                paginator = client.get_paginator('list_byoip_cidrs')
-                return paginator.paginate(), True
-            else:
-                return client.list_byoip_cidrs(), False
-        elif module.params['list_custom_routing_accelerators']:
-            if client.can_paginate('list_custom_routing_accelerators'):
-                paginator = client.get_paginator('list_custom_routing_accelerators')
-                return paginator.paginate(), True
-            else:
-                return client.list_custom_routing_accelerators(), False
-        elif module.params['list_custom_routing_endpoint_groups']:
-            if client.can_paginate('list_custom_routing_endpoint_groups'):
-                paginator = client.get_paginator('list_custom_routing_endpoint_groups')
-                return paginator.paginate(
-                    ListenerArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_custom_routing_endpoint_groups(
-                    ListenerArn=module.params['arn'],
-                ), False
-        elif module.params['list_custom_routing_listeners']:
-            if client.can_paginate('list_custom_routing_listeners'):
-                paginator = client.get_paginator('list_custom_routing_listeners')
-                return paginator.paginate(
-                    AcceleratorArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_custom_routing_listeners(
-                    AcceleratorArn=module.params['arn'],
-                ), False
-        elif module.params['list_custom_routing_port_mappings']:
-            if client.can_paginate('list_custom_routing_port_mappings'):
-                paginator = client.get_paginator('list_custom_routing_port_mappings')
-                return paginator.paginate(
-                    AcceleratorArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_custom_routing_port_mappings(
-                    AcceleratorArn=module.params['arn'],
-                ), False
-        elif module.params['list_endpoint_groups']:
-            if client.can_paginate('list_endpoint_groups'):
-                paginator = client.get_paginator('list_endpoint_groups')
-                return paginator.paginate(
-                    ListenerArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_endpoint_groups(
-                    ListenerArn=module.params['arn'],
-                ), False
-        elif module.params['list_listeners']:
-            if client.can_paginate('list_listeners'):
-                paginator = client.get_paginator('list_listeners')
-                return paginator.paginate(
-                    AcceleratorArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_listeners(
-                    AcceleratorArn=module.params['arn'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Global Accelerator details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_GLOBALACCELERATOR_OPERATIONS = dict(
+    list_accelerators=aws_list_operation('list_accelerators', 'accelerators', 'Accelerators'),
+    list_byoip_cidrs=aws_list_operation('list_byoip_cidrs', 'byoip_cidrs', 'ByoipCidrs'),
+    list_custom_routing_accelerators=aws_list_operation('list_custom_routing_accelerators', 'custom_routing_accelerators', 'Accelerators'),
+    list_custom_routing_endpoint_groups=aws_list_operation(
+        'list_custom_routing_endpoint_groups',
+        'custom_routing_endpoint_groups',
+        'EndpointGroups',
+        ListenerArn='arn',
+    ),
+    list_custom_routing_listeners=aws_list_operation('list_custom_routing_listeners', 'custom_routing_listeners', 'Listeners', AcceleratorArn='arn'),
+    list_custom_routing_port_mappings=aws_list_operation(
+        'list_custom_routing_port_mappings',
+        'custom_routing_port_mappings',
+        'PortMappings',
+        AcceleratorArn='arn',
+    ),
+    list_endpoint_groups=aws_list_operation('list_endpoint_groups', 'endpoint_groups', 'EndpointGroups', ListenerArn='arn'),
+    list_listeners=aws_list_operation('list_listeners', 'listeners', 'Listeners', AcceleratorArn='arn'),
+)
+
+
+def _globalaccelerator_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _GLOBALACCELERATOR_OPERATIONS,
+        error_msg='Failed to fetch Amazon Global Accelerator details',
+    )
 
 
 def main():
@@ -246,8 +200,9 @@ def main():
         list_listeners=dict(required=False, type=bool),
 
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_custom_routing_endpoint_groups', True, ['arn']),
@@ -270,27 +225,7 @@ def main():
         ],
     )
 
-    client = module.client('globalaccelerator', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _globalaccelerator(client, module)
-
-    if module.params['list_accelerators']:
-        module.exit_json(accelerators=aws_response_list_parser(paginate, it, 'Accelerators'))
-    elif module.params['list_byoip_cidrs']:
-        module.exit_json(byoip_cidrs=aws_response_list_parser(paginate, it, 'ByoipCidrs'))
-    elif module.params['list_custom_routing_accelerators']:
-        module.exit_json(custom_routing_accelerators=aws_response_list_parser(paginate, it, 'Accelerators'))
-    elif module.params['list_custom_routing_endpoint_groups']:
-        module.exit_json(custom_routing_endpoint_groups=aws_response_list_parser(paginate, it, 'EndpointGroups'))
-    elif module.params['list_custom_routing_listeners']:
-        module.exit_json(custom_routing_listeners=aws_response_list_parser(paginate, it, 'Listeners'))
-    elif module.params['list_custom_routing_port_mappings']:
-        module.exit_json(custom_routing_port_mappings=aws_response_list_parser(paginate, it, 'PortMappings'))
-    elif module.params['list_endpoint_groups']:
-        module.exit_json(endpoint_groups=aws_response_list_parser(paginate, it, 'EndpointGroups'))
-    elif module.params['list_listeners']:
-        module.exit_json(listeners=aws_response_list_parser(paginate, it, 'Listeners'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'globalaccelerator', _globalaccelerator_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -82,11 +82,31 @@ options:
       - do you want to get list of partitions for given database I(name) and I(table_name)?
     required: false
     type: bool
+  expression:
+    description:
+      - filter of I(get_partitions) evaluated by glue example C(year = '2021' AND month > '06').
+    required: false
+    type: str
+  exclude_column_schema:
+    description:
+      - do you want I(get_partitions) to leave out column schema of every partition?
+    required: false
+    type: bool
+    default: false
+  segments:
+    description:
+      - number of segments of table scanned concurrently by I(get_partitions) on I(max_workers) threads, maximum is 10.
+      - partitions of different segments are returned interleaved, use I(dest) to stream them to file.
+      - I(max_items) limits partitions of all segments, I(starting_token) can not be used with more than one segment.
+    required: false
+    type: int
+    default: 1
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -135,6 +155,16 @@ EXAMPLES = """
     get_tables: true
     database_name: 'test'
 
+- name: "get partitions of huge table, 8 segments streamed to file"
+  aws_glue_info:
+    get_partitions: true
+    name: 'test'
+    table_name: 'events'
+    expression: "year = '2021'"
+    exclude_column_schema: true
+    segments: 8
+    dest: '/tmp/partitions.ndjson'
+
 - name: "get list of partitions"
   aws_glue_info:
     get_partitions: true
@@ -194,105 +224,79 @@ try:
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_pagination_config
 from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_segment_pages
+
+# GetPartitions accepts up to 10 segments.
+_MAX_SEGMENTS = 10
+
+
+_GLUE_OPERATIONS = dict(
+    list_workflows=aws_list_operation('list_workflows', 'workflows', 'Workflows'),
+    list_triggers=aws_list_operation('list_triggers', 'triggers', 'TriggerNames'),
+    list_schemas=aws_list_operation('list_schemas', 'schemas', 'Schemas', RegistryId={'RegistryName': 'name'}),
+    list_registries=aws_list_operation('list_registries', 'registries', 'Registries'),
+    list_ml_transforms=aws_list_operation('list_ml_transforms', 'ml_transforms', 'TransformIds'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'JobNames'),
+    list_dev_endpoints=aws_list_operation('list_dev_endpoints', 'dev_endpoints', 'DevEndpointNames'),
+    list_crawlers=aws_list_operation('list_crawlers', 'crawlers', 'CrawlerNames'),
+    get_databases=aws_list_operation('get_databases', 'databases', 'DatabaseList', ResourceShareType='resource_share_type'),
+    get_tables=aws_list_operation('get_tables', 'tables', 'TableList', DatabaseName='name'),
+)
+
 
+def _partitions_result(client, module) -> dict:
+    segments = module.params['segments']
+    if not 1 <= segments <= _MAX_SEGMENTS:
+        aws_info_fail_usage(module, 'segments must be between 1 and {0}'.format(_MAX_SEGMENTS))
+    params = dict(DatabaseName=module.params['name'], TableName=module.params['table_name'])
+    # filter and column schema are left out by glue, not after pages are received.
+    if module.params['expression']:
+        params['Expression'] = module.params['expression']
+    if module.params['exclude_column_schema']:
+        params['ExcludeColumnSchema'] = True
 
-def _glue(client, module):
+    paginator = client.get_paginator('get_partitions')
+    max_items = None
+    if segments == 1:
+        pages = paginator.paginate(PaginationConfig=aws_pagination_config(module), **params)
+    else:
+        if module.params.get('starting_token'):
+            aws_info_fail_usage(module, 'starting_token can not be used with segments')
+        config = dict(PageSize=module.params['page_size']) if module.params.get('page_size') else {}
+        pages = aws_response_segment_pages(
+            lambda segment: paginator.paginate(
+                Segment=dict(SegmentNumber=segment, TotalSegments=segments),
+                PaginationConfig=config,
+                **params
+            ),
+            segments,
+            max_workers=module.params['max_workers'],
+        )
+        max_items = module.params.get('max_items')
     try:
-        if module.params['list_workflows']:
-            if client.can_paginate('list_workflows'):
-                paginator = client.get_paginator('list_workflows')
-                return paginator.paginate(), True
-            else:
-                return client.list_workflows(), False
-        elif module.params['list_triggers']:
-            if client.can_paginate('list_triggers'):
-                paginator = client.get_paginator('list_triggers')
-                return paginator.paginate(), True
-            else:
-                return client.list_triggers(), False
-        elif module.params['list_schemas']:
-            if client.can_paginate('list_schemas'):
-                paginator = client.get_paginator('list_schemas')
-                return paginator.paginate(
-                    RegistryId={
-                        'RegistryName': module.params['name'],
-                    }
-                ), True
-            else:
-                return client.list_schemas(
-                    RegistryId={
-                        'RegistryName': module.params['name'],
-                    }
-                ), False
-        elif module.params['list_registries']:
-            if client.can_paginate('list_registries'):
-                paginator = client.get_paginator('list_registries')
-                return paginator.paginate(), True
-            else:
-                return client.list_registries(), False
-        elif module.params['list_ml_transforms']:
-            if client.can_paginate('list_ml_transforms'):
-                paginator = client.get_paginator('list_ml_transforms')
-                return paginator.paginate(), True
-            else:
-                return client.list_ml_transforms(), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_jobs(), False
-        elif module.params['list_dev_endpoints']:
-            if client.can_paginate('list_dev_endpoints'):
-                paginator = client.get_paginator('list_dev_endpoints')
-                return paginator.paginate(), True
-            else:
-                return client.list_dev_endpoints(), False
-        elif module.params['list_crawlers']:
-            if client.can_paginate('list_crawlers'):
-                paginator = client.get_paginator('list_crawlers')
-                return paginator.paginate(), True
-            else:
-                return client.list_crawlers(), False
-        elif module.params['get_databases']:
-            if client.can_paginate('get_databases'):
-                paginator = client.get_paginator('get_databases')
-                return paginator.paginate(
-                    ResourceShareType=module.params['resource_share_type']
-                ), True
-            else:
-                return client.get_databases(
-                    ResourceShareType=module.params['resource_share_type']
-                ), False
-        elif module.params['get_tables']:
-            if client.can_paginate('get_tables'):
-                paginator = client.get_paginator('get_tables')
-                return paginator.paginate(
-                    DatabaseName=module.params['name']
-                ), True
-            else:
-                return client.get_tables(
-                    DatabaseName=module.params['name']
-                ), False
-        elif module.params['get_partitions']:
-            if client.can_paginate('get_partitions'):
-                paginator = client.get_paginator('get_partitions')
-                return paginator.paginate(
-                    DatabaseName=module.params['name'],
-                    TableName=module.params['table_name']
-                ), True
-            else:
-                return client.get_partitions(
-                    DatabaseName=module.params['name'],
-                    TableName=module.params['table_name']
-                ), False
-        else:
-            return None, False
+        return dict(partitions=aws_response_list_parser(True, pages, 'Partitions', max_items=max_items, fields=module.params['fields']))
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Glue details')
+        module.fail_json_aws(e, msg='Failed to fetch Amazon Glue partitions')
+
+
+def _glue_result(client, module) -> dict:
+    if module.params['get_partitions']:
+        return _partitions_result(client, module)
+    return aws_operations_result(
+        client,
+        module,
+        _GLUE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Glue details',
+    )
 
 
 def main():
@@ -311,9 +315,13 @@ def main():
         get_databases=dict(required=False, type=bool),
         get_tables=dict(required=False, type=bool),
         get_partitions=dict(required=False, type=bool),
+        expression=dict(required=False),
+        exclude_column_schema=dict(required=False, type=bool, default=False),
+        segments=dict(required=False, type=int, default=1),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_schemas', True, ['name']),
@@ -338,33 +346,7 @@ def main():
         ],
     )
 
-    client = module.client('glue', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _glue(client, module)
-
-    if module.params['list_workflows']:
-        module.exit_json(workflows=aws_response_list_parser(paginate, it, 'Workflows'))
-    elif module.params['list_triggers']:
-        module.exit_json(triggers=aws_response_list_parser(paginate, it, 'TriggerNames'))
-    elif module.params['list_schemas']:
-        module.exit_json(schemas=aws_response_list_parser(paginate, it, 'Schemas'))
-    elif module.params['list_registries']:
-        module.exit_json(registries=aws_response_list_parser(paginate, it, 'Registries'))
-    elif module.params['list_ml_transforms']:
-        module.exit_json(ml_transforms=aws_response_list_parser(paginate, it, 'TransformIds'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'JobNames'))
-    elif module.params['list_dev_endpoints']:
-        module.exit_json(dev_endpoints=aws_response_list_parser(paginate, it, 'DevEndpointNames'))
-    elif module.params['list_crawlers']:
-        module.exit_json(crawlers=aws_response_list_parser(paginate, it, 'CrawlerNames'))
-    elif module.params['get_databases']:
-        module.exit_json(databases=aws_response_list_parser(paginate, it, 'DatabaseList'))
-    elif module.params['get_tables']:
-        module.exit_json(tables=aws_response_list_parser(paginate, it, 'TableList'))
-    elif module.params['get_partitions']:
-        module.exit_json(partitions=aws_response_list_parser(paginate, it, 'Partitions'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'glue', _glue_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -83,6 +83,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -148,84 +149,31 @@ installed_components:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _greengrassv2(client, module):
-    try:
-        if module.params['list_component_versions']:
-            if client.can_paginate('list_component_versions'):
-                paginator = client.get_paginator('list_component_versions')
-                return paginator.paginate(
-                    arn=module.params['arn']
-                ), True
-            else:
-                return client.list_component_versions(
-                    arn=module.params['arn']
-                ), False
-        elif module.params['list_components']:
-            if client.can_paginate('list_components'):
-                paginator = client.get_paginator('list_components')
-                return paginator.paginate(
-                    scope=module.params['scope']
-                ), True
-            else:
-                return client.list_components(
-                    scope=module.params['scope']
-                ), False
-        elif module.params['list_core_devices']:
-            if client.can_paginate('list_core_devices'):
-                paginator = client.get_paginator('list_core_devices')
-                return paginator.paginate(
-                    status=module.params['status']
-                ), True
-            else:
-                return client.list_core_devices(
-                    status=module.params['status']
-                ), False
-        elif module.params['list_deployments']:
-            if client.can_paginate('list_deployments'):
-                paginator = client.get_paginator('list_deployments')
-                return paginator.paginate(
-                    targetArn=module.params['arn'],
-                    historyFilter=module.params['history_filter']
-                ), True
-            else:
-                return client.list_deployments(
-                    targetArn=module.params['arn'],
-                    historyFilter=module.params['history_filter']
-                ), False
-        elif module.params['list_effective_deployments']:
-            if client.can_paginate('list_effective_deployments'):
-                paginator = client.get_paginator('list_effective_deployments')
-                return paginator.paginate(
-                    coreDeviceThingName=module.params['name']
-                ), True
-            else:
-                return client.list_effective_deployments(
-                    coreDeviceThingName=module.params['name']
-                ), False
-        elif module.params['list_installed_components']:
-            if client.can_paginate('list_installed_components'):
-                paginator = client.get_paginator('list_installed_components')
-                return paginator.paginate(
-                    coreDeviceThingName=module.params['name']
-                ), True
-            else:
-                return client.list_installed_components(
-                    coreDeviceThingName=module.params['name']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon greengrassv2 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_GREENGRASSV2_OPERATIONS = dict(
+    list_component_versions=aws_list_operation('list_component_versions', 'component_versions', 'componentVersions', arn='arn'),
+    list_components=aws_list_operation('list_components', 'components', 'components', scope='scope'),
+    list_core_devices=aws_list_operation('list_core_devices', 'core_devices', 'coreDevices', status='status'),
+    list_deployments=aws_list_operation('list_deployments', 'deployments', 'deployments', targetArn='arn', historyFilter='history_filter'),
+    list_effective_deployments=aws_list_operation('list_effective_deployments', 'effective_deployments', 'effectiveDeployments', coreDeviceThingName='name'),
+    list_installed_components=aws_list_operation('list_installed_components', 'installed_components', 'installedComponents', coreDeviceThingName='name'),
+)
+
+
+def _greengrassv2_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _GREENGRASSV2_OPERATIONS,
+        error_msg='Failed to fetch Amazon greengrassv2 details',
+    )
 
 
 def main():
@@ -242,8 +190,9 @@ def main():
         list_effective_deployments=dict(required=False, type=bool),
         list_installed_components=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_component_versions', True, ['arn']),
@@ -263,23 +212,7 @@ def main():
         ],
     )
 
-    client = module.client('greengrassv2', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _greengrassv2(client, module)
-
-    if module.params['list_component_versions']:
-        module.exit_json(component_versions=aws_response_list_parser(paginate, it, 'componentVersions'))
-    elif module.params['list_components']:
-        module.exit_json(components=aws_response_list_parser(paginate, it, 'components'))
-    elif module.params['list_core_devices']:
-        module.exit_json(core_devices=aws_response_list_parser(paginate, it, 'coreDevices'))
-    elif module.params['list_deployments']:
-        module.exit_json(deployments=aws_response_list_parser(paginate, it, 'deployments'))
-    elif module.params['list_effective_deployments']:
-        module.exit_json(effective_deployments=aws_response_list_parser(paginate, it, 'effectiveDeployments'))
-    elif module.params['list_installed_components']:
-        module.exit_json(installed_components=aws_response_list_parser(paginate, it, 'installedComponents'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'greengrassv2', _greengrassv2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
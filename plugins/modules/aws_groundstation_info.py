@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -95,52 +96,30 @@ satellites:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _groundstation(client, module):
-    try:
-        if module.params['list_configs']:
-            if client.can_paginate('list_configs'):
-                paginator = client.get_paginator('list_configs')
-                return paginator.paginate(), True
-            else:
-                return client.list_configs(), False
-        elif module.params['list_dataflow_endpoint_groups']:
-            if client.can_paginate('list_dataflow_endpoint_groups'):
-                paginator = client.get_paginator('list_dataflow_endpoint_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_dataflow_endpoint_groups(), False
-        elif module.params['list_ground_stations']:
-            if client.can_paginate('list_ground_stations'):
-                paginator = client.get_paginator('list_ground_stations')
-                return paginator.paginate(), True
-            else:
-                return client.list_ground_stations(), False
-        elif module.params['list_mission_profiles']:
-            if client.can_paginate('list_mission_profiles'):
-                paginator = client.get_paginator('list_mission_profiles')
-                return paginator.paginate(), True
-            else:
-                return client.list_mission_profiles(), False
-        elif module.params['list_satellites']:
-            if client.can_paginate('list_satellites'):
-                paginator = client.get_paginator('list_satellites')
-                return paginator.paginate(), True
-            else:
-                return client.list_satellites(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon groundstation details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_GROUNDSTATION_OPERATIONS = dict(
+    list_configs=aws_list_operation('list_configs', 'configs', 'configList'),
+    list_dataflow_endpoint_groups=aws_list_operation('list_dataflow_endpoint_groups', 'dataflow_endpoint_groups', 'dataflowEndpointGroupList'),
+    list_ground_stations=aws_list_operation('list_ground_stations', 'ground_stations', 'groundStationList'),
+    list_mission_profiles=aws_list_operation('list_mission_profiles', 'mission_profiles', 'missionProfileList'),
+    list_satellites=aws_list_operation('list_satellites', 'satellites', 'satellites'),
+)
+
+
+def _groundstation_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _GROUNDSTATION_OPERATIONS,
+        error_msg='Failed to fetch Amazon groundstation details',
+    )
 
 
 def main():
@@ -151,8 +130,9 @@ def main():
         list_mission_profiles=dict(required=False, type=bool),
         list_satellites=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -166,21 +146,7 @@ def main():
         ],
     )
 
-    client = module.client('groundstation', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _groundstation(client, module)
-
-    if module.params['list_configs']:
-        module.exit_json(configs=aws_response_list_parser(paginate, it, 'configList'))
-    elif module.params['list_dataflow_endpoint_groups']:
-        module.exit_json(dataflow_endpoint_groups=aws_response_list_parser(paginate, it, 'dataflowEndpointGroupList'))
-    elif module.params['list_ground_stations']:
-        module.exit_json(ground_stations=aws_response_list_parser(paginate, it, 'groundStationList'))
-    elif module.params['list_mission_profiles']:
-        module.exit_json(mission_profiles=aws_response_list_parser(paginate, it, 'missionProfileList'))
-    elif module.params['list_satellites']:
-        module.exit_json(satellites=aws_response_list_parser(paginate, it, 'satellites'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'groundstation', _groundstation_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
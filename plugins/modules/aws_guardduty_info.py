@@ -70,6 +70,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -80,6 +81,13 @@ EXAMPLES = """
   aws_guardduty_info:
     list_detectors: true
 
+- name: "get list of detectors in member accounts"
+  aws_guardduty_info:
+    list_detectors: true
+    account_ids: ['111111111111', '222222222222']
+    role_name: 'OrganizationAccountAccessRole'
+    role_credentials_cache: '~/.ansible/aws_role_credentials'
+
 - name: "get list of filters"
   aws_guardduty_info:
     list_filters: true
@@ -158,94 +166,34 @@ threat_intel_sets:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _guardduty(client, module):
-    try:
-        if module.params['list_detectors']:
-            if client.can_paginate('list_detectors'):
-                paginator = client.get_paginator('list_detectors')
-                return paginator.paginate(), True
-            else:
-                return client.list_detectors(), False
-        elif module.params['list_filters']:
-            if client.can_paginate('list_filters'):
-                paginator = client.get_paginator('list_filters')
-                return paginator.paginate(
-                    DetectorId=module.params['id']
-                ), True
-            else:
-                return client.list_filters(
-                    DetectorId=module.params['id']
-                ), False
-        elif module.params['list_findings']:
-            if client.can_paginate('list_findings'):
-                paginator = client.get_paginator('list_findings')
-                return paginator.paginate(
-                    DetectorId=module.params['id']
-                ), True
-            else:
-                return client.list_findings(
-                    DetectorId=module.params['id']
-                ), False
-        elif module.params['list_ip_sets']:
-            if client.can_paginate('list_ip_sets'):
-                paginator = client.get_paginator('list_ip_sets')
-                return paginator.paginate(
-                    DetectorId=module.params['id']
-                ), True
-            else:
-                return client.list_ip_sets(
-                    DetectorId=module.params['id']
-                ), False
-        elif module.params['list_members']:
-            if client.can_paginate('list_members'):
-                paginator = client.get_paginator('list_members')
-                return paginator.paginate(
-                    DetectorId=module.params['id']
-                ), True
-            else:
-                return client.list_members(
-                    DetectorId=module.params['id']
-                ), False
-        elif module.params['list_organization_admin_accounts']:
-            if client.can_paginate('list_organization_admin_accounts'):
-                paginator = client.get_paginator('list_organization_admin_accounts')
-                return paginator.paginate(), True
-            else:
-                return client.list_organization_admin_accounts(), False
-        elif module.params['list_publishing_destinations']:
-            if client.can_paginate('list_publishing_destinations'):
-                paginator = client.get_paginator('list_publishing_destinations')
-                return paginator.paginate(
-                    DetectorId=module.params['id']
-                ), True
-            else:
-                return client.list_publishing_destinations(
-                    DetectorId=module.params['id']
-                ), False
-        elif module.params['list_threat_intel_sets']:
-            if client.can_paginate('list_threat_intel_sets'):
-                paginator = client.get_paginator('list_threat_intel_sets')
-                return paginator.paginate(
-                    DetectorId=module.params['id']
-                ), True
-            else:
-                return client.list_threat_intel_sets(
-                    DetectorId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Guard Duty details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_GUARDDUTY_OPERATIONS = dict(
+    list_detectors=aws_list_operation('list_detectors', 'detectors', 'DetectorIds'),
+    list_filters=aws_list_operation('list_filters', 'filters', 'FilterNames', DetectorId='id'),
+    list_findings=aws_list_operation('list_findings', 'findings', 'FindingIds', DetectorId='id'),
+    list_invitations=aws_list_operation('list_invitations', 'invitations', 'Invitations'),
+    list_ip_sets=aws_list_operation('list_ip_sets', 'ip_sets', 'IpSetIds', DetectorId='id'),
+    list_members=aws_list_operation('list_members', 'members', 'Members', DetectorId='id'),
+    list_organization_admin_accounts=aws_list_operation('list_organization_admin_accounts', 'organization_admin_accounts', 'AdminAccounts'),
+    list_publishing_destinations=aws_list_operation('list_publishing_destinations', 'publishing_destinations', 'Destinations', DetectorId='id'),
+    list_threat_intel_sets=aws_list_operation('list_threat_intel_sets', 'threat_intel_sets', 'ThreatIntelSetIds', DetectorId='id'),
+)
+
+
+def _guardduty_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _GUARDDUTY_OPERATIONS,
+        error_msg='Failed to fetch Amazon Guard Duty details',
+    )
 
 
 def main():
@@ -261,8 +209,9 @@ def main():
         list_publishing_destinations=dict(required=False, type=bool),
         list_threat_intel_sets=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_filters', True, ['id']),
@@ -288,29 +237,7 @@ def main():
         ],
     )
 
-    client = module.client('guardduty', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _guardduty(client, module)
-
-    if module.params['list_detectors']:
-        module.exit_json(detectors=aws_response_list_parser(paginate, it, 'DetectorIds'))
-    elif module.params['list_filters']:
-        module.exit_json(filters=aws_response_list_parser(paginate, it, 'FilterNames'))
-    elif module.params['list_findings']:
-        module.exit_json(findings=aws_response_list_parser(paginate, it, 'FindingIds'))
-    elif module.params['list_invitations']:
-        module.exit_json(invitations=aws_response_list_parser(paginate, it, 'Invitations'))
-    elif module.params['list_ip_sets']:
-        module.exit_json(ip_sets=aws_response_list_parser(paginate, it, 'IpSetIds'))
-    elif module.params['list_members']:
-        module.exit_json(members=aws_response_list_parser(paginate, it, 'Members'))
-    elif module.params['list_organization_admin_accounts']:
-        module.exit_json(organization_admin_accounts=aws_response_list_parser(paginate, it, 'AdminAccounts'))
-    elif module.params['list_publishing_destinations']:
-        module.exit_json(publishing_destinations=aws_response_list_parser(paginate, it, 'Destinations'))
-    elif module.params['list_threat_intel_sets']:
-        module.exit_json(threat_intel_sets=aws_response_list_parser(paginate, it, 'ThreatIntelSetIds'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'guardduty', _guardduty_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -62,6 +62,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -109,55 +110,43 @@ affected_accounts_for_organization:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _health(client, module):
-    try:
-        if module.params['describe_health_service_status_for_organization']:
-            return client.describe_health_service_status_for_organization(), False
-        elif module.params['describe_events']:
-            if client.can_paginate('describe_events'):
-                paginator = client.get_paginator('describe_events')
-                return paginator.paginate(
-                    filter={
-                        "services": module.params['services'],
-                        "eventTypeCategories": module.params['event_type_categories'],
-                    }
-                ), True
-            else:
-                return client.describe_events(
-                    filter={
-                        "services": module.params['services'],
-                        "eventTypeCategories": module.params['event_type_categories'],
-                    }
-                ), False
-        elif module.params['describe_event_details']:
-            if client.can_paginate('describe_event_details'):
-                paginator = client.get_paginator('describe_event_details')
-                return paginator.paginate(
-                    eventArns=module.params['arns']
-                ), True
-            else:
-                return client.describe_event_details(
-                    eventArns=module.params['arns']
-                ), False
-        elif module.params['describe_affected_accounts_for_organization']:
-            return client.describe_affected_accounts_for_organization(
-                eventArn=module.params['arn']
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Health details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_HEALTH_OPERATIONS = dict(
+    describe_health_service_status_for_organization=aws_dict_operation(
+        'describe_health_service_status_for_organization',
+        'health_service_status_for_organization',
+        'healthServiceAccessStatusForOrganization',
+    ),
+    describe_events=aws_list_operation(
+        'describe_events',
+        'events',
+        'events',
+        filter={'services': 'services', 'eventTypeCategories': 'event_type_categories'},
+    ),
+    describe_event_details=aws_dict_operation('describe_event_details', 'event_details', eventArns='arns'),
+    describe_affected_accounts_for_organization=aws_dict_operation(
+        'describe_affected_accounts_for_organization',
+        'affected_accounts_for_organization',
+        eventArn='arn',
+    ),
+)
+
+
+def _health_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _HEALTH_OPERATIONS,
+        error_msg='Failed to fetch Amazon Health details',
+    )
 
 
 def main():
@@ -171,8 +160,9 @@ def main():
         describe_event_details=dict(required=False, type=bool),
         describe_affected_accounts_for_organization=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_event_details', True, ['arns']),
@@ -188,19 +178,7 @@ def main():
         ],
     )
 
-    client = module.client('health', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _health(client, module)
-
-    if module.params['describe_health_service_status_for_organization']:
-        module.exit_json(health_service_status_for_organization=it['healthServiceAccessStatusForOrganization'])
-    elif module.params['describe_events']:
-        module.exit_json(events=aws_response_list_parser(paginate, it, 'events'))
-    elif module.params['describe_event_details']:
-        module.exit_json(event_details=camel_dict_to_snake_dict(it))
-    elif module.params['describe_affected_accounts_for_organization']:
-        module.exit_json(affected_accounts_for_organization=camel_dict_to_snake_dict(it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'health', _health_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
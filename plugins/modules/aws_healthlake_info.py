@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -105,51 +106,35 @@ fhir_import_job:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _healthlake(client, module):
-    try:
-        if module.params['list_fhir_datastores']:
-            if client.can_paginate('list_fhir_datastores'):
-                paginator = client.get_paginator('list_fhir_datastores')
-                return paginator.paginate(
-                    Filter={
-                        "DatastoreStatus": module.params['datastore_status'],
-                    }
-                ), True
-            else:
-                return client.list_fhir_datastores(
-                    Filter={
-                        "DatastoreStatus": module.params['datastore_status'],
-                    }
-                ), False
-        elif module.params['describe_fhir_datastore']:
-            return client.describe_fhir_datastore(
-                DatastoreId=module.params['id']
-            ), False
-        elif module.params['describe_fhir_export_job']:
-            return client.describe_fhir_export_job(
-                DatastoreId=module.params['id'],
-                JobId=module.params['job_id']
-            ), False
-        elif module.params['describe_fhir_import_job']:
-            return client.describe_fhir_import_job(
-                DatastoreId=module.params['id'],
-                JobId=module.params['job_id']
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon healthlake details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_HEALTHLAKE_OPERATIONS = dict(
+    list_fhir_datastores=aws_list_operation(
+        'list_fhir_datastores',
+        'fhir_datastores',
+        'DatastorePropertiesList',
+        Filter={'DatastoreStatus': 'datastore_status'},
+    ),
+    describe_fhir_datastore=aws_dict_operation('describe_fhir_datastore', 'fhir_datastore', DatastoreId='id'),
+    describe_fhir_export_job=aws_dict_operation('describe_fhir_export_job', 'fhir_export_job', 'ExportJobProperties', DatastoreId='id', JobId='job_id'),
+    describe_fhir_import_job=aws_dict_operation('describe_fhir_import_job', 'fhir_import_job', 'ImportJobProperties', DatastoreId='id', JobId='job_id'),
+)
+
+
+def _healthlake_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _HEALTHLAKE_OPERATIONS,
+        error_msg='Failed to fetch Amazon healthlake details',
+    )
 
 
 def main():
@@ -162,8 +147,9 @@ def main():
         describe_fhir_export_job=dict(required=False, type=bool),
         describe_fhir_import_job=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_fhir_datastore', True, ['id']),
@@ -180,19 +166,7 @@ def main():
         ],
     )
 
-    client = module.client('healthlake', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _healthlake(client, module)
-
-    if module.params['list_fhir_datastores']:
-        module.exit_json(fhir_datastores=aws_response_list_parser(paginate, it, 'DatastorePropertiesList'))
-    elif module.params['describe_fhir_datastore']:
-        module.exit_json(fhir_datastore=camel_dict_to_snake_dict(it))
-    elif module.params['describe_fhir_export_job']:
-        module.exit_json(fhir_export_job=camel_dict_to_snake_dict(it['ExportJobProperties']))
-    elif module.params['describe_fhir_import_job']:
-        module.exit_json(fhir_import_job=camel_dict_to_snake_dict(it['ImportJobProperties']))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'healthlake', _healthlake_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
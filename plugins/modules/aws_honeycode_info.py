@@ -50,6 +50,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -90,58 +91,28 @@ table_columns:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _honeycode(client, module):
-    try:
-        if module.params['list_tables']:
-            if client.can_paginate('list_tables'):
-                paginator = client.get_paginator('list_tables')
-                return paginator.paginate(
-                    workbookId=module.params['id']
-                ), True
-            else:
-                return client.list_tables(
-                    workbookId=module.params['id']
-                ), False
-        elif module.params['list_table_rows']:
-            if client.can_paginate('list_table_rows'):
-                paginator = client.get_paginator('list_table_rows')
-                return paginator.paginate(
-                    workbookId=module.params['id'],
-                    tableId=module.params['table_id'],
-                    rowIds=module.params['row_ids'],
-                ), True
-            else:
-                return client.list_table_rows(
-                    workbookId=module.params['id'],
-                    tableId=module.params['table_id'],
-                    rowIds=module.params['row_ids'],
-                ), False
-        elif module.params['list_table_columns']:
-            if client.can_paginate('list_table_columns'):
-                paginator = client.get_paginator('list_table_columns')
-                return paginator.paginate(
-                    workbookId=module.params['id'],
-                    tableId=module.params['table_id'],
-                ), True
-            else:
-                return client.list_table_columns(
-                    workbookId=module.params['id'],
-                    tableId=module.params['table_id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Honey Code details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_HONEYCODE_OPERATIONS = dict(
+    list_tables=aws_list_operation('list_tables', 'tables', 'tables', workbookId='id'),
+    list_table_rows=aws_list_operation('list_table_rows', 'table_rows', 'rows', workbookId='id', tableId='table_id', rowIds='row_ids'),
+    list_table_columns=aws_list_operation('list_table_columns', 'table_columns', 'tableColumns', workbookId='id', tableId='table_id'),
+)
+
+
+def _honeycode_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _HONEYCODE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Honey Code details',
+    )
 
 
 def main():
@@ -153,8 +124,9 @@ def main():
         list_table_rows=dict(required=False, type=bool),
         list_table_columns=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_tables', True, ['id']),
@@ -170,17 +142,7 @@ def main():
         ],
     )
 
-    client = module.client('honeycode', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _honeycode(client, module)
-
-    if module.params['list_tables']:
-        module.exit_json(tables=aws_response_list_parser(paginate, it, 'tables'))
-    elif module.params['list_table_rows']:
-        module.exit_json(table_rows=aws_response_list_parser(paginate, it, 'rows'))
-    elif module.params['list_table_columns']:
-        module.exit_json(table_columns=aws_response_list_parser(paginate, it, 'tableColumns'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'honeycode', _honeycode_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -71,6 +71,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -93,6 +94,12 @@ EXAMPLES = """
     arn: "{{ __iam_analyzer.analyzers[0].arn }}"
     list_findings: true
 
+- name: "get findings which are new or changed since last run"
+  aws_iam_access_analyzer_info:
+    arn: "{{ __iam_analyzer.analyzers[0].arn }}"
+    list_findings: true
+    since_state: "/var/lib/ansible/access_analyzer_findings.json"
+
 - name: "get list of analyzed resources"
   aws_iam_access_analyzer_info:
     arn: "{{ __iam_analyzer.analyzers[0].arn }}"
@@ -170,66 +177,35 @@ analyzed_resources:
   ]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_IAM_ACCESS_ANALYZER_OPERATIONS = dict(
+    list_analyzers=aws_list_operation('list_analyzers', 'analyzers', 'analyzers', type='list_analyzers_type'),
+    list_archive_rules=aws_list_operation('list_archive_rules', 'archive_rules', 'archiveRules', analyzerName='name'),
+    list_findings=aws_list_operation('list_findings', 'findings', 'findings', analyzerArn='arn'),
+    list_analyzed_resources=aws_list_operation(
+        'list_analyzed_resources',
+        'analyzed_resources',
+        'analyzedResources',
+        analyzerArn='arn',
+        resourceType='list_analyzed_resources_type',
+    ),
+)
 
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _iam_access_analyzer(client, module):
-    try:
-        if module.params['list_analyzers']:
-            if client.can_paginate('list_analyzers'):
-                paginator = client.get_paginator('list_analyzers')
-                iterator = paginator.paginate(
-                    type=module.params['list_analyzers_type']
-                )
-                return iterator, True
-            else:
-                return client.list_analyzers(
-                    type=module.params['list_analyzers_type']
-                ), False
-        elif module.params['list_archive_rules']:
-            if client.can_paginate('list_archive_rules'):
-                paginator = client.get_paginator('list_archive_rules')
-                return paginator.paginate(
-                    analyzerName=module.params['name']
-                ), True
-            else:
-                return client.list_archive_rules(
-                    analyzerName=module.params['name']
-                ), False
-        elif module.params['list_findings']:
-            if client.can_paginate('list_findings'):
-                paginator = client.get_paginator('list_findings')
-                return paginator.paginate(
-                    analyzerArn=module.params['arn']
-                ), True
-            else:
-                return client.list_findings(
-                    analyzerArn=module.params['arn'],
-                ), False
-        elif module.params['list_analyzed_resources']:
-            if client.can_paginate('list_analyzed_resources'):
-                paginator = client.get_paginator('list_analyzed_resources')
-                return paginator.paginate(
-                    analyzerArn=module.params['arn'],
-                    resourceType=module.params['list_analyzed_resources_type']
-                ), True
-            else:
-                return client.list_analyzed_resources(
-                    analyzerArn=module.params['arn'],
-                    resourceType=module.params['list_analyzed_resources_type']
-                ), False
-        else:
-            module.fail_json(msg='please pass correct arguments')
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch aws iam access analyzer details')
+
+def _iam_access_analyzer_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _IAM_ACCESS_ANALYZER_OPERATIONS,
+        error_msg='Failed to fetch aws iam access analyzer details',
+    )
 
 
 def main():
@@ -253,8 +229,9 @@ def main():
             ]
         )
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -273,18 +250,7 @@ def main():
         ]
     )
 
-    client = module.client('accessanalyzer')
-
-    _it, paginate = _iam_access_analyzer(client, module)
-    if _it is not None:
-        if module.params['list_analyzers']:
-            module.exit_json(analyzers=aws_response_list_parser(paginate, _it, 'analyzers'))
-        elif module.params['list_archive_rules']:
-            module.exit_json(archive_rules=aws_response_list_parser(paginate, _it, 'archiveRules'))
-        elif module.params['list_findings']:
-            module.exit_json(findings=aws_response_list_parser(paginate, _it, 'findings'))
-        elif module.params['list_analyzed_resources']:
-            module.exit_json(analyzed_resources=aws_response_list_parser(paginate, _it, 'analyzedResources'))
+    module.exit_json(**aws_info_run(module, 'accessanalyzer', _iam_access_analyzer_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
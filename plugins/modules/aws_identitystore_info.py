@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -63,42 +64,27 @@ users:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _identitystore(client, module):
-    try:
-        if module.params['list_groups']:
-            if client.can_paginate('list_groups'):
-                paginator = client.get_paginator('list_groups')
-                return paginator.paginate(
-                    IdentityStoreId=module.params['id']
-                ), True
-            else:
-                return client.list_groups(
-                    IdentityStoreId=module.params['id']
-                ), False
-        elif module.params['list_users']:
-            if client.can_paginate('list_users'):
-                paginator = client.get_paginator('list_users')
-                return paginator.paginate(
-                    IdentityStoreId=module.params['id'],
-                ), True
-            else:
-                return client.list_users(
-                    IdentityStoreId=module.params['id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS SSO Identity Store details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_IDENTITYSTORE_OPERATIONS = dict(
+    list_groups=aws_list_operation('list_groups', 'groups', 'Groups', IdentityStoreId='id'),
+    list_users=aws_list_operation('list_users', 'users', 'Users', IdentityStoreId='id'),
+)
+
+
+def _identitystore_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _IDENTITYSTORE_OPERATIONS,
+        error_msg='Failed to fetch AWS SSO Identity Store details',
+    )
 
 
 def main():
@@ -108,8 +94,9 @@ def main():
         list_groups=dict(required=False, type=bool),
         list_users=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_groups', True, ['id']),
@@ -123,15 +110,7 @@ def main():
         ],
     )
 
-    client = module.client('identitystore', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _identitystore(client, module)
-
-    if module.params['list_groups']:
-        module.exit_json(groups=aws_response_list_parser(paginate, it, 'Groups'))
-    elif module.params['list_users']:
-        module.exit_json(users=aws_response_list_parser(paginate, it, 'Users'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'identitystore', _identitystore_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -79,6 +79,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -167,100 +168,42 @@ infrastructure_configurations:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _imagebuilder(client, module):
-    try:
-        if module.params['list_components']:
-            if client.can_paginate('list_components'):
-                paginator = client.get_paginator('list_components')
-                return paginator.paginate(
-                    owner=module.params['owner']
-                ), True
-            else:
-                return client.list_components(
-                    owner=module.params['owner']
-                ), False
-        elif module.params['list_container_recipes']:
-            if client.can_paginate('list_container_recipes'):
-                paginator = client.get_paginator('list_container_recipes')
-                return paginator.paginate(
-                    owner=module.params['owner']
-                ), True
-            else:
-                return client.list_container_recipes(
-                    owner=module.params['owner']
-                ), False
-        elif module.params['list_distribution_configurations']:
-            if client.can_paginate('list_distribution_configurations'):
-                paginator = client.get_paginator('list_distribution_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_distribution_configurations(), False
-        elif module.params['list_image_build_versions']:
-            if client.can_paginate('list_image_build_versions'):
-                paginator = client.get_paginator('list_image_build_versions')
-                return paginator.paginate(
-                    imageVersionArn=module.params['arn']
-                ), True
-            else:
-                return client.list_image_build_versions(
-                    imageVersionArn=module.params['arn']
-                ), False
-        elif module.params['list_image_pipeline_images']:
-            if client.can_paginate('list_image_pipeline_images'):
-                paginator = client.get_paginator('list_image_pipeline_images')
-                return paginator.paginate(
-                    imagePipelineArn=module.params['arn']
-                ), True
-            else:
-                return client.list_image_pipeline_images(
-                    imagePipelineArn=module.params['arn']
-                ), False
-        elif module.params['list_image_pipelines']:
-            if client.can_paginate('list_image_pipelines'):
-                paginator = client.get_paginator('list_image_pipelines')
-                return paginator.paginate(), True
-            else:
-                return client.list_image_pipelines(), False
-        elif module.params['list_image_recipes']:
-            if client.can_paginate('list_image_recipes'):
-                paginator = client.get_paginator('list_image_recipes')
-                return paginator.paginate(
-                    owner=module.params['owner']
-                ), True
-            else:
-                return client.list_image_recipes(
-                    owner=module.params['owner']
-                ), False
-        elif module.params['list_images']:
-            if client.can_paginate('list_images'):
-                paginator = client.get_paginator('list_images')
-                return paginator.paginate(
-                    owner=module.params['owner']
-                ), True
-            else:
-                return client.list_images(
-                    owner=module.params['owner']
-                ), False
-        elif module.params['list_infrastructure_configurations']:
-            if client.can_paginate('list_infrastructure_configurations'):
-                paginator = client.get_paginator('list_infrastructure_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_infrastructure_configurations(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon EC2 Image Builder details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_IMAGEBUILDER_OPERATIONS = dict(
+    list_components=aws_list_operation('list_components', 'components', 'componentVersionList', owner='owner'),
+    list_container_recipes=aws_list_operation('list_container_recipes', 'container_recipes', 'containerRecipeSummaryList', owner='owner'),
+    list_distribution_configurations=aws_list_operation(
+        'list_distribution_configurations',
+        'distribution_configurations',
+        'distributionConfigurationSummaryList',
+    ),
+    list_image_build_versions=aws_list_operation('list_image_build_versions', 'image_build_versions', 'imageSummaryList', imageVersionArn='arn'),
+    list_image_pipeline_images=aws_list_operation('list_image_pipeline_images', 'image_pipeline_images', 'imageSummaryList', imagePipelineArn='arn'),
+    list_image_pipelines=aws_list_operation('list_image_pipelines', 'image_pipelines', 'imagePipelineList'),
+    list_image_recipes=aws_list_operation('list_image_recipes', 'image_recipes', 'imageRecipeSummaryList', owner='owner'),
+    list_images=aws_list_operation('list_images', 'images', 'imageVersionList', owner='owner'),
+    list_infrastructure_configurations=aws_list_operation(
+        'list_infrastructure_configurations',
+        'infrastructure_configurations',
+        'infrastructureConfigurationSummaryList',
+    ),
+)
+
+
+def _imagebuilder_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _IMAGEBUILDER_OPERATIONS,
+        error_msg='Failed to fetch Amazon EC2 Image Builder details',
+    )
 
 
 def main():
@@ -277,8 +220,9 @@ def main():
         list_images=dict(required=False, type=bool),
         list_infrastructure_configurations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_image_build_versions', True, ['arn']),
@@ -299,29 +243,7 @@ def main():
         ],
     )
 
-    client = module.client('imagebuilder', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _imagebuilder(client, module)
-
-    if module.params['list_components']:
-        module.exit_json(components=aws_response_list_parser(paginate, it, 'componentVersionList'))
-    elif module.params['list_container_recipes']:
-        module.exit_json(container_recipes=aws_response_list_parser(paginate, it, 'containerRecipeSummaryList'))
-    elif module.params['list_distribution_configurations']:
-        module.exit_json(distribution_configurations=aws_response_list_parser(paginate, it, 'distributionConfigurationSummaryList'))
-    elif module.params['list_image_build_versions']:
-        module.exit_json(image_build_versions=aws_response_list_parser(paginate, it, 'imageSummaryList'))
-    elif module.params['list_image_pipeline_images']:
-        module.exit_json(image_pipeline_images=aws_response_list_parser(paginate, it, 'imageSummaryList'))
-    elif module.params['list_image_pipelines']:
-        module.exit_json(image_pipelines=aws_response_list_parser(paginate, it, 'imagePipelineList'))
-    elif module.params['list_image_recipes']:
-        module.exit_json(image_recipes=aws_response_list_parser(paginate, it, 'imageRecipeSummaryList'))
-    elif module.params['list_images']:
-        module.exit_json(images=aws_response_list_parser(paginate, it, 'imageVersionList'))
-    elif module.params['list_infrastructure_configurations']:
-        module.exit_json(infrastructure_configurations=aws_response_list_parser(paginate, it, 'infrastructureConfigurationSummaryList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'imagebuilder', _imagebuilder_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
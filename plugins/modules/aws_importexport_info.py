@@ -45,6 +45,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -81,36 +82,29 @@ status:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _importexport(client, module):
-    try:
-        if module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_jobs(), False
-        elif module.params['get_shipping_label']:
-            return client.get_shipping_label(
-                jobIds=module.params['job_ids'],
-            ), False
-        elif module.params['get_status']:
-            return client.get_status(
-                JobId=module.params['job_id'],
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Import/Export Jobs details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_IMPORTEXPORT_OPERATIONS = dict(
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'Jobs'),
+    get_shipping_label=aws_dict_operation('get_shipping_label', 'shipping_label', jobIds='job_ids'),
+    get_status=aws_dict_operation('get_status', 'status', JobId='job_id'),
+)
+
+
+def _importexport_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _IMPORTEXPORT_OPERATIONS,
+        error_msg='Failed to fetch Amazon Import/Export Jobs details',
+    )
 
 
 def main():
@@ -121,8 +115,9 @@ def main():
         get_shipping_label=dict(required=False, type=bool),
         get_status=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_shipping_label', True, ['job_ids']),
@@ -137,17 +132,7 @@ def main():
         ],
     )
 
-    client = module.client('importexport', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _importexport(client, module)
-
-    if module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'Jobs'))
-    elif module.params['get_shipping_label']:
-        module.exit_json(shipping_label=it)
-    elif module.params['get_status']:
-        module.exit_json(status=it)
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'importexport', _importexport_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -75,6 +75,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -154,90 +155,33 @@ rules_packages:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _inspector(client, module):
-    try:
-        if module.params['list_assessment_run_agents']:
-            if client.can_paginate('list_assessment_run_agents'):
-                paginator = client.get_paginator('list_assessment_run_agents')
-                return paginator.paginate(
-                    assessmentRunArn=module.params['arn']
-                ), True
-            else:
-                return client.list_assessment_run_agents(
-                    assessmentRunArn=module.params['arn']
-                ), False
-        elif module.params['list_assessment_runs']:
-            if client.can_paginate('list_assessment_runs'):
-                paginator = client.get_paginator('list_assessment_runs')
-                return paginator.paginate(
-                    assessmentTemplateArns=module.params['arns']
-                ), True
-            else:
-                return client.list_assessment_runs(
-                    assessmentTemplateArns=module.params['arns']
-                ), False
-        elif module.params['list_assessment_targets']:
-            if client.can_paginate('list_assessment_targets'):
-                paginator = client.get_paginator('list_assessment_targets')
-                return paginator.paginate(), True
-            else:
-                return client.list_assessment_targets(), False
-        elif module.params['list_assessment_templates']:
-            if client.can_paginate('list_assessment_templates'):
-                paginator = client.get_paginator('list_assessment_templates')
-                return paginator.paginate(
-                    assessmentTargetArns=module.params['arns']
-                ), True
-            else:
-                return client.list_assessment_templates(
-                    assessmentTargetArns=module.params['arns']
-                ), False
-        elif module.params['list_event_subscriptions']:
-            if client.can_paginate('list_event_subscriptions'):
-                paginator = client.get_paginator('list_event_subscriptions')
-                return paginator.paginate(), True
-            else:
-                return client.list_event_subscriptions(), False
-        elif module.params['list_exclusions']:
-            if client.can_paginate('list_exclusions'):
-                paginator = client.get_paginator('list_exclusions')
-                return paginator.paginate(
-                    assessmentRunArn=module.params['arn']
-                ), True
-            else:
-                return client.list_exclusions(
-                    assessmentRunArn=module.params['arn']
-                ), False
-        elif module.params['list_findings']:
-            if client.can_paginate('list_findings'):
-                paginator = client.get_paginator('list_findings')
-                return paginator.paginate(
-                    assessmentRunArns=module.params['arns']
-                ), True
-            else:
-                return client.list_findings(
-                    assessmentRunArns=module.params['arns']
-                ), False
-        elif module.params['list_rules_packages']:
-            if client.can_paginate('list_rules_packages'):
-                paginator = client.get_paginator('list_rules_packages')
-                return paginator.paginate(), True
-            else:
-                return client.list_rules_packages(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Inspector details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_INSPECTOR_OPERATIONS = dict(
+    list_assessment_run_agents=aws_list_operation('list_assessment_run_agents', 'assessment_run_agents', 'assessmentRunAgents', assessmentRunArn='arn'),
+    list_assessment_runs=aws_list_operation('list_assessment_runs', 'assessment_runs', 'assessmentRunArns', assessmentTemplateArns='arns'),
+    list_assessment_targets=aws_list_operation('list_assessment_targets', 'assessment_targets', 'assessmentTargetArns'),
+    list_assessment_templates=aws_list_operation('list_assessment_templates', 'assessment_templates', 'assessmentTemplateArns', assessmentTargetArns='arns'),
+    list_event_subscriptions=aws_list_operation('list_event_subscriptions', 'event_subscriptions', 'subscriptions'),
+    list_exclusions=aws_list_operation('list_exclusions', 'exclusions', 'exclusionArns', assessmentRunArn='arn'),
+    list_findings=aws_list_operation('list_findings', 'findings', 'findingArns', assessmentRunArns='arns'),
+    list_rules_packages=aws_list_operation('list_rules_packages', 'rules_packages', 'rulesPackageArns'),
+)
+
+
+def _inspector_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _INSPECTOR_OPERATIONS,
+        error_msg='Failed to fetch Amazon Inspector details',
+    )
 
 
 def main():
@@ -253,8 +197,9 @@ def main():
         list_findings=dict(required=False, type=bool),
         list_rules_packages=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_assessment_run_agents', True, ['arn']),
@@ -277,27 +222,7 @@ def main():
         ],
     )
 
-    client = module.client('inspector', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _inspector(client, module)
-
-    if module.params['list_assessment_run_agents']:
-        module.exit_json(assessment_run_agents=aws_response_list_parser(paginate, it, 'assessmentRunAgents'))
-    elif module.params['list_assessment_runs']:
-        module.exit_json(assessment_runs=aws_response_list_parser(paginate, it, 'assessmentRunArns'))
-    elif module.params['list_assessment_targets']:
-        module.exit_json(assessment_targets=aws_response_list_parser(paginate, it, 'assessmentTargetArns'))
-    elif module.params['list_assessment_templates']:
-        module.exit_json(assessment_templates=aws_response_list_parser(paginate, it, 'assessmentTemplateArns'))
-    elif module.params['list_event_subscriptions']:
-        module.exit_json(event_subscriptions=aws_response_list_parser(paginate, it, 'subscriptions'))
-    elif module.params['list_exclusions']:
-        module.exit_json(exclusions=aws_response_list_parser(paginate, it, 'exclusionArns'))
-    elif module.params['list_findings']:
-        module.exit_json(findings=aws_response_list_parser(paginate, it, 'findingArns'))
-    elif module.params['list_rules_packages']:
-        module.exit_json(rules_packages=aws_response_list_parser(paginate, it, 'rulesPackageArns'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'inspector', _inspector_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
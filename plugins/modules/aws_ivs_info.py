@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -89,50 +90,29 @@ streams:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _ivs(client, module):
-    try:
-        if module.params['list_channels']:
-            if client.can_paginate('list_channels'):
-                paginator = client.get_paginator('list_channels')
-                return paginator.paginate(), True
-            else:
-                return client.list_channels(), False
-        elif module.params['list_playback_key_pairs']:
-            if client.can_paginate('list_playback_key_pairs'):
-                paginator = client.get_paginator('list_playback_key_pairs')
-                return paginator.paginate(), True
-            else:
-                return client.list_playback_key_pairs(), False
-        elif module.params['list_stream_keys']:
-            if client.can_paginate('list_stream_keys'):
-                paginator = client.get_paginator('list_stream_keys')
-                return paginator.paginate(
-                    channelArn=module.params['arn']
-                ), True
-            else:
-                return client.list_stream_keys(
-                    channelArn=module.params['arn']
-                ), False
-        elif module.params['list_streams']:
-            if client.can_paginate('list_streams'):
-                paginator = client.get_paginator('list_streams')
-                return paginator.paginate(), True
-            else:
-                return client.list_streams(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon ivs details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_IVS_OPERATIONS = dict(
+    list_channels=aws_list_operation('list_channels', 'channels', 'channels'),
+    list_playback_key_pairs=aws_list_operation('list_playback_key_pairs', 'playback_key_pairs', 'keyPairs'),
+    list_stream_keys=aws_list_operation('list_stream_keys', 'stream_keys', 'streamKeys', channelArn='arn'),
+    list_streams=aws_list_operation('list_streams', 'streams', 'streams'),
+)
+
+
+def _ivs_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _IVS_OPERATIONS,
+        error_msg='Failed to fetch Amazon ivs details',
+    )
 
 
 def main():
@@ -143,8 +123,9 @@ def main():
         list_stream_keys=dict(required=False, type=bool),
         list_streams=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_stream_keys', True, ['arn']),
@@ -159,19 +140,7 @@ def main():
         ],
     )
 
-    client = module.client('ivs', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ivs(client, module)
-
-    if module.params['list_channels']:
-        module.exit_json(channels=aws_response_list_parser(paginate, it, 'channels'))
-    elif module.params['list_playback_key_pairs']:
-        module.exit_json(playback_key_pairs=aws_response_list_parser(paginate, it, 'keyPairs'))
-    elif module.params['list_stream_keys']:
-        module.exit_json(stream_keys=aws_response_list_parser(paginate, it, 'streamKeys'))
-    elif module.params['list_streams']:
-        module.exit_json(streams=aws_response_list_parser(paginate, it, 'streams'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'ivs', _ivs_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -119,74 +120,31 @@ scram_secrets:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kafka(client, module):
-    try:
-        if module.params['list_cluster_operations']:
-            if client.can_paginate('list_cluster_operations'):
-                paginator = client.get_paginator('list_cluster_operations')
-                return paginator.paginate(
-                    ClusterArn=module.params['arn']
-                ), True
-            else:
-                return client.list_cluster_operations(
-                    ClusterArn=module.params['arn']
-                ), False
-        elif module.params['list_clusters']:
-            if client.can_paginate('list_clusters'):
-                paginator = client.get_paginator('list_clusters')
-                return paginator.paginate(), True
-            else:
-                return client.list_clusters(), False
-        elif module.params['list_configuration_revisions']:
-            if client.can_paginate('list_configuration_revisions'):
-                paginator = client.get_paginator('list_configuration_revisions')
-                return paginator.paginate(
-                    Arn=module.params['arn']
-                ), True
-            else:
-                return client.list_configuration_revisions(
-                    Arn=module.params['arn']
-                ), False
-        elif module.params['list_configurations']:
-            if client.can_paginate('list_configurations'):
-                paginator = client.get_paginator('list_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_configurations(), False
-        elif module.params['list_nodes']:
-            if client.can_paginate('list_nodes'):
-                paginator = client.get_paginator('list_nodes')
-                return paginator.paginate(
-                    ClusterArn=module.params['arn']
-                ), True
-            else:
-                return client.list_nodes(
-                    ClusterArn=module.params['arn']
-                ), False
-        elif module.params['list_scram_secrets']:
-            if client.can_paginate('list_scram_secrets'):
-                paginator = client.get_paginator('list_scram_secrets')
-                return paginator.paginate(
-                    ClusterArn=module.params['arn']
-                ), True
-            else:
-                return client.list_scram_secrets(
-                    ClusterArn=module.params['arn']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon kafka details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KAFKA_OPERATIONS = dict(
+    list_cluster_operations=aws_list_operation('list_cluster_operations', 'cluster_operations', 'ClusterOperationInfoList', ClusterArn='arn'),
+    list_clusters=aws_list_operation('list_clusters', 'clusters', 'ClusterInfoList'),
+    list_configuration_revisions=aws_list_operation('list_configuration_revisions', 'configuration_revisions', 'Revisions', Arn='arn'),
+    list_configurations=aws_list_operation('list_configurations', 'configurations', 'Configurations'),
+    list_nodes=aws_list_operation('list_nodes', 'nodes', 'NodeInfoList', ClusterArn='arn'),
+    list_scram_secrets=aws_list_operation('list_scram_secrets', 'scram_secrets', 'SecretArnList', ClusterArn='arn'),
+)
+
+
+def _kafka_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KAFKA_OPERATIONS,
+        error_msg='Failed to fetch Amazon kafka details',
+    )
 
 
 def main():
@@ -199,8 +157,9 @@ def main():
         list_nodes=dict(required=False, type=bool),
         list_scram_secrets=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_cluster_operations', True, ['arn']),
@@ -220,23 +179,7 @@ def main():
         ],
     )
 
-    client = module.client('kafka', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kafka(client, module)
-
-    if module.params['list_cluster_operations']:
-        module.exit_json(cluster_operations=aws_response_list_parser(paginate, it, 'ClusterOperationInfoList'))
-    elif module.params['list_clusters']:
-        module.exit_json(clusters=aws_response_list_parser(paginate, it, 'ClusterInfoList'))
-    elif module.params['list_configuration_revisions']:
-        module.exit_json(configuration_revisions=aws_response_list_parser(paginate, it, 'Revisions'))
-    elif module.params['list_configurations']:
-        module.exit_json(configurations=aws_response_list_parser(paginate, it, 'Configurations'))
-    elif module.params['list_nodes']:
-        module.exit_json(nodes=aws_response_list_parser(paginate, it, 'NodeInfoList'))
-    elif module.params['list_scram_secrets']:
-        module.exit_json(scram_secrets=aws_response_list_parser(paginate, it, 'SecretArnList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kafka', _kafka_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
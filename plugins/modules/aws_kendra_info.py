@@ -63,6 +63,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -119,72 +120,37 @@ thesauri:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kendra(client, module):
-    try:
-        if module.params['list_data_source_sync_jobs']:
-            if client.can_paginate('list_data_source_sync_jobs'):
-                paginator = client.get_paginator('list_data_source_sync_jobs')
-                return paginator.paginate(
-                    Id=module.params['id'],
-                    IndexId=module.params['index_id'],
-                    StatusFilter=module.params['status_filter']
-                ), True
-            else:
-                return client.list_data_source_sync_jobs(
-                    Id=module.params['id'],
-                    IndexId=module.params['index_id'],
-                    StatusFilter=module.params['status_filter']
-                ), False
-        elif module.params['list_data_sources']:
-            if client.can_paginate('list_data_sources'):
-                paginator = client.get_paginator('list_data_sources')
-                return paginator.paginate(
-                    IndexId=module.params['index_id'],
-                ), True
-            else:
-                return client.list_data_sources(
-                    IndexId=module.params['index_id'],
-                ), False
-        elif module.params['list_faqs']:
-            if client.can_paginate('list_faqs'):
-                paginator = client.get_paginator('list_faqs')
-                return paginator.paginate(
-                    IndexId=module.params['index_id'],
-                ), True
-            else:
-                return client.list_faqs(
-                    IndexId=module.params['index_id'],
-                ), False
-        elif module.params['list_indices']:
-            if client.can_paginate('list_indices'):
-                paginator = client.get_paginator('list_indices')
-                return paginator.paginate(), True
-            else:
-                return client.list_indices(), False
-        elif module.params['list_thesauri']:
-            if client.can_paginate('list_thesauri'):
-                paginator = client.get_paginator('list_thesauri')
-                return paginator.paginate(
-                    IndexId=module.params['index_id'],
-                ), True
-            else:
-                return client.list_thesauri(
-                    IndexId=module.params['index_id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon kendra details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KENDRA_OPERATIONS = dict(
+    list_data_source_sync_jobs=aws_list_operation(
+        'list_data_source_sync_jobs',
+        'data_source_sync_jobs',
+        'History',
+        Id='id',
+        IndexId='index_id',
+        StatusFilter='status_filter',
+    ),
+    list_data_sources=aws_list_operation('list_data_sources', 'data_sources', 'SummaryItems', IndexId='index_id'),
+    list_faqs=aws_list_operation('list_faqs', 'faqs', 'FaqSummaryItems', IndexId='index_id'),
+    list_indices=aws_list_operation('list_indices', 'indices', 'IndexConfigurationSummaryItems'),
+    list_thesauri=aws_list_operation('list_thesauri', 'thesauri', 'ThesaurusSummaryItems', IndexId='index_id'),
+)
+
+
+def _kendra_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KENDRA_OPERATIONS,
+        error_msg='Failed to fetch Amazon kendra details',
+    )
 
 
 def main():
@@ -202,8 +168,9 @@ def main():
         list_indices=dict(required=False, type=bool),
         list_thesauri=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_data_source_sync_jobs', True, ['id', 'index_id']),
@@ -222,21 +189,7 @@ def main():
         ],
     )
 
-    client = module.client('kendra', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kendra(client, module)
-
-    if module.params['list_data_source_sync_jobs']:
-        module.exit_json(data_source_sync_jobs=aws_response_list_parser(paginate, it, 'History'))
-    elif module.params['list_data_sources']:
-        module.exit_json(data_sources=aws_response_list_parser(paginate, it, 'SummaryItems'))
-    elif module.params['list_faqs']:
-        module.exit_json(faqs=aws_response_list_parser(paginate, it, 'FaqSummaryItems'))
-    elif module.params['list_indices']:
-        module.exit_json(indices=aws_response_list_parser(paginate, it, 'IndexindicesummaryItems'))
-    elif module.params['list_thesauri']:
-        module.exit_json(thesauri=aws_response_list_parser(paginate, it, 'ThesaurusSummaryItems'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kendra', _kendra_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -42,11 +42,50 @@ options:
       - do you want to get list of streams?
     required: false
     type: bool
+  sample_shards:
+    description:
+      - do you want to read records of last I(sample_window) seconds from every shard of given stream I(name)?
+      - shards are read concurrently by I(max_workers) threads, shards which were split or merged in window are read before their children.
+      - every shard is read until it is caught up, I(max_records_per_shard) or I(time_budget), whichever comes first.
+      - I(page_size) is maximum records per get_records call, calls of one shard are spaced 200ms apart to stay below kinesis limit.
+    required: false
+    type: bool
+  sample_window:
+    description:
+      - seconds before now where reading of every shard starts.
+    required: false
+    type: int
+    default: 60
+  max_records_per_shard:
+    description:
+      - maximum number of records read from every shard.
+    required: false
+    type: int
+    default: 1000
+  time_budget:
+    description:
+      - seconds after which I(sample_shards) stops calling aws and reports records read so far.
+    required: false
+    type: float
+    default: 30
+  top_partition_keys:
+    description:
+      - number of partition keys with most bytes reported for every shard.
+    required: false
+    type: int
+    default: 5
+  include_records:
+    description:
+      - return read records with base64 encoded data, not only statistics.
+    required: false
+    type: bool
+    default: false
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -66,6 +105,19 @@ EXAMPLES = """
 - name: "get list of streams"
   aws_kinesis_info:
     list_streams: true
+
+- name: "find hot shards and partition keys of last 5 minutes"
+  aws_kinesis_info:
+    sample_shards: true
+    name: 'stream-name'
+    sample_window: 300
+    max_records_per_shard: 10000
+    time_budget: 60
+  register: __samples
+
+- name: "hottest shard"
+  debug:
+    msg: "{{ __samples.shard_samples[__samples.hot_shards[0]] }}"
 """
 
 RETURN = """
@@ -81,50 +133,162 @@ streams:
   description: list of streams.
   returned: when `list_streams` is defined and success.
   type: list
+shard_samples:
+  description:
+    - statistics of records read from every shard.
+    - rates are over time from window start until shard was caught up, or until last read record if reading stopped before.
+  returned: when `sample_shards` is defined and success.
+  type: dict
+  sample: {
+    'shardId-000000000000': {
+      'records': 1200,
+      'bytes': 614400,
+      'records_per_sec': 20.0,
+      'bytes_per_sec': 10240.0,
+      'millis_behind_latest': 0,
+      'hot_partition_keys': [{'partition_key': 'user-1', 'records': 300, 'bytes': 153600}]
+    }
+  }
+hot_shards:
+  description: ids of read shards ordered by bytes per second, hottest first.
+  returned: when `sample_shards` is defined and success.
+  type: list
+stopped:
+  description: C(time_budget) if reading stopped before all shards were caught up or full, else null.
+  returned: when `sample_shards` is defined and success.
+  type: str
+records:
+  description: read records in shard order with C(shard_id) and base64 encoded C(data).
+  returned: when `sample_shards` and `include_records` are defined and success.
+  type: list
 """
 
+import base64
+import time
+from datetime import datetime, timedelta, timezone
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_stream_reader import aws_stream_read
+
+
+_KINESIS_OPERATIONS = dict(
+    list_shards=aws_list_operation('list_shards', 'shards', 'Shards', StreamName='name'),
+    list_stream_consumers=aws_list_operation('list_stream_consumers', 'stream_consumers', 'Consumers', StreamARN='arn'),
+    list_streams=aws_list_operation('list_streams', 'streams', 'StreamNames'),
+)
+
+
+def _stream_shards(client, name: str, since: datetime) -> list:
+    # list_shards refuses StreamName together with NextToken, so no paginator.
+    shards = []
+    params = dict(StreamName=name, ShardFilter=dict(Type='AT_TIMESTAMP', Timestamp=since))
+    while True:
+        response = client.list_shards(**params, **aws_info_retry_params(client))
+        shards += response.get('Shards', [])
+        if not response.get('NextToken'):
+            return shards
+        params = dict(NextToken=response['NextToken'])
+
+
+def _shard_sample(records: list, millis_behind_latest: int, since: float, top: int) -> dict:
+    keys = {}
+    for record in records:
+        key = keys.setdefault(record['partition_key'], dict(partition_key=record['partition_key'], records=0, bytes=0))
+        key['records'] += 1
+        key['bytes'] += record['size']
+    # caught up shard covered whole window, otherwise only until last read record.
+    end = time.time() if millis_behind_latest == 0 or not records else records[-1]['approximate_arrival_timestamp'].timestamp()
+    seconds = max(1.0, end - since)
+    total_bytes = sum(key['bytes'] for key in keys.values())
+    return dict(
+        records=len(records),
+        bytes=total_bytes,
+        records_per_sec=round(len(records) / seconds, 3),
+        bytes_per_sec=round(total_bytes / seconds, 3),
+        millis_behind_latest=millis_behind_latest,
+        hot_partition_keys=sorted(keys.values(), key=lambda k: (-k['bytes'], -k['records'], k['partition_key']))[:top],
+    )
+
+
+def _sample_shards_result(client, module) -> dict:
+    include_records = module.params['include_records']
 
+    def _record(record):
+        item = dict(
+            sequence_number=record['SequenceNumber'],
+            partition_key=record['PartitionKey'],
+            approximate_arrival_timestamp=record['ApproximateArrivalTimestamp'],
+            size=len(record['Data']),
+        )
+        if include_records:
+            item['data'] = base64.b64encode(record['Data']).decode('ascii')
+        return item
 
-def _kinesis(client, module):
+    since = datetime.now(timezone.utc) - timedelta(seconds=module.params['sample_window'])
     try:
-        if module.params['list_shards']:
-            if client.can_paginate('list_shards'):
-                paginator = client.get_paginator('list_shards')
-                return paginator.paginate(
-                    StreamName=module.params['name'],
-                ), True
-            else:
-                return client.list_shards(
-                    StreamName=module.params['name'],
-                ), False
-        elif module.params['list_stream_consumers']:
-            if client.can_paginate('list_stream_consumers'):
-                paginator = client.get_paginator('list_stream_consumers')
-                return paginator.paginate(
-                    StreamARN=module.params['arn'],
-                ), True
-            else:
-                return client.list_stream_consumers(
-                    StreamARN=module.params['arn'],
-                ), False
-        elif module.params['list_streams']:
-            if client.can_paginate('list_streams'):
-                paginator = client.get_paginator('list_streams')
-                return paginator.paginate(), True
-            else:
-                return client.list_streams(), False
-        else:
-            return None, False
+        read = aws_stream_read(
+            client,
+            dict(StreamName=module.params['name']),
+            _stream_shards(client, module.params['name'], since),
+            {},
+            lambda record: record['SequenceNumber'],
+            _record,
+            iterator_type='AT_TIMESTAMP',
+            iterator_params=dict(Timestamp=since),
+            max_records=None,
+            max_shard_records=module.params['max_records_per_shard'],
+            time_budget=module.params['time_budget'],
+            limit=module.params['page_size'],
+            min_interval=0.2,
+            max_workers=module.params['max_workers'],
+        )
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Kinesis details')
+        module.fail_json_aws(e, msg='Failed to read Amazon Kinesis records')
+
+    samples = dict(
+        (
+            shard_id,
+            _shard_sample(
+                read['shard_records'][shard_id],
+                shard.get('millis_behind_latest'),
+                since.timestamp(),
+                module.params['top_partition_keys'],
+            ),
+        )
+        for shard_id, shard in read['shards'].items()
+    )
+    _return = dict(
+        shard_samples=samples,
+        hot_shards=sorted(samples, key=lambda shard_id: (-samples[shard_id]['bytes_per_sec'], shard_id)),
+        stopped=read['stopped'],
+    )
+    if include_records:
+        _return['records'] = [
+            dict(record, shard_id=shard_id) for shard_id, records in read['shard_records'].items() for record in records
+        ]
+    return _return
+
+
+def _kinesis_result(client, module) -> dict:
+    if module.params['sample_shards']:
+        return _sample_shards_result(client, module)
+    return aws_operations_result(
+        client,
+        module,
+        _KINESIS_OPERATIONS,
+        error_msg='Failed to fetch Amazon Kinesis details',
+    )
 
 
 def main():
@@ -134,34 +298,33 @@ def main():
         list_shards=dict(required=False, type=bool),
         list_stream_consumers=dict(required=False, type=bool),
         list_streams=dict(required=False, type=bool),
+        sample_shards=dict(required=False, type=bool),
+        sample_window=dict(required=False, type=int, default=60),
+        max_records_per_shard=dict(required=False, type=int, default=1000),
+        time_budget=dict(required=False, type=float, default=30),
+        top_partition_keys=dict(required=False, type=int, default=5),
+        include_records=dict(required=False, type=bool, default=False),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_shards', True, ['name']),
             ('list_stream_consumers', True, ['arn']),
+            ('sample_shards', True, ['name']),
         ),
         mutually_exclusive=[
             (
                 'list_shards',
                 'list_stream_consumers',
                 'list_streams',
+                'sample_shards',
             )
         ],
     )
 
-    client = module.client('kinesis', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kinesis(client, module)
-
-    if module.params['list_shards']:
-        module.exit_json(shards=aws_response_list_parser(paginate, it, 'Shards'))
-    elif module.params['list_stream_consumers']:
-        module.exit_json(stream_consumers=aws_response_list_parser(paginate, it, 'Consumers'))
-    elif module.params['list_streams']:
-        module.exit_json(streams=aws_response_list_parser(paginate, it, 'StreamNames'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kinesis', _kinesis_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -31,6 +31,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -50,32 +51,26 @@ fragments:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kinesis_video_archived_media(client, module):
-    try:
-        if module.params['list_fragments']:
-            if client.can_paginate('list_fragments'):
-                paginator = client.get_paginator('list_fragments')
-                return paginator.paginate(
-                    StreamName=module.params['name'],
-                ), True
-            else:
-                return client.list_fragments(
-                    StreamName=module.params['name'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Kinesis Video Archived Media details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KINESIS_VIDEO_ARCHIVED_MEDIA_OPERATIONS = dict(
+    list_fragments=aws_list_operation('list_fragments', 'fragments', 'Fragments', StreamName='name'),
+)
+
+
+def _kinesis_video_archived_media_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KINESIS_VIDEO_ARCHIVED_MEDIA_OPERATIONS,
+        error_msg='Failed to fetch Amazon Kinesis Video Archived Media details',
+    )
 
 
 def main():
@@ -83,8 +78,9 @@ def main():
         name=dict(required=False, aliases=['stream_name']),
         list_fragments=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_fragments', True, ['name']),
@@ -92,13 +88,14 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('kinesis-video-archived-media', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kinesis_video_archived_media(client, module)
-
-    if module.params['list_fragments']:
-        module.exit_json(fragments=aws_response_list_parser(paginate, it, 'Fragments'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(
+        **aws_info_run(
+            module,
+            'kinesis-video-archived-media',
+            _kinesis_video_archived_media_result,
+            retry_decorator=aws_info_retry(),
+        )
+    )
 
 
 if __name__ == '__main__':
@@ -37,6 +37,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -56,32 +57,26 @@ ice_server_config:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kinesis_video_signaling(client, module):
-    try:
-        if module.params['get_ice_server_config']:
-            if client.can_paginate('get_ice_server_config'):
-                paginator = client.get_paginator('get_ice_server_config')
-                return paginator.paginate(
-                    ChannelARN=module.params['arn'],
-                ), True
-            else:
-                return client.get_ice_server_config(
-                    ChannelARN=module.params['arn'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Kinesis Video Signaling details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KINESIS_VIDEO_SIGNALING_OPERATIONS = dict(
+    get_ice_server_config=aws_list_operation('get_ice_server_config', 'ice_server_config', 'IceServerList', ChannelARN='arn'),
+)
+
+
+def _kinesis_video_signaling_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KINESIS_VIDEO_SIGNALING_OPERATIONS,
+        error_msg='Failed to fetch Amazon Kinesis Video Signaling details',
+    )
 
 
 def main():
@@ -89,8 +84,9 @@ def main():
         arn=dict(required=False, aliases=['channel_arn']),
         get_ice_server_config=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_ice_server_config', True, ['arn']),
@@ -98,13 +94,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('kinesis-video-signaling', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kinesis_video_signaling(client, module)
-
-    if module.params['get_ice_server_config']:
-        module.exit_json(ice_server_config=aws_response_list_parser(paginate, it, 'IceServerList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kinesis-video-signaling', _kinesis_video_signaling_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
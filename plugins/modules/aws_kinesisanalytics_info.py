@@ -25,6 +25,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -43,48 +44,41 @@ applications:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_KINESISANALYTICS_OPERATIONS = dict(
+    list_applications=aws_list_operation('list_applications', 'applications', 'ApplicationSummaries'),
+)
 
-def _kinesisanalytics(client, module):
-    try:
-        if module.params['list_applications']:
-            if client.can_paginate('list_applications'):
-                paginator = client.get_paginator('list_applications')
-                return paginator.paginate(), True
-            else:
-                return client.list_applications(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Kinesis Analytics details')
+
+def _kinesisanalytics_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KINESISANALYTICS_OPERATIONS,
+        error_msg='Failed to fetch Amazon Kinesis Analytics details',
+    )
 
 
 def main():
     argument_spec = dict(
         list_applications=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[],
     )
 
-    client = module.client('kinesisanalytics', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kinesisanalytics(client, module)
-
-    if module.params['list_applications']:
-        module.exit_json(applications=aws_response_list_parser(paginate, it, 'ApplicationSummaries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kinesisanalytics', _kinesisanalytics_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
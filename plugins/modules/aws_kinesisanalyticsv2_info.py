@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -62,38 +63,27 @@ application_snapshots:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kinesisanalyticsv2(client, module):
-    try:
-        if module.params['list_applications']:
-            if client.can_paginate('list_applications'):
-                paginator = client.get_paginator('list_applications')
-                return paginator.paginate(), True
-            else:
-                return client.list_applications(), False
-        elif module.params['list_application_snapshots']:
-            if client.can_paginate('list_application_snapshots'):
-                paginator = client.get_paginator('list_application_snapshots')
-                return paginator.paginate(
-                    ApplicationName=module.params['name']
-                ), True
-            else:
-                return client.list_application_snapshots(
-                    ApplicationName=module.params['name']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Kinesis Analytics V2 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KINESISANALYTICSV2_OPERATIONS = dict(
+    list_applications=aws_list_operation('list_applications', 'applications', 'ApplicationSummaries'),
+    list_application_snapshots=aws_list_operation('list_application_snapshots', 'application_snapshots', 'SnapshotSummaries', ApplicationName='name'),
+)
+
+
+def _kinesisanalyticsv2_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KINESISANALYTICSV2_OPERATIONS,
+        error_msg='Failed to fetch Amazon Kinesis Analytics V2 details',
+    )
 
 
 def main():
@@ -102,8 +92,9 @@ def main():
         list_applications=dict(required=False, type=bool),
         list_application_snapshots=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_application_snapshots', True, ['name']),
@@ -116,15 +107,7 @@ def main():
         ],
     )
 
-    client = module.client('kinesisanalyticsv2', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kinesisanalyticsv2(client, module)
-
-    if module.params['list_applications']:
-        module.exit_json(applications=aws_response_list_parser(paginate, it, 'ApplicationSummaries'))
-    elif module.params['list_application_snapshots']:
-        module.exit_json(application_snapshots=aws_response_list_parser(paginate, it, 'SnapshotSummaries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kinesisanalyticsv2', _kinesisanalyticsv2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
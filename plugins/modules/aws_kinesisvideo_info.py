@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -56,34 +57,27 @@ signaling_channels:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kinesisvideo(client, module):
-    try:
-        if module.params['list_streams']:
-            if client.can_paginate('list_streams'):
-                paginator = client.get_paginator('list_streams')
-                return paginator.paginate(), True
-            else:
-                return client.list_streams(), False
-        elif module.params['list_signaling_channels']:
-            if client.can_paginate('list_signaling_channels'):
-                paginator = client.get_paginator('list_signaling_channels')
-                return paginator.paginate(), True
-            else:
-                return client.list_signaling_channels(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Kinesis Video Streams details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KINESISVIDEO_OPERATIONS = dict(
+    list_streams=aws_list_operation('list_streams', 'streams', 'StreamInfoList'),
+    list_signaling_channels=aws_list_operation('list_signaling_channels', 'signaling_channels', 'ChannelInfoList'),
+)
+
+
+def _kinesisvideo_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KINESISVIDEO_OPERATIONS,
+        error_msg='Failed to fetch Amazon Kinesis Video Streams details',
+    )
 
 
 def main():
@@ -91,8 +85,9 @@ def main():
         list_streams=dict(required=False, type=bool),
         list_signaling_channels=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -103,15 +98,7 @@ def main():
         ],
     )
 
-    client = module.client('kinesisvideo', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kinesisvideo(client, module)
-
-    if module.params['list_streams']:
-        module.exit_json(streams=aws_response_list_parser(paginate, it, 'StreamInfoList'))
-    elif module.params['list_signaling_channels']:
-        module.exit_json(signaling_channels=aws_response_list_parser(paginate, it, 'ChannelInfoList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kinesisvideo', _kinesisvideo_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
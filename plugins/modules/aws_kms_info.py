@@ -56,6 +56,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -66,6 +67,12 @@ EXAMPLES = """
   aws_kms_info:
     list_aliases: true
 
+- name: "get list of aliases, cached for 10 minutes"
+  aws_kms_info:
+    list_aliases: true
+    cache: true
+    cache_ttl: 600
+
 - name: "get list of grants"
   aws_kms_info:
     list_grants: true
@@ -105,64 +112,30 @@ keys:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _kms(client, module):
-    try:
-        if module.params['list_aliases']:
-            if client.can_paginate('list_aliases'):
-                paginator = client.get_paginator('list_aliases')
-                return paginator.paginate(), True
-            else:
-                return client.list_aliases(), False
-        elif module.params['list_grants']:
-            if client.can_paginate('list_grants'):
-                paginator = client.get_paginator('list_grants')
-                return paginator.paginate(
-                    KeyId=module.params['id'],
-                ), True
-            else:
-                return client.list_grants(
-                    KeyId=module.params['id'],
-                ), False
-        elif module.params['list_key_policies']:
-            if client.can_paginate('list_key_policies'):
-                paginator = client.get_paginator('list_key_policies')
-                return paginator.paginate(
-                    KeyId=module.params['id'],
-                ), True
-            else:
-                return client.list_key_policies(
-                    KeyId=module.params['id'],
-                ), False
-        elif module.params['list_keys']:
-            if client.can_paginate('list_keys'):
-                paginator = client.get_paginator('list_keys')
-                return paginator.paginate(), True
-            else:
-                return client.list_keys(), False
-        elif module.params['list_retirable_grants']:
-            if client.can_paginate('list_retirable_grants'):
-                paginator = client.get_paginator('list_retirable_grants')
-                return paginator.paginate(
-                    RetiringPrincipal=module.params['retiring_principal'],
-                ), True
-            else:
-                return client.list_retirable_grants(
-                    RetiringPrincipal=module.params['retiring_principal'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon kms details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_KMS_OPERATIONS = dict(
+    list_aliases=aws_list_operation('list_aliases', 'aliases', 'Aliases'),
+    list_grants=aws_list_operation('list_grants', 'grants', 'Grants', KeyId='id'),
+    list_key_policies=aws_list_operation('list_key_policies', 'key_policies', 'PolicyNames', KeyId='id'),
+    list_keys=aws_list_operation('list_keys', 'keys', 'Keys'),
+    list_retirable_grants=aws_list_operation('list_retirable_grants', 'grants', 'Grants', RetiringPrincipal='retiring_principal'),
+)
+
+
+def _kms_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _KMS_OPERATIONS,
+        error_msg='Failed to fetch Amazon kms details',
+    )
 
 
 def main():
@@ -175,8 +148,9 @@ def main():
         list_keys=dict(required=False, type=bool),
         list_retirable_grants=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_grants', True, ['id']),
@@ -194,19 +168,7 @@ def main():
         ],
     )
 
-    client = module.client('kms', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _kms(client, module)
-
-    if module.params['list_aliases']:
-        module.exit_json(aliases=aws_response_list_parser(paginate, it, 'Aliases'))
-    elif module.params['list_grants'] or module.params['list_retirable_grants']:
-        module.exit_json(grants=aws_response_list_parser(paginate, it, 'Grants'))
-    elif module.params['list_key_policies']:
-        module.exit_json(key_policies=aws_response_list_parser(paginate, it, 'PolicyNames'))
-    elif module.params['list_keys']:
-        module.exit_json(keys=aws_response_list_parser(paginate, it, 'Keys'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'kms', _kms_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
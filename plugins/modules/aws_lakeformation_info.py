@@ -53,6 +53,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -90,46 +91,35 @@ data_lake_settings:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _lakeformation(client, module):
-    try:
-        if module.params['list_resources']:
-            if client.can_paginate('list_resources'):
-                paginator = client.get_paginator('list_resources')
-                return paginator.paginate(), True
-            else:
-                return client.list_resources(), False
-        elif module.params['list_permissions']:
-            if client.can_paginate('list_permissions'):
-                paginator = client.get_paginator('list_permissions')
-                return paginator.paginate(
-                    ResourceType=module.params['resource_type'],
-                    Principal={
-                        'DataLakePrincipalIdentifier': module.params['data_lake_principal_identifier']
-                    }
-                ), True
-            else:
-                return client.list_permissions(
-                    KeyId=module.params['id'],
-                ), False
-        elif module.params['get_data_lake_settings']:
-            return client.get_data_lake_settings(
-                CatalogId=module.params['id'],
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon lakeformation details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_LAKEFORMATION_OPERATIONS = dict(
+    list_resources=aws_list_operation('list_resources', 'resources', 'ResourceInfoList'),
+    list_permissions=aws_list_operation(
+        'list_permissions',
+        'permissions',
+        'PrincipalResourcePermissions',
+        ResourceType='resource_type',
+        Principal={'DataLakePrincipalIdentifier': 'data_lake_principal_identifier'},
+    ),
+    get_data_lake_settings=aws_dict_operation('get_data_lake_settings', 'data_lake_settings', 'DataLakeSettings', CatalogId='id'),
+)
+
+
+def _lakeformation_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _LAKEFORMATION_OPERATIONS,
+        error_msg='Failed to fetch Amazon lakeformation details',
+    )
 
 
 def main():
@@ -141,8 +131,9 @@ def main():
         list_permissions=dict(required=False, type=bool),
         get_data_lake_settings=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_permissions', True, ['data_lake_principal_identifier']),
@@ -157,17 +148,7 @@ def main():
         ],
     )
 
-    client = module.client('lakeformation', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _lakeformation(client, module)
-
-    if module.params['list_resources']:
-        module.exit_json(resources=aws_response_list_parser(paginate, it, 'ResourceInfoList'))
-    elif module.params['list_permissions']:
-        module.exit_json(permissions=aws_response_list_parser(paginate, it, 'PrincipalResourcePermissions'))
-    elif module.params['get_data_lake_settings']:
-        module.exit_json(data_lake_settings=camel_dict_to_snake_dict(it['DataLakeSettings']))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'lakeformation', _lakeformation_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -61,28 +62,26 @@ session:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
+_LEX_RUNTIME_OPERATIONS = dict(
+    get_session=aws_dict_operation('get_session', 'session', botName='bot_name', botAlias='bot_alias', userId='user_id'),
+)
 
-def _lex_runtime(client, module):
-    try:
-        if module.params['get_session']:
-            return client.get_session(
-                botName=module.params['bot_name'],
-                botAlias=module.params['bot_alias'],
-                userId=module.params['user_id'],
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon lex_runtime details')
+
+def _lex_runtime_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _LEX_RUNTIME_OPERATIONS,
+        error_msg='Failed to fetch Amazon lex_runtime details',
+    )
 
 
 def main():
@@ -92,8 +91,9 @@ def main():
         user_id=dict(required=False),
         get_session=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_session', True, ['bot_name', 'bot_alias', 'user_id']),
@@ -101,13 +101,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('lex-runtime', retry_decorator=AWSRetry.exponential_backoff())
-    it, _ = _lex_runtime(client, module)
-
-    if module.params['get_session']:
-        module.exit_json(session=camel_dict_to_snake_dict(it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'lex-runtime', _lex_runtime_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -72,6 +72,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -166,98 +167,50 @@ usage_for_license_configuration:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_LICENSE_MANAGER_OPERATIONS = dict(
+    list_associations_for_license_configuration=aws_list_operation(
+        'list_associations_for_license_configuration',
+        'associations_for_license_configuration',
+        'LicenseConfigurationAssociations',
+        LicenseConfigurationArn='arn',
+    ),
+    list_distributed_distributed_grants=aws_list_operation('list_distributed_grants', 'distributed_distributed_grants', 'Grants'),
+    list_failures_for_license_configuration_operations=aws_list_operation(
+        'list_failures_for_license_configuration_operations',
+        'failures_for_license_configuration_operations',
+        'LicenseOperationFailureList',
+        LicenseConfigurationArn='arn',
+    ),
+    list_license_configurations=aws_list_operation('list_license_configurations', 'license_configurations', 'LicenseConfigurations'),
+    list_license_versions=aws_list_operation('list_license_versions', 'license_versions', 'Licenses', LicenseArn='arn'),
+    list_licenses=aws_list_operation('list_licenses', 'licenses', 'Licenses'),
+    list_received_distributed_grants=aws_list_operation('list_received_grants', 'received_distributed_grants', 'Grants'),
+    list_received_licenses=aws_list_operation('list_received_licenses', 'received_licenses', 'Licenses'),
+    list_tokens=aws_list_operation('list_tokens', 'tokens', 'Tokens'),
+    list_usage_for_license_configuration=aws_list_operation(
+        'list_usage_for_license_configuration',
+        'usage_for_license_configuration',
+        'LicenseConfigurationUsageList',
+        LicenseConfigurationArn='arn',
+    ),
+)
 
-def _license_manager(client, module):
-    try:
-        if module.params['list_associations_for_license_configuration']:
-            if client.can_paginate('list_associations_for_license_configuration'):
-                paginator = client.get_paginator('list_associations_for_license_configuration')
-                return paginator.paginate(
-                    LicenseConfigurationArn=module.params['arn']
-                ), True
-            else:
-                return client.list_associations_for_license_configuration(
-                    LicenseConfigurationArn=module.params['arn']
-                ), False
-        elif module.params['list_distributed_distributed_grants']:
-            if client.can_paginate('list_distributed_distributed_grants'):
-                paginator = client.get_paginator('list_distributed_distributed_grants')
-                return paginator.paginate(), True
-            else:
-                return client.list_distributed_distributed_grants(), False
-        elif module.params['list_failures_for_license_configuration_operations']:
-            if client.can_paginate('list_failures_for_license_configuration_operations'):
-                paginator = client.get_paginator('list_failures_for_license_configuration_operations')
-                return paginator.paginate(
-                    LicenseConfigurationArn=module.params['arn']
-                ), True
-            else:
-                return client.list_failures_for_license_configuration_operations(
-                    LicenseConfigurationArn=module.params['arn']
-                ), False
-        elif module.params['list_license_configurations']:
-            if client.can_paginate('list_license_configurations'):
-                paginator = client.get_paginator('list_license_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_license_configurations(), False
-        elif module.params['list_license_versions']:
-            if client.can_paginate('list_license_versions'):
-                paginator = client.get_paginator('list_license_versions')
-                return paginator.paginate(
-                    LicenseArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_license_versions(
-                    LicenseArn=module.params['arn'],
-                ), False
-        elif module.params['list_licenses']:
-            if client.can_paginate('list_licenses'):
-                paginator = client.get_paginator('list_licenses')
-                return paginator.paginate(), True
-            else:
-                return client.list_licenses(), False
-        elif module.params['list_received_distributed_grants']:
-            if client.can_paginate('list_received_distributed_grants'):
-                paginator = client.get_paginator('list_received_distributed_grants')
-                return paginator.paginate(), True
-            else:
-                return client.list_received_distributed_grants(), False
-        elif module.params['list_received_licenses']:
-            if client.can_paginate('list_received_licenses'):
-                paginator = client.get_paginator('list_received_licenses')
-                return paginator.paginate(), True
-            else:
-                return client.list_received_licenses(), False
-        elif module.params['list_tokens']:
-            if client.can_paginate('list_tokens'):
-                paginator = client.get_paginator('list_tokens')
-                return paginator.paginate(), True
-            else:
-                return client.list_tokens(), False
-        elif module.params['list_usage_for_license_configuration']:
-            if client.can_paginate('list_usage_for_license_configuration'):
-                paginator = client.get_paginator('list_usage_for_license_configuration')
-                return paginator.paginate(
-                    LicenseConfigurationArn=module.params['arn'],
-                ), True
-            else:
-                return client.list_usage_for_license_configuration(
-                    LicenseConfigurationArn=module.params['arn'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon license manager details')
+
+def _license_manager_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _LICENSE_MANAGER_OPERATIONS,
+        error_msg='Failed to fetch Amazon license manager details',
+    )
 
 
 def main():
@@ -274,8 +227,9 @@ def main():
         list_tokens=dict(required=False, type=bool),
         list_usage_for_license_configuration=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_associations_for_license_configuration', True, ['arn']),
@@ -299,31 +253,7 @@ def main():
         ],
     )
 
-    client = module.client('license-manager', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _license_manager(client, module)
-
-    if module.params['list_associations_for_license_configuration']:
-        module.exit_json(associations_for_license_configuration=aws_response_list_parser(paginate, it, 'LicenseConfigurationAssociations'))
-    elif module.params['list_distributed_distributed_grants']:
-        module.exit_json(distributed_distributed_grants=aws_response_list_parser(paginate, it, 'distributed_grants'))
-    elif module.params['list_failures_for_license_configuration_operations']:
-        module.exit_json(failures_for_license_configuration_operations=aws_response_list_parser(paginate, it, 'LicenseOperationFailureList'))
-    elif module.params['list_license_configurations']:
-        module.exit_json(license_configurations=aws_response_list_parser(paginate, it, 'LicenseConfigurations'))
-    elif module.params['list_license_versions']:
-        module.exit_json(license_versions=aws_response_list_parser(paginate, it, 'Licenses'))
-    elif module.params['list_licenses']:
-        module.exit_json(licenses=aws_response_list_parser(paginate, it, 'Licenses'))
-    elif module.params['list_received_distributed_grants']:
-        module.exit_json(received_distributed_grants=aws_response_list_parser(paginate, it, 'distributed_grants'))
-    elif module.params['list_received_licenses']:
-        module.exit_json(received_licenses=aws_response_list_parser(paginate, it, 'Licenses'))
-    elif module.params['list_tokens']:
-        module.exit_json(tokens=aws_response_list_parser(paginate, it, 'Tokens'))
-    elif module.params['list_usage_for_license_configuration']:
-        module.exit_json(usage_for_license_configuration=aws_response_list_parser(paginate, it, 'LicenseConfigurationUsageList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'license-manager', _license_manager_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
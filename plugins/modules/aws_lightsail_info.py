@@ -72,6 +72,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -165,94 +166,40 @@ container_service_deployments:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _lightsail(client, module):
-    try:
-        if module.params['get_active_names']:
-            if client.can_paginate('get_active_names'):
-                paginator = client.get_paginator('get_active_names')
-                return paginator.paginate(), True
-            else:
-                return client.get_active_names(), False
-        elif module.params['get_alarms']:
-            if client.can_paginate('get_alarms'):
-                paginator = client.get_paginator('get_alarms')
-                return paginator.paginate(), True
-            else:
-                return client.get_alarms(), False
-        elif module.params['get_auto_snapshots']:
-            if client.can_paginate('get_auto_snapshots'):
-                paginator = client.get_paginator('get_auto_snapshots')
-                return paginator.paginate(
-                    resourceName=module.params['name']
-                ), True
-            else:
-                return client.get_auto_snapshots(
-                    resourceName=module.params['name']
-                ), False
-        elif module.params['get_blueprints']:
-            if client.can_paginate('get_blueprints'):
-                paginator = client.get_paginator('get_blueprints')
-                return paginator.paginate(), True
-            else:
-                return client.get_blueprints(), False
-        elif module.params['get_bundles']:
-            if client.can_paginate('get_bundles'):
-                paginator = client.get_paginator('get_bundles')
-                return paginator.paginate(), True
-            else:
-                return client.get_bundles(), False
-        elif module.params['get_certificates']:
-            if client.can_paginate('get_certificates'):
-                paginator = client.get_paginator('get_certificates')
-                return paginator.paginate(), True
-            else:
-                return client.get_certificates(), False
-        elif module.params['get_cloud_formation_stack_records']:
-            if client.can_paginate('get_cloud_formation_stack_records'):
-                paginator = client.get_paginator('get_cloud_formation_stack_records')
-                return paginator.paginate(), True
-            else:
-                return client.get_cloud_formation_stack_records(), False
-        elif module.params['get_contact_methods']:
-            if client.can_paginate('get_contact_methods'):
-                paginator = client.get_paginator('get_contact_methods')
-                return paginator.paginate(), True
-            else:
-                return client.get_contact_methods(), False
-        elif module.params['get_container_images']:
-            if client.can_paginate('get_container_images'):
-                paginator = client.get_paginator('get_container_images')
-                return paginator.paginate(
-                    serviceName=module.params['name']
-                ), True
-            else:
-                return client.get_container_images(
-                    serviceName=module.params['name']
-                ), False
-        elif module.params['get_container_service_deployments']:
-            if client.can_paginate('get_container_service_deployments'):
-                paginator = client.get_paginator('get_container_service_deployments')
-                return paginator.paginate(
-                    serviceName=module.params['name'],
-                ), True
-            else:
-                return client.get_container_service_deployments(
-                    serviceName=module.params['name'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Lightsail details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_LIGHTSAIL_OPERATIONS = dict(
+    get_active_names=aws_list_operation('get_active_names', 'active_names', 'activeNames'),
+    get_alarms=aws_list_operation('get_alarms', 'alarms', 'alarms'),
+    get_auto_snapshots=aws_list_operation('get_auto_snapshots', 'auto_snapshots', 'autoSnapshots', resourceName='name'),
+    get_blueprints=aws_list_operation('get_blueprints', 'blueprints', 'blueprints'),
+    get_bundles=aws_list_operation('get_bundles', 'bundles', 'bundles'),
+    get_certificates=aws_list_operation('get_certificates', 'certificates', 'certificates'),
+    get_cloud_formation_stack_records=aws_list_operation('get_cloud_formation_stack_records', 'cloud_formation_stack_records', 'cloudFormationStackRecords'),
+    get_contact_methods=aws_list_operation('get_contact_methods', 'contact_methods', 'contactMethods'),
+    get_container_images=aws_list_operation('get_container_images', 'container_images', 'containerImages', serviceName='name'),
+    get_container_service_deployments=aws_list_operation(
+        'get_container_service_deployments',
+        'container_service_deployments',
+        'deployments',
+        serviceName='name',
+    ),
+)
+
+
+def _lightsail_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _LIGHTSAIL_OPERATIONS,
+        error_msg='Failed to fetch Amazon Lightsail details',
+    )
 
 
 def main():
@@ -269,8 +216,9 @@ def main():
         get_container_images=dict(required=False, type=bool),
         get_container_service_deployments=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_auto_snapshots', True, ['name']),
@@ -293,31 +241,7 @@ def main():
         ],
     )
 
-    client = module.client('lightsail', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _lightsail(client, module)
-
-    if module.params['get_active_names']:
-        module.exit_json(active_names=aws_response_list_parser(paginate, it, 'activeNames'))
-    elif module.params['get_alarms']:
-        module.exit_json(alarms=aws_response_list_parser(paginate, it, 'alarms'))
-    elif module.params['get_auto_snapshots']:
-        module.exit_json(auto_snapshots=aws_response_list_parser(paginate, it, 'autoSnapshots'))
-    elif module.params['get_blueprints']:
-        module.exit_json(blueprints=aws_response_list_parser(paginate, it, 'blueprints'))
-    elif module.params['get_bundles']:
-        module.exit_json(bundles=aws_response_list_parser(paginate, it, 'bundles'))
-    elif module.params['get_certificates']:
-        module.exit_json(certificates=aws_response_list_parser(paginate, it, 'certificates'))
-    elif module.params['get_cloud_formation_stack_records']:
-        module.exit_json(cloud_formation_stack_records=aws_response_list_parser(paginate, it, 'cloudFormationStackRecords'))
-    elif module.params['get_contact_methods']:
-        module.exit_json(contact_methods=aws_response_list_parser(paginate, it, 'contactMethods'))
-    elif module.params['get_container_images']:
-        module.exit_json(container_images=aws_response_list_parser(paginate, it, 'containerImages'))
-    elif module.params['get_container_service_deployments']:
-        module.exit_json(container_service_deployments=aws_response_list_parser(paginate, it, 'deployments'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'lightsail', _lightsail_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -117,66 +118,31 @@ trackers:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _location(client, module):
-    try:
-        if module.params['list_geofence_collections']:
-            if client.can_paginate('list_geofence_collections'):
-                paginator = client.get_paginator('list_geofence_collections')
-                return paginator.paginate(), True
-            else:
-                return client.list_geofence_collections(), False
-        elif module.params['list_geofences']:
-            if client.can_paginate('list_geofences'):
-                paginator = client.get_paginator('list_geofences')
-                return paginator.paginate(
-                    CollectionName=module.params['name']
-                ), True
-            else:
-                return client.list_geofences(
-                    CollectionName=module.params['name']
-                ), False
-        elif module.params['list_maps']:
-            if client.can_paginate('list_maps'):
-                paginator = client.get_paginator('list_maps')
-                return paginator.paginate(), True
-            else:
-                return client.list_maps(), False
-        elif module.params['list_place_indexes']:
-            if client.can_paginate('list_place_indexes'):
-                paginator = client.get_paginator('list_place_indexes')
-                return paginator.paginate(), True
-            else:
-                return client.list_place_indexes(), False
-        elif module.params['list_tracker_consumers']:
-            if client.can_paginate('list_tracker_consumers'):
-                paginator = client.get_paginator('list_tracker_consumers')
-                return paginator.paginate(
-                    TrackerName=module.params['name'],
-                ), True
-            else:
-                return client.list_tracker_consumers(
-                    TrackerName=module.params['name'],
-                ), False
-        elif module.params['list_trackers']:
-            if client.can_paginate('list_trackers'):
-                paginator = client.get_paginator('list_trackers')
-                return paginator.paginate(), True
-            else:
-                return client.list_trackers(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Location Service details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_LOCATION_OPERATIONS = dict(
+    list_geofence_collections=aws_list_operation('list_geofence_collections', 'geofence_collections', 'Entries'),
+    list_geofences=aws_list_operation('list_geofences', 'geofences', 'Entries', CollectionName='name'),
+    list_maps=aws_list_operation('list_maps', 'maps', 'Entries'),
+    list_place_indexes=aws_list_operation('list_place_indexes', 'place_indexes', 'Entries'),
+    list_tracker_consumers=aws_list_operation('list_tracker_consumers', 'tracker_consumers', 'ConsumerArns', TrackerName='name'),
+    list_trackers=aws_list_operation('list_trackers', 'trackers', 'Entries'),
+)
+
+
+def _location_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _LOCATION_OPERATIONS,
+        error_msg='Failed to fetch Amazon Location Service details',
+    )
 
 
 def main():
@@ -189,8 +155,9 @@ def main():
         list_tracker_consumers=dict(required=False, type=bool),
         list_trackers=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_geofences', True, ['name']),
@@ -208,23 +175,7 @@ def main():
         ],
     )
 
-    client = module.client('location', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _location(client, module)
-
-    if module.params['list_geofence_collections']:
-        module.exit_json(geofence_collections=aws_response_list_parser(paginate, it, 'Entries'))
-    elif module.params['list_geofences']:
-        module.exit_json(geofences=aws_response_list_parser(paginate, it, 'Entries'))
-    elif module.params['list_maps']:
-        module.exit_json(maps=aws_response_list_parser(paginate, it, 'Entries'))
-    elif module.params['list_place_indexes']:
-        module.exit_json(place_indexes=aws_response_list_parser(paginate, it, 'Entries'))
-    elif module.params['list_tracker_consumers']:
-        module.exit_json(tracker_consumers=aws_response_list_parser(paginate, it, 'ConsumerArns'))
-    elif module.params['list_trackers']:
-        module.exit_json(trackers=aws_response_list_parser(paginate, it, 'Entries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'location', _location_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -51,11 +51,66 @@ options:
       - do you want to get list of queries for given log group name I(name)?
     required: false
     type: bool
+  run_query:
+    description:
+      - do you want to run logs insights I(query_string) on I(log_group_names) from I(start_time) to I(end_time)?
+      - time range is split into windows of I(query_window) seconds and log groups into chunks of 50, one query per window and chunk.
+      - at most I(max_concurrent_queries) queries run at same time, results are polled with backoff until queries finish.
+      - rows of every finished query are converted to snake_case records, field names without leading C(@), in order queries finish.
+      - with I(dest) rows are written to file as queries finish instead of returned.
+    required: false
+    type: bool
+  query_string:
+    description:
+      - logs insights query example C(fields @timestamp, @message | filter @message like /ERROR/).
+    required: false
+    type: str
+  log_group_names:
+    description:
+      - log groups queried by I(run_query), I(name) if not given.
+    required: false
+    type: list
+    elements: str
+  start_time:
+    description:
+      - start of I(run_query) time range, epoch seconds or ISO 8601 example C(2021-01-01T00:00:00Z).
+      - one hour before I(end_time) if not given.
+    required: false
+    type: str
+  end_time:
+    description:
+      - end of I(run_query) time range, epoch seconds or ISO 8601, now if not given.
+    required: false
+    type: str
+  query_window:
+    description:
+      - seconds of time range queried by single query, whole time range in one query if not given.
+    required: false
+    type: int
+  query_limit:
+    description:
+      - maximum rows returned by single query, logs insights allows up to 10000.
+      - module warns when a query returns this many rows, results of its window may be incomplete.
+    required: false
+    type: int
+  max_concurrent_queries:
+    description:
+      - maximum number of queries running at same time, keep it below logs insights concurrency limit of account.
+    required: false
+    type: int
+    default: 10
+  query_timeout:
+    description:
+      - seconds after which running queries are stopped and module fails.
+    required: false
+    type: int
+    default: 900
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -81,6 +136,19 @@ EXAMPLES = """
     describe_log_streams: true
     name: '{{ _reg.log_groups[0].logGroupName }}'
 
+- name: "get first 10 log_streams"
+  aws_logs_info:
+    describe_log_streams: true
+    name: '{{ _reg.log_groups[0].log_group_name }}'
+    max_items: 10
+    page_size: 5
+
+- name: "get all log_streams with api call, page and timing counters"
+  aws_logs_info:
+    describe_log_streams: true
+    name: '{{ _reg.log_groups[0].log_group_name }}'
+    collect_metrics: true
+
 - name: "get list of metric_filters"
   aws_logs_info:
     describe_metric_filters: true
@@ -91,6 +159,27 @@ EXAMPLES = """
     describe_queries: true
     name: '{{ _reg.log_groups[0].logGroupName }}'
     query_status: 'Complete'
+
+- name: "errors of last day in all given log groups, one query per hour"
+  aws_logs_info:
+    run_query: true
+    query_string: 'fields @timestamp, @logStream, @message | filter @message like /ERROR/'
+    log_group_names:
+      - '/aws/lambda/a'
+      - '/aws/lambda/b'
+    start_time: '{{ lookup("pipe", "date -d yesterday +%s") }}'
+    query_window: 3600
+    max_concurrent_queries: 5
+
+- name: "write rows of query to file"
+  aws_logs_info:
+    run_query: true
+    query_string: 'stats count(*) as requests by bin(5m)'
+    name: '/aws/apigateway/access'
+    start_time: '2021-01-01T00:00:00Z'
+    end_time: '2021-01-02T00:00:00Z'
+    query_window: 21600
+    dest: '/tmp/requests.ndjson'
 """
 
 RETURN = """
@@ -118,78 +207,150 @@ queries:
   description: list of queries.
   returned: when `describe_queries` is defined and success.
   type: list
+query_results:
+  description: rows of all queries as snake_case records.
+  returned: when `run_query` is defined and success.
+  type: list
+  sample: [{'timestamp': '2021-01-01 00:00:00.000', 'log_stream': 'a', 'message': 'ERROR b', 'ptr': 'c'}]
+query_statistics:
+  description: number of queries and sum of their records_matched, records_scanned and bytes_scanned.
+  returned: when `run_query` is defined and success.
+  type: dict
+  sample: {'queries': 24, 'records_matched': 10.0, 'records_scanned': 1000.0, 'bytes_scanned': 100000.0}
 """
 
+import time
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
+from ansible.module_utils._text import to_native
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.snake_case import camel_to_snake
+from ansible_collections.community.missing_collection.plugins.module_utils.utils import convert_str_to_epoch
+
+
+_LOGS_OPERATIONS = dict(
+    describe_log_groups=aws_list_operation('describe_log_groups', 'log_groups', 'logGroups'),
+    describe_destinations=aws_list_operation('describe_destinations', 'destinations', 'destinations'),
+    describe_export_tasks=aws_list_operation('describe_export_tasks', 'export_tasks', 'exportTasks', statusCode='task_status'),
+    describe_log_streams=aws_list_operation('describe_log_streams', 'log_streams', 'logStreams', logGroupName='name'),
+    describe_metric_filters=aws_list_operation('describe_metric_filters', 'metric_filters', 'metricFilters', logGroupName='name'),
+    describe_queries=aws_list_operation('describe_queries', 'queries', 'queries', logGroupName='name', status='query_status'),
+)
+
 
+# start_query accepts up to 50 log groups.
+_QUERY_LOG_GROUPS = 50
+# seconds between polls of running queries, grows up to maximum while nothing finishes.
+_QUERY_POLL_INTERVAL = 0.5
+_QUERY_POLL_INTERVAL_MAX = 5.0
 
-def _logs(client, module):
+
+def _query_windows(module) -> list:
+    end = convert_str_to_epoch(module.params['end_time'], int(time.time()))
+    start = convert_str_to_epoch(module.params['start_time'], end - 3600)
+    if start >= end:
+        aws_info_fail_usage(module, 'start_time must be before end_time')
+    step = module.params['query_window'] or (end - start)
+    if step <= 0:
+        aws_info_fail_usage(module, 'query_window must be greater than 0')
+    groups = module.params['log_group_names'] or [module.params['name']]
+    return [
+        dict(startTime=window, endTime=min(window + step, end), logGroupNames=groups[i:i + _QUERY_LOG_GROUPS])
+        for window in range(start, end, step)
+        for i in range(0, len(groups), _QUERY_LOG_GROUPS)
+    ]
+
+
+def _query_row(row: list) -> dict:
+    # [{'field': '@timestamp', 'value': '...'}] -> {'timestamp': '...'}, keys are converted to snake_case by parser.
+    return dict((column['field'].lstrip('@'), column.get('value')) for column in row)
+
+
+def _query_pages(client, module, statistics: dict):
+    # start queries up to concurrency limit, poll running ones and yield rows of every finished query as one page.
+    pending = _query_windows(module)
+    running = {}
+    params = dict(queryString=module.params['query_string'])
+    if module.params['query_limit'] is not None:
+        params['limit'] = module.params['query_limit']
+    deadline = time.monotonic() + module.params['query_timeout']
+    interval = _QUERY_POLL_INTERVAL
+    try:
+        while pending or running:
+            while pending and len(running) < module.params['max_concurrent_queries']:
+                try:
+                    query_id = client.start_query(**dict(params, **pending[0]), **aws_info_retry_params(client))['queryId']
+                except ClientError as e:
+                    # concurrency limit of account is shared with other users, start query after next poll.
+                    if e.response.get('Error', {}).get('Code') != 'LimitExceededException':
+                        raise
+                    break
+                running[query_id] = pending.pop(0)
+
+            if time.monotonic() > deadline:
+                module.fail_json(msg='logs insights queries did not finish in {0} seconds'.format(module.params['query_timeout']))
+            time.sleep(interval)
+            interval = min(interval * 2, _QUERY_POLL_INTERVAL_MAX)
+            for query_id in list(running):
+                response = client.get_query_results(queryId=query_id, **aws_info_retry_params(client))
+                if response['status'] in ('Scheduled', 'Running'):
+                    continue
+                window = running.pop(query_id)
+                if response['status'] != 'Complete':
+                    module.fail_json(msg='logs insights query {0} of {1} to {2} ended with status {3}'.format(
+                        query_id, window['startTime'], window['endTime'], response['status']
+                    ))
+                interval = _QUERY_POLL_INTERVAL
+                statistics['queries'] += 1
+                for key, value in response.get('statistics', {}).items():
+                    key = camel_to_snake(key)
+                    statistics[key] = statistics.get(key, 0) + value
+                if module.params['query_limit'] is not None and len(response['results']) >= module.params['query_limit']:
+                    module.warn('query of {0} to {1} returned query_limit rows, use smaller query_window'.format(window['startTime'], window['endTime']))
+                yield dict(results=[_query_row(row) for row in response['results']])
+    finally:
+        # module failed or stopped consuming, don't leave queries running against concurrency limit.
+        for query_id in running:
+            try:
+                client.stop_query(queryId=query_id)
+            except (BotoCoreError, ClientError):
+                pass
+
+
+def _run_query_result(client, module) -> dict:
+    if module.params['max_concurrent_queries'] < 1:
+        aws_info_fail_usage(module, 'max_concurrent_queries must be greater than 0')
+    statistics = dict(queries=0)
     try:
-        if module.params['describe_log_groups']:
-            if client.can_paginate('describe_log_groups'):
-                paginator = client.get_paginator('describe_log_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_log_groups(), False
-        elif module.params['describe_destinations']:
-            if client.can_paginate('describe_destinations'):
-                paginator = client.get_paginator('describe_destinations')
-                return paginator.paginate(), True
-            else:
-                return client.describe_destinations(), False
-        elif module.params['describe_export_tasks']:
-            if client.can_paginate('describe_export_tasks'):
-                paginator = client.get_paginator('describe_export_tasks')
-                return paginator.paginate(
-                    statusCode=module.params['task_status']
-                ), True
-            else:
-                return client.describe_export_tasks(
-                    statusCode=module.params['task_status']
-                ), False
-        elif module.params['describe_log_streams']:
-            if client.can_paginate('describe_log_streams'):
-                paginator = client.get_paginator('describe_log_streams')
-                return paginator.paginate(
-                    logGroupName=module.params['name']
-                ), True
-            else:
-                return client.describe_log_streams(
-                    logGroupName=module.params['name']
-                ), False
-        elif module.params['describe_metric_filters']:
-            if client.can_paginate('describe_metric_filters'):
-                paginator = client.get_paginator('describe_metric_filters')
-                return paginator.paginate(
-                    logGroupName=module.params['name']
-                ), True
-            else:
-                return client.describe_metric_filters(
-                    logGroupName=module.params['name']
-                ), False
-        elif module.params['describe_queries']:
-            if client.can_paginate('describe_queries'):
-                paginator = client.get_paginator('describe_queries')
-                return paginator.paginate(
-                    logGroupName=module.params['name'],
-                    status=module.params['query_status']
-                ), True
-            else:
-                return client.describe_queries(
-                    logGroupName=module.params['name'],
-                    status=module.params['query_status']
-                ), False
-        else:
-            return None, False
+        rows = aws_response_list_parser(True, _query_pages(client, module, statistics), 'results', fields=module.params['fields'])
+    except ValueError as e:
+        aws_info_fail_usage(module, 'invalid start_time or end_time: {0}'.format(to_native(e)))
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon CloudWatch Logs details')
+        module.fail_json_aws(e, msg='Failed to run Amazon CloudWatch Logs Insights query')
+    return dict(query_results=rows, query_statistics=dict((k, statistics[k]) for k in sorted(statistics)))
+
+
+def _logs_result(client, module) -> dict:
+    if module.params['run_query']:
+        return _run_query_result(client, module)
+    return aws_operations_result(
+        client,
+        module,
+        _LOGS_OPERATIONS,
+        error_msg='Failed to fetch Amazon CloudWatch Logs details',
+    )
 
 
 def main():
@@ -211,14 +372,26 @@ def main():
         describe_log_streams=dict(required=False, type=bool),
         describe_metric_filters=dict(required=False, type=bool),
         describe_queries=dict(required=False, type=bool),
+        run_query=dict(required=False, type=bool),
+        query_string=dict(required=False, type=str),
+        log_group_names=dict(required=False, type='list', elements='str'),
+        start_time=dict(required=False, type=str),
+        end_time=dict(required=False, type=str),
+        query_window=dict(required=False, type=int),
+        query_limit=dict(required=False, type=int),
+        max_concurrent_queries=dict(required=False, type=int, default=10),
+        query_timeout=dict(required=False, type=int, default=900),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_log_streams', True, ['name']),
             ('describe_metric_filters', True, ['name']),
             ('describe_queries', True, ['name']),
+            ('run_query', True, ['query_string']),
+            ('run_query', True, ['name', 'log_group_names'], True),
         ),
         mutually_exclusive=[
             (
@@ -228,27 +401,12 @@ def main():
                 'describe_log_streams',
                 'describe_metric_filters',
                 'describe_queries',
+                'run_query',
             )
         ],
     )
 
-    client = module.client('logs', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _logs(client, module)
-
-    if module.params['describe_log_groups']:
-        module.exit_json(log_groups=aws_response_list_parser(paginate, it, 'logGroups'))
-    elif module.params['describe_destinations']:
-        module.exit_json(destinations=aws_response_list_parser(paginate, it, 'destinations'))
-    elif module.params['describe_export_tasks']:
-        module.exit_json(export_tasks=aws_response_list_parser(paginate, it, 'exportTasks'))
-    elif module.params['describe_log_streams']:
-        module.exit_json(log_streams=aws_response_list_parser(paginate, it, 'logStreams'))
-    elif module.params['describe_metric_filters']:
-        module.exit_json(metric_filters=aws_response_list_parser(paginate, it, 'metricFilters'))
-    elif module.params['describe_queries']:
-        module.exit_json(queries=aws_response_list_parser(paginate, it, 'queries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'logs', _logs_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -78,50 +79,28 @@ projects:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _lookoutvision(client, module):
-    try:
-        if module.params['list_dataset_entries']:
-            if client.can_paginate('list_dataset_entries'):
-                paginator = client.get_paginator('list_dataset_entries')
-                return paginator.paginate(
-                    ProjectName=module.params['name'],
-                    DatasetType=module.params['dataset_type']
-                ), True
-            else:
-                return client.list_dataset_entries(
-                    ProjectName=module.params['name'],
-                    DatasetType=module.params['dataset_type']
-                ), False
-        elif module.params['list_models']:
-            if client.can_paginate('list_models'):
-                paginator = client.get_paginator('list_models')
-                return paginator.paginate(
-                    ProjectName=module.params['name'],
-                ), True
-            else:
-                return client.list_models(
-                    ProjectName=module.params['name'],
-                ), False
-        elif module.params['list_projects']:
-            if client.can_paginate('list_projects'):
-                paginator = client.get_paginator('list_projects')
-                return paginator.paginate(), True
-            else:
-                return client.list_projects(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Lookout for Vision details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_LOOKOUTVISION_OPERATIONS = dict(
+    list_dataset_entries=aws_list_operation('list_dataset_entries', 'dataset_entries', 'DatasetEntries', ProjectName='name', DatasetType='dataset_type'),
+    list_models=aws_list_operation('list_models', 'models', 'Models', ProjectName='name'),
+    list_projects=aws_list_operation('list_projects', 'projects', 'Projects'),
+)
+
+
+def _lookoutvision_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _LOOKOUTVISION_OPERATIONS,
+        error_msg='Failed to fetch Amazon Lookout for Vision details',
+    )
 
 
 def main():
@@ -132,8 +111,9 @@ def main():
         list_models=dict(required=False, type=bool),
         list_projects=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_dataset_entries', True, ['name', 'dataset_type']),
@@ -148,17 +128,7 @@ def main():
         ],
     )
 
-    client = module.client('lookoutvision', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _lookoutvision(client, module)
-
-    if module.params['list_dataset_entries']:
-        module.exit_json(dataset_entries=aws_response_list_parser(paginate, it, 'DatasetEntries'))
-    elif module.params['list_models']:
-        module.exit_json(models=aws_response_list_parser(paginate, it, 'Models'))
-    elif module.params['list_projects']:
-        module.exit_json(projects=aws_response_list_parser(paginate, it, 'Projects'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'lookoutvision', _lookoutvision_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -69,6 +69,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -119,70 +120,35 @@ ml_models:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _machinelearning(client, module):
-    try:
-        if module.params['describe_batch_predictions']:
-            if client.can_paginate('describe_batch_predictions'):
-                paginator = client.get_paginator('describe_batch_predictions')
-                return paginator.paginate(
-                    FilterVariable=module.params['filter_variable_prediction'],
-                    EQ=module.params['eq']
-                ), True
-            else:
-                return client.describe_batch_predictions(
-                    FilterVariable=module.params['filter_variable_prediction'],
-                    EQ=module.params['eq']
-                ), False
-        elif module.params['describe_data_sources']:
-            if client.can_paginate('describe_data_sources'):
-                paginator = client.get_paginator('describe_data_sources')
-                return paginator.paginate(
-                    FilterVariable=module.params['filter_variable_datasource'],
-                    EQ=module.params['eq']
-                ), True
-            else:
-                return client.describe_data_sources(
-                    FilterVariable=module.params['filter_variable_datasource'],
-                    EQ=module.params['eq']
-                ), False
-        elif module.params['describe_evaluations']:
-            if client.can_paginate('describe_evaluations'):
-                paginator = client.get_paginator('describe_evaluations')
-                return paginator.paginate(
-                    FilterVariable=module.params['filter_variable_evaluation'],
-                    EQ=module.params['eq']
-                ), True
-            else:
-                return client.describe_evaluations(
-                    FilterVariable=module.params['filter_variable_evaluation'],
-                    EQ=module.params['eq']
-                ), False
-        elif module.params['describe_ml_models']:
-            if client.can_paginate('describe_ml_models'):
-                paginator = client.get_paginator('describe_ml_models')
-                return paginator.paginate(
-                    FilterVariable=module.params['filter_variable_ml_models'],
-                    EQ=module.params['eq']
-                ), True
-            else:
-                return client.describe_ml_models(
-                    FilterVariable=module.params['filter_variable_ml_models'],
-                    EQ=module.params['eq']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Machine Learning details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MACHINELEARNING_OPERATIONS = dict(
+    describe_batch_predictions=aws_list_operation(
+        'describe_batch_predictions',
+        'batch_predictions',
+        'Results',
+        FilterVariable='filter_variable_prediction',
+        EQ='eq',
+    ),
+    describe_data_sources=aws_list_operation('describe_data_sources', 'data_sources', 'Results', FilterVariable='filter_variable_datasource', EQ='eq'),
+    describe_evaluations=aws_list_operation('describe_evaluations', 'evaluations', 'Results', FilterVariable='filter_variable_evaluation', EQ='eq'),
+    describe_ml_models=aws_list_operation('describe_ml_models', 'ml_models', 'Results', FilterVariable='filter_variable_ml_models', EQ='eq'),
+)
+
+
+def _machinelearning_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MACHINELEARNING_OPERATIONS,
+        error_msg='Failed to fetch Amazon Machine Learning details',
+    )
 
 
 def main():
@@ -209,8 +175,9 @@ def main():
         describe_evaluations=dict(required=False, type=bool),
         describe_ml_models=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_batch_predictions', True, ['filter_variable_prediction', 'eq']),
@@ -228,19 +195,7 @@ def main():
         ],
     )
 
-    client = module.client('machinelearning', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _machinelearning(client, module)
-
-    if module.params['describe_batch_predictions']:
-        module.exit_json(batch_predictions=aws_response_list_parser(paginate, it, 'Results'))
-    elif module.params['describe_data_sources']:
-        module.exit_json(data_sources=aws_response_list_parser(paginate, it, 'Results'))
-    elif module.params['describe_evaluations']:
-        module.exit_json(evaluations=aws_response_list_parser(paginate, it, 'Results'))
-    elif module.params['describe_ml_models']:
-        module.exit_json(ml_models=aws_response_list_parser(paginate, it, 'Results'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'machinelearning', _machinelearning_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -116,78 +117,43 @@ organization_admin_accounts:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _macie2(client, module):
-    try:
-        if module.params['list_classification_jobs']:
-            if client.can_paginate('list_classification_jobs'):
-                paginator = client.get_paginator('list_classification_jobs')
-                return paginator.paginate(
-                    filterCriteria={
-                        'includes': [
-                            {
-                                'comparator': 'EQ',
-                                'key': 'jobStatus',
-                                'values': [module.params['job_status']]
-                            },
-                        ]
-                    }
-                ), True
-            else:
-                return client.list_classification_jobs(
-                    filterCriteria={
-                        'includes': [
-                            {
-                                'comparator': 'EQ',
-                                'key': 'jobStatus',
-                                'values': [module.params['job_status']]
-                            },
-                        ]
-                    }
-                ), False
-        elif module.params['list_custom_data_identifiers']:
-            if client.can_paginate('list_custom_data_identifiers'):
-                paginator = client.get_paginator('list_custom_data_identifiers')
-                return paginator.paginate(), True
-            else:
-                return client.list_custom_data_identifiers(), False
-        elif module.params['list_findings_filters']:
-            if client.can_paginate('list_findings_filters'):
-                paginator = client.get_paginator('list_findings_filters')
-                return paginator.paginate(), True
-            else:
-                return client.list_findings_filters(), False
-        elif module.params['list_invitations']:
-            if client.can_paginate('list_invitations'):
-                paginator = client.get_paginator('list_invitations')
-                return paginator.paginate(), True
-            else:
-                return client.list_invitations(), False
-        elif module.params['list_members']:
-            if client.can_paginate('list_members'):
-                paginator = client.get_paginator('list_members')
-                return paginator.paginate(), True
-            else:
-                return client.list_members(), False
-        elif module.params['list_organization_admin_accounts']:
-            if client.can_paginate('list_organization_admin_accounts'):
-                paginator = client.get_paginator('list_organization_admin_accounts')
-                return paginator.paginate(), True
-            else:
-                return client.list_organization_admin_accounts(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Macie 2 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+def _job_status_criteria(module):
+    return {
+        'includes': [
+            {
+                'comparator': 'EQ',
+                'key': 'jobStatus',
+                'values': [module.params['job_status']]
+            },
+        ]
+    }
+
+
+_MACIE2_OPERATIONS = dict(
+    list_classification_jobs=aws_list_operation('list_classification_jobs', 'classification_jobs', 'items', filterCriteria=_job_status_criteria),
+    list_custom_data_identifiers=aws_list_operation('list_custom_data_identifiers', 'custom_data_identifiers', 'items'),
+    list_findings_filters=aws_list_operation('list_findings_filters', 'findings_filters', 'findingsFilterListItems'),
+    list_invitations=aws_list_operation('list_invitations', 'invitations', 'invitations'),
+    list_members=aws_list_operation('list_members', 'members', 'members'),
+    list_organization_admin_accounts=aws_list_operation('list_organization_admin_accounts', 'organization_admin_accounts', 'adminAccounts'),
+)
+
+
+def _macie2_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MACIE2_OPERATIONS,
+        error_msg='Failed to fetch Amazon Macie 2 details',
+    )
 
 
 def main():
@@ -204,8 +170,9 @@ def main():
         list_members=dict(required=False, type=bool),
         list_organization_admin_accounts=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -220,23 +187,7 @@ def main():
         ],
     )
 
-    client = module.client('macie2', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _macie2(client, module)
-
-    if module.params['list_classification_jobs']:
-        module.exit_json(classification_jobs=aws_response_list_parser(paginate, it, 'items'))
-    elif module.params['list_custom_data_identifiers']:
-        module.exit_json(custom_data_identifiers=aws_response_list_parser(paginate, it, 'items'))
-    elif module.params['list_findings_filters']:
-        module.exit_json(findings_filters=aws_response_list_parser(paginate, it, 'findingsFilterListItems'))
-    elif module.params['list_invitations']:
-        module.exit_json(invitations=aws_response_list_parser(paginate, it, 'invitations'))
-    elif module.params['list_members']:
-        module.exit_json(members=aws_response_list_parser(paginate, it, 'members'))
-    elif module.params['list_organization_admin_accounts']:
-        module.exit_json(organization_admin_accounts=aws_response_list_parser(paginate, it, 'adminAccounts'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'macie2', _macie2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -62,38 +63,27 @@ s3_resources:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _macie(client, module):
-    try:
-        if module.params['list_member_accounts']:
-            if client.can_paginate('list_member_accounts'):
-                paginator = client.get_paginator('list_member_accounts')
-                return paginator.paginate(), True
-            else:
-                return client.list_member_accounts(), False
-        elif module.params['list_s3_resources']:
-            if client.can_paginate('list_s3_resources'):
-                paginator = client.get_paginator('list_s3_resources')
-                return paginator.paginate(
-                    memberAccountId=module.params['id'],
-                ), True
-            else:
-                return client.list_s3_resources(
-                    memberAccountId=module.params['id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Macie details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MACIE_OPERATIONS = dict(
+    list_member_accounts=aws_list_operation('list_member_accounts', 'member_accounts', 'memberAccounts'),
+    list_s3_resources=aws_list_operation('list_s3_resources', 's3_resources', 's3Resources', memberAccountId='id'),
+)
+
+
+def _macie_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MACIE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Macie details',
+    )
 
 
 def main():
@@ -102,8 +92,9 @@ def main():
         list_member_accounts=dict(required=False, type=bool),
         list_s3_resources=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_s3_resources', True, ['id']),
@@ -116,15 +107,7 @@ def main():
         ],
     )
 
-    client = module.client('macie', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _macie(client, module)
-
-    if module.params['list_member_accounts']:
-        module.exit_json(member_accounts=aws_response_list_parser(paginate, it, 'memberAccounts'))
-    elif module.params['list_s3_resources']:
-        module.exit_json(s3_resources=aws_response_list_parser(paginate, it, 's3Resources'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'macie', _macie_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -55,6 +55,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -118,76 +119,31 @@ proposals:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _managedblockchain(client, module):
-    try:
-        if module.params['list_invitations']:
-            if client.can_paginate('list_invitations'):
-                paginator = client.get_paginator('list_invitations')
-                return paginator.paginate(), True
-            else:
-                return client.list_invitations(), False
-        elif module.params['list_members']:
-            if client.can_paginate('list_members'):
-                paginator = client.get_paginator('list_members')
-                return paginator.paginate(
-                    NetworkId=module.params['id'],
-                ), True
-            else:
-                return client.list_members(
-                    NetworkId=module.params['id'],
-                ), False
-        elif module.params['list_networks']:
-            if client.can_paginate('list_networks'):
-                paginator = client.get_paginator('list_networks')
-                return paginator.paginate(), True
-            else:
-                return client.list_networks(), False
-        elif module.params['list_nodes']:
-            if client.can_paginate('list_nodes'):
-                paginator = client.get_paginator('list_nodes')
-                return paginator.paginate(
-                    NetworkId=module.params['id'],
-                ), True
-            else:
-                return client.list_nodes(
-                    NetworkId=module.params['id'],
-                ), False
-        elif module.params['list_proposal_votes']:
-            if client.can_paginate('list_proposal_votes'):
-                paginator = client.get_paginator('list_proposal_votes')
-                return paginator.paginate(
-                    NetworkId=module.params['id'],
-                    ProposalId=module.params['proposal_id']
-                ), True
-            else:
-                return client.list_proposal_votes(
-                    NetworkId=module.params['id'],
-                    ProposalId=module.params['proposal_id']
-                ), False
-        elif module.params['list_proposals']:
-            if client.can_paginate('list_proposals'):
-                paginator = client.get_paginator('list_proposals')
-                return paginator.paginate(
-                    NetworkId=module.params['id'],
-                ), True
-            else:
-                return client.list_proposals(
-                    NetworkId=module.params['id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Managed Blockchain details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MANAGEDBLOCKCHAIN_OPERATIONS = dict(
+    list_invitations=aws_list_operation('list_invitations', 'invitations', 'Invitations'),
+    list_members=aws_list_operation('list_members', 'members', 'Members', NetworkId='id'),
+    list_networks=aws_list_operation('list_networks', 'networks', 'Networks'),
+    list_nodes=aws_list_operation('list_nodes', 'nodes', 'Nodes', NetworkId='id'),
+    list_proposal_votes=aws_list_operation('list_proposal_votes', 'proposal_votes', 'ProposalVotes', NetworkId='id', ProposalId='proposal_id'),
+    list_proposals=aws_list_operation('list_proposals', 'proposals', 'Proposals', NetworkId='id'),
+)
+
+
+def _managedblockchain_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MANAGEDBLOCKCHAIN_OPERATIONS,
+        error_msg='Failed to fetch Amazon Managed Blockchain details',
+    )
 
 
 def main():
@@ -201,8 +157,9 @@ def main():
         list_proposal_votes=dict(required=False, type=bool),
         list_proposals=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_members', True, ['id']),
@@ -222,23 +179,7 @@ def main():
         ],
     )
 
-    client = module.client('managedblockchain', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _managedblockchain(client, module)
-
-    if module.params['list_invitations']:
-        module.exit_json(invitations=aws_response_list_parser(paginate, it, 'Invitations'))
-    elif module.params['list_members']:
-        module.exit_json(members=aws_response_list_parser(paginate, it, 'Members'))
-    elif module.params['list_networks']:
-        module.exit_json(networks=aws_response_list_parser(paginate, it, 'Networks'))
-    elif module.params['list_nodes']:
-        module.exit_json(nodes=aws_response_list_parser(paginate, it, 'Nodes'))
-    elif module.params['list_proposal_votes']:
-        module.exit_json(proposal_votes=aws_response_list_parser(paginate, it, 'ProposalVotes'))
-    elif module.params['list_proposals']:
-        module.exit_json(proposals=aws_response_list_parser(paginate, it, 'Proposals'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'managedblockchain', _managedblockchain_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -64,44 +65,27 @@ entities:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _marketplace_catalog(client, module):
-    try:
-        if module.params['list_change_sets']:
-            if client.can_paginate('list_change_sets'):
-                paginator = client.get_paginator('list_change_sets')
-                return paginator.paginate(
-                    Catalog=module.params['catalog']
-                ), True
-            else:
-                return client.list_change_sets(
-                    Catalog=module.params['catalog']
-                ), False
-        elif module.params['list_entities']:
-            if client.can_paginate('list_entities'):
-                paginator = client.get_paginator('list_entities')
-                return paginator.paginate(
-                    Catalog=module.params['catalog'],
-                    EntityType=module.params['entity_type']
-                ), True
-            else:
-                return client.list_entities(
-                    Catalog=module.params['catalog'],
-                    EntityType=module.params['entity_type']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Marketplace Catalog Service details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MARKETPLACE_CATALOG_OPERATIONS = dict(
+    list_change_sets=aws_list_operation('list_change_sets', 'change_sets', 'ChangeSetSummaryList', Catalog='catalog'),
+    list_entities=aws_list_operation('list_entities', 'entities', 'EntitySummaryList', Catalog='catalog', EntityType='entity_type'),
+)
+
+
+def _marketplace_catalog_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MARKETPLACE_CATALOG_OPERATIONS,
+        error_msg='Failed to fetch AWS Marketplace Catalog Service details',
+    )
 
 
 def main():
@@ -111,8 +95,9 @@ def main():
         list_change_sets=dict(required=False, type=bool),
         list_entities=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_change_sets', True, ['catalog']),
@@ -126,15 +111,7 @@ def main():
         ],
     )
 
-    client = module.client('marketplace-catalog', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _marketplace_catalog(client, module)
-
-    if module.params['list_change_sets']:
-        module.exit_json(change_sets=aws_response_list_parser(paginate, it, 'ChangeSetSummaryList'))
-    elif module.params['list_entities']:
-        module.exit_json(entities=aws_response_list_parser(paginate, it, 'EntitySummaryList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'marketplace-catalog', _marketplace_catalog_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -49,32 +50,26 @@ entitlements:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _marketplace_entitlement(client, module):
-    try:
-        if module.params['get_entitlements']:
-            if client.can_paginate('get_entitlements'):
-                paginator = client.get_paginator('get_entitlements')
-                return paginator.paginate(
-                    ProductCode=module.params['product_code']
-                ), True
-            else:
-                return client.get_entitlements(
-                    ProductCode=module.params['product_code']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Marketplace Entitlement Service details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MARKETPLACE_ENTITLEMENT_OPERATIONS = dict(
+    get_entitlements=aws_list_operation('get_entitlements', 'entitlements', 'Entitlements', ProductCode='product_code'),
+)
+
+
+def _marketplace_entitlement_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MARKETPLACE_ENTITLEMENT_OPERATIONS,
+        error_msg='Failed to fetch AWS Marketplace Entitlement Service details',
+    )
 
 
 def main():
@@ -82,8 +77,9 @@ def main():
         product_code=dict(required=False),
         get_entitlements=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_entitlements', True, ['product_code']),
@@ -91,13 +87,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('marketplace-entitlement', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _marketplace_entitlement(client, module)
-
-    if module.params['get_entitlements']:
-        module.exit_json(entitlements=aws_response_list_parser(paginate, it, 'Entitlements'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'marketplace-entitlement', _marketplace_entitlement_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
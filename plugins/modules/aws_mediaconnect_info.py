@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -82,46 +83,29 @@ reservations:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mediaconnect(client, module):
-    try:
-        if module.params['list_entitlements']:
-            if client.can_paginate('list_entitlements'):
-                paginator = client.get_paginator('list_entitlements')
-                return paginator.paginate(), True
-            else:
-                return client.list_entitlements(), False
-        elif module.params['list_flows']:
-            if client.can_paginate('list_flows'):
-                paginator = client.get_paginator('list_flows')
-                return paginator.paginate(), True
-            else:
-                return client.list_flows(), False
-        elif module.params['list_offerings']:
-            if client.can_paginate('list_offerings'):
-                paginator = client.get_paginator('list_offerings')
-                return paginator.paginate(), True
-            else:
-                return client.list_offerings(), False
-        elif module.params['list_reservations']:
-            if client.can_paginate('list_reservations'):
-                paginator = client.get_paginator('list_reservations')
-                return paginator.paginate(), True
-            else:
-                return client.list_reservations(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Media Connect details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIACONNECT_OPERATIONS = dict(
+    list_entitlements=aws_list_operation('list_entitlements', 'entitlements', 'Entitlements'),
+    list_flows=aws_list_operation('list_flows', 'flows', 'Flows'),
+    list_offerings=aws_list_operation('list_offerings', 'offerings', 'Offerings'),
+    list_reservations=aws_list_operation('list_reservations', 'reservations', 'Reservations'),
+)
+
+
+def _mediaconnect_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIACONNECT_OPERATIONS,
+        error_msg='Failed to fetch Amazon Media Connect details',
+    )
 
 
 def main():
@@ -131,8 +115,9 @@ def main():
         list_offerings=dict(required=False, type=bool),
         list_reservations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -145,19 +130,7 @@ def main():
         ],
     )
 
-    client = module.client('mediaconnect', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mediaconnect(client, module)
-
-    if module.params['list_entitlements']:
-        module.exit_json(entitlements=aws_response_list_parser(paginate, it, 'Entitlements'))
-    elif module.params['list_flows']:
-        module.exit_json(flows=aws_response_list_parser(paginate, it, 'Flows'))
-    elif module.params['list_offerings']:
-        module.exit_json(offerings=aws_response_list_parser(paginate, it, 'Offerings'))
-    elif module.params['list_reservations']:
-        module.exit_json(reservations=aws_response_list_parser(paginate, it, 'Reservations'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mediaconnect', _mediaconnect_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
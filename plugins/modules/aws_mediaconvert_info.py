@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -83,50 +84,29 @@ queues:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mediaconvert(client, module):
-    try:
-        if module.params['list_job_templates']:
-            if client.can_paginate('list_job_templates'):
-                paginator = client.get_paginator('list_job_templates')
-                return paginator.paginate(), True
-            else:
-                return client.list_job_templates(), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    Status=module.params['job_status']
-                ), True
-            else:
-                return client.list_jobs(
-                    Status=module.params['job_status']
-                ), False
-        elif module.params['list_presets']:
-            if client.can_paginate('list_presets'):
-                paginator = client.get_paginator('list_presets')
-                return paginator.paginate(), True
-            else:
-                return client.list_presets(), False
-        elif module.params['list_queues']:
-            if client.can_paginate('list_queues'):
-                paginator = client.get_paginator('list_queues')
-                return paginator.paginate(), True
-            else:
-                return client.list_queues(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental MediaConvert details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIACONVERT_OPERATIONS = dict(
+    list_job_templates=aws_list_operation('list_job_templates', 'job_templates', 'JobTemplates'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'Jobs', Status='job_status'),
+    list_presets=aws_list_operation('list_presets', 'presets', 'Presets'),
+    list_queues=aws_list_operation('list_queues', 'queues', 'Queues'),
+)
+
+
+def _mediaconvert_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIACONVERT_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental MediaConvert details',
+    )
 
 
 def main():
@@ -141,8 +121,9 @@ def main():
         list_presets=dict(required=False, type=bool),
         list_queues=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -155,19 +136,7 @@ def main():
         ],
     )
 
-    client = module.client('mediaconvert', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mediaconvert(client, module)
-
-    if module.params['list_job_templates']:
-        module.exit_json(job_templates=aws_response_list_parser(paginate, it, 'JobTemplates'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'Jobs'))
-    elif module.params['list_presets']:
-        module.exit_json(presets=aws_response_list_parser(paginate, it, 'Presets'))
-    elif module.params['list_queues']:
-        module.exit_json(queues=aws_response_list_parser(paginate, it, 'Queues'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mediaconvert', _mediaconvert_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -72,6 +72,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -156,84 +157,39 @@ reservations:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _medialive(client, module):
-    try:
-        if module.params['list_channels']:
-            if client.can_paginate('list_channels'):
-                paginator = client.get_paginator('list_channels')
-                return paginator.paginate(), True
-            else:
-                return client.list_channels(), False
-        elif module.params['list_input_device_transfers']:
-            if client.can_paginate('list_input_device_transfers'):
-                paginator = client.get_paginator('list_input_device_transfers')
-                return paginator.paginate(
-                    TransferType=module.params['transfer_type']
-                ), True
-            else:
-                return client.list_input_device_transfers(
-                    TransferType=module.params['transfer_type']
-                ), False
-        elif module.params['list_input_devices']:
-            if client.can_paginate('list_input_devices'):
-                paginator = client.get_paginator('list_input_devices')
-                return paginator.paginate(), True
-            else:
-                return client.list_input_devices(), False
-        elif module.params['list_input_security_groups']:
-            if client.can_paginate('list_input_security_groups'):
-                paginator = client.get_paginator('list_input_security_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_input_security_groups(), False
-        elif module.params['list_inputs']:
-            if client.can_paginate('list_inputs'):
-                paginator = client.get_paginator('list_inputs')
-                return paginator.paginate(), True
-            else:
-                return client.list_inputs(), False
-        elif module.params['list_multiplex_programs']:
-            if client.can_paginate('list_multiplex_programs'):
-                paginator = client.get_paginator('list_multiplex_programs')
-                return paginator.paginate(
-                    MultiplexId=module.params['id']
-                ), True
-            else:
-                return client.list_multiplex_programs(
-                    MultiplexId=module.params['id']
-                ), False
-        elif module.params['list_multiplexes']:
-            if client.can_paginate('list_multiplexes'):
-                paginator = client.get_paginator('list_multiplexes')
-                return paginator.paginate(), True
-            else:
-                return client.list_multiplexes(), False
-        elif module.params['list_offerings']:
-            if client.can_paginate('list_offerings'):
-                paginator = client.get_paginator('list_offerings')
-                return paginator.paginate(), True
-            else:
-                return client.list_offerings(), False
-        elif module.params['list_reservations']:
-            if client.can_paginate('list_reservations'):
-                paginator = client.get_paginator('list_reservations')
-                return paginator.paginate(), True
-            else:
-                return client.list_reservations(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental MediaLive details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIALIVE_OPERATIONS = dict(
+    list_channels=aws_list_operation('list_channels', 'channels', 'Channels'),
+    list_input_device_transfers=aws_list_operation(
+        'list_input_device_transfers',
+        'input_device_transfers',
+        'InputDeviceTransfers',
+        TransferType='transfer_type',
+    ),
+    list_input_devices=aws_list_operation('list_input_devices', 'input_devices', 'InputDevices'),
+    list_input_security_groups=aws_list_operation('list_input_security_groups', 'input_security_groups', 'InputSecurityGroups'),
+    list_inputs=aws_list_operation('list_inputs', 'inputs', 'Inputs'),
+    list_multiplex_programs=aws_list_operation('list_multiplex_programs', 'multiplex_programs', 'MultiplexPrograms', MultiplexId='id'),
+    list_multiplexes=aws_list_operation('list_multiplexes', 'multiplexes', 'Multiplexes'),
+    list_offerings=aws_list_operation('list_offerings', 'offerings', 'Offerings'),
+    list_reservations=aws_list_operation('list_reservations', 'reservations', 'Reservations'),
+)
+
+
+def _medialive_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIALIVE_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental MediaLive details',
+    )
 
 
 def main():
@@ -254,8 +210,9 @@ def main():
         list_offerings=dict(required=False, type=bool),
         list_reservations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_multiplex_programs', True, ['id']),
@@ -275,29 +232,7 @@ def main():
         ],
     )
 
-    client = module.client('medialive', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _medialive(client, module)
-
-    if module.params['list_channels']:
-        module.exit_json(channels=aws_response_list_parser(paginate, it, 'Channels'))
-    elif module.params['list_input_device_transfers']:
-        module.exit_json(input_device_transfers=aws_response_list_parser(paginate, it, 'InputDeviceTransfers'))
-    elif module.params['list_input_devices']:
-        module.exit_json(input_devices=aws_response_list_parser(paginate, it, 'InputDevices'))
-    elif module.params['list_input_security_groups']:
-        module.exit_json(input_security_groups=aws_response_list_parser(paginate, it, 'InputSecurityGroups'))
-    elif module.params['list_inputs']:
-        module.exit_json(inputs=aws_response_list_parser(paginate, it, 'Inputs'))
-    elif module.params['list_multiplex_programs']:
-        module.exit_json(multiplex_programs=aws_response_list_parser(paginate, it, 'MultiplexPrograms'))
-    elif module.params['list_multiplexes']:
-        module.exit_json(multiplexes=aws_response_list_parser(paginate, it, 'Multiplexes'))
-    elif module.params['list_offerings']:
-        module.exit_json(offerings=aws_response_list_parser(paginate, it, 'Offerings'))
-    elif module.params['list_reservations']:
-        module.exit_json(reservations=aws_response_list_parser(paginate, it, 'Reservations'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'medialive', _medialive_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -48,6 +48,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -84,48 +85,28 @@ origin_endpoints:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mediapackage(client, module):
-    try:
-        if module.params['list_channels']:
-            if client.can_paginate('list_channels'):
-                paginator = client.get_paginator('list_channels')
-                return paginator.paginate(), True
-            else:
-                return client.list_channels(), False
-        elif module.params['list_harvest_jobs']:
-            if client.can_paginate('list_harvest_jobs'):
-                paginator = client.get_paginator('list_harvest_jobs')
-                return paginator.paginate(
-                    IncludeStatus=module.params['job_status']
-                ), True
-            else:
-                return client.list_harvest_jobs(
-                    IncludeStatus=module.params['job_status']
-                ), False
-        elif module.params['list_origin_endpoints']:
-            if client.can_paginate('list_origin_endpoints'):
-                paginator = client.get_paginator('list_origin_endpoints')
-                return paginator.paginate(
-                    ChannelId=module.params['id']
-                ), True
-            else:
-                return client.list_origin_endpoints(
-                    ChannelId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental MediaPackage details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIAPACKAGE_OPERATIONS = dict(
+    list_channels=aws_list_operation('list_channels', 'channels', 'Channels'),
+    list_harvest_jobs=aws_list_operation('list_harvest_jobs', 'harvest_jobs', 'HarvestJobs', IncludeStatus='job_status'),
+    list_origin_endpoints=aws_list_operation('list_origin_endpoints', 'origin_endpoints', 'OriginEndpoints', ChannelId='id'),
+)
+
+
+def _mediapackage_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIAPACKAGE_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental MediaPackage details',
+    )
 
 
 def main():
@@ -140,8 +121,9 @@ def main():
         list_harvest_jobs=dict(required=False, type=bool),
         list_origin_endpoints=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_origin_endpoints', True, ['id']),
@@ -155,17 +137,7 @@ def main():
         ],
     )
 
-    client = module.client('mediapackage', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mediapackage(client, module)
-
-    if module.params['list_channels']:
-        module.exit_json(channels=aws_response_list_parser(paginate, it, 'Channels'))
-    elif module.params['list_harvest_jobs']:
-        module.exit_json(harvest_jobs=aws_response_list_parser(paginate, it, 'HarvestJobs'))
-    elif module.params['list_origin_endpoints']:
-        module.exit_json(origin_endpoints=aws_response_list_parser(paginate, it, 'OriginEndpoints'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mediapackage', _mediapackage_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
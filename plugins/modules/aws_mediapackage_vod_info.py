@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -77,48 +78,33 @@ packaging_groups:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mediapackage_vod(client, module):
-    try:
-        if module.params['list_assets']:
-            if client.can_paginate('list_assets'):
-                paginator = client.get_paginator('list_assets')
-                return paginator.paginate(
-                    PackagingGroupId=module.params['id']
-                ), True
-            else:
-                return client.list_assets(
-                    PackagingGroupId=module.params['id']
-                ), False
-        elif module.params['list_packaging_configurations']:
-            if client.can_paginate('list_packaging_configurations'):
-                paginator = client.get_paginator('list_packaging_configurations')
-                return paginator.paginate(
-                    PackagingGroupId=module.params['id']
-                ), True
-            else:
-                return client.list_packaging_configurations(
-                    PackagingGroupId=module.params['id']
-                ), False
-        elif module.params['list_packaging_groups']:
-            if client.can_paginate('list_packaging_groups'):
-                paginator = client.get_paginator('list_packaging_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_packaging_groups(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental Mediapackage Vod details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIAPACKAGE_VOD_OPERATIONS = dict(
+    list_assets=aws_list_operation('list_assets', 'assets', 'Assets', PackagingGroupId='id'),
+    list_packaging_configurations=aws_list_operation(
+        'list_packaging_configurations',
+        'packaging_configurations',
+        'PackagingConfigurations',
+        PackagingGroupId='id',
+    ),
+    list_packaging_groups=aws_list_operation('list_packaging_groups', 'packaging_groups', 'PackagingGroups'),
+)
+
+
+def _mediapackage_vod_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIAPACKAGE_VOD_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental Mediapackage Vod details',
+    )
 
 
 def main():
@@ -128,8 +114,9 @@ def main():
         list_packaging_configurations=dict(required=False, type=bool),
         list_packaging_groups=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_assets', True, ['id']),
@@ -144,17 +131,7 @@ def main():
         ],
     )
 
-    client = module.client('mediapackage-vod', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mediapackage_vod(client, module)
-
-    if module.params['list_assets']:
-        module.exit_json(assets=aws_response_list_parser(paginate, it, 'Assets'))
-    elif module.params['list_packaging_configurations']:
-        module.exit_json(packaging_configurations=aws_response_list_parser(paginate, it, 'PackagingConfigurations'))
-    elif module.params['list_packaging_groups']:
-        module.exit_json(packaging_groups=aws_response_list_parser(paginate, it, 'PackagingGroups'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mediapackage-vod', _mediapackage_vod_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -91,59 +92,30 @@ lifecycle_policy:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _mediastore(client, module):
-    try:
-        if module.params['list_containers']:
-            if client.can_paginate('list_containers'):
-                paginator = client.get_paginator('list_containers')
-                return paginator.paginate(), True
-            else:
-                return client.list_containers(), False
-        elif module.params['get_container_policy']:
-            if client.can_paginate('get_container_policy'):
-                paginator = client.get_paginator('get_container_policy')
-                return paginator.paginate(
-                    ContainerName=module.params['name']
-                ), True
-            else:
-                return client.get_container_policy(
-                    ContainerName=module.params['name']
-                ), False
-        elif module.params['get_cors_policy']:
-            if client.can_paginate('get_cors_policy'):
-                paginator = client.get_paginator('get_cors_policy')
-                return paginator.paginate(
-                    ContainerName=module.params['name']
-                ), True
-            else:
-                return client.get_cors_policy(
-                    ContainerName=module.params['name']
-                ), False
-        elif module.params['get_lifecycle_policy']:
-            if client.can_paginate('get_lifecycle_policy'):
-                paginator = client.get_paginator('get_lifecycle_policy')
-                return paginator.paginate(
-                    ContainerName=module.params['name']
-                ), True
-            else:
-                return client.get_lifecycle_policy(
-                    ContainerName=module.params['name']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental MediaStore details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIASTORE_OPERATIONS = dict(
+    list_containers=aws_list_operation('list_containers', 'containers', 'Containers'),
+    get_container_policy=aws_dict_operation('get_container_policy', 'container_policy', ContainerName='name'),
+    get_cors_policy=aws_list_operation('get_cors_policy', 'cors_policy', 'CorsPolicy', ContainerName='name'),
+    get_lifecycle_policy=aws_dict_operation('get_lifecycle_policy', 'lifecycle_policy', ContainerName='name'),
+)
+
+
+def _mediastore_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIASTORE_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental MediaStore details',
+    )
 
 
 def main():
@@ -154,8 +126,9 @@ def main():
         get_cors_policy=dict(required=False, type=bool),
         get_lifecycle_policy=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_container_policy', True, ['name']),
@@ -172,19 +145,7 @@ def main():
         ],
     )
 
-    client = module.client('mediastore', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mediastore(client, module)
-
-    if module.params['list_containers']:
-        module.exit_json(containers=aws_response_list_parser(paginate, it, 'Containers'))
-    elif module.params['get_container_policy']:
-        module.exit_json(container_policy=camel_dict_to_snake_dict(it))
-    elif module.params['get_cors_policy']:
-        module.exit_json(cors_policy=aws_response_list_parser(paginate, it, 'CorsPolicy'))
-    elif module.params['get_lifecycle_policy']:
-        module.exit_json(lifecycle_policy=camel_dict_to_snake_dict(it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mediastore', _mediastore_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -89,50 +90,29 @@ vod_sources:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mediatailor(client, module):
-    try:
-        if module.params['list_channels']:
-            if client.can_paginate('list_channels'):
-                paginator = client.get_paginator('list_channels')
-                return paginator.paginate(), True
-            else:
-                return client.list_channels(), False
-        elif module.params['list_playback_configurations']:
-            if client.can_paginate('list_playback_configurations'):
-                paginator = client.get_paginator('list_playback_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_playback_configurations(), False
-        elif module.params['list_source_locations']:
-            if client.can_paginate('list_source_locations'):
-                paginator = client.get_paginator('list_source_locations')
-                return paginator.paginate(), True
-            else:
-                return client.list_source_locations(), False
-        elif module.params['list_vod_sources']:
-            if client.can_paginate('list_vod_sources'):
-                paginator = client.get_paginator('list_vod_sources')
-                return paginator.paginate(
-                    SourceLocationName=module.params['name']
-                ), True
-            else:
-                return client.list_vod_sources(
-                    SourceLocationName=module.params['name']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental mediatailor details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MEDIATAILOR_OPERATIONS = dict(
+    list_channels=aws_list_operation('list_channels', 'channels', 'Items'),
+    list_playback_configurations=aws_list_operation('list_playback_configurations', 'playback_configurations', 'Items'),
+    list_source_locations=aws_list_operation('list_source_locations', 'source_locations', 'Items'),
+    list_vod_sources=aws_list_operation('list_vod_sources', 'vod_sources', 'Items', SourceLocationName='name'),
+)
+
+
+def _mediatailor_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MEDIATAILOR_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental mediatailor details',
+    )
 
 
 def main():
@@ -143,8 +123,9 @@ def main():
         list_source_locations=dict(required=False, type=bool),
         list_vod_sources=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_vod_sources', True, ['name']),
@@ -159,19 +140,7 @@ def main():
         ],
     )
 
-    client = module.client('mediatailor', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mediatailor(client, module)
-
-    if module.params['list_channels']:
-        module.exit_json(channels=aws_response_list_parser(paginate, it, 'Items'))
-    elif module.params['list_playback_configurations']:
-        module.exit_json(playback_configurations=aws_response_list_parser(paginate, it, 'Items'))
-    elif module.params['list_source_locations']:
-        module.exit_json(source_locations=aws_response_list_parser(paginate, it, 'Items'))
-    elif module.params['list_vod_sources']:
-        module.exit_json(vod_sources=aws_response_list_parser(paginate, it, 'Items'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mediatailor', _mediatailor_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
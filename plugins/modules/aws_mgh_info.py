@@ -51,6 +51,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -98,58 +99,41 @@ migration_tasks:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mgh(client, module):
-    try:
-        if module.params['list_application_states']:
-            if client.can_paginate('list_application_states'):
-                paginator = client.get_paginator('list_application_states')
-                return paginator.paginate(), True
-            else:
-                return client.list_application_states(), False
-        elif module.params['list_created_artifacts']:
-            if client.can_paginate('list_created_artifacts'):
-                paginator = client.get_paginator('list_created_artifacts')
-                return paginator.paginate(
-                    MigrationTaskName=module.params['name'],
-                    ProgressUpdateStream=module.params['progress_update_stream']
-                ), True
-            else:
-                return client.list_created_artifacts(
-                    MigrationTaskName=module.params['name'],
-                    ProgressUpdateStream=module.params['progress_update_stream']
-                ), False
-        elif module.params['list_discovered_resources']:
-            if client.can_paginate('list_discovered_resources'):
-                paginator = client.get_paginator('list_discovered_resources')
-                return paginator.paginate(
-                    MigrationTaskName=module.params['name'],
-                    ProgressUpdateStream=module.params['progress_update_stream']
-                ), True
-            else:
-                return client.list_discovered_resources(
-                    MigrationTaskName=module.params['name'],
-                    ProgressUpdateStream=module.params['progress_update_stream']
-                ), False
-        elif module.params['list_migration_tasks']:
-            if client.can_paginate('list_migration_tasks'):
-                paginator = client.get_paginator('list_migration_tasks')
-                return paginator.paginate(), True
-            else:
-                return client.list_migration_tasks(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Migration Hub details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MGH_OPERATIONS = dict(
+    list_application_states=aws_list_operation('list_application_states', 'application_states', 'ApplicationStateList'),
+    list_created_artifacts=aws_list_operation(
+        'list_created_artifacts',
+        'created_artifacts',
+        'CreatedArtifactList',
+        MigrationTaskName='name',
+        ProgressUpdateStream='progress_update_stream',
+    ),
+    list_discovered_resources=aws_list_operation(
+        'list_discovered_resources',
+        'discovered_resources',
+        'DiscoveredResourceList',
+        MigrationTaskName='name',
+        ProgressUpdateStream='progress_update_stream',
+    ),
+    list_migration_tasks=aws_list_operation('list_migration_tasks', 'migration_tasks', 'MigrationTaskSummaryList'),
+)
+
+
+def _mgh_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MGH_OPERATIONS,
+        error_msg='Failed to fetch AWS Migration Hub details',
+    )
 
 
 def main():
@@ -161,8 +145,9 @@ def main():
         list_discovered_resources=dict(required=False, type=bool),
         list_migration_tasks=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_created_artifacts', True, ['name', 'progress_update_stream']),
@@ -178,19 +163,7 @@ def main():
         ],
     )
 
-    client = module.client('mgh', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mgh(client, module)
-
-    if module.params['list_application_states']:
-        module.exit_json(application_states=aws_response_list_parser(paginate, it, 'ApplicationStateList'))
-    elif module.params['list_created_artifacts']:
-        module.exit_json(created_artifacts=aws_response_list_parser(paginate, it, 'CreatedArtifactList'))
-    elif module.params['list_discovered_resources']:
-        module.exit_json(discovered_resources=aws_response_list_parser(paginate, it, 'DiscoveredResourceList'))
-    elif module.params['list_migration_tasks']:
-        module.exit_json(migration_tasks=aws_response_list_parser(paginate, it, 'MigrationTaskSummaryList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mgh', _mgh_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -31,6 +31,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -50,32 +51,26 @@ home_region_controls:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _migrationhub_config(client, module):
-    try:
-        if module.params['describe_home_region_controls']:
-            if client.can_paginate('describe_home_region_controls'):
-                paginator = client.get_paginator('describe_home_region_controls')
-                return paginator.paginate(
-                    HomeRegion=module.params['region']
-                ), True
-            else:
-                return client.describe_home_region_controls(
-                    HomeRegion=module.params['region']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Migration Hub Config details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MIGRATIONHUB_CONFIG_OPERATIONS = dict(
+    describe_home_region_controls=aws_list_operation('describe_home_region_controls', 'home_region_controls', 'HomeRegionControls', HomeRegion='region'),
+)
+
+
+def _migrationhub_config_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MIGRATIONHUB_CONFIG_OPERATIONS,
+        error_msg='Failed to fetch AWS Migration Hub Config details',
+    )
 
 
 def main():
@@ -83,8 +78,9 @@ def main():
         region=dict(required=False, aliases=['home_region']),
         describe_home_region_controls=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_home_region_controls', True, ['region']),
@@ -96,13 +92,7 @@ def main():
         ],
     )
 
-    client = module.client('migrationhub-config', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _migrationhub_config(client, module)
-
-    if module.params['describe_home_region_controls']:
-        module.exit_json(home_region_controls=aws_response_list_parser(paginate, it, 'HomeRegionControls'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'migrationhub-config', _migrationhub_config_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -56,34 +57,27 @@ projects:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mobile(client, module):
-    try:
-        if module.params['list_bundles']:
-            if client.can_paginate('list_bundles'):
-                paginator = client.get_paginator('list_bundles')
-                return paginator.paginate(), True
-            else:
-                return client.list_bundles(), False
-        elif module.params['list_projects']:
-            if client.can_paginate('list_projects'):
-                paginator = client.get_paginator('list_projects')
-                return paginator.paginate(), True
-            else:
-                return client.list_projects(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Mobile details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MOBILE_OPERATIONS = dict(
+    list_bundles=aws_list_operation('list_bundles', 'bundles', 'bundleList'),
+    list_projects=aws_list_operation('list_projects', 'projects', 'projects'),
+)
+
+
+def _mobile_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MOBILE_OPERATIONS,
+        error_msg='Failed to fetch AWS Mobile details',
+    )
 
 
 def main():
@@ -91,8 +85,9 @@ def main():
         list_bundles=dict(required=False, type=bool),
         list_projects=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -103,15 +98,7 @@ def main():
         ],
     )
 
-    client = module.client('mobile', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mobile(client, module)
-
-    if module.params['list_bundles']:
-        module.exit_json(bundles=aws_response_list_parser(paginate, it, 'bundleList'))
-    elif module.params['list_projects']:
-        module.exit_json(projects=aws_response_list_parser(paginate, it, 'projects'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mobile', _mobile_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -76,44 +77,28 @@ users:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mq(client, module):
-    try:
-        if module.params['list_brokers']:
-            if client.can_paginate('list_brokers'):
-                paginator = client.get_paginator('list_brokers')
-                return paginator.paginate(), True
-            else:
-                return client.list_brokers(), False
-        elif module.params['list_configurations']:
-            if client.can_paginate('list_configurations'):
-                paginator = client.get_paginator('list_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_configurations(), False
-        elif module.params['list_users']:
-            if client.can_paginate('list_users'):
-                paginator = client.get_paginator('list_users')
-                return paginator.paginate(
-                    BrokerId=module.params['id']
-                ), True
-            else:
-                return client.list_users(
-                    BrokerId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Elemental MQ details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MQ_OPERATIONS = dict(
+    list_brokers=aws_list_operation('list_brokers', 'brokers', 'BrokerSummaries'),
+    list_configurations=aws_list_operation('list_configurations', 'configurations', 'Configurations'),
+    list_users=aws_list_operation('list_users', 'users', 'Users', BrokerId='id'),
+)
+
+
+def _mq_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MQ_OPERATIONS,
+        error_msg='Failed to fetch AWS Elemental MQ details',
+    )
 
 
 def main():
@@ -123,8 +108,9 @@ def main():
         list_configurations=dict(required=False, type=bool),
         list_users=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_users', True, ['id']),
@@ -138,17 +124,7 @@ def main():
         ],
     )
 
-    client = module.client('mq', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mq(client, module)
-
-    if module.params['list_brokers']:
-        module.exit_json(brokers=aws_response_list_parser(paginate, it, 'BrokerSummaries'))
-    elif module.params['list_configurations']:
-        module.exit_json(configurations=aws_response_list_parser(paginate, it, 'Configurations'))
-    elif module.params['list_users']:
-        module.exit_json(users=aws_response_list_parser(paginate, it, 'Users'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mq', _mq_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
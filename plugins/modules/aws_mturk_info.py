@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -90,54 +91,29 @@ worker_blocks:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _mturk(client, module):
-    try:
-        if module.params['list_assignments_for_hit']:
-            if client.can_paginate('list_assignments_for_hit'):
-                paginator = client.get_paginator('list_assignments_for_hit')
-                return paginator.paginate(
-                    HITId=module.params['id']
-                ), True
-            else:
-                return client.list_assignments_for_hit(
-                    HITId=module.params['id']
-                ), False
-        elif module.params['list_bonus_payments']:
-            if client.can_paginate('list_bonus_payments'):
-                paginator = client.get_paginator('list_bonus_payments')
-                return paginator.paginate(
-                    HITId=module.params['id']
-                ), True
-            else:
-                return client.list_bonus_payments(
-                    HITId=module.params['id']
-                ), False
-        elif module.params['list_hits']:
-            if client.can_paginate('list_hits'):
-                paginator = client.get_paginator('list_hits')
-                return paginator.paginate(), True
-            else:
-                return client.list_hits(), False
-        elif module.params['list_worker_blocks']:
-            if client.can_paginate('list_worker_blocks'):
-                paginator = client.get_paginator('list_worker_blocks')
-                return paginator.paginate(), True
-            else:
-                return client.list_worker_blocks(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Mechanical Turk (MTurk) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_MTURK_OPERATIONS = dict(
+    list_assignments_for_hit=aws_list_operation('list_assignments_for_hit', 'assignments_for_hit', 'Assignments', HITId='id'),
+    list_bonus_payments=aws_list_operation('list_bonus_payments', 'bonus_payments', 'BonusPayments', HITId='id'),
+    list_hits=aws_list_operation('list_hits', 'hits', 'HITs'),
+    list_worker_blocks=aws_list_operation('list_worker_blocks', 'worker_blocks', 'WorkerBlocks'),
+)
+
+
+def _mturk_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MTURK_OPERATIONS,
+        error_msg='Failed to fetch Amazon Mechanical Turk (MTurk) details',
+    )
 
 
 def main():
@@ -148,8 +124,9 @@ def main():
         list_hits=dict(required=False, type=bool),
         list_worker_blocks=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_assignments_for_hit', True, ['id']),
@@ -165,19 +142,7 @@ def main():
         ],
     )
 
-    client = module.client('mturk', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mturk(client, module)
-
-    if module.params['list_assignments_for_hit']:
-        module.exit_json(assignments_for_hit=aws_response_list_parser(paginate, it, 'Assignments'))
-    elif module.params['list_bonus_payments']:
-        module.exit_json(bonus_payments=aws_response_list_parser(paginate, it, 'BonusPayments'))
-    elif module.params['list_hits']:
-        module.exit_json(hits=aws_response_list_parser(paginate, it, 'HITs'))
-    elif module.params['list_worker_blocks']:
-        module.exit_json(worker_blocks=aws_response_list_parser(paginate, it, 'WorkerBlocks'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mturk', _mturk_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
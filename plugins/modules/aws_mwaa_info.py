@@ -25,6 +25,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -43,36 +44,35 @@ environments:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_MWAA_OPERATIONS = dict(
+    list_environments=aws_list_operation('list_environments', 'environments', 'Environments'),
+)
 
-def _mwaa(client, module):
-    try:
-        if module.params['list_environments']:
-            if client.can_paginate('list_environments'):
-                paginator = client.get_paginator('list_environments')
-                return paginator.paginate(), True
-            else:
-                return client.list_environments(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Managed Workflows for Apache Airflow (MWAA) details')
+
+def _mwaa_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _MWAA_OPERATIONS,
+        error_msg='Failed to fetch Amazon Managed Workflows for Apache Airflow (MWAA) details',
+    )
 
 
 def main():
     argument_spec = dict(
         list_environments=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -82,13 +82,7 @@ def main():
         ],
     )
 
-    client = module.client('mwaa', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _mwaa(client, module)
-
-    if module.params['list_environments']:
-        module.exit_json(environments=aws_response_list_parser(paginate, it, 'Environments'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'mwaa', _mwaa_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
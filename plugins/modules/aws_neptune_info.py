@@ -72,6 +72,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -150,96 +151,61 @@ db_subnet_groups:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _neptune(client, module):
-    try:
-        if module.params['describe_db_cluster_endpoints']:
-            if client.can_paginate('describe_db_cluster_endpoints'):
-                paginator = client.get_paginator('describe_db_cluster_endpoints')
-                return paginator.paginate(
-                    DBClusterIdentifier=module.params['id']
-                ), True
-            else:
-                return client.describe_db_cluster_endpoints(
-                    DBClusterIdentifier=module.params['id']
-                ), False
-        elif module.params['describe_db_cluster_parameter_groups']:
-            if client.can_paginate('describe_db_cluster_parameter_groups'):
-                paginator = client.get_paginator('describe_db_cluster_parameter_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_cluster_parameter_groups(), False
-        elif module.params['describe_db_cluster_parameters']:
-            if client.can_paginate('describe_db_cluster_parameters'):
-                paginator = client.get_paginator('describe_db_cluster_parameters')
-                return paginator.paginate(
-                    DBClusterParameterGroupName=module.params['name']
-                ), True
-            else:
-                return client.describe_db_cluster_parameters(
-                    DBClusterParameterGroupName=module.params['name']
-                ), False
-        elif module.params['describe_db_cluster_snapshots']:
-            if client.can_paginate('describe_db_cluster_snapshots'):
-                paginator = client.get_paginator('describe_db_cluster_snapshots')
-                return paginator.paginate(
-                    DBClusterIdentifier=module.params['id']
-                ), True
-            else:
-                return client.describe_db_cluster_snapshots(
-                    DBClusterIdentifier=module.params['id']
-                ), False
-        elif module.params['describe_db_clusters']:
-            if client.can_paginate('describe_db_clusters'):
-                paginator = client.get_paginator('describe_db_clusters')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_clusters(), False
-        elif module.params['describe_db_instances']:
-            if client.can_paginate('describe_db_instances'):
-                paginator = client.get_paginator('describe_db_instances')
-                return paginator.paginate(
-                    Filters=[
-                        {
-                            'Name': 'db-cluster-id',
-                            'Values': [module.params['id']]
-                        },
-                    ]
-                ), True
-            else:
-                return client.describe_db_instances(
-                    Filters=[
-                        {
-                            'Name': 'db-cluster-id',
-                            'Values': [module.params['id']]
-                        },
-                    ]
-                ), False
-        elif module.params['describe_db_parameter_groups']:
-            if client.can_paginate('describe_db_parameter_groups'):
-                paginator = client.get_paginator('describe_db_parameter_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_parameter_groups(), False
-        elif module.params['describe_db_subnet_groups']:
-            if client.can_paginate('describe_db_subnet_groups'):
-                paginator = client.get_paginator('describe_db_subnet_groups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_db_subnet_groups(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Neptune details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+def _db_cluster_id_filter(module):
+    return [
+        {
+            'Name': 'db-cluster-id',
+            'Values': [module.params['id']]
+        },
+    ]
+
+
+_NEPTUNE_OPERATIONS = dict(
+    describe_db_cluster_endpoints=aws_list_operation(
+        'describe_db_cluster_endpoints',
+        'db_cluster_endpoints',
+        'DBClusterEndpoints',
+        DBClusterIdentifier='id',
+    ),
+    describe_db_cluster_parameter_groups=aws_list_operation(
+        'describe_db_cluster_parameter_groups',
+        'db_cluster_parameter_groups',
+        'DBClusterParameterGroups',
+    ),
+    describe_db_cluster_parameters=aws_list_operation(
+        'describe_db_cluster_parameters',
+        'db_cluster_parameters',
+        'Parameters',
+        DBClusterParameterGroupName='name',
+    ),
+    describe_db_cluster_snapshots=aws_list_operation(
+        'describe_db_cluster_snapshots',
+        'db_cluster_snapshots',
+        'DBClusterSnapshots',
+        DBClusterIdentifier='id',
+    ),
+    describe_db_clusters=aws_list_operation('describe_db_clusters', 'db_clusters', 'DBClusters'),
+    describe_db_instances=aws_list_operation('describe_db_instances', 'db_instances', 'DBInstances', Filters=_db_cluster_id_filter),
+    describe_db_parameter_groups=aws_list_operation('describe_db_parameter_groups', 'db_parameter_groups', 'DBParameterGroups'),
+    describe_db_subnet_groups=aws_list_operation('describe_db_subnet_groups', 'db_subnet_groups', 'DBSubnetGroups'),
+)
+
+
+def _neptune_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _NEPTUNE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Neptune details',
+    )
 
 
 def main():
@@ -255,8 +221,9 @@ def main():
         describe_db_parameter_groups=dict(required=False, type=bool),
         describe_db_subnet_groups=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_db_cluster_endpoints', True, ['id']),
@@ -278,27 +245,7 @@ def main():
         ],
     )
 
-    client = module.client('neptune', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _neptune(client, module)
-
-    if module.params['describe_db_cluster_endpoints']:
-        module.exit_json(db_cluster_endpoints=aws_response_list_parser(paginate, it, 'DBClusterEndpoints'))
-    elif module.params['describe_db_cluster_parameter_groups']:
-        module.exit_json(db_cluster_parameter_groups=aws_response_list_parser(paginate, it, 'DBClusterParameterGroups'))
-    elif module.params['describe_db_cluster_parameters']:
-        module.exit_json(db_cluster_parameters=aws_response_list_parser(paginate, it, 'Parameters'))
-    elif module.params['describe_db_cluster_snapshots']:
-        module.exit_json(db_cluster_snapshots=aws_response_list_parser(paginate, it, 'DBClusterSnapshots'))
-    elif module.params['describe_db_clusters']:
-        module.exit_json(db_clusters=aws_response_list_parser(paginate, it, 'DBClusters'))
-    elif module.params['describe_db_instances']:
-        module.exit_json(db_instances=aws_response_list_parser(paginate, it, 'DBInstances'))
-    elif module.params['describe_db_parameter_groups']:
-        module.exit_json(db_parameter_groups=aws_response_list_parser(paginate, it, 'DBParameterGroups'))
-    elif module.params['describe_db_subnet_groups']:
-        module.exit_json(db_subnet_groups=aws_response_list_parser(paginate, it, 'DBSubnetGroups'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'neptune', _neptune_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
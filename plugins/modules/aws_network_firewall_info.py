@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -69,40 +70,28 @@ rule_groups:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _network_firewall(client, module):
-    try:
-        if module.params['list_firewall_policies']:
-            if client.can_paginate('list_firewall_policies'):
-                paginator = client.get_paginator('list_firewall_policies')
-                return paginator.paginate(), True
-            else:
-                return client.list_firewall_policies(), False
-        elif module.params['list_firewalls']:
-            if client.can_paginate('list_firewalls'):
-                paginator = client.get_paginator('list_firewalls')
-                return paginator.paginate(), True
-            else:
-                return client.list_firewalls(), False
-        elif module.params['list_rule_groups']:
-            if client.can_paginate('list_rule_groups'):
-                paginator = client.get_paginator('list_rule_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_rule_groups(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Network Firewall details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_NETWORK_FIREWALL_OPERATIONS = dict(
+    list_firewall_policies=aws_list_operation('list_firewall_policies', 'firewall_policies', 'FirewallPolicies'),
+    list_firewalls=aws_list_operation('list_firewalls', 'firewalls', 'Firewalls'),
+    list_rule_groups=aws_list_operation('list_rule_groups', 'rule_groups', 'RuleGroups'),
+)
+
+
+def _network_firewall_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _NETWORK_FIREWALL_OPERATIONS,
+        error_msg='Failed to fetch AWS Network Firewall details',
+    )
 
 
 def main():
@@ -111,8 +100,9 @@ def main():
         list_firewalls=dict(required=False, type=bool),
         list_rule_groups=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -124,17 +114,7 @@ def main():
         ],
     )
 
-    client = module.client('network-firewall', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _network_firewall(client, module)
-
-    if module.params['list_firewall_policies']:
-        module.exit_json(firewall_policies=aws_response_list_parser(paginate, it, 'FirewallPolicies'))
-    elif module.params['list_firewalls']:
-        module.exit_json(firewalls=aws_response_list_parser(paginate, it, 'Firewalls'))
-    elif module.params['list_rule_groups']:
-        module.exit_json(rule_groups=aws_response_list_parser(paginate, it, 'RuleGroups'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'network-firewall', _network_firewall_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -67,6 +67,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -148,98 +149,43 @@ transit_gateway_registrations:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _networkmanager(client, module):
-    try:
-        if module.params['describe_global_networks']:
-            if client.can_paginate('describe_global_networks'):
-                paginator = client.get_paginator('describe_global_networks')
-                return paginator.paginate(), True
-            else:
-                return client.describe_global_networks(), False
-        elif module.params['get_connections']:
-            if client.can_paginate('get_connections'):
-                paginator = client.get_paginator('get_connections')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_connections(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        elif module.params['get_customer_gateway_associations']:
-            if client.can_paginate('get_customer_gateway_associations'):
-                paginator = client.get_paginator('get_customer_gateway_associations')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_customer_gateway_associations(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        elif module.params['get_devices']:
-            if client.can_paginate('get_devices'):
-                paginator = client.get_paginator('get_devices')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_devices(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        elif module.params['get_link_associations']:
-            if client.can_paginate('get_link_associations'):
-                paginator = client.get_paginator('get_link_associations')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_link_associations(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        elif module.params['get_links']:
-            if client.can_paginate('get_links'):
-                paginator = client.get_paginator('get_links')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_links(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        elif module.params['get_sites']:
-            if client.can_paginate('get_sites'):
-                paginator = client.get_paginator('get_sites')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_sites(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        elif module.params['get_transit_gateway_registrations']:
-            if client.can_paginate('get_transit_gateway_registrations'):
-                paginator = client.get_paginator('get_transit_gateway_registrations')
-                return paginator.paginate(
-                    GlobalNetworkId=module.params['id']
-                ), True
-            else:
-                return client.get_transit_gateway_registrations(
-                    GlobalNetworkId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Network Manager (NetworkManager) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_NETWORKMANAGER_OPERATIONS = dict(
+    describe_global_networks=aws_list_operation('describe_global_networks', 'global_networks', 'GlobalNetworks'),
+    get_connections=aws_list_operation('get_connections', 'connections', 'Connections', GlobalNetworkId='id'),
+    get_customer_gateway_associations=aws_list_operation(
+        'get_customer_gateway_associations',
+        'customer_gateway_associations',
+        'CustomerGatewayAssociations',
+        GlobalNetworkId='id',
+    ),
+    get_devices=aws_list_operation('get_devices', 'devices', 'Devices', GlobalNetworkId='id'),
+    get_link_associations=aws_list_operation('get_link_associations', 'link_associations', 'LinkAssociations', GlobalNetworkId='id'),
+    get_links=aws_list_operation('get_links', 'links', 'Links', GlobalNetworkId='id'),
+    get_sites=aws_list_operation('get_sites', 'sites', 'Sites', GlobalNetworkId='id'),
+    get_transit_gateway_registrations=aws_list_operation(
+        'get_transit_gateway_registrations',
+        'transit_gateway_registrations',
+        'TransitGatewayRegistrations',
+        GlobalNetworkId='id',
+    ),
+)
+
+
+def _networkmanager_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _NETWORKMANAGER_OPERATIONS,
+        error_msg='Failed to fetch AWS Network Manager (NetworkManager) details',
+    )
 
 
 def main():
@@ -254,8 +200,9 @@ def main():
         get_sites=dict(required=False, type=bool),
         get_transit_gateway_registrations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_connections', True, ['id']),
@@ -280,27 +227,7 @@ def main():
         ],
     )
 
-    client = module.client('networkmanager', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _networkmanager(client, module)
-
-    if module.params['describe_global_networks']:
-        module.exit_json(global_networks=aws_response_list_parser(paginate, it, 'GlobalNetworks'))
-    elif module.params['get_connections']:
-        module.exit_json(connections=aws_response_list_parser(paginate, it, 'Connections'))
-    elif module.params['get_customer_gateway_associations']:
-        module.exit_json(customer_gateway_associations=aws_response_list_parser(paginate, it, 'CustomerGatewayAssociations'))
-    elif module.params['get_devices']:
-        module.exit_json(devices=aws_response_list_parser(paginate, it, 'Devices'))
-    elif module.params['get_link_associations']:
-        module.exit_json(link_associations=aws_response_list_parser(paginate, it, 'LinkAssociations'))
-    elif module.params['get_links']:
-        module.exit_json(links=aws_response_list_parser(paginate, it, 'Links'))
-    elif module.params['get_sites']:
-        module.exit_json(sites=aws_response_list_parser(paginate, it, 'Sites'))
-    elif module.params['get_transit_gateway_registrations']:
-        module.exit_json(transit_gateway_registrations=aws_response_list_parser(paginate, it, 'TransitGatewayRegistrations'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'networkmanager', _networkmanager_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -76,6 +76,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -175,118 +176,35 @@ stacks:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_OPSWORKS_OPERATIONS = dict(
+    describe_apps=aws_list_operation('describe_apps', 'apps', 'Apps', StackId='id'),
+    describe_deployments=aws_list_operation('describe_deployments', 'deployments', 'Deployments', StackId='id'),
+    describe_ecs_clusters=aws_list_operation('describe_ecs_clusters', 'ecs_clusters', 'EcsClusters', StackId='id'),
+    describe_elastic_ips=aws_list_operation('describe_elastic_ips', 'elastic_ips', 'ElasticIps', StackId='id'),
+    describe_elastic_load_balancers=aws_list_operation('describe_elastic_load_balancers', 'elastic_load_balancers', 'ElasticLoadBalancers', StackId='id'),
+    describe_instances=aws_list_operation('describe_instances', 'instances', 'Instances', StackId='id'),
+    describe_layers=aws_list_operation('describe_layers', 'layers', 'Layers', StackId='id'),
+    describe_raid_arrays=aws_list_operation('describe_raid_arrays', 'raid_arrays', 'RaidArrays', StackId='id'),
+    describe_rds_db_instances=aws_list_operation('describe_rds_db_instances', 'rds_db_instances', 'RdsDbInstances', StackId='id'),
+    describe_stacks=aws_list_operation('describe_stacks', 'stacks', 'Stacks'),
+)
 
-def _opsworks(client, module):
-    try:
-        if module.params['describe_apps']:
-            if client.can_paginate('describe_apps'):
-                paginator = client.get_paginator('describe_apps')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_apps(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_deployments']:
-            if client.can_paginate('describe_deployments'):
-                paginator = client.get_paginator('describe_deployments')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_deployments(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_ecs_clusters']:
-            if client.can_paginate('describe_ecs_clusters'):
-                paginator = client.get_paginator('describe_ecs_clusters')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_ecs_clusters(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_elastic_ips']:
-            if client.can_paginate('describe_elastic_ips'):
-                paginator = client.get_paginator('describe_elastic_ips')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_elastic_ips(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_elastic_load_balancers']:
-            if client.can_paginate('describe_elastic_load_balancers'):
-                paginator = client.get_paginator('describe_elastic_load_balancers')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_elastic_load_balancers(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_instances']:
-            if client.can_paginate('describe_instances'):
-                paginator = client.get_paginator('describe_instances')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_instances(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_layers']:
-            if client.can_paginate('describe_layers'):
-                paginator = client.get_paginator('describe_layers')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_layers(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_raid_arrays']:
-            if client.can_paginate('describe_raid_arrays'):
-                paginator = client.get_paginator('describe_raid_arrays')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_raid_arrays(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_rds_db_instances']:
-            if client.can_paginate('describe_rds_db_instances'):
-                paginator = client.get_paginator('describe_rds_db_instances')
-                return paginator.paginate(
-                    StackId=module.params['id']
-                ), True
-            else:
-                return client.describe_rds_db_instances(
-                    StackId=module.params['id']
-                ), False
-        elif module.params['describe_stacks']:
-            if client.can_paginate('describe_stacks'):
-                paginator = client.get_paginator('describe_stacks')
-                return paginator.paginate(), True
-            else:
-                return client.describe_stacks(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon OpsWorks details')
+
+def _opsworks_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _OPSWORKS_OPERATIONS,
+        error_msg='Failed to fetch Amazon OpsWorks details',
+    )
 
 
 def main():
@@ -303,8 +221,9 @@ def main():
         describe_rds_db_instances=dict(required=False, type=bool),
         describe_stacks=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_apps', True, ['id']),
@@ -333,31 +252,7 @@ def main():
         ],
     )
 
-    client = module.client('opsworks', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _opsworks(client, module)
-
-    if module.params['describe_apps']:
-        module.exit_json(apps=aws_response_list_parser(paginate, it, 'Apps'))
-    elif module.params['describe_deployments']:
-        module.exit_json(deployments=aws_response_list_parser(paginate, it, 'Deployments'))
-    elif module.params['describe_ecs_clusters']:
-        module.exit_json(ecs_clusters=aws_response_list_parser(paginate, it, 'EcsClusters'))
-    elif module.params['describe_elastic_ips']:
-        module.exit_json(elastic_ips=aws_response_list_parser(paginate, it, 'ElasticIps'))
-    elif module.params['describe_elastic_load_balancers']:
-        module.exit_json(elastic_load_balancers=aws_response_list_parser(paginate, it, 'ElasticLoadBalancers'))
-    elif module.params['describe_instances']:
-        module.exit_json(instances=aws_response_list_parser(paginate, it, 'Instances'))
-    elif module.params['describe_layers']:
-        module.exit_json(layers=aws_response_list_parser(paginate, it, 'Layers'))
-    elif module.params['describe_raid_arrays']:
-        module.exit_json(raid_arrays=aws_response_list_parser(paginate, it, 'RaidArrays'))
-    elif module.params['describe_rds_db_instances']:
-        module.exit_json(rds_db_instances=aws_response_list_parser(paginate, it, 'RdsDbInstances'))
-    elif module.params['describe_stacks']:
-        module.exit_json(stacks=aws_response_list_parser(paginate, it, 'Stacks'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'opsworks', _opsworks_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -69,40 +70,28 @@ servers:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _opsworkscm(client, module):
-    try:
-        if module.params['describe_account_attributes']:
-            if client.can_paginate('describe_account_attributes'):
-                paginator = client.get_paginator('describe_account_attributes')
-                return paginator.paginate(), True
-            else:
-                return client.describe_account_attributes(), False
-        elif module.params['describe_backups']:
-            if client.can_paginate('describe_backups'):
-                paginator = client.get_paginator('describe_backups')
-                return paginator.paginate(), True
-            else:
-                return client.describe_backups(), False
-        elif module.params['describe_servers']:
-            if client.can_paginate('describe_servers'):
-                paginator = client.get_paginator('describe_servers')
-                return paginator.paginate(), True
-            else:
-                return client.describe_servers(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS OpsWorks CM (OpsWorksCM) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_OPSWORKSCM_OPERATIONS = dict(
+    describe_account_attributes=aws_list_operation('describe_account_attributes', 'account_attributes', 'Attributes'),
+    describe_backups=aws_list_operation('describe_backups', 'backups', 'Backups'),
+    describe_servers=aws_list_operation('describe_servers', 'servers', 'Servers'),
+)
+
+
+def _opsworkscm_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _OPSWORKSCM_OPERATIONS,
+        error_msg='Failed to fetch AWS OpsWorks CM (OpsWorksCM) details',
+    )
 
 
 def main():
@@ -112,8 +101,9 @@ def main():
         describe_backups=dict(required=False, type=bool),
         describe_servers=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -125,17 +115,7 @@ def main():
         ],
     )
 
-    client = module.client('opsworkscm', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _opsworkscm(client, module)
-
-    if module.params['describe_account_attributes']:
-        module.exit_json(account_attributes=aws_response_list_parser(paginate, it, 'Attributes'))
-    elif module.params['describe_backups']:
-        module.exit_json(backups=aws_response_list_parser(paginate, it, 'Backups'))
-    elif module.params['describe_servers']:
-        module.exit_json(servers=aws_response_list_parser(paginate, it, 'Servers'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'opsworkscm', _opsworkscm_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
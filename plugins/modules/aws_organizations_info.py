@@ -61,6 +61,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -128,68 +129,41 @@ roots:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _organizations(client, module):
-    try:
-        if module.params['list_accounts']:
-            if client.can_paginate('list_accounts'):
-                paginator = client.get_paginator('list_accounts')
-                return paginator.paginate(), True
-            else:
-                return client.list_accounts(), False
-        elif module.params['list_aws_service_access_for_organization']:
-            if client.can_paginate('list_aws_service_access_for_organization'):
-                paginator = client.get_paginator('list_aws_service_access_for_organization')
-                return paginator.paginate(), True
-            else:
-                return client.list_aws_service_access_for_organization(), False
-        elif module.params['list_delegated_administrators']:
-            if client.can_paginate('list_delegated_administrators'):
-                paginator = client.get_paginator('list_delegated_administrators')
-                return paginator.paginate(), True
-            else:
-                return client.list_delegated_administrators(), False
-        elif module.params['list_delegated_services_for_account']:
-            if client.can_paginate('list_delegated_services_for_account'):
-                paginator = client.get_paginator('list_delegated_services_for_account')
-                return paginator.paginate(
-                    AccountId=module.params['id']
-                ), True
-            else:
-                return client.list_delegated_services_for_account(
-                    AccountId=module.params['id']
-                ), False
-        elif module.params['list_handshakes_for_account']:
-            if client.can_paginate('list_handshakes_for_account'):
-                paginator = client.get_paginator('list_handshakes_for_account')
-                return paginator.paginate(), True
-            else:
-                return client.list_handshakes_for_account(), False
-        elif module.params['list_handshakes_for_organization']:
-            if client.can_paginate('list_handshakes_for_organization'):
-                paginator = client.get_paginator('list_handshakes_for_organization')
-                return paginator.paginate(), True
-            else:
-                return client.list_handshakes_for_organization(), False
-        elif module.params['list_roots']:
-            if client.can_paginate('list_roots'):
-                paginator = client.get_paginator('list_roots')
-                return paginator.paginate(), True
-            else:
-                return client.list_roots(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Organizations details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ORGANIZATIONS_OPERATIONS = dict(
+    list_accounts=aws_list_operation('list_accounts', 'accounts', 'Accounts'),
+    list_aws_service_access_for_organization=aws_list_operation(
+        'list_aws_service_access_for_organization',
+        'aws_service_access_for_organization',
+        'EnabledServicePrincipals',
+    ),
+    list_delegated_administrators=aws_list_operation('list_delegated_administrators', 'delegated_administrators', 'DelegatedAdministrators'),
+    list_delegated_services_for_account=aws_list_operation(
+        'list_delegated_services_for_account',
+        'delegated_services_for_account',
+        'DelegatedServices',
+        AccountId='id',
+    ),
+    list_handshakes_for_account=aws_list_operation('list_handshakes_for_account', 'handshakes_for_account', 'Handshakes'),
+    list_handshakes_for_organization=aws_list_operation('list_handshakes_for_organization', 'handshakes_for_organization', 'Handshakes'),
+    list_roots=aws_list_operation('list_roots', 'roots', 'Roots'),
+)
+
+
+def _organizations_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ORGANIZATIONS_OPERATIONS,
+        error_msg='Failed to fetch Amazon Organizations details',
+    )
 
 
 def main():
@@ -203,8 +177,9 @@ def main():
         list_handshakes_for_organization=dict(required=False, type=bool),
         list_roots=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_delegated_services_for_account', True, ['id']),
@@ -222,25 +197,7 @@ def main():
         ],
     )
 
-    client = module.client('organizations', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _organizations(client, module)
-
-    if module.params['list_accounts']:
-        module.exit_json(accounts=aws_response_list_parser(paginate, it, 'Accounts'))
-    elif module.params['list_aws_service_access_for_organization']:
-        module.exit_json(aws_service_access_for_organization=aws_response_list_parser(paginate, it, 'EnabledServicePrincipals'))
-    elif module.params['list_delegated_administrators']:
-        module.exit_json(delegated_administrators=aws_response_list_parser(paginate, it, 'DelegatedAdministrators'))
-    elif module.params['list_delegated_services_for_account']:
-        module.exit_json(delegated_services_for_account=aws_response_list_parser(paginate, it, 'DelegatedServices'))
-    elif module.params['list_handshakes_for_account']:
-        module.exit_json(handshakes_for_account=aws_response_list_parser(paginate, it, 'Handshakes'))
-    elif module.params['list_handshakes_for_organization']:
-        module.exit_json(handshakes_for_organization=aws_response_list_parser(paginate, it, 'Handshakes'))
-    elif module.params['list_roots']:
-        module.exit_json(roots=aws_response_list_parser(paginate, it, 'Roots'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'organizations', _organizations_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
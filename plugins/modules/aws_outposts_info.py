@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -56,34 +57,27 @@ sites:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _outposts(client, module):
-    try:
-        if module.params['list_outposts']:
-            if client.can_paginate('list_outposts'):
-                paginator = client.get_paginator('list_outposts')
-                return paginator.paginate(), True
-            else:
-                return client.list_outposts(), False
-        elif module.params['list_sites']:
-            if client.can_paginate('list_sites'):
-                paginator = client.get_paginator('list_sites')
-                return paginator.paginate(), True
-            else:
-                return client.list_sites(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon outposts details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_OUTPOSTS_OPERATIONS = dict(
+    list_outposts=aws_list_operation('list_outposts', 'outposts', 'Outposts'),
+    list_sites=aws_list_operation('list_sites', 'sites', 'Sites'),
+)
+
+
+def _outposts_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _OUTPOSTS_OPERATIONS,
+        error_msg='Failed to fetch Amazon outposts details',
+    )
 
 
 def main():
@@ -91,8 +85,9 @@ def main():
         list_outposts=dict(required=False, type=bool),
         list_sites=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -103,15 +98,7 @@ def main():
         ],
     )
 
-    client = module.client('outposts', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _outposts(client, module)
-
-    if module.params['list_outposts']:
-        module.exit_json(outposts=aws_response_list_parser(paginate, it, 'Outposts'))
-    elif module.params['list_sites']:
-        module.exit_json(sites=aws_response_list_parser(paginate, it, 'Sites'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'outposts', _outposts_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -59,6 +59,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -122,78 +123,31 @@ solutions:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _personalize(client, module):
-    try:
-        if module.params['list_batch_inference_jobs']:
-            if client.can_paginate('list_batch_inference_jobs'):
-                paginator = client.get_paginator('list_batch_inference_jobs')
-                return paginator.paginate(
-                    solutionVersionArn=module.params['arn']
-                ), True
-            else:
-                return client.list_batch_inference_jobs(
-                    solutionVersionArn=module.params['arn']
-                ), False
-        elif module.params['list_campaigns']:
-            if client.can_paginate('list_campaigns'):
-                paginator = client.get_paginator('list_campaigns')
-                return paginator.paginate(
-                    solutionArn=module.params['arn']
-                ), True
-            else:
-                return client.list_campaigns(
-                    solutionArn=module.params['arn']
-                ), False
-        elif module.params['list_dataset_groups']:
-            if client.can_paginate('list_dataset_groups'):
-                paginator = client.get_paginator('list_dataset_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_dataset_groups(), False
-        elif module.params['list_dataset_import_jobs']:
-            if client.can_paginate('list_dataset_import_jobs'):
-                paginator = client.get_paginator('list_dataset_import_jobs')
-                return paginator.paginate(
-                    datasetArn=module.params['arn']
-                ), True
-            else:
-                return client.list_dataset_import_jobs(
-                    datasetArn=module.params['arn']
-                ), False
-        elif module.params['list_datasets']:
-            if client.can_paginate('list_datasets'):
-                paginator = client.get_paginator('list_datasets')
-                return paginator.paginate(
-                    datasetGroupArn=module.params['arn']
-                ), True
-            else:
-                return client.list_datasets(
-                    datasetGroupArn=module.params['arn']
-                ), False
-        elif module.params['list_solutions']:
-            if client.can_paginate('list_solutions'):
-                paginator = client.get_paginator('list_solutions')
-                return paginator.paginate(
-                    datasetGroupArn=module.params['arn']
-                ), True
-            else:
-                return client.list_solutions(
-                    datasetGroupArn=module.params['arn']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Personalize details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_PERSONALIZE_OPERATIONS = dict(
+    list_batch_inference_jobs=aws_list_operation('list_batch_inference_jobs', 'batch_inference_jobs', 'batchInferenceJobs', solutionVersionArn='arn'),
+    list_campaigns=aws_list_operation('list_campaigns', 'campaigns', 'campaigns', solutionArn='arn'),
+    list_dataset_groups=aws_list_operation('list_dataset_groups', 'dataset_groups', 'datasetGroups'),
+    list_dataset_import_jobs=aws_list_operation('list_dataset_import_jobs', 'dataset_import_jobs', 'datasetImportJobs', datasetArn='arn'),
+    list_datasets=aws_list_operation('list_datasets', 'datasets', 'datasets', datasetGroupArn='arn'),
+    list_solutions=aws_list_operation('list_solutions', 'solutions', 'solutions', datasetGroupArn='arn'),
+)
+
+
+def _personalize_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _PERSONALIZE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Personalize details',
+    )
 
 
 def main():
@@ -209,8 +163,9 @@ def main():
         list_datasets=dict(required=False, type=bool),
         list_solutions=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_batch_inference_jobs', True, ['arn']),
@@ -231,23 +186,7 @@ def main():
         ],
     )
 
-    client = module.client('personalize', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _personalize(client, module)
-
-    if module.params['list_batch_inference_jobs']:
-        module.exit_json(batch_inference_jobs=aws_response_list_parser(paginate, it, 'batchInferenceJobs'))
-    elif module.params['list_campaigns']:
-        module.exit_json(campaigns=aws_response_list_parser(paginate, it, 'campaigns'))
-    elif module.params['list_dataset_groups']:
-        module.exit_json(dataset_groups=aws_response_list_parser(paginate, it, 'datasetGroups'))
-    elif module.params['list_dataset_import_jobs']:
-        module.exit_json(dataset_import_jobs=aws_response_list_parser(paginate, it, 'datasetImportJobs'))
-    elif module.params['list_datasets']:
-        module.exit_json(datasets=aws_response_list_parser(paginate, it, 'datasets'))
-    elif module.params['list_solutions']:
-        module.exit_json(solutions=aws_response_list_parser(paginate, it, 'solutions'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'personalize', _personalize_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -69,41 +70,32 @@ deliverability_test_reports:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _pinpoint_email(client, module):
-    try:
-        if module.params['list_configuration_sets']:
-            if client.can_paginate('list_configuration_sets'):
-                if client.can_paginate('list_configuration_sets'):
-                    paginator = client.get_paginator('list_configuration_sets')
-                    return paginator.paginate(), True
-                else:
-                    return client.list_configuration_sets(), False
-        elif module.params['list_dedicated_ip_pools']:
-            if client.can_paginate('list_dedicated_ip_pools'):
-                paginator = client.get_paginator('list_dedicated_ip_pools')
-                return paginator.paginate(), True
-            else:
-                return client.list_dedicated_ip_pools(), False
-        elif module.params['list_deliverability_test_reports']:
-            if client.can_paginate('list_deliverability_test_reports'):
-                paginator = client.get_paginator('list_deliverability_test_reports')
-                return paginator.paginate(), True
-            else:
-                return client.list_deliverability_test_reports(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Pinpoint Email details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_PINPOINT_EMAIL_OPERATIONS = dict(
+    list_configuration_sets=aws_list_operation('list_configuration_sets', 'configuration_sets', 'ConfigurationSets'),
+    list_dedicated_ip_pools=aws_list_operation('list_dedicated_ip_pools', 'dedicated_ip_pools', 'DedicatedIpPools'),
+    list_deliverability_test_reports=aws_list_operation(
+        'list_deliverability_test_reports',
+        'deliverability_test_reports',
+        'DeliverabilityTestReports',
+    ),
+)
+
+
+def _pinpoint_email_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _PINPOINT_EMAIL_OPERATIONS,
+        error_msg='Failed to fetch Amazon Pinpoint Email details',
+    )
 
 
 def main():
@@ -112,8 +104,9 @@ def main():
         list_dedicated_ip_pools=dict(required=False, type=bool),
         list_deliverability_test_reports=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -125,17 +118,7 @@ def main():
         ],
     )
 
-    client = module.client('pinpoint-email', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _pinpoint_email(client, module)
-
-    if module.params['list_configuration_sets']:
-        module.exit_json(configuration_sets=aws_response_list_parser(paginate, it, 'ConfigurationSets'))
-    elif module.params['list_dedicated_ip_pools']:
-        module.exit_json(dedicated_ip_pools=aws_response_list_parser(paginate, it, 'DedicatedIpPools'))
-    elif module.params['list_deliverability_test_reports']:
-        module.exit_json(deliverability_test_reports=aws_response_list_parser(paginate, it, 'DeliverabilityTestReports'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'pinpoint-email', _pinpoint_email_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
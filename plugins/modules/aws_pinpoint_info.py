@@ -66,6 +66,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -147,75 +148,34 @@ import_jobs:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_nested_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _pinpoint(client, module):
-    try:
-        if module.params['get_adm_channel']:
-            return client.get_adm_channel(
-                ApplicationId=module.params['id']
-            ), False
-        elif module.params['get_apns_channel']:
-            return client.get_apns_channel(
-                ApplicationId=module.params['id']
-            ), False
-        elif module.params['get_application_settings']:
-            return client.get_application_settings(
-                ApplicationId=module.params['id']
-            ), False
-        elif module.params['get_apps']:
-            if client.can_paginate('get_apps'):
-                paginator = client.get_paginator('get_apps')
-                return paginator.paginate(), True
-            else:
-                return client.get_apps(), False
-        elif module.params['get_baidu_channel']:
-            return client.get_baidu_channel(
-                ApplicationId=module.params['id']
-            ), False
-        elif module.params['get_campaigns']:
-            if client.can_paginate('get_campaigns'):
-                paginator = client.get_paginator('get_campaigns')
-                return paginator.paginate(
-                    ApplicationId=module.params['id']
-                ), True
-            else:
-                return client.get_campaigns(
-                    ApplicationId=module.params['id']
-                ), False
-        elif module.params['get_export_jobs']:
-            if client.can_paginate('get_export_jobs'):
-                paginator = client.get_paginator('get_export_jobs')
-                return paginator.paginate(
-                    ApplicationId=module.params['id']
-                ), True
-            else:
-                return client.get_export_jobs(
-                    ApplicationId=module.params['id']
-                ), False
-        elif module.params['get_import_jobs']:
-            if client.can_paginate('get_import_jobs'):
-                paginator = client.get_paginator('get_import_jobs')
-                return paginator.paginate(
-                    ApplicationId=module.params['id']
-                ), True
-            else:
-                return client.get_import_jobs(
-                    ApplicationId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Pinpoint details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_nested_list_operation
+
+
+_PINPOINT_OPERATIONS = dict(
+    get_adm_channel=aws_dict_operation('get_adm_channel', 'adm_channel', 'ADMChannelResponse', ApplicationId='id'),
+    get_apns_channel=aws_dict_operation('get_apns_channel', 'apns_channel', 'APNSChannelResponse', ApplicationId='id'),
+    get_application_settings=aws_dict_operation('get_application_settings', 'application_settings', ApplicationId='id'),
+    get_apps=aws_nested_list_operation('get_apps', 'apps', 'ApplicationsResponse', 'Item'),
+    get_baidu_channel=aws_dict_operation('get_baidu_channel', 'baidu_channel', 'BaiduChannelResponse', ApplicationId='id'),
+    get_campaigns=aws_nested_list_operation('get_campaigns', 'campaigns', 'CampaignsResponse', 'Item', ApplicationId='id'),
+    get_export_jobs=aws_nested_list_operation('get_export_jobs', 'export_jobs', 'ExportJobsResponse', 'Item', ApplicationId='id'),
+    get_import_jobs=aws_nested_list_operation('get_import_jobs', 'import_jobs', 'ImportJobsResponse', 'Item', ApplicationId='id'),
+)
+
+
+def _pinpoint_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _PINPOINT_OPERATIONS,
+        error_msg='Failed to fetch Amazon Pinpoint details',
+    )
 
 
 def main():
@@ -230,8 +190,9 @@ def main():
         get_export_jobs=dict(required=False, type=bool),
         get_import_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_adm_channel', True, ['id']),
@@ -256,27 +217,7 @@ def main():
         ],
     )
 
-    client = module.client('pinpoint', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _pinpoint(client, module)
-
-    if module.params['get_adm_channel']:
-        module.exit_json(adm_channel=camel_dict_to_snake_dict(it['ADMChannelResponse']))
-    elif module.params['get_apns_channel']:
-        module.exit_json(apns_channel=camel_dict_to_snake_dict(it['APNSChannelResponse']))
-    elif module.params['get_application_settings']:
-        module.exit_json(application_settings=camel_dict_to_snake_dict(it))
-    elif module.params['get_apps']:
-        module.exit_json(apps=aws_response_nested_list_parser(paginate, it, 'ApplicationsResponse', 'Item'))
-    elif module.params['get_baidu_channel']:
-        module.exit_json(baidu_channel=camel_dict_to_snake_dict(it['BaiduChannelResponse']))
-    elif module.params['get_campaigns']:
-        module.exit_json(campaigns=aws_response_nested_list_parser(paginate, it, 'CampaignsResponse', 'Item'))
-    elif module.params['get_export_jobs']:
-        module.exit_json(export_jobs=aws_response_nested_list_parser(paginate, it, 'ExportJobsResponse', 'Item'))
-    elif module.params['get_import_jobs']:
-        module.exit_json(import_jobs=aws_response_nested_list_parser(paginate, it, 'ImportJobsResponse', 'Item'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'pinpoint', _pinpoint_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
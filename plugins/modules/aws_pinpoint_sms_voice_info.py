@@ -31,6 +31,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -50,32 +51,31 @@ configuration_set_event_destinations:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _sms_voice(client, module):
-    try:
-        if module.params['get_configuration_set_event_destinations']:
-            if client.can_paginate('get_configuration_set_event_destinations'):
-                paginator = client.get_paginator('get_configuration_set_event_destinations')
-                return paginator.paginate(
-                    ConfigurationSetName=module.params['name']
-                ), True
-            else:
-                return client.get_configuration_set_event_destinations(
-                    ConfigurationSetName=module.params['name']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS PinPoint Sms Voice details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SMS_VOICE_OPERATIONS = dict(
+    get_configuration_set_event_destinations=aws_list_operation(
+        'get_configuration_set_event_destinations',
+        'configuration_set_event_destinations',
+        'EventDestinations',
+        ConfigurationSetName='name',
+    ),
+)
+
+
+def _sms_voice_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SMS_VOICE_OPERATIONS,
+        error_msg='Failed to fetch AWS PinPoint Sms Voice details',
+    )
 
 
 def main():
@@ -83,8 +83,9 @@ def main():
         name=dict(required=False, aliases=['configuration_set_name']),
         get_configuration_set_event_destinations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_configuration_set_event_destinations', True, ['name']),
@@ -92,13 +93,7 @@ def main():
         mutually_exclusive=[],
     )
 
-    client = module.client('pinpoint-sms-voice', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _sms_voice(client, module)
-
-    if module.params['get_configuration_set_event_destinations']:
-        module.exit_json(configuration_set_event_destinations=aws_response_list_parser(paginate, it, 'EventDestinations'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'pinpoint-sms-voice', _sms_voice_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
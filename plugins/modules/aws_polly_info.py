@@ -37,6 +37,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -64,38 +65,27 @@ speech_synthesis_tasks:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _polly(client, module):
-    try:
-        if module.params['list_lexicons']:
-            if client.can_paginate('list_lexicons'):
-                paginator = client.get_paginator('list_lexicons')
-                return paginator.paginate(), True
-            else:
-                return client.list_lexicons(), False
-        elif module.params['list_speech_synthesis_tasks']:
-            if client.can_paginate('list_speech_synthesis_tasks'):
-                paginator = client.get_paginator('list_speech_synthesis_tasks')
-                return paginator.paginate(
-                    Status=module.params['status']
-                ), True
-            else:
-                return client.list_speech_synthesis_tasks(
-                    Status=module.params['status']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Polly details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_POLLY_OPERATIONS = dict(
+    list_lexicons=aws_list_operation('list_lexicons', 'lexicons', 'Lexicons'),
+    list_speech_synthesis_tasks=aws_list_operation('list_speech_synthesis_tasks', 'speech_synthesis_tasks', 'SynthesisTasks', Status='status'),
+)
+
+
+def _polly_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _POLLY_OPERATIONS,
+        error_msg='Failed to fetch Amazon Polly details',
+    )
 
 
 def main():
@@ -108,8 +98,9 @@ def main():
         list_lexicons=dict(required=False, type=bool),
         list_speech_synthesis_tasks=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -120,15 +111,7 @@ def main():
         ],
     )
 
-    client = module.client('polly', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _polly(client, module)
-
-    if module.params['list_lexicons']:
-        module.exit_json(lexicons=aws_response_list_parser(paginate, it, 'Lexicons'))
-    elif module.params['list_speech_synthesis_tasks']:
-        module.exit_json(speech_synthesis_tasks=aws_response_list_parser(paginate, it, 'SynthesisTasks'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'polly', _polly_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -90,54 +91,39 @@ journal_kinesis_streams_for_ledger:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _qldb(client, module):
-    try:
-        if module.params['list_ledgers']:
-            if client.can_paginate('list_ledgers'):
-                paginator = client.get_paginator('list_ledgers')
-                return paginator.paginate(), True
-            else:
-                return client.list_ledgers(), False
-        elif module.params['list_journal_s3_exports_for_ledger']:
-            if client.can_paginate('list_journal_s3_exports_for_ledger'):
-                paginator = client.get_paginator('list_journal_s3_exports_for_ledger')
-                return paginator.paginate(
-                    Name=module.params['name']
-                ), True
-            else:
-                return client.list_journal_s3_exports_for_ledger(
-                    Name=module.params['name']
-                ), False
-        elif module.params['list_journal_s3_exports']:
-            if client.can_paginate('list_journal_s3_exports'):
-                paginator = client.get_paginator('list_journal_s3_exports')
-                return paginator.paginate(), True
-            else:
-                return client.list_journal_s3_exports(), False
-        elif module.params['list_journal_kinesis_streams_for_ledger']:
-            if client.can_paginate('list_journal_kinesis_streams_for_ledger'):
-                paginator = client.get_paginator('list_journal_kinesis_streams_for_ledger')
-                return paginator.paginate(
-                    Name=module.params['name']
-                ), True
-            else:
-                return client.list_journal_kinesis_streams_for_ledger(
-                    Name=module.params['name']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon qldb details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_QLDB_OPERATIONS = dict(
+    list_ledgers=aws_list_operation('list_ledgers', 'ledgers', 'Ledgers'),
+    list_journal_s3_exports_for_ledger=aws_list_operation(
+        'list_journal_s3_exports_for_ledger',
+        'journal_s3_exports_for_ledger',
+        'JournalS3Exports',
+        Name='name',
+    ),
+    list_journal_s3_exports=aws_list_operation('list_journal_s3_exports', 'journal_s3_exports', 'JournalS3Exports'),
+    list_journal_kinesis_streams_for_ledger=aws_list_operation(
+        'list_journal_kinesis_streams_for_ledger',
+        'journal_kinesis_streams_for_ledger',
+        'Streams',
+        Name='name',
+    ),
+)
+
+
+def _qldb_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _QLDB_OPERATIONS,
+        error_msg='Failed to fetch Amazon qldb details',
+    )
 
 
 def main():
@@ -151,8 +137,9 @@ def main():
         list_journal_s3_exports=dict(required=False, type=bool),
         list_journal_kinesis_streams_for_ledger=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_journal_s3_exports_for_ledger', True, ['name']),
@@ -168,19 +155,7 @@ def main():
         ],
     )
 
-    client = module.client('qldb', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _qldb(client, module)
-
-    if module.params['list_ledgers']:
-        module.exit_json(ledgers=aws_response_list_parser(paginate, it, 'Ledgers'))
-    elif module.params['list_journal_s3_exports_for_ledger']:
-        module.exit_json(journal_s3_exports_for_ledger=aws_response_list_parser(paginate, it, 'JournalS3Exports'))
-    elif module.params['list_journal_s3_exports']:
-        module.exit_json(journal_s3_exports=aws_response_list_parser(paginate, it, 'JournalS3Exports'))
-    elif module.params['list_journal_kinesis_streams_for_ledger']:
-        module.exit_json(journal_kinesis_streams_for_ledger=aws_response_list_parser(paginate, it, 'Streams'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'qldb', _qldb_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -64,6 +64,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -126,74 +127,36 @@ resources:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _ram(client, module):
-    try:
-        if module.params['list_pending_invitation_resources']:
-            if client.can_paginate('list_pending_invitation_resources'):
-                paginator = client.get_paginator('list_pending_invitation_resources')
-                return paginator.paginate(
-                    resourceShareInvitationArn=module.params['arn']
-                ), True
-            else:
-                return client.list_pending_invitation_resources(
-                    resourceShareInvitationArn=module.params['arn']
-                ), False
-        elif module.params['list_permissions']:
-            if client.can_paginate('list_permissions'):
-                paginator = client.get_paginator('list_permissions')
-                return paginator.paginate(), True
-            else:
-                return client.list_permissions(), False
-        elif module.params['list_principals']:
-            if client.can_paginate('list_principals'):
-                paginator = client.get_paginator('list_principals')
-                return paginator.paginate(
-                    resourceOwner=module.params['resource_owner']
-                ), True
-            else:
-                return client.list_principals(
-                    resourceOwner=module.params['resource_owner']
-                ), False
-        elif module.params['list_resource_share_permissions']:
-            if client.can_paginate('list_resource_share_permissions'):
-                paginator = client.get_paginator('list_resource_share_permissions')
-                return paginator.paginate(
-                    resourceShareArn=module.params['arn']
-                ), True
-            else:
-                return client.list_resource_share_permissions(
-                    resourceShareArn=module.params['arn']
-                ), False
-        elif module.params['list_resource_types']:
-            if client.can_paginate('list_resource_types'):
-                paginator = client.get_paginator('list_resource_types')
-                return paginator.paginate(), True
-            else:
-                return client.list_resource_types(), False
-        elif module.params['list_resources']:
-            if client.can_paginate('list_resources'):
-                paginator = client.get_paginator('list_resources')
-                return paginator.paginate(
-                    resourceOwner=module.params['resource_owner']
-                ), True
-            else:
-                return client.list_resources(
-                    resourceOwner=module.params['resource_owner']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon RAM details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_RAM_OPERATIONS = dict(
+    list_pending_invitation_resources=aws_list_operation(
+        'list_pending_invitation_resources',
+        'pending_invitation_resources',
+        'resources',
+        resourceShareInvitationArn='arn',
+    ),
+    list_permissions=aws_list_operation('list_permissions', 'permissions', 'permissions'),
+    list_principals=aws_list_operation('list_principals', 'principals', 'principals', resourceOwner='resource_owner'),
+    list_resource_share_permissions=aws_list_operation('list_resource_share_permissions', 'resource_share_permissions', 'permissions', resourceShareArn='arn'),
+    list_resource_types=aws_list_operation('list_resource_types', 'resource_types', 'resourceTypes'),
+    list_resources=aws_list_operation('list_resources', 'resources', 'resources', resourceOwner='resource_owner'),
+)
+
+
+def _ram_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _RAM_OPERATIONS,
+        error_msg='Failed to fetch Amazon RAM details',
+    )
 
 
 def main():
@@ -210,8 +173,9 @@ def main():
         list_resource_types=dict(required=False, type=bool),
         list_resources=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_pending_invitation_resources', True, ['arn']),
@@ -229,23 +193,7 @@ def main():
         ],
     )
 
-    client = module.client('ram', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ram(client, module)
-
-    if module.params['list_pending_invitation_resources']:
-        module.exit_json(pending_invitation_resources=aws_response_list_parser(paginate, it, 'resources'))
-    elif module.params['list_permissions']:
-        module.exit_json(permissions=aws_response_list_parser(paginate, it, 'permissions'))
-    elif module.params['list_principals']:
-        module.exit_json(principals=aws_response_list_parser(paginate, it, 'principals'))
-    elif module.params['list_resource_share_permissions']:
-        module.exit_json(resource_share_permissions=aws_response_list_parser(paginate, it, 'permissions'))
-    elif module.params['list_resource_types']:
-        module.exit_json(resource_types=aws_response_list_parser(paginate, it, 'resourceTypes'))
-    elif module.params['list_resources']:
-        module.exit_json(resources=aws_response_list_parser(paginate, it, 'resources'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'ram', _ram_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
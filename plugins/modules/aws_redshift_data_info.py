@@ -59,11 +59,51 @@ options:
       - do you want to get tables for given I(id), database I(name), and I(database_user)??
     required: false
     type: bool
+  secret_arn:
+    description:
+      - arn of secret with database credentials, used instead of I(database_user).
+    required: false
+    type: str
+  workgroup_name:
+    description:
+      - name of redshift serverless workgroup, used instead of cluster I(id).
+    required: false
+    type: str
+  sql:
+    description:
+      - sql statements run by I(execute_statement) or I(batch_execute_statement) in I(database).
+    required: false
+    type: list
+    elements: str
+  execute_statement:
+    description:
+      - do you want to run every statement of I(sql) on its own and fetch their results?
+      - up to I(max_concurrent_statements) statements run at same time, their status is polled with backoff.
+    required: false
+    type: bool
+  batch_execute_statement:
+    description:
+      - do you want to run all statements of I(sql) in one transaction and fetch their results?
+    required: false
+    type: bool
+  max_concurrent_statements:
+    description:
+      - maximum number of I(execute_statement) statements running at same time.
+    required: false
+    type: int
+    default: 10
+  statement_timeout:
+    description:
+      - seconds to wait for all statements to finish, running statements are cancelled after it.
+    required: false
+    type: int
+    default: 900
 author:
   - "Davinder Pal (@116davinder) <dpsangwal@gmail.com>"
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -94,6 +134,28 @@ EXAMPLES = """
     id: 'cluster_id'
     database: 'database_name'
     database_user: 'dpal'
+
+- name: "run small queries side by side"
+  aws_redshift_data_info:
+    execute_statement: true
+    id: 'cluster_id'
+    database: 'database_name'
+    database_user: 'dpal'
+    sql:
+      - 'SELECT count(*) AS users FROM users'
+      - 'SELECT max(created_at) AS last_order FROM orders'
+    max_concurrent_statements: 5
+  register: __r
+
+- name: "run statements in one transaction"
+  aws_redshift_data_info:
+    batch_execute_statement: true
+    workgroup_name: 'default'
+    database: 'dev'
+    secret_arn: 'arn:aws:secretsmanager:eu-central-1:123456789012:secret:redshift-abc'
+    sql:
+      - 'CREATE TEMP TABLE recent AS SELECT * FROM orders WHERE created_at > sysdate - 1'
+      - 'SELECT status, count(*) FROM recent GROUP BY status'
 """
 
 RETURN = """
@@ -113,74 +175,185 @@ tables:
   description: list of tables.
   returned: when `list_tables` is defined and success.
   type: list
+executed_statements:
+  description: finished statements in order of I(sql), sub statements of I(batch_execute_statement).
+  returned: when `execute_statement` or `batch_execute_statement` is defined and success.
+  type: list
+  sample: [
+    {
+        'id': 'd9b6c0c9-0747-4bf4-b142-e8883122f766',
+        'query_string': 'SELECT count(*) AS users FROM users',
+        'status': 'FINISHED',
+        'duration': 12345678,
+        'has_result_set': true,
+        'result_rows': 1
+    }
+  ]
+statement_results:
+  description:
+    - values of every result column by statement id and column name, only for statements with result set.
+    - with I(dest) rows of all statements are written one after another as json objects, I(result_rows) tells which belong to which statement.
+  returned: when `execute_statement` or `batch_execute_statement` is defined and success.
+  type: dict
+  sample: {
+    'd9b6c0c9-0747-4bf4-b142-e8883122f766': {
+        'users': [1024]
+    }
+  }
 """
 
+import base64
+import time
+
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_fail_usage
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry_params
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_query_results import aws_query_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_pagination_config
+
+
+_REDSHIFT_DATA_OPERATIONS = dict(
+    list_databases=aws_list_operation('list_databases', 'databases', 'Databases', ClusterIdentifier='id', DbUser='database_user'),
+    list_schemas=aws_list_operation('list_schemas', 'schemas', 'Schemas', ClusterIdentifier='id', Database='database', DbUser='database_user'),
+    list_statements=aws_list_operation('list_statements', 'statements', 'Statements', Status='status'),
+    list_tables=aws_list_operation('list_tables', 'tables', 'Tables', ClusterIdentifier='id', Database='database', DbUser='database_user'),
+)
+
 
+_STATEMENT_POLL_INTERVAL = 0.25
+_STATEMENT_POLL_INTERVAL_MAX = 5.0
+_STATEMENT_RUNNING = ('SUBMITTED', 'PICKED', 'STARTED')
+
+
+def _statement_params(module) -> dict:
+    options = (
+        ('ClusterIdentifier', 'id'),
+        ('WorkgroupName', 'workgroup_name'),
+        ('Database', 'database'),
+        ('DbUser', 'database_user'),
+        ('SecretArn', 'secret_arn'),
+    )
+    return dict((k, module.params[v]) for k, v in options if module.params[v])
 
-def _redshift_data(client, module):
+
+def _run_statements(client, module) -> list:
+    # start statements up to concurrency limit and poll running ones, batch is single statement with sub statements.
+    params = _statement_params(module)
+    if module.params['batch_execute_statement']:
+        pending = [dict(params, Sqls=module.params['sql'])]
+        limit = 1
+    else:
+        pending = [dict(params, Sql=sql) for sql in module.params['sql']]
+        limit = module.params['max_concurrent_statements']
+    started = []
+    running = set()
+    finished = {}
+    deadline = time.monotonic() + module.params['statement_timeout']
+    interval = _STATEMENT_POLL_INTERVAL
     try:
-        if module.params['list_databases']:
-            if client.can_paginate('list_databases'):
-                paginator = client.get_paginator('list_databases')
-                return paginator.paginate(
-                    ClusterIdentifier=module.params['id'],
-                    DbUser=module.params['database_user']
-                ), True
-            else:
-                return client.list_databases(
-                    ClusterIdentifier=module.params['id'],
-                    DbUser=module.params['database_user']
-                ), False
-        elif module.params['list_schemas']:
-            if client.can_paginate('list_schemas'):
-                paginator = client.get_paginator('list_schemas')
-                return paginator.paginate(
-                    ClusterIdentifier=module.params['id'],
-                    Database=module.params['database'],
-                    DbUser=module.params['database_user']
-                ), True
-            else:
-                return client.list_schemas(
-                    ClusterIdentifier=module.params['id'],
-                    Database=module.params['database'],
-                    DbUser=module.params['database_user']
-                ), False
-        elif module.params['list_statements']:
-            if client.can_paginate('list_statements'):
-                paginator = client.get_paginator('list_statements')
-                return paginator.paginate(
-                    Status=module.params['status']
-                ), True
-            else:
-                return client.list_statements(
-                    Status=module.params['status']
-                ), False
-        elif module.params['list_tables']:
-            if client.can_paginate('list_tables'):
-                paginator = client.get_paginator('list_tables')
-                return paginator.paginate(
-                    ClusterIdentifier=module.params['id'],
-                    Database=module.params['database'],
-                    DbUser=module.params['database_user']
-                ), True
-            else:
-                return client.list_tables(
-                    ClusterIdentifier=module.params['id'],
-                    Database=module.params['database'],
-                    DbUser=module.params['database_user']
-                ), False
-        else:
-            return None, False
+        while pending or running:
+            while pending and len(running) < limit:
+                execute = client.batch_execute_statement if 'Sqls' in pending[0] else client.execute_statement
+                statement_id = execute(**pending.pop(0), **aws_info_retry_params(client))['Id']
+                started.append(statement_id)
+                running.add(statement_id)
+
+            if time.monotonic() > deadline:
+                module.fail_json(msg='redshift data statements did not finish in {0} seconds'.format(module.params['statement_timeout']))
+            time.sleep(interval)
+            interval = min(interval * 2, _STATEMENT_POLL_INTERVAL_MAX)
+            for statement_id in list(running):
+                statement = client.describe_statement(Id=statement_id, **aws_info_retry_params(client))
+                if statement['Status'] in _STATEMENT_RUNNING:
+                    continue
+                running.remove(statement_id)
+                if statement['Status'] != 'FINISHED':
+                    module.fail_json(msg='redshift data statement {0} ended with status {1}: {2}'.format(
+                        statement_id, statement['Status'], statement.get('Error')
+                    ))
+                interval = _STATEMENT_POLL_INTERVAL
+                finished[statement_id] = statement
+    finally:
+        # module failed or timed out, don't leave statements running on cluster.
+        for statement_id in running:
+            try:
+                client.cancel_statement(Id=statement_id)
+            except (BotoCoreError, ClientError):
+                pass
+    statements = [finished[statement_id] for statement_id in started]
+    if module.params['batch_execute_statement']:
+        return statements[0].get('SubStatements', [])
+    return statements
+
+
+def _field_value(field: dict):
+    # field has single key named after its type.
+    for key, value in field.items():
+        if key == 'isNull':
+            return None
+        if key == 'blobValue':
+            return base64.b64encode(value).decode('ascii')
+        return value
+    return None
+
+
+def _statement_pages(client, module, statement_id: str):
+    config = aws_pagination_config(module)
+    config.pop('MaxItems', None)
+    names = []
+    for page in client.get_paginator('get_statement_result').paginate(Id=statement_id, PaginationConfig=config):
+        # ColumnMetadata is returned only with first page.
+        if not names:
+            names = [column.get('label') or column['name'] for column in page.get('ColumnMetadata', [])]
+        yield names, [[_field_value(field) for field in record] for record in page.get('Records', [])]
+
+
+def _execute_statement_result(client, module) -> dict:
+    if module.params['max_concurrent_statements'] < 1:
+        aws_info_fail_usage(module, 'max_concurrent_statements must be greater than 0')
+    try:
+        statements = _run_statements(client, module)
+        results = {}
+        for statement in statements:
+            if statement.get('HasResultSet'):
+                results[statement['Id']] = aws_query_result(_statement_pages(client, module, statement['Id']))
     except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Redshift Data API Service details')
+        module.fail_json_aws(e, msg='Failed to run AWS Redshift Data API Service statements')
+    return dict(
+        executed_statements=[
+            dict(
+                id=statement['Id'],
+                query_string=statement.get('QueryString'),
+                status=statement.get('Status'),
+                duration=statement.get('Duration'),
+                has_result_set=statement.get('HasResultSet', False),
+                result_rows=statement.get('ResultRows'),
+            )
+            for statement in statements
+        ],
+        statement_results=results,
+    )
+
+
+def _redshift_data_result(client, module) -> dict:
+    if module.params['execute_statement'] or module.params['batch_execute_statement']:
+        return _execute_statement_result(client, module)
+    return aws_operations_result(
+        client,
+        module,
+        _REDSHIFT_DATA_OPERATIONS,
+        error_msg='Failed to fetch AWS Redshift Data API Service details',
+    )
 
 
 def main():
@@ -193,14 +366,24 @@ def main():
         list_schemas=dict(required=False, type=bool),
         list_statements=dict(required=False, type=bool),
         list_tables=dict(required=False, type=bool),
+        secret_arn=dict(required=False),
+        workgroup_name=dict(required=False),
+        sql=dict(required=False, type='list', elements='str'),
+        execute_statement=dict(required=False, type=bool),
+        batch_execute_statement=dict(required=False, type=bool),
+        max_concurrent_statements=dict(required=False, type=int, default=10),
+        statement_timeout=dict(required=False, type=int, default=900),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_databases', True, ['id', 'database_user']),
             ('list_schemas', True, ['id', 'database', 'database_user']),
             ('list_tables', True, ['id', 'database', 'database_user']),
+            ('execute_statement', True, ['sql', 'database']),
+            ('batch_execute_statement', True, ['sql', 'database']),
         ),
         mutually_exclusive=[
             (
@@ -208,23 +391,14 @@ def main():
                 'list_schemas',
                 'list_statements',
                 'list_tables',
-            )
+                'execute_statement',
+                'batch_execute_statement',
+            ),
+            ('id', 'workgroup_name'),
         ],
     )
 
-    client = module.client('redshift-data', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _redshift_data(client, module)
-
-    if module.params['list_databases']:
-        module.exit_json(databases=aws_response_list_parser(paginate, it, 'Databases'))
-    elif module.params['list_schemas']:
-        module.exit_json(schemas=aws_response_list_parser(paginate, it, 'Schemas'))
-    elif module.params['list_statements']:
-        module.exit_json(statements=aws_response_list_parser(paginate, it, 'Statements'))
-    elif module.params['list_tables']:
-        module.exit_json(tables=aws_response_list_parser(paginate, it, 'Tables'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'redshift-data', _redshift_data_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
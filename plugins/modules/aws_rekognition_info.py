@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -76,44 +77,28 @@ stream_processors:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _rekognition(client, module):
-    try:
-        if module.params['list_collections']:
-            if client.can_paginate('list_collections'):
-                paginator = client.get_paginator('list_collections')
-                return paginator.paginate(), True
-            else:
-                return client.list_collections(), False
-        elif module.params['list_faces']:
-            if client.can_paginate('list_faces'):
-                paginator = client.get_paginator('list_faces')
-                return paginator.paginate(
-                    CollectionId=module.params['id'],
-                ), True
-            else:
-                return client.list_faces(
-                    CollectionId=module.params['id'],
-                ), False
-        elif module.params['list_stream_processors']:
-            if client.can_paginate('list_stream_processors'):
-                paginator = client.get_paginator('list_stream_processors')
-                return paginator.paginate(), True
-            else:
-                return client.list_stream_processors(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Rekognition details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_REKOGNITION_OPERATIONS = dict(
+    list_collections=aws_list_operation('list_collections', 'collections', 'CollectionIds'),
+    list_faces=aws_list_operation('list_faces', 'faces', 'Faces', CollectionId='id'),
+    list_stream_processors=aws_list_operation('list_stream_processors', 'stream_processors', 'StreamProcessors'),
+)
+
+
+def _rekognition_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _REKOGNITION_OPERATIONS,
+        error_msg='Failed to fetch Amazon Rekognition details',
+    )
 
 
 def main():
@@ -123,8 +108,9 @@ def main():
         list_faces=dict(required=False, type=bool),
         list_stream_processors=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_faces', True, ['id']),
@@ -138,17 +124,7 @@ def main():
         ],
     )
 
-    client = module.client('rekognition', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _rekognition(client, module)
-
-    if module.params['list_collections']:
-        module.exit_json(collections=aws_response_list_parser(paginate, it, 'CollectionIds'))
-    elif module.params['list_faces']:
-        module.exit_json(faces=aws_response_list_parser(paginate, it, 'Faces'))
-    elif module.params['list_stream_processors']:
-        module.exit_json(stream_processors=aws_response_list_parser(paginate, it, 'StreamProcessors'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'rekognition', _rekognition_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -36,6 +36,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -63,38 +64,27 @@ group_resources:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _resource_groups(client, module):
-    try:
-        if module.params['list_groups']:
-            if client.can_paginate('list_groups'):
-                paginator = client.get_paginator('list_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_groups(), False
-        elif module.params['list_group_resources']:
-            if client.can_paginate('list_group_resources'):
-                paginator = client.get_paginator('list_group_resources')
-                return paginator.paginate(
-                    Group=module.params['name'],
-                ), True
-            else:
-                return client.list_group_resources(
-                    Group=module.params['name'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Resource Groups details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_RESOURCE_GROUPS_OPERATIONS = dict(
+    list_groups=aws_list_operation('list_groups', 'groups', 'GroupIdentifiers'),
+    list_group_resources=aws_list_operation('list_group_resources', 'group_resources', 'Resources', Group='name'),
+)
+
+
+def _resource_groups_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _RESOURCE_GROUPS_OPERATIONS,
+        error_msg='Failed to fetch AWS Resource Groups details',
+    )
 
 
 def main():
@@ -103,8 +93,9 @@ def main():
         list_groups=dict(required=False, type=bool),
         list_group_resources=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_group_resources', True, ['name']),
@@ -117,15 +108,7 @@ def main():
         ],
     )
 
-    client = module.client('resource-groups', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _resource_groups(client, module)
-
-    if module.params['list_groups']:
-        module.exit_json(groups=aws_response_list_parser(paginate, it, 'GroupIdentifiers'))
-    elif module.params['list_group_resources']:
-        module.exit_json(group_resources=aws_response_list_parser(paginate, it, 'Resources'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'resource-groups', _resource_groups_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
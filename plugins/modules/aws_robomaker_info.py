@@ -50,6 +50,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -108,58 +109,31 @@ worlds:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _robomaker(client, module):
-    try:
-        if module.params['list_deployment_jobs']:
-            if client.can_paginate('list_deployment_jobs'):
-                paginator = client.get_paginator('list_deployment_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_deployment_jobs(), False
-        elif module.params['list_fleets']:
-            if client.can_paginate('list_fleets'):
-                paginator = client.get_paginator('list_fleets')
-                return paginator.paginate(), True
-            else:
-                return client.list_fleets(), False
-        elif module.params['list_robot_applications']:
-            if client.can_paginate('list_robot_applications'):
-                paginator = client.get_paginator('list_robot_applications')
-                return paginator.paginate(), True
-            else:
-                return client.list_robot_applications(), False
-        elif module.params['list_robots']:
-            if client.can_paginate('list_robots'):
-                paginator = client.get_paginator('list_robots')
-                return paginator.paginate(), True
-            else:
-                return client.list_robots(), False
-        elif module.params['list_simulation_jobs']:
-            if client.can_paginate('list_simulation_jobs'):
-                paginator = client.get_paginator('list_simulation_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_simulation_jobs(), False
-        elif module.params['list_worlds']:
-            if client.can_paginate('list_worlds'):
-                paginator = client.get_paginator('list_worlds')
-                return paginator.paginate(), True
-            else:
-                return client.list_worlds(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Robomaker details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ROBOMAKER_OPERATIONS = dict(
+    list_deployment_jobs=aws_list_operation('list_deployment_jobs', 'deployment_jobs', 'deploymentJobs'),
+    list_fleets=aws_list_operation('list_fleets', 'fleets', 'fleetDetails'),
+    list_robot_applications=aws_list_operation('list_robot_applications', 'robot_applications', 'robotApplicationSummaries'),
+    list_robots=aws_list_operation('list_robots', 'robots', 'robots'),
+    list_simulation_jobs=aws_list_operation('list_simulation_jobs', 'simulation_jobs', 'simulationJobSummaries'),
+    list_worlds=aws_list_operation('list_worlds', 'worlds', 'worldSummaries'),
+)
+
+
+def _robomaker_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ROBOMAKER_OPERATIONS,
+        error_msg='Failed to fetch Amazon Robomaker details',
+    )
 
 
 def main():
@@ -171,8 +145,9 @@ def main():
         list_simulation_jobs=dict(required=False, type=bool),
         list_worlds=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -187,23 +162,7 @@ def main():
         ],
     )
 
-    client = module.client('robomaker', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _robomaker(client, module)
-
-    if module.params['list_deployment_jobs']:
-        module.exit_json(deployment_jobs=aws_response_list_parser(paginate, it, 'deploymentJobs'))
-    elif module.params['list_fleets']:
-        module.exit_json(fleets=aws_response_list_parser(paginate, it, 'fleetDetails'))
-    elif module.params['list_robot_applications']:
-        module.exit_json(robot_applications=aws_response_list_parser(paginate, it, 'robotApplicationSummaries'))
-    elif module.params['list_robots']:
-        module.exit_json(robots=aws_response_list_parser(paginate, it, 'robots'))
-    elif module.params['list_simulation_jobs']:
-        module.exit_json(simulation_jobs=aws_response_list_parser(paginate, it, 'simulationJobSummaries'))
-    elif module.params['list_worlds']:
-        module.exit_json(worlds=aws_response_list_parser(paginate, it, 'worldSummaries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'robomaker', _robomaker_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -37,6 +37,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -64,33 +65,28 @@ domain_detail:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _route53domains(client, module):
-    try:
-        if module.params['list_domains']:
-            if client.can_paginate('list_domains'):
-                paginator = client.get_paginator('list_domains')
-                return paginator.paginate(), True
-            else:
-                return client.list_domains(), False
-        elif module.params['get_domain_detail']:
-            return client.get_domain_detail(
-                DomainName=module.params['name']
-            ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Route 53 Domains details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ROUTE53DOMAINS_OPERATIONS = dict(
+    list_domains=aws_list_operation('list_domains', 'domains', 'Domains'),
+    get_domain_detail=aws_dict_operation('get_domain_detail', 'domain_detail', DomainName='name'),
+)
+
+
+def _route53domains_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ROUTE53DOMAINS_OPERATIONS,
+        error_msg='Failed to fetch Amazon Route 53 Domains details',
+    )
 
 
 def main():
@@ -99,8 +95,9 @@ def main():
         list_domains=dict(required=False, type=bool),
         get_domain_detail=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('get_domain_detail', True, ['name']),
@@ -113,15 +110,7 @@ def main():
         ],
     )
 
-    client = module.client('route53domains', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _route53domains(client, module)
-
-    if module.params['list_domains']:
-        module.exit_json(domains=aws_response_list_parser(paginate, it, 'Domains'))
-    elif module.params['get_domain_detail']:
-        module.exit_json(domain_detail=camel_dict_to_snake_dict(it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'route53domains', _route53domains_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
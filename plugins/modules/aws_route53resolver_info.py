@@ -62,6 +62,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -130,72 +131,37 @@ resolver_endpoints:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _route53resolver(client, module):
-    try:
-        if module.params['list_firewall_configs']:
-            if client.can_paginate('list_firewall_configs'):
-                paginator = client.get_paginator('list_firewall_configs')
-                return paginator.paginate(), True
-            else:
-                return client.list_firewall_configs(), False
-        elif module.params['list_firewall_domain_lists']:
-            if client.can_paginate('list_firewall_domain_lists'):
-                paginator = client.get_paginator('list_firewall_domain_lists')
-                return paginator.paginate(), True
-            else:
-                return client.list_firewall_domain_lists(), False
-        elif module.params['list_firewall_rule_groups']:
-            if client.can_paginate('list_firewall_rule_groups'):
-                paginator = client.get_paginator('list_firewall_rule_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_firewall_rule_groups(), False
-        elif module.params['list_firewall_rules']:
-            if client.can_paginate('list_firewall_rules'):
-                paginator = client.get_paginator('list_firewall_rules')
-                return paginator.paginate(
-                    FirewallRuleGroupId=module.params['id']
-                ), True
-            else:
-                return client.list_firewall_rules(
-                    FirewallRuleGroupId=module.params['id']
-                ), False
-        elif module.params['list_resolver_dnssec_configs']:
-            if client.can_paginate('list_resolver_dnssec_configs'):
-                paginator = client.get_paginator('list_resolver_dnssec_configs')
-                return paginator.paginate(), True
-            else:
-                return client.list_resolver_dnssec_configs(), False
-        elif module.params['list_resolver_endpoint_ip_addresses']:
-            if client.can_paginate('list_resolver_endpoint_ip_addresses'):
-                paginator = client.get_paginator('list_resolver_endpoint_ip_addresses')
-                return paginator.paginate(
-                    ResolverEndpointId=module.params['id']
-                ), True
-            else:
-                return client.list_resolver_endpoint_ip_addresses(
-                    ResolverEndpointId=module.params['id']
-                ), False
-        elif module.params['list_resolver_endpoints']:
-            if client.can_paginate('list_resolver_endpoints'):
-                paginator = client.get_paginator('list_resolver_endpoints')
-                return paginator.paginate(), True
-            else:
-                return client.list_resolver_endpoints(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Route 53 Resolver details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_ROUTE53RESOLVER_OPERATIONS = dict(
+    list_firewall_configs=aws_list_operation('list_firewall_configs', 'firewall_configs', 'FirewallConfigs'),
+    list_firewall_domain_lists=aws_list_operation('list_firewall_domain_lists', 'firewall_domain_lists', 'FirewallDomainLists'),
+    list_firewall_rule_groups=aws_list_operation('list_firewall_rule_groups', 'firewall_rule_groups', 'FirewallRuleGroups'),
+    list_firewall_rules=aws_list_operation('list_firewall_rules', 'firewall_rules', 'FirewallRules', FirewallRuleGroupId='id'),
+    list_resolver_dnssec_configs=aws_list_operation('list_resolver_dnssec_configs', 'resolver_dnssec_configs', 'ResolverDnssecConfigs'),
+    list_resolver_endpoint_ip_addresses=aws_list_operation(
+        'list_resolver_endpoint_ip_addresses',
+        'resolver_endpoint_ip_addresses',
+        'IpAddresses',
+        ResolverEndpointId='id',
+    ),
+    list_resolver_endpoints=aws_list_operation('list_resolver_endpoints', 'resolver_endpoints', 'ResolverEndpoints'),
+)
+
+
+def _route53resolver_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _ROUTE53RESOLVER_OPERATIONS,
+        error_msg='Failed to fetch Amazon Route 53 Resolver details',
+    )
 
 
 def main():
@@ -209,8 +175,9 @@ def main():
         list_resolver_endpoint_ip_addresses=dict(required=False, type=bool),
         list_resolver_endpoints=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_firewall_rules', True, ['id']),
@@ -229,25 +196,7 @@ def main():
         ],
     )
 
-    client = module.client('route53resolver', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _route53resolver(client, module)
-
-    if module.params['list_firewall_configs']:
-        module.exit_json(firewall_configs=aws_response_list_parser(paginate, it, 'FirewallConfigs'))
-    elif module.params['list_firewall_domain_lists']:
-        module.exit_json(firewall_domain_lists=aws_response_list_parser(paginate, it, 'FirewallDomainLists'))
-    elif module.params['list_firewall_rule_groups']:
-        module.exit_json(firewall_rule_groups=aws_response_list_parser(paginate, it, 'FirewallRuleGroups'))
-    elif module.params['list_firewall_rules']:
-        module.exit_json(firewall_rules=aws_response_list_parser(paginate, it, 'FirewallRules'))
-    elif module.params['list_resolver_dnssec_configs']:
-        module.exit_json(resolver_dnssec_configs=aws_response_list_parser(paginate, it, 'ResolverDnssecConfigs'))
-    elif module.params['list_resolver_endpoint_ip_addresses']:
-        module.exit_json(resolver_endpoint_ip_addresses=aws_response_list_parser(paginate, it, 'IpAddresses'))
-    elif module.params['list_resolver_endpoints']:
-        module.exit_json(resolver_endpoints=aws_response_list_parser(paginate, it, 'ResolverEndpoints'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'route53resolver', _route53resolver_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
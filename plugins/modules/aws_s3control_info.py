@@ -51,6 +51,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -106,72 +107,40 @@ storage_lens_configurations:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _s3control(client, module):
-    try:
-        if module.params['list_access_points']:
-            if client.can_paginate('list_access_points'):
-                paginator = client.get_paginator('list_access_points')
-                return paginator.paginate(
-                    AccountId=module.params['id']
-                ), True
-            else:
-                return client.list_access_points(
-                    AccountId=module.params['id']
-                ), False
-        elif module.params['list_access_points_for_object_lambda']:
-            if client.can_paginate('list_access_points_for_object_lambda'):
-                paginator = client.get_paginator('list_access_points_for_object_lambda')
-                return paginator.paginate(
-                    AccountId=module.params['id']
-                ), True
-            else:
-                return client.list_access_points_for_object_lambda(
-                    AccountId=module.params['id']
-                ), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(
-                    AccountId=module.params['id']
-                ), True
-            else:
-                return client.list_jobs(
-                    AccountId=module.params['id']
-                ), False
-        elif module.params['list_regional_buckets']:
-            if client.can_paginate('list_regional_buckets'):
-                paginator = client.get_paginator('list_regional_buckets')
-                return paginator.paginate(
-                    AccountId=module.params['id']
-                ), True
-            else:
-                return client.list_regional_buckets(
-                    AccountId=module.params['id']
-                ), False
-        elif module.params['list_storage_lens_configurations']:
-            if client.can_paginate('list_storage_lens_configurations'):
-                paginator = client.get_paginator('list_storage_lens_configurations')
-                return paginator.paginate(
-                    AccountId=module.params['id']
-                ), True
-            else:
-                return client.list_storage_lens_configurations(
-                    AccountId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS S3 Control details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_S3CONTROL_OPERATIONS = dict(
+    list_access_points=aws_list_operation('list_access_points', 'access_points', 'AccessPointList', AccountId='id'),
+    list_access_points_for_object_lambda=aws_list_operation(
+        'list_access_points_for_object_lambda',
+        'access_points_for_object_lambda',
+        'ObjectLambdaAccessPointList',
+        AccountId='id',
+    ),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'Jobs', AccountId='id'),
+    list_regional_buckets=aws_list_operation('list_regional_buckets', 'regional_buckets', 'RegionalBucketList', AccountId='id'),
+    list_storage_lens_configurations=aws_list_operation(
+        'list_storage_lens_configurations',
+        'storage_lens_configurations',
+        'StorageLensConfigurationList',
+        AccountId='id',
+    ),
+)
+
+
+def _s3control_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _S3CONTROL_OPERATIONS,
+        error_msg='Failed to fetch AWS S3 Control details',
+    )
 
 
 def main():
@@ -183,8 +152,9 @@ def main():
         list_regional_buckets=dict(required=False, type=bool),
         list_storage_lens_configurations=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_regional_buckets', True, ['id']),
@@ -204,21 +174,7 @@ def main():
         ],
     )
 
-    client = module.client('s3control', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _s3control(client, module)
-
-    if module.params['list_access_points']:
-        module.exit_json(access_points=aws_response_list_parser(paginate, it, 'AccessPointList'))
-    elif module.params['list_access_points_for_object_lambda']:
-        module.exit_json(access_points_for_object_lambda=aws_response_list_parser(paginate, it, 'ObjectLambdaAccessPointList'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'Jobs'))
-    elif module.params['list_regional_buckets']:
-        module.exit_json(regional_buckets=aws_response_list_parser(paginate, it, 'RegionalBucketList'))
-    elif module.params['list_storage_lens_configurations']:
-        module.exit_json(storage_lens_configurations=aws_response_list_parser(paginate, it, 'StorageLensConfigurationList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 's3control', _s3control_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -30,6 +30,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -57,39 +58,28 @@ secrets:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _secretsmanager(client, module):
-    try:
-        if module.params['describe_secret']:
-            if client.can_paginate('describe_secret'):
-                paginator = client.get_paginator('describe_secret')
-                return paginator.paginate(
-                    SecretId=module.params['id']
-                ), True
-            else:
-                return client.describe_secret(
-                    SecretId=module.params['id']
-                ), False
-        elif module.params['list_secrets']:
-            if client.can_paginate('list_secrets'):
-                paginator = client.get_paginator('list_secrets')
-                return paginator.paginate(), True
-            else:
-                return client.list_secrets(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Secrets Manager details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SECRETSMANAGER_OPERATIONS = dict(
+    describe_secret=aws_dict_operation('describe_secret', 'secret', SecretId='id'),
+    list_secrets=aws_list_operation('list_secrets', 'secrets', 'SecretList'),
+)
+
+
+def _secretsmanager_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SECRETSMANAGER_OPERATIONS,
+        error_msg='Failed to fetch AWS Secrets Manager details',
+    )
 
 
 def main():
@@ -98,8 +88,9 @@ def main():
         describe_secret=dict(required=False, type=bool),
         list_secrets=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('describe_secret', True, ['id']),
@@ -112,15 +103,7 @@ def main():
         ],
     )
 
-    client = module.client('secretsmanager', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _secretsmanager(client, module)
-
-    if module.params['describe_secret']:
-        module.exit_json(secret=camel_dict_to_snake_dict(it))
-    elif module.params['list_secrets']:
-        module.exit_json(secrets=aws_response_list_parser(paginate, it, 'SecretList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'secretsmanager', _secretsmanager_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
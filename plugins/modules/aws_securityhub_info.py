@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -82,46 +83,29 @@ organization_admin_accounts:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _securityhub(client, module):
-    try:
-        if module.params['list_enabled_products_for_import']:
-            if client.can_paginate('list_enabled_products_for_import'):
-                paginator = client.get_paginator('list_enabled_products_for_import')
-                return paginator.paginate(), True
-            else:
-                return client.list_enabled_products_for_import(), False
-        elif module.params['list_invitations']:
-            if client.can_paginate('list_invitations'):
-                paginator = client.get_paginator('list_invitations')
-                return paginator.paginate(), True
-            else:
-                return client.list_invitations(), False
-        elif module.params['list_members']:
-            if client.can_paginate('list_members'):
-                paginator = client.get_paginator('list_members')
-                return paginator.paginate(), True
-            else:
-                return client.list_members(), False
-        elif module.params['list_organization_admin_accounts']:
-            if client.can_paginate('list_organization_admin_accounts'):
-                paginator = client.get_paginator('list_organization_admin_accounts')
-                return paginator.paginate(), True
-            else:
-                return client.list_organization_admin_accounts(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS SecurityHub details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SECURITYHUB_OPERATIONS = dict(
+    list_enabled_products_for_import=aws_list_operation('list_enabled_products_for_import', 'enabled_products_for_import', 'ProductSubscriptions'),
+    list_invitations=aws_list_operation('list_invitations', 'invitations', 'Invitations'),
+    list_members=aws_list_operation('list_members', 'members', 'Members'),
+    list_organization_admin_accounts=aws_list_operation('list_organization_admin_accounts', 'organization_admin_accounts', 'AdminAccounts'),
+)
+
+
+def _securityhub_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SECURITYHUB_OPERATIONS,
+        error_msg='Failed to fetch AWS SecurityHub details',
+    )
 
 
 def main():
@@ -131,8 +115,9 @@ def main():
         list_members=dict(required=False, type=bool),
         list_organization_admin_accounts=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -145,19 +130,7 @@ def main():
         ],
     )
 
-    client = module.client('securityhub', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _securityhub(client, module)
-
-    if module.params['list_enabled_products_for_import']:
-        module.exit_json(enabled_products_for_import=aws_response_list_parser(paginate, it, 'ProductSubscriptions'))
-    elif module.params['list_invitations']:
-        module.exit_json(invitations=aws_response_list_parser(paginate, it, 'Invitations'))
-    elif module.params['list_members']:
-        module.exit_json(members=aws_response_list_parser(paginate, it, 'Members'))
-    elif module.params['list_organization_admin_accounts']:
-        module.exit_json(organization_admin_accounts=aws_response_list_parser(paginate, it, 'AdminAccounts'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'securityhub', _securityhub_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
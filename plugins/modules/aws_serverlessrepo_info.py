@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -77,48 +78,28 @@ applications:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _serverlessrepo(client, module):
-    try:
-        if module.params['list_application_dependencies']:
-            if client.can_paginate('list_application_dependencies'):
-                paginator = client.get_paginator('list_application_dependencies')
-                return paginator.paginate(
-                    ApplicationId=module.params['id']
-                ), True
-            else:
-                return client.list_application_dependencies(
-                    ApplicationId=module.params['id']
-                ), False
-        elif module.params['list_application_versions']:
-            if client.can_paginate('list_application_versions'):
-                paginator = client.get_paginator('list_application_versions')
-                return paginator.paginate(
-                    ApplicationId=module.params['id']
-                ), True
-            else:
-                return client.list_application_versions(
-                    ApplicationId=module.params['id']
-                ), False
-        elif module.params['list_applications']:
-            if client.can_paginate('list_applications'):
-                paginator = client.get_paginator('list_applications')
-                return paginator.paginate(), True
-            else:
-                return client.list_applications(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Serverless Application Repository details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SERVERLESSREPO_OPERATIONS = dict(
+    list_application_dependencies=aws_list_operation('list_application_dependencies', 'application_dependencies', 'Dependencies', ApplicationId='id'),
+    list_application_versions=aws_list_operation('list_application_versions', 'application_versions', 'Versions', ApplicationId='id'),
+    list_applications=aws_list_operation('list_applications', 'applications', 'Applications'),
+)
+
+
+def _serverlessrepo_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SERVERLESSREPO_OPERATIONS,
+        error_msg='Failed to fetch AWS Serverless Application Repository details',
+    )
 
 
 def main():
@@ -128,8 +109,9 @@ def main():
         list_application_versions=dict(required=False, type=bool),
         list_applications=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_application_dependencies', True, ['id']),
@@ -144,17 +126,7 @@ def main():
         ],
     )
 
-    client = module.client('serverlessrepo', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _serverlessrepo(client, module)
-
-    if module.params['list_application_dependencies']:
-        module.exit_json(application_dependencies=aws_response_list_parser(paginate, it, 'Dependencies'))
-    elif module.params['list_application_versions']:
-        module.exit_json(application_versions=aws_response_list_parser(paginate, it, 'Versions'))
-    elif module.params['list_applications']:
-        module.exit_json(applications=aws_response_list_parser(paginate, it, 'Applications'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'serverlessrepo', _serverlessrepo_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
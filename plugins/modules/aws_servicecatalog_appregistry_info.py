@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -77,48 +78,28 @@ associated_resources:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _servicecatalog_appregistry(client, module):
-    try:
-        if module.params['list_applications']:
-            if client.can_paginate('list_applications'):
-                paginator = client.get_paginator('list_applications')
-                return paginator.paginate(), True
-            else:
-                return client.list_applications(), False
-        elif module.params['list_associated_attribute_groups']:
-            if client.can_paginate('list_associated_attribute_groups'):
-                paginator = client.get_paginator('list_associated_attribute_groups')
-                return paginator.paginate(
-                    application=module.params['id']
-                ), True
-            else:
-                return client.list_associated_attribute_groups(
-                    application=module.params['id']
-                ), False
-        elif module.params['list_associated_resources']:
-            if client.can_paginate('list_associated_resources'):
-                paginator = client.get_paginator('list_associated_resources')
-                return paginator.paginate(
-                    application=module.params['id']
-                ), True
-            else:
-                return client.list_associated_resources(
-                    application=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Service Catalog App Registry details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SERVICECATALOG_APPREGISTRY_OPERATIONS = dict(
+    list_applications=aws_list_operation('list_applications', 'applications', 'applications'),
+    list_associated_attribute_groups=aws_list_operation('list_associated_attribute_groups', 'associated_attribute_groups', 'attributeGroups', application='id'),
+    list_associated_resources=aws_list_operation('list_associated_resources', 'associated_resources', 'resources', application='id'),
+)
+
+
+def _servicecatalog_appregistry_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SERVICECATALOG_APPREGISTRY_OPERATIONS,
+        error_msg='Failed to fetch AWS Service Catalog App Registry details',
+    )
 
 
 def main():
@@ -128,8 +109,9 @@ def main():
         list_associated_attribute_groups=dict(required=False, type=bool),
         list_associated_resources=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_associated_attribute_groups', True, ['id']),
@@ -144,17 +126,7 @@ def main():
         ],
     )
 
-    client = module.client('servicecatalog-appregistry', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _servicecatalog_appregistry(client, module)
-
-    if module.params['list_applications']:
-        module.exit_json(applications=aws_response_list_parser(paginate, it, 'applications'))
-    elif module.params['list_associated_attribute_groups']:
-        module.exit_json(associated_attribute_groups=aws_response_list_parser(paginate, it, 'attributeGroups'))
-    elif module.params['list_associated_resources']:
-        module.exit_json(associated_resources=aws_response_list_parser(paginate, it, 'resources'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'servicecatalog-appregistry', _servicecatalog_appregistry_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -42,6 +42,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -78,60 +79,38 @@ services:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _servicediscovery(client, module):
-    try:
-        if module.params['list_instances']:
-            if client.can_paginate('list_instances'):
-                paginator = client.get_paginator('list_instances')
-                return paginator.paginate(
-                    ServiceId=module.params['id']
-                ), True
-            else:
-                return client.list_instances(
-                    ServiceId=module.params['id']
-                ), False
-        elif module.params['list_namespaces']:
-            if client.can_paginate('list_namespaces'):
-                paginator = client.get_paginator('list_namespaces')
-                return paginator.paginate(), True
-            else:
-                return client.list_namespaces(), False
-        elif module.params['list_services']:
-            if client.can_paginate('list_services'):
-                paginator = client.get_paginator('list_services')
-                return paginator.paginate(
-                    Filters=[
-                        {
-                            'Name': 'NAMESPACE_ID',
-                            'Values': [module.params['id']],
-                            'Condition': 'EQ'
-                        },
-                    ]
-                ), True
-            else:
-                return client.list_services(
-                    Filters=[
-                        {
-                            'Name': 'NAMESPACE_ID',
-                            'Values': [module.params['id']],
-                            'Condition': 'EQ'
-                        },
-                    ]
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Cloud Map details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+def _namespace_id_filter(module):
+    return [
+        {
+            'Name': 'NAMESPACE_ID',
+            'Values': [module.params['id']],
+            'Condition': 'EQ'
+        },
+    ]
+
+
+_SERVICEDISCOVERY_OPERATIONS = dict(
+    list_instances=aws_list_operation('list_instances', 'instances', 'Instances', ServiceId='id'),
+    list_namespaces=aws_list_operation('list_namespaces', 'namespaces', 'Namespaces'),
+    list_services=aws_list_operation('list_services', 'services', 'Services', Filters=_namespace_id_filter),
+)
+
+
+def _servicediscovery_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SERVICEDISCOVERY_OPERATIONS,
+        error_msg='Failed to fetch AWS Cloud Map details',
+    )
 
 
 def main():
@@ -141,8 +120,9 @@ def main():
         list_namespaces=dict(required=False, type=bool),
         list_services=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_instances', True, ['id']),
@@ -157,17 +137,7 @@ def main():
         ],
     )
 
-    client = module.client('servicediscovery', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _servicediscovery(client, module)
-
-    if module.params['list_instances']:
-        module.exit_json(instances=aws_response_list_parser(paginate, it, 'Instances'))
-    elif module.params['list_namespaces']:
-        module.exit_json(namespaces=aws_response_list_parser(paginate, it, 'Namespaces'))
-    elif module.params['list_services']:
-        module.exit_json(services=aws_response_list_parser(paginate, it, 'Services'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'servicediscovery', _servicediscovery_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -50,6 +50,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -101,56 +102,34 @@ templates:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _ses(client, module):
-    try:
-        if module.params['list_configuration_sets']:
-            if client.can_paginate('list_configuration_sets'):
-                paginator = client.get_paginator('list_configuration_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_configuration_sets(), False
-        elif module.params['list_custom_verification_email_templates']:
-            if client.can_paginate('list_custom_verification_email_templates'):
-                paginator = client.get_paginator('list_custom_verification_email_templates')
-                return paginator.paginate(), True
-            else:
-                return client.list_custom_verification_email_templates(), False
-        elif module.params['list_identities']:
-            if client.can_paginate('list_identities'):
-                paginator = client.get_paginator('list_identities')
-                return paginator.paginate(
-                    IdentityType=module.params['identity_type']
-                ), True
-            else:
-                return client.list_identities(
-                    IdentityType=module.params['identity_type']
-                ), False
-        elif module.params['list_receipt_rule_sets']:
-            if client.can_paginate('list_receipt_rule_sets'):
-                paginator = client.get_paginator('list_receipt_rule_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_receipt_rule_sets(), False
-        elif module.params['list_templates']:
-            if client.can_paginate('list_templates'):
-                paginator = client.get_paginator('list_templates')
-                return paginator.paginate(), True
-            else:
-                return client.list_templates(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Simple Email Service (SES) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SES_OPERATIONS = dict(
+    list_configuration_sets=aws_list_operation('list_configuration_sets', 'configuration_sets', 'ConfigurationSets'),
+    list_custom_verification_email_templates=aws_list_operation(
+        'list_custom_verification_email_templates',
+        'custom_verification_email_templates',
+        'CustomVerificationEmailTemplates',
+    ),
+    list_identities=aws_list_operation('list_identities', 'identities', 'Identities', IdentityType='identity_type'),
+    list_receipt_rule_sets=aws_list_operation('list_receipt_rule_sets', 'receipt_rule_sets', 'RuleSets'),
+    list_templates=aws_list_operation('list_templates', 'templates', 'TemplatesMetadata'),
+)
+
+
+def _ses_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SES_OPERATIONS,
+        error_msg='Failed to fetch Amazon Simple Email Service (SES) details',
+    )
 
 
 def main():
@@ -164,8 +143,9 @@ def main():
         list_resolver_endpoint_ip_addresses=dict(required=False, type=bool),
         list_resolver_endpoints=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_identities', True, ['identity_type']),
@@ -181,21 +161,7 @@ def main():
         ],
     )
 
-    client = module.client('ses', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _ses(client, module)
-
-    if module.params['list_configuration_sets']:
-        module.exit_json(configuration_sets=aws_response_list_parser(paginate, it, 'ConfigurationSets'))
-    elif module.params['list_custom_verification_email_templates']:
-        module.exit_json(custom_verification_email_templates=aws_response_list_parser(paginate, it, 'CustomVerificationEmailTemplates'))
-    elif module.params['list_identities']:
-        module.exit_json(identities=aws_response_list_parser(paginate, it, 'Identities'))
-    elif module.params['list_receipt_rule_sets']:
-        module.exit_json(receipt_rule_sets=aws_response_list_parser(paginate, it, 'RuleSets'))
-    elif module.params['list_templates']:
-        module.exit_json(templates=aws_response_list_parser(paginate, it, 'TemplatesMetadata'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'ses', _ses_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -61,6 +61,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -128,68 +129,36 @@ email_identities:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _sesv2(client, module):
-    try:
-        if module.params['list_configuration_sets']:
-            if client.can_paginate('list_configuration_sets'):
-                paginator = client.get_paginator('list_configuration_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_configuration_sets(), False
-        elif module.params['list_contact_lists']:
-            if client.can_paginate('list_contact_lists'):
-                paginator = client.get_paginator('list_contact_lists')
-                return paginator.paginate(), True
-            else:
-                return client.list_contact_lists(), False
-        elif module.params['list_contacts']:
-            if client.can_paginate('list_contacts'):
-                paginator = client.get_paginator('list_contacts')
-                return paginator.paginate(
-                    ContactListName=module.params['name']
-                ), True
-            else:
-                return client.list_contacts(
-                    ContactListName=module.params['name']
-                ), False
-        elif module.params['list_custom_verification_email_templates']:
-            if client.can_paginate('list_custom_verification_email_templates'):
-                paginator = client.get_paginator('list_custom_verification_email_templates')
-                return paginator.paginate(), True
-            else:
-                return client.list_custom_verification_email_templates(), False
-        elif module.params['list_dedicated_ip_pools']:
-            if client.can_paginate('list_dedicated_ip_pools'):
-                paginator = client.get_paginator('list_dedicated_ip_pools')
-                return paginator.paginate(), True
-            else:
-                return client.list_dedicated_ip_pools(), False
-        elif module.params['list_deliverability_test_reports']:
-            if client.can_paginate('list_deliverability_test_reports'):
-                paginator = client.get_paginator('list_deliverability_test_reports')
-                return paginator.paginate(), True
-            else:
-                return client.list_deliverability_test_reports(), False
-        elif module.params['list_email_identities']:
-            if client.can_paginate('list_email_identities'):
-                paginator = client.get_paginator('list_email_identities')
-                return paginator.paginate(), True
-            else:
-                return client.list_email_identities(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Simple Email Service (SES V2) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SESV2_OPERATIONS = dict(
+    list_configuration_sets=aws_list_operation('list_configuration_sets', 'configuration_sets', 'ConfigurationSets'),
+    list_contact_lists=aws_list_operation('list_contact_lists', 'contact_lists', 'ContactLists'),
+    list_contacts=aws_list_operation('list_contacts', 'contacts', 'Contacts', ContactListName='name'),
+    list_custom_verification_email_templates=aws_list_operation(
+        'list_custom_verification_email_templates',
+        'custom_verification_email_templates',
+        'CustomVerificationEmailTemplates',
+    ),
+    list_dedicated_ip_pools=aws_list_operation('list_dedicated_ip_pools', 'dedicated_ip_pools', 'DedicatedIpPools'),
+    list_deliverability_test_reports=aws_list_operation('list_deliverability_test_reports', 'deliverability_test_reports', 'DeliverabilityTestReports'),
+    list_email_identities=aws_list_operation('list_email_identities', 'email_identities', 'EmailIdentities'),
+)
+
+
+def _sesv2_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SESV2_OPERATIONS,
+        error_msg='Failed to fetch Amazon Simple Email Service (SES V2) details',
+    )
 
 
 def main():
@@ -203,8 +172,9 @@ def main():
         list_deliverability_test_reports=dict(required=False, type=bool),
         list_email_identities=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_contacts', True, ['name']),
@@ -222,25 +192,7 @@ def main():
         ],
     )
 
-    client = module.client('sesv2', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _sesv2(client, module)
-
-    if module.params['list_configuration_sets']:
-        module.exit_json(configuration_sets=aws_response_list_parser(paginate, it, 'ConfigurationSets'))
-    elif module.params['list_contact_lists']:
-        module.exit_json(contact_lists=aws_response_list_parser(paginate, it, 'ContactLists'))
-    elif module.params['list_contacts']:
-        module.exit_json(contacts=aws_response_list_parser(paginate, it, 'Contacts'))
-    elif module.params['list_custom_verification_email_templates']:
-        module.exit_json(custom_verification_email_templates=aws_response_list_parser(paginate, it, 'CustomVerificationEmailTemplates'))
-    elif module.params['list_dedicated_ip_pools']:
-        module.exit_json(dedicated_ip_pools=aws_response_list_parser(paginate, it, 'DedicatedIpPools'))
-    elif module.params['list_deliverability_test_reports']:
-        module.exit_json(deliverability_test_reports=aws_response_list_parser(paginate, it, 'DeliverabilityTestReports'))
-    elif module.params['list_email_identities']:
-        module.exit_json(email_identities=aws_response_list_parser(paginate, it, 'EmailIdentities'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'sesv2', _sesv2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
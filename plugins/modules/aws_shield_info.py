@@ -41,6 +41,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -72,44 +73,33 @@ protections:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _shield(client, module):
-    try:
-        if module.params['list_protection_groups']:
-            if client.can_paginate('list_protection_groups'):
-                paginator = client.get_paginator('list_protection_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_protection_groups(), False
-        elif module.params['list_protections']:
-            if client.can_paginate('list_protections'):
-                paginator = client.get_paginator('list_protections')
-                return paginator.paginate(), True
-            else:
-                return client.list_protections(), False
-        elif module.params['list_resources_in_protection_group']:
-            if client.can_paginate('list_resources_in_protection_group'):
-                paginator = client.get_paginator('list_resources_in_protection_group')
-                return paginator.paginate(
-                    ProtectionGroupId=module.params['id']
-                ), True
-            else:
-                return client.list_resources_in_protection_group(
-                    ProtectionGroupId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Shield details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SHIELD_OPERATIONS = dict(
+    list_protection_groups=aws_list_operation('list_protection_groups', 'protection_groups', 'ProtectionGroups'),
+    list_protections=aws_list_operation('list_protections', 'protections', 'Protections'),
+    list_resources_in_protection_group=aws_list_operation(
+        'list_resources_in_protection_group',
+        'resources_in_protection_group',
+        'ResourceArns',
+        ProtectionGroupId='id',
+    ),
+)
+
+
+def _shield_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SHIELD_OPERATIONS,
+        error_msg='Failed to fetch Amazon Shield details',
+    )
 
 
 def main():
@@ -119,8 +109,9 @@ def main():
         list_protections=dict(required=False, type=bool),
         list_resources_in_protection_group=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_resources_in_protection_group', True, ['id']),
@@ -134,17 +125,7 @@ def main():
         ],
     )
 
-    client = module.client('shield', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _shield(client, module)
-
-    if module.params['list_protection_groups']:
-        module.exit_json(protection_groups=aws_response_list_parser(paginate, it, 'ProtectionGroups'))
-    elif module.params['list_protections']:
-        module.exit_json(protections=aws_response_list_parser(paginate, it, 'Protections'))
-    elif module.params['list_resources_in_protection_group']:
-        module.exit_json(resources_in_protection_group=aws_response_list_parser(paginate, it, 'ResourceArns'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'shield', _shield_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
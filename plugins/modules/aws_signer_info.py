@@ -48,6 +48,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -84,48 +85,28 @@ signing_profiles:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _signer(client, module):
-    try:
-        if module.params['list_profile_permissions']:
-            if client.can_paginate('list_profile_permissions'):
-                paginator = client.get_paginator('list_profile_permissions')
-                return paginator.paginate(
-                    profileName=module.params['name']
-                ), True
-            else:
-                return client.list_profile_permissions(
-                    profileName=module.params['name']
-                ), False
-        elif module.params['list_signing_platforms']:
-            if client.can_paginate('list_signing_platforms'):
-                paginator = client.get_paginator('list_signing_platforms')
-                return paginator.paginate(), True
-            else:
-                return client.list_signing_platforms(), False
-        elif module.params['list_signing_profiles']:
-            if client.can_paginate('list_signing_profiles'):
-                paginator = client.get_paginator('list_signing_profiles')
-                return paginator.paginate(
-                    statuses=[module.params['status']]
-                ), True
-            else:
-                return client.list_signing_profiles(
-                    statuses=[module.params['status']]
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Signer details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SIGNER_OPERATIONS = dict(
+    list_profile_permissions=aws_list_operation('list_profile_permissions', 'profile_permissions', 'permissions', profileName='name'),
+    list_signing_platforms=aws_list_operation('list_signing_platforms', 'signing_platforms', 'platforms'),
+    list_signing_profiles=aws_list_operation('list_signing_profiles', 'signing_profiles', 'profiles', statuses=['status']),
+)
+
+
+def _signer_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SIGNER_OPERATIONS,
+        error_msg='Failed to fetch Amazon Signer details',
+    )
 
 
 def main():
@@ -136,8 +117,9 @@ def main():
         list_signing_platforms=dict(required=False, type=bool),
         list_signing_profiles=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_profile_permissions', True, ['name']),
@@ -151,17 +133,7 @@ def main():
         ],
     )
 
-    client = module.client('signer', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _signer(client, module)
-
-    if module.params['list_profile_permissions']:
-        module.exit_json(profile_permissions=aws_response_list_parser(paginate, it, 'permissions'))
-    elif module.params['list_signing_platforms']:
-        module.exit_json(signing_platforms=aws_response_list_parser(paginate, it, 'platforms'))
-    elif module.params['list_signing_profiles']:
-        module.exit_json(signing_profiles=aws_response_list_parser(paginate, it, 'profiles'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'signer', _signer_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -34,6 +34,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -70,36 +71,29 @@ phone_numbers:
   sample: [{"phone_number": "+359888XXXXX", "status": "Verified"}]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _sms(client, module):
-    try:
-        if module.params['get_sms_sandbox_account_status']:
-            return client.get_sms_sandbox_account_status(), False
-        elif module.params['list_phone_numbers_opted_out']:
-            if client.can_paginate('list_phone_numbers_opted_out'):
-                paginator = client.get_paginator('list_phone_numbers_opted_out')
-                return paginator.paginate(), True
-            else:
-                return client.list_phone_numbers_opted_out(), False
-        elif module.params['list_sms_sandbox_phone_numbers']:
-            if client.can_paginate('list_sms_sandbox_phone_numbers'):
-                paginator = client.get_paginator('list_sms_sandbox_phone_numbers')
-                return paginator.paginate(), True
-            else:
-                return client.list_sms_sandbox_phone_numbers(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon SNS SMS details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SMS_OPERATIONS = dict(
+    get_sms_sandbox_account_status=aws_dict_operation('get_sms_sandbox_account_status', 'is_in_sandbox', 'IsInSandbox'),
+    list_phone_numbers_opted_out=aws_list_operation('list_phone_numbers_opted_out', 'phone_numbers_opted_out', 'phoneNumbers'),
+    list_sms_sandbox_phone_numbers=aws_list_operation('list_sms_sandbox_phone_numbers', 'phone_numbers', 'PhoneNumbers'),
+)
+
+
+def _sms_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SMS_OPERATIONS,
+        error_msg='Failed to fetch Amazon SNS SMS details',
+    )
 
 
 def main():
@@ -108,8 +102,9 @@ def main():
         list_phone_numbers_opted_out=dict(required=False, type=bool),
         list_sms_sandbox_phone_numbers=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         mutually_exclusive=[
             (
@@ -120,17 +115,7 @@ def main():
         ],
     )
 
-    client = module.client('sns', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _sms(client, module)
-
-    if module.params['get_sms_sandbox_account_status']:
-        module.exit_json(is_in_sandbox=it['IsInSandbox'])
-    elif module.params['list_phone_numbers_opted_out']:
-        module.exit_json(phone_numbers_opted_out=aws_response_list_parser(paginate, it, 'phoneNumbers'))
-    elif module.params['list_sms_sandbox_phone_numbers']:
-        module.exit_json(phone_numbers=aws_response_list_parser(paginate, it, 'PhoneNumbers'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'sns', _sms_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -89,50 +90,29 @@ jobs:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _snowball(client, module):
-    try:
-        if module.params['list_cluster_jobs']:
-            if client.can_paginate('list_cluster_jobs'):
-                paginator = client.get_paginator('list_cluster_jobs')
-                return paginator.paginate(
-                    ClusterId=module.params['id']
-                ), True
-            else:
-                return client.list_cluster_jobs(
-                    ClusterId=module.params['id']
-                ), False
-        elif module.params['list_clusters']:
-            if client.can_paginate('list_clusters'):
-                paginator = client.get_paginator('list_clusters')
-                return paginator.paginate(), True
-            else:
-                return client.list_clusters(), False
-        elif module.params['list_compatible_images']:
-            if client.can_paginate('list_compatible_images'):
-                paginator = client.get_paginator('list_compatible_images')
-                return paginator.paginate(), True
-            else:
-                return client.list_compatible_images(), False
-        elif module.params['list_jobs']:
-            if client.can_paginate('list_jobs'):
-                paginator = client.get_paginator('list_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_jobs(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Snowball details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SNOWBALL_OPERATIONS = dict(
+    list_cluster_jobs=aws_list_operation('list_cluster_jobs', 'cluster_jobs', 'JobListEntries', ClusterId='id'),
+    list_clusters=aws_list_operation('list_clusters', 'clusters', 'ClusterListEntries'),
+    list_compatible_images=aws_list_operation('list_compatible_images', 'compatible_images', 'CompatibleImages'),
+    list_jobs=aws_list_operation('list_jobs', 'jobs', 'JobListEntries'),
+)
+
+
+def _snowball_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SNOWBALL_OPERATIONS,
+        error_msg='Failed to fetch Amazon Snowball details',
+    )
 
 
 def main():
@@ -146,8 +126,9 @@ def main():
         list_compatible_images=dict(required=False, type=bool),
         list_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_cluster_jobs', True, ['id']),
@@ -162,19 +143,7 @@ def main():
         ],
     )
 
-    client = module.client('snowball', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _snowball(client, module)
-
-    if module.params['list_cluster_jobs']:
-        module.exit_json(cluster_jobs=aws_response_list_parser(paginate, it, 'JobListEntries'))
-    elif module.params['list_clusters']:
-        module.exit_json(clusters=aws_response_list_parser(paginate, it, 'ClusterListEntries'))
-    elif module.params['list_compatible_images']:
-        module.exit_json(compatible_images=aws_response_list_parser(paginate, it, 'CompatibleImages'))
-    elif module.params['list_jobs']:
-        module.exit_json(jobs=aws_response_list_parser(paginate, it, 'JobListEntries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'snowball', _snowball_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -25,6 +25,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -59,17 +60,26 @@ try:
 except ImportError:
     pass    # Handled by AnsibleAWSModule
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_pagination_config
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
 
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _platform_it(sns, module):
+def _enabled_pages(pages, resource_field: str, enabled: str):
+    # filter pages before parsing, so `fields`, `dest` and `since_state` see only matching items.
+    for page in pages:
+        yield dict(page, **{resource_field: [item for item in page.get(resource_field, []) if item.get('Attributes', {}).get('Enabled') == enabled]})
+
+
+def _sns_platform_result(client, module) -> dict:
     try:
-        paginator = sns.get_paginator('list_platform_applications')
-        iterator = paginator.paginate()
-        return iterator
+        pages = client.get_paginator('list_platform_applications').paginate(PaginationConfig=aws_pagination_config(module))
+        if module.params['enabled'] is not None:
+            pages = _enabled_pages(pages, 'PlatformApplications', module.params['enabled'])
+        return dict(platforms=aws_response_list_parser(True, pages, 'PlatformApplications', fields=module.params['fields']))
     except (BotoCoreError, ClientError) as e:
         module.fail_json_aws(e, msg='Failed to fetch sns platform applications')
 
@@ -78,27 +88,11 @@ def main():
     argument_spec = dict(
         enabled=dict(required=False, choices=['true', 'false']),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(argument_spec=argument_spec)
-    sns = module.client('sns')
-
-    __default_return = []
-
-    _it = _platform_it(sns, module)
-    if _it is not None:
-        for response in _it:
-            for application in response['PlatformApplications']:
-                __default_return.append(camel_dict_to_snake_dict(application))
-
-    if module.params['enabled'] is not None:
-        __override_default_return = []
-        for application in __default_return:
-            if application['attributes']['enabled'] == module.params['enabled']:
-                __override_default_return.append(application)
-
-        module.exit_json(platforms=__override_default_return)
+    module = aws_info_module(argument_spec=argument_spec)
 
-    module.exit_json(platforms=__default_return)
+    module.exit_json(**aws_info_run(module, 'sns', _sns_platform_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
@@ -25,6 +25,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -53,47 +54,40 @@ subscriptions:
   }]
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
 
+_SNS_SUBSCRIPTIONS_OPERATIONS = dict(
+    topic_arn=aws_list_operation('list_subscriptions_by_topic', 'subscriptions', 'Subscriptions', TopicArn='topic_arn'),
+)
 
-@AWSRetry.exponential_backoff(retries=5, delay=5)
-def _sub_it(sns, module):
-    try:
-        if module.params['topic_arn'] is not None:
-            paginator = sns.get_paginator('list_subscriptions_by_topic')
-            iterator = paginator.paginate(TopicArn=module.params['arn'])
-        else:
-            paginator = sns.get_paginator('list_subscriptions')
-            iterator = paginator.paginate()
-        return iterator
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch sns subscriptions')
+_SNS_LIST_SUBSCRIPTIONS = aws_list_operation('list_subscriptions', 'subscriptions', 'Subscriptions')
+
+
+def _sns_subscriptions_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SNS_SUBSCRIPTIONS_OPERATIONS,
+        default=_SNS_LIST_SUBSCRIPTIONS,
+        error_msg='Failed to fetch sns subscriptions',
+    )
 
 
 def main():
     argument_spec = dict(
         topic_arn=dict(required=False, aliases=['arn']),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(argument_spec=argument_spec)
-    sns = module.client('sns')
-
-    __default_return = []
-
-    _it = _sub_it(sns, module)
-    if _it is not None:
-        for response in _it:
-            for sub in response['Subscriptions']:
-                __default_return.append(camel_dict_to_snake_dict(sub))
+    module = aws_info_module(argument_spec=argument_spec)
 
-    module.exit_json(subscriptions=__default_return)
+    module.exit_json(**aws_info_run(module, 'sns', _sns_subscriptions_result, retry_decorator=aws_info_retry(retries=5, delay=5)))
 
 
 if __name__ == '__main__':
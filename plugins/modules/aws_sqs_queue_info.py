@@ -44,6 +44,7 @@ options:
 extends_documentation_fragment:
     - amazon.aws.aws
     - amazon.aws.ec2
+    - community.missing_collection.aws_info
 '''
 
 RETURN = '''
@@ -100,47 +101,39 @@ EXAMPLES = '''
 
 '''
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import camel_dict_to_snake_dict
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass  # handled by AnsibleAWSModule
-
-
-@AWSRetry.exponential_backoff()
-def _sqs(module):
-    try:
-        client = module.client('sqs')
-        if module.params['queue_url'] is not None:
-            if module.params['dead_letter_source_queue'] is None:
-                response = client.get_queue_attributes(
-                    QueueUrl=module.params['queue_url'],
-                    AttributeNames=module.params['queue_attribute_name']
-                )
-                module.exit_json(attributes=camel_dict_to_snake_dict(response['Attributes']))
-            else:
-                paginator = client.get_paginator('list_dead_letter_source_queues')
-                iterator = paginator.paginate(
-                    QueueUrl=module.params['queue_url']
-                )
-                for response in iterator:
-                    module.exit_json(queue_urls=response['queueUrls'])
-        else:
-            paginator = client.get_paginator('list_queues')
-            if module.params['queue_name_prefix'] is None:
-                iterator = paginator.paginate()
-            else:
-                iterator = paginator.paginate(
-                    QueueNamePrefix=module.params['queue_name_prefix']
-                )
-            for response in iterator:
-                module.exit_json(queue_urls=response['QueueUrls'])
-
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e)
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+# checked in given order, list_queues without prefix if none is set.
+_SQS_OPERATIONS = dict(
+    dead_letter_source_queue=aws_list_operation('list_dead_letter_source_queues', 'queue_urls', 'queueUrls', QueueUrl='queue_url'),
+    queue_url=aws_dict_operation(
+        'get_queue_attributes',
+        'attributes',
+        'Attributes',
+        QueueUrl='queue_url',
+        AttributeNames='queue_attribute_name',
+    ),
+    queue_name_prefix=aws_list_operation('list_queues', 'queue_urls', 'QueueUrls', QueueNamePrefix='queue_name_prefix'),
+)
+
+_SQS_LIST_QUEUES = aws_list_operation('list_queues', 'queue_urls', 'QueueUrls')
+
+
+def _sqs_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SQS_OPERATIONS,
+        default=_SQS_LIST_QUEUES,
+        error_msg='Failed to fetch AWS SQS details',
+    )
 
 
 def main():
@@ -151,8 +144,9 @@ def main():
         queue_attribute_name=dict(required=False, default=['All'], type=list),
         dead_letter_source_queue=dict(required=False, type=bool)
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
 
         required_if=(
@@ -165,7 +159,7 @@ def main():
         ],
     )
 
-    _sqs(module)
+    module.exit_json(**aws_info_run(module, 'sqs', _sqs_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -82,6 +82,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -170,124 +171,70 @@ permission_sets:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
 
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
 
+_SSO_ADMIN_OPERATIONS = dict(
+    list_account_assignment_creation_status=aws_list_operation(
+        'list_account_assignment_creation_status',
+        'account_assignment_creation_status',
+        'AccountAssignmentsCreationStatus',
+        InstanceArn='instance_arn',
+        Filter={'Status': 'status'},
+    ),
+    list_account_assignment_deletion_status=aws_list_operation(
+        'list_account_assignment_deletion_status',
+        'account_assignment_deletion_status',
+        'AccountAssignmentsDeletionStatus',
+        InstanceArn='instance_arn',
+        Filter={'Status': 'status'},
+    ),
+    list_account_assignments=aws_list_operation(
+        'list_account_assignments',
+        'account_assignments',
+        'AccountAssignments',
+        InstanceArn='instance_arn',
+        AccountId='account_id',
+        PermissionSetArn='permission_set_arn',
+    ),
+    list_accounts_for_provisioned_permission_set=aws_list_operation(
+        'list_accounts_for_provisioned_permission_set',
+        'accounts_for_provisioned_permission_set',
+        'AccountIds',
+        InstanceArn='instance_arn',
+        PermissionSetArn='permission_set_arn',
+    ),
+    list_instances=aws_list_operation('list_instances', 'instances', 'Instances'),
+    list_managed_policies_in_permission_set=aws_list_operation(
+        'list_managed_policies_in_permission_set',
+        'managed_policies_in_permission_set',
+        'AttachedManagedPolicies',
+        InstanceArn='instance_arn',
+        PermissionSetArn='permission_set_arn',
+    ),
+    list_permission_set_provisioning_status=aws_list_operation(
+        'list_permission_set_provisioning_status',
+        'permission_set_provisioning_status',
+        'PermissionSetsProvisioningStatus',
+        InstanceArn='instance_arn',
+        Filter={'Status': 'status'},
+    ),
+    list_permission_sets=aws_list_operation('list_permission_sets', 'permission_sets', 'PermissionSets', InstanceArn='instance_arn'),
+)
 
-def _sso_admin(client, module):
-    try:
-        if module.params['list_account_assignment_creation_status']:
-            if client.can_paginate('list_account_assignment_creation_status'):
-                paginator = client.get_paginator('list_account_assignment_creation_status')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                    Filter={
-                        'Status': module.params['status']
-                    }
-                ), True
-            else:
-                return client.list_account_assignment_creation_status(
-                    InstanceArn=module.params['instance_arn'],
-                    Filter={
-                        'Status': module.params['status']
-                    }
-                ), False
-        elif module.params['list_account_assignment_deletion_status']:
-            if client.can_paginate('list_account_assignment_deletion_status'):
-                paginator = client.get_paginator('list_account_assignment_deletion_status')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                    Filter={
-                        'Status': module.params['status']
-                    }
-                ), True
-            else:
-                return client.list_account_assignment_deletion_status(
-                    InstanceArn=module.params['instance_arn'],
-                    Filter={
-                        'Status': module.params['status']
-                    }
-                ), False
-        elif module.params['list_account_assignments']:
-            if client.can_paginate('list_account_assignments'):
-                paginator = client.get_paginator('list_account_assignments')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                    AccountId=module.params['account_id'],
-                    PermissionSetArn=module.params['permission_set_arn'],
-                ), True
-            else:
-                return client.list_account_assignments(
-                    InstanceArn=module.params['instance_arn'],
-                    AccountId=module.params['account_id'],
-                    PermissionSetArn=module.params['permission_set_arn'],
-                ), False
-        elif module.params['list_accounts_for_provisioned_permission_set']:
-            if client.can_paginate('list_accounts_for_provisioned_permission_set'):
-                paginator = client.get_paginator('list_accounts_for_provisioned_permission_set')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                    PermissionSetArn=module.params['permission_set_arn'],
-                ), True
-            else:
-                return client.list_accounts_for_provisioned_permission_set(
-                    InstanceArn=module.params['instance_arn'],
-                    PermissionSetArn=module.params['permission_set_arn'],
-                ), False
-        elif module.params['list_instances']:
-            if client.can_paginate('list_instances'):
-                paginator = client.get_paginator('list_instances')
-                return paginator.paginate(), True
-            else:
-                return client.list_instances(), False
-        elif module.params['list_managed_policies_in_permission_set']:
-            if client.can_paginate('list_managed_policies_in_permission_set'):
-                paginator = client.get_paginator('list_managed_policies_in_permission_set')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                    PermissionSetArn=module.params['permission_set_arn'],
-                ), True
-            else:
-                return client.list_managed_policies_in_permission_set(
-                    InstanceArn=module.params['instance_arn'],
-                    PermissionSetArn=module.params['permission_set_arn'],
-                ), False
-        elif module.params['list_permission_set_provisioning_status']:
-            if client.can_paginate('list_permission_set_provisioning_status'):
-                paginator = client.get_paginator('list_permission_set_provisioning_status')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                    Filter={
-                        'Status': module.params['status']
-                    }
-                ), True
-            else:
-                return client.list_permission_set_provisioning_status(
-                    InstanceArn=module.params['instance_arn'],
-                    Filter={
-                        'Status': module.params['status']
-                    }
-                ), False
-        elif module.params['list_permission_sets']:
-            if client.can_paginate('list_permission_sets'):
-                paginator = client.get_paginator('list_permission_sets')
-                return paginator.paginate(
-                    InstanceArn=module.params['instance_arn'],
-                ), True
-            else:
-                return client.list_permission_sets(
-                    InstanceArn=module.params['instance_arn'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Single Sign-On Admin (SSO Admin) details')
+
+def _sso_admin_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SSO_ADMIN_OPERATIONS,
+        error_msg='Failed to fetch AWS Single Sign-On Admin (SSO Admin) details',
+    )
 
 
 def main():
@@ -309,8 +256,9 @@ def main():
         list_permission_set_provisioning_status=dict(required=False, type=bool),
         list_permission_sets=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_account_assignment_creation_status', True, ['instance_arn']),
@@ -335,27 +283,7 @@ def main():
         ],
     )
 
-    client = module.client('sso-admin', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _sso_admin(client, module)
-
-    if module.params['list_account_assignment_creation_status']:
-        module.exit_json(account_assignment_creation_status=aws_response_list_parser(paginate, it, 'AccountAssignmentsCreationStatus'))
-    elif module.params['list_account_assignment_deletion_status']:
-        module.exit_json(account_assignment_deletion_status=aws_response_list_parser(paginate, it, 'AccountAssignmentsDeletionStatus'))
-    elif module.params['list_account_assignments']:
-        module.exit_json(account_assignments=aws_response_list_parser(paginate, it, 'AccountAssignments'))
-    elif module.params['list_accounts_for_provisioned_permission_set']:
-        module.exit_json(accounts_for_provisioned_permission_set=aws_response_list_parser(paginate, it, 'AccountIds'))
-    elif module.params['list_instances']:
-        module.exit_json(instances=aws_response_list_parser(paginate, it, 'Instances'))
-    elif module.params['list_managed_policies_in_permission_set']:
-        module.exit_json(managed_policies_in_permission_set=aws_response_list_parser(paginate, it, 'AttachedManagedPolicies'))
-    elif module.params['list_permission_set_provisioning_status']:
-        module.exit_json(permission_set_provisioning_status=aws_response_list_parser(paginate, it, 'PermissionSetsProvisioningStatus'))
-    elif module.params['list_permission_sets']:
-        module.exit_json(permission_sets=aws_response_list_parser(paginate, it, 'PermissionSets'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'sso-admin', _sso_admin_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
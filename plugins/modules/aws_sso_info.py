@@ -40,6 +40,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -69,44 +70,27 @@ accounts:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _sso(client, module):
-    try:
-        if module.params['list_account_roles']:
-            if client.can_paginate('list_account_roles'):
-                paginator = client.get_paginator('list_account_roles')
-                return paginator.paginate(
-                    accessToken=module.params['access_token'],
-                    accountId=module.params['account_id'],
-                ), True
-            else:
-                return client.list_account_roles(
-                    accessToken=module.params['access_token'],
-                    accountId=module.params['account_id'],
-                ), False
-        elif module.params['list_accounts']:
-            if client.can_paginate('list_accounts'):
-                paginator = client.get_paginator('list_accounts')
-                return paginator.paginate(
-                    accessToken=module.params['access_token']
-                ), True
-            else:
-                return client.list_accounts(
-                    accessToken=module.params['access_token']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Single Sign-On (SSO) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SSO_OPERATIONS = dict(
+    list_account_roles=aws_list_operation('list_account_roles', 'account_roles', 'roleList', accessToken='access_token', accountId='account_id'),
+    list_accounts=aws_list_operation('list_accounts', 'accounts', 'accountList', accessToken='access_token'),
+)
+
+
+def _sso_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SSO_OPERATIONS,
+        error_msg='Failed to fetch AWS Single Sign-On (SSO) details',
+    )
 
 
 def main():
@@ -116,8 +100,9 @@ def main():
         list_account_roles=dict(required=False, type=bool),
         list_accounts=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_account_roles', True, ['access_token', 'account_id']),
@@ -131,15 +116,7 @@ def main():
         ],
     )
 
-    client = module.client('sso', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _sso(client, module)
-
-    if module.params['list_account_roles']:
-        module.exit_json(account_roles=aws_response_list_parser(paginate, it, 'roleList'))
-    elif module.params['list_accounts']:
-        module.exit_json(accounts=aws_response_list_parser(paginate, it, 'accountList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'sso', _sso_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
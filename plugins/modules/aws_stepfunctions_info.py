@@ -52,6 +52,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -97,57 +98,30 @@ state_machine:
   type: dict
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
-
-def _stepfunctions(client, module):
-    try:
-        if module.params['list_activities']:
-            if client.can_paginate('list_activities'):
-                paginator = client.get_paginator('list_activities')
-                return paginator.paginate(), True
-            else:
-                return client.list_activities(), False
-        elif module.params['list_executions']:
-            if client.can_paginate('list_executions'):
-                paginator = client.get_paginator('list_executions')
-                return paginator.paginate(
-                    stateMachineArn=module.params['arn'],
-                    statusFilter=module.params['status_filter']
-                ), True
-            else:
-                return client.list_executions(
-                    stateMachineArn=module.params['arn'],
-                    statusFilter=module.params['status_filter']
-                ), False
-        elif module.params['list_state_machines']:
-            if client.can_paginate('list_state_machines'):
-                paginator = client.get_paginator('list_state_machines')
-                return paginator.paginate(), True
-            else:
-                return client.list_state_machines(), False
-        elif module.params['describe_state_machine']:
-            if client.can_paginate('describe_state_machine'):
-                paginator = client.get_paginator('describe_state_machine')
-                return paginator.paginate(
-                    stateMachineArn=module.params['arn'],
-                ), True
-            else:
-                return client.describe_state_machine(
-                    stateMachineArn=module.params['arn'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Step Functions (SFN) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_dict_operation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_STEPFUNCTIONS_OPERATIONS = dict(
+    list_activities=aws_list_operation('list_activities', 'activities', 'activities'),
+    list_executions=aws_list_operation('list_executions', 'executions', 'executions', stateMachineArn='arn', statusFilter='status_filter'),
+    list_state_machines=aws_list_operation('list_state_machines', 'state_machines', 'stateMachines'),
+    describe_state_machine=aws_dict_operation('describe_state_machine', 'state_machine', stateMachineArn='arn'),
+)
+
+
+def _stepfunctions_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _STEPFUNCTIONS_OPERATIONS,
+        error_msg='Failed to fetch AWS Step Functions (SFN) details',
+    )
 
 
 def main():
@@ -163,8 +137,9 @@ def main():
         list_state_machines=dict(required=False, type=bool),
         describe_state_machine=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_executions', True, ['arn']),
@@ -180,19 +155,7 @@ def main():
         ],
     )
 
-    client = module.client('stepfunctions', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _stepfunctions(client, module)
-
-    if module.params['list_activities']:
-        module.exit_json(activities=aws_response_list_parser(paginate, it, 'activities'))
-    elif module.params['list_executions']:
-        module.exit_json(executions=aws_response_list_parser(paginate, it, 'executions'))
-    elif module.params['list_state_machines']:
-        module.exit_json(state_machines=aws_response_list_parser(paginate, it, 'stateMachines'))
-    elif module.params['describe_state_machine']:
-        module.exit_json(state_machine=camel_dict_to_snake_dict(it))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'stepfunctions', _stepfunctions_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -61,6 +61,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -141,90 +142,43 @@ volumes:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _storagegateway(client, module):
-    try:
-        if module.params['list_automatic_tape_creation_policies']:
-            if client.can_paginate('list_automatic_tape_creation_policies'):
-                paginator = client.get_paginator('list_automatic_tape_creation_policies')
-                return paginator.paginate(
-                    GatewayARN=module.params['arn']
-                ), True
-            else:
-                return client.list_automatic_tape_creation_policies(
-                    GatewayARN=module.params['arn']
-                ), False
-        elif module.params['list_file_shares']:
-            if client.can_paginate('list_file_shares'):
-                paginator = client.get_paginator('list_file_shares')
-                return paginator.paginate(
-                    GatewayARN=module.params['arn']
-                ), True
-            else:
-                return client.list_file_shares(
-                    GatewayARN=module.params['arn']
-                ), False
-        elif module.params['list_file_system_associations']:
-            if client.can_paginate('list_file_system_associations'):
-                paginator = client.get_paginator('list_file_system_associations')
-                return paginator.paginate(
-                    GatewayARN=module.params['arn']
-                ), True
-            else:
-                return client.list_file_system_associations(
-                    GatewayARN=module.params['arn']
-                ), False
-        elif module.params['list_gateways']:
-            if client.can_paginate('list_gateways'):
-                paginator = client.get_paginator('list_gateways')
-                return paginator.paginate(), True
-            else:
-                return client.list_gateways(), False
-        elif module.params['list_local_disks']:
-            if client.can_paginate('list_local_disks'):
-                paginator = client.get_paginator('list_local_disks')
-                return paginator.paginate(
-                    GatewayARN=module.params['arn']
-                ), True
-            else:
-                return client.list_local_disks(
-                    GatewayARN=module.params['arn']
-                ), False
-        elif module.params['list_tape_pools']:
-            if client.can_paginate('list_tape_pools'):
-                paginator = client.get_paginator('list_tape_pools')
-                return paginator.paginate(), True
-            else:
-                return client.list_tape_pools(), False
-        elif module.params['list_tapes']:
-            if client.can_paginate('list_tapes'):
-                paginator = client.get_paginator('list_tapes')
-                return paginator.paginate(), True
-            else:
-                return client.list_tapes(), False
-        elif module.params['list_volumes']:
-            if client.can_paginate('list_volumes'):
-                paginator = client.get_paginator('list_volumes')
-                return paginator.paginate(
-                    GatewayARN=module.params['arn']
-                ), True
-            else:
-                return client.list_volumes(
-                    GatewayARN=module.params['arn']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Storage Gateway details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_STORAGEGATEWAY_OPERATIONS = dict(
+    list_automatic_tape_creation_policies=aws_list_operation(
+        'list_automatic_tape_creation_policies',
+        'automatic_tape_creation_policies',
+        'AutomaticTapeCreationPolicyInfos',
+        GatewayARN='arn',
+    ),
+    list_file_shares=aws_list_operation('list_file_shares', 'file_shares', 'FileShareInfoList', GatewayARN='arn'),
+    list_file_system_associations=aws_list_operation(
+        'list_file_system_associations',
+        'file_system_associations',
+        'FileSystemAssociationSummaryList',
+        GatewayARN='arn',
+    ),
+    list_gateways=aws_list_operation('list_gateways', 'gateways', 'Gateways'),
+    list_local_disks=aws_list_operation('list_local_disks', 'local_disks', 'Disks', GatewayARN='arn'),
+    list_tape_pools=aws_list_operation('list_tape_pools', 'tape_pools', 'PoolInfos'),
+    list_tapes=aws_list_operation('list_tapes', 'tapes', 'TapeInfos'),
+    list_volumes=aws_list_operation('list_volumes', 'volumes', 'VolumeInfos', GatewayARN='arn'),
+)
+
+
+def _storagegateway_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _STORAGEGATEWAY_OPERATIONS,
+        error_msg='Failed to fetch AWS Storage Gateway details',
+    )
 
 
 def main():
@@ -239,8 +193,9 @@ def main():
         list_tapes=dict(required=False, type=bool),
         list_volumes=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_automatic_tape_creation_policies', True, ['arn']),
@@ -263,27 +218,7 @@ def main():
         ],
     )
 
-    client = module.client('storagegateway', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _storagegateway(client, module)
-
-    if module.params['list_automatic_tape_creation_policies']:
-        module.exit_json(automatic_tape_creation_policies=aws_response_list_parser(paginate, it, 'AutomaticTapeCreationPolicyInfos'))
-    elif module.params['list_file_shares']:
-        module.exit_json(file_shares=aws_response_list_parser(paginate, it, 'FileShareInfoList'))
-    elif module.params['list_file_system_associations']:
-        module.exit_json(file_system_associations=aws_response_list_parser(paginate, it, 'FileSystemAssociationSummaryList'))
-    elif module.params['list_gateways']:
-        module.exit_json(gateways=aws_response_list_parser(paginate, it, 'Gateways'))
-    elif module.params['list_local_disks']:
-        module.exit_json(local_disks=aws_response_list_parser(paginate, it, 'Disks'))
-    elif module.params['list_tape_pools']:
-        module.exit_json(tape_pools=aws_response_list_parser(paginate, it, 'PoolInfos'))
-    elif module.params['list_tapes']:
-        module.exit_json(tapes=aws_response_list_parser(paginate, it, 'TapeInfos'))
-    elif module.params['list_volumes']:
-        module.exit_json(volumes=aws_response_list_parser(paginate, it, 'VolumeInfos'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'storagegateway', _storagegateway_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
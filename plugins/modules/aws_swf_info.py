@@ -47,6 +47,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -86,56 +87,28 @@ workflow_types:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _swf(client, module):
-    try:
-        if module.params['list_activity_types']:
-            if client.can_paginate('list_activity_types'):
-                paginator = client.get_paginator('list_activity_types')
-                return paginator.paginate(
-                    domain=module.params['domain'],
-                    registrationStatus=module.params['registration_status'],
-                ), True
-            else:
-                return client.list_activity_types(
-                    domain=module.params['domain'],
-                    registrationStatus=module.params['registration_status'],
-                ), False
-        elif module.params['list_domains']:
-            if client.can_paginate('list_domains'):
-                paginator = client.get_paginator('list_domains')
-                return paginator.paginate(
-                    registrationStatus=module.params['registration_status'],
-                ), True
-            else:
-                return client.list_domains(
-                    registrationStatus=module.params['registration_status'],
-                ), False
-        elif module.params['list_workflow_types']:
-            if client.can_paginate('list_workflow_types'):
-                paginator = client.get_paginator('list_workflow_types')
-                return paginator.paginate(
-                    domain=module.params['domain'],
-                    registrationStatus=module.params['registration_status'],
-                ), True
-            else:
-                return client.list_workflow_types(
-                    domain=module.params['domain'],
-                    registrationStatus=module.params['registration_status'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Simple Workflow Service (SWF) details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SWF_OPERATIONS = dict(
+    list_activity_types=aws_list_operation('list_activity_types', 'activity_types', 'typeInfos', domain='domain', registrationStatus='registration_status'),
+    list_domains=aws_list_operation('list_domains', 'domains', 'domainInfos', registrationStatus='registration_status'),
+    list_workflow_types=aws_list_operation('list_workflow_types', 'workflow_types', 'typeInfos', domain='domain', registrationStatus='registration_status'),
+)
+
+
+def _swf_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SWF_OPERATIONS,
+        error_msg='Failed to fetch Amazon Simple Workflow Service (SWF) details',
+    )
 
 
 def main():
@@ -146,8 +119,9 @@ def main():
         list_domains=dict(required=False, type=bool),
         list_workflow_types=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_activity_types', True, ['domain']),
@@ -162,17 +136,7 @@ def main():
         ],
     )
 
-    client = module.client('swf', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _swf(client, module)
-
-    if module.params['list_activity_types']:
-        module.exit_json(activity_types=aws_response_list_parser(paginate, it, 'typeInfos'))
-    elif module.params['list_domains']:
-        module.exit_json(domains=aws_response_list_parser(paginate, it, 'domainInfos'))
-    elif module.params['list_workflow_types']:
-        module.exit_json(workflow_types=aws_response_list_parser(paginate, it, 'typeInfos'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'swf', _swf_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -69,40 +70,28 @@ runtime_versions:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _synthetics(client, module):
-    try:
-        if module.params['describe_canaries']:
-            if client.can_paginate('describe_canaries'):
-                paginator = client.get_paginator('describe_canaries')
-                return paginator.paginate(), True
-            else:
-                return client.describe_canaries(), False
-        elif module.params['describe_canaries_last_run']:
-            if client.can_paginate('describe_canaries_last_run'):
-                paginator = client.get_paginator('describe_canaries_last_run')
-                return paginator.paginate(), True
-            else:
-                return client.describe_canaries_last_run(), False
-        elif module.params['describe_runtime_versions']:
-            if client.can_paginate('describe_runtime_versions'):
-                paginator = client.get_paginator('describe_runtime_versions')
-                return paginator.paginate(), True
-            else:
-                return client.describe_runtime_versions(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Cloudwatch Synthetics details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_SYNTHETICS_OPERATIONS = dict(
+    describe_canaries=aws_list_operation('describe_canaries', 'canaries', 'Canaries'),
+    describe_canaries_last_run=aws_list_operation('describe_canaries_last_run', 'canaries_last_run', 'CanariesLastRun'),
+    describe_runtime_versions=aws_list_operation('describe_runtime_versions', 'runtime_versions', 'RuntimeVersions'),
+)
+
+
+def _synthetics_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _SYNTHETICS_OPERATIONS,
+        error_msg='Failed to fetch Amazon Cloudwatch Synthetics details',
+    )
 
 
 def main():
@@ -111,8 +100,9 @@ def main():
         describe_canaries_last_run=dict(required=False, type=bool),
         describe_runtime_versions=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -124,17 +114,7 @@ def main():
         ],
     )
 
-    client = module.client('synthetics', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _synthetics(client, module)
-
-    if module.params['describe_canaries']:
-        module.exit_json(canaries=aws_response_list_parser(paginate, it, 'Canaries'))
-    elif module.params['describe_canaries_last_run']:
-        module.exit_json(canaries_last_run=aws_response_list_parser(paginate, it, 'CanariesLastRun'))
-    elif module.params['describe_runtime_versions']:
-        module.exit_json(runtime_versions=aws_response_list_parser(paginate, it, 'RuntimeVersions'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'synthetics', _synthetics_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -62,38 +63,27 @@ tables:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _timestream_write(client, module):
-    try:
-        if module.params['list_databases']:
-            if client.can_paginate('list_databases'):
-                paginator = client.get_paginator('list_databases')
-                return paginator.paginate(), True
-            else:
-                return client.list_databases(), False
-        elif module.params['list_tables']:
-            if client.can_paginate('list_tables'):
-                paginator = client.get_paginator('list_tables')
-                return paginator.paginate(
-                    DatabaseName=module.params['database_name'],
-                ), True
-            else:
-                return client.list_tables(
-                    DatabaseName=module.params['database_name'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Timestream Write details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_TIMESTREAM_WRITE_OPERATIONS = dict(
+    list_databases=aws_list_operation('list_databases', 'databases', 'Databases'),
+    list_tables=aws_list_operation('list_tables', 'tables', 'Tables', DatabaseName='database_name'),
+)
+
+
+def _timestream_write_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _TIMESTREAM_WRITE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Timestream Write details',
+    )
 
 
 def main():
@@ -102,8 +92,9 @@ def main():
         list_databases=dict(required=False, type=bool),
         list_tables=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_tables', True, ['database_name']),
@@ -116,15 +107,7 @@ def main():
         ],
     )
 
-    client = module.client('timestream-write', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _timestream_write(client, module)
-
-    if module.params['list_databases']:
-        module.exit_json(databases=aws_response_list_parser(paginate, it, 'Databases'))
-    elif module.params['list_tables']:
-        module.exit_json(tables=aws_response_list_parser(paginate, it, 'Tables'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'timestream-write', _timestream_write_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -51,6 +51,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -99,64 +100,41 @@ vocabulary_filters:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _transcribe(client, module):
-    try:
-        if module.params['list_language_models']:
-            if client.can_paginate('list_language_models'):
-                paginator = client.get_paginator('list_language_models')
-                return paginator.paginate(
-                    StatusEquals=module.params['status'],
-                    NameContains=module.params['name_contains'],
-                ), True
-            else:
-                return client.list_language_models(
-                    StatusEquals=module.params['status'],
-                    NameContains=module.params['name_contains'],
-                ), False
-        elif module.params['list_medical_transcription_jobs']:
-            if client.can_paginate('list_medical_transcription_jobs'):
-                paginator = client.get_paginator('list_medical_transcription_jobs')
-                return paginator.paginate(
-                    Status=module.params['status'],
-                    JobNameContains=module.params['name_contains'],
-                ), True
-            else:
-                return client.list_medical_transcription_jobs(
-                    Status=module.params['status'],
-                    JobNameContains=module.params['name_contains'],
-                ), False
-        elif module.params['list_transcription_jobs']:
-            if client.can_paginate('list_transcription_jobs'):
-                paginator = client.get_paginator('list_transcription_jobs')
-                return paginator.paginate(
-                    Status=module.params['status'],
-                    JobNameContains=module.params['name_contains'],
-                ), True
-            else:
-                return client.list_transcription_jobs(
-                    Status=module.params['status'],
-                    JobNameContains=module.params['name_contains'],
-                ), False
-        elif module.params['list_vocabulary_filters']:
-            if client.can_paginate('list_vocabulary_filters'):
-                paginator = client.get_paginator('list_vocabulary_filters')
-                return paginator.paginate(), True
-            else:
-                return client.list_vocabulary_filters(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Transcribe Service details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_TRANSCRIBE_OPERATIONS = dict(
+    list_language_models=aws_list_operation('list_language_models', 'language_models', 'Models', StatusEquals='status', NameContains='name_contains'),
+    list_medical_transcription_jobs=aws_list_operation(
+        'list_medical_transcription_jobs',
+        'medical_transcription_jobs',
+        'MedicalTranscriptionJobSummaries',
+        Status='status',
+        JobNameContains='name_contains',
+    ),
+    list_transcription_jobs=aws_list_operation(
+        'list_transcription_jobs',
+        'transcription_jobs',
+        'TranscriptionJobSummaries',
+        Status='status',
+        JobNameContains='name_contains',
+    ),
+    list_vocabulary_filters=aws_list_operation('list_vocabulary_filters', 'vocabulary_filters', 'VocabularyFilters'),
+)
+
+
+def _transcribe_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _TRANSCRIBE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Transcribe Service details',
+    )
 
 
 def main():
@@ -172,8 +150,9 @@ def main():
         list_transcription_jobs=dict(required=False, type=bool),
         list_vocabulary_filters=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_language_models', True, ['name_contains']),
@@ -190,19 +169,7 @@ def main():
         ],
     )
 
-    client = module.client('transcribe', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _transcribe(client, module)
-
-    if module.params['list_language_models']:
-        module.exit_json(language_models=aws_response_list_parser(paginate, it, 'Models'))
-    elif module.params['list_medical_transcription_jobs']:
-        module.exit_json(medical_transcription_jobs=aws_response_list_parser(paginate, it, 'MedicalTranscriptionJobSummaries'))
-    elif module.params['list_transcription_jobs']:
-        module.exit_json(transcription_jobs=aws_response_list_parser(paginate, it, 'TranscriptionJobSummaries'))
-    elif module.params['list_vocabulary_filters']:
-        module.exit_json(vocabulary_filters=aws_response_list_parser(paginate, it, 'VocabularyFilters'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'transcribe', _transcribe_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -39,6 +39,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -74,44 +75,28 @@ users:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _transfer(client, module):
-    try:
-        if module.params['list_security_policies']:
-            if client.can_paginate('list_security_policies'):
-                paginator = client.get_paginator('list_security_policies')
-                return paginator.paginate(), True
-            else:
-                return client.list_security_policies(), False
-        elif module.params['list_servers']:
-            if client.can_paginate('list_servers'):
-                paginator = client.get_paginator('list_servers')
-                return paginator.paginate(), True
-            else:
-                return client.list_servers(), False
-        elif module.params['list_users']:
-            if client.can_paginate('list_users'):
-                paginator = client.get_paginator('list_users')
-                return paginator.paginate(
-                    ServerId=module.params['server_id'],
-                ), True
-            else:
-                return client.list_users(
-                    ServerId=module.params['server_id'],
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Transfer Family details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_TRANSFER_OPERATIONS = dict(
+    list_security_policies=aws_list_operation('list_security_policies', 'security_policies', 'SecurityPolicyNames'),
+    list_servers=aws_list_operation('list_servers', 'servers', 'Servers'),
+    list_users=aws_list_operation('list_users', 'users', 'Users', ServerId='server_id'),
+)
+
+
+def _transfer_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _TRANSFER_OPERATIONS,
+        error_msg='Failed to fetch AWS Transfer Family details',
+    )
 
 
 def main():
@@ -121,8 +106,9 @@ def main():
         list_servers=dict(required=False, type=bool),
         list_users=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_users', True, ['server_id']),
@@ -136,17 +122,7 @@ def main():
         ],
     )
 
-    client = module.client('transfer', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _transfer(client, module)
-
-    if module.params['list_security_policies']:
-        module.exit_json(security_policies=aws_response_list_parser(paginate, it, 'SecurityPolicyNames'))
-    elif module.params['list_servers']:
-        module.exit_json(servers=aws_response_list_parser(paginate, it, 'Servers'))
-    elif module.params['list_users']:
-        module.exit_json(users=aws_response_list_parser(paginate, it, 'Users'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'transfer', _transfer_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
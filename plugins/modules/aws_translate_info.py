@@ -34,6 +34,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -68,40 +69,28 @@ text_translation_jobs:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _translate(client, module):
-    try:
-        if module.params['list_parallel_data']:
-            if client.can_paginate('list_parallel_data'):
-                paginator = client.get_paginator('list_parallel_data')
-                return paginator.paginate(), True
-            else:
-                return client.list_parallel_data(), False
-        elif module.params['list_terminologies']:
-            if client.can_paginate('list_terminologies'):
-                paginator = client.get_paginator('list_terminologies')
-                return paginator.paginate(), True
-            else:
-                return client.list_terminologies(), False
-        elif module.params['list_text_translation_jobs']:
-            if client.can_paginate('list_text_translation_jobs'):
-                paginator = client.get_paginator('list_text_translation_jobs')
-                return paginator.paginate(), True
-            else:
-                return client.list_text_translation_jobs(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon Translate details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_TRANSLATE_OPERATIONS = dict(
+    list_parallel_data=aws_list_operation('list_parallel_data', 'parallel_data', 'ParallelDataPropertiesList'),
+    list_terminologies=aws_list_operation('list_terminologies', 'terminologies', 'TerminologyPropertiesList'),
+    list_text_translation_jobs=aws_list_operation('list_text_translation_jobs', 'text_translation_jobs', 'TextTranslationJobPropertiesList'),
+)
+
+
+def _translate_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _TRANSLATE_OPERATIONS,
+        error_msg='Failed to fetch Amazon Translate details',
+    )
 
 
 def main():
@@ -110,8 +99,9 @@ def main():
         list_terminologies=dict(required=False, type=bool),
         list_text_translation_jobs=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -123,17 +113,7 @@ def main():
         ],
     )
 
-    client = module.client('translate', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _translate(client, module)
-
-    if module.params['list_parallel_data']:
-        module.exit_json(parallel_data=aws_response_list_parser(paginate, it, 'ParallelDataPropertiesList'))
-    elif module.params['list_terminologies']:
-        module.exit_json(terminologies=aws_response_list_parser(paginate, it, 'TerminologyPropertiesList'))
-    elif module.params['list_text_translation_jobs']:
-        module.exit_json(text_translation_jobs=aws_response_list_parser(paginate, it, 'TextTranslationJobPropertiesList'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'translate', _translate_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
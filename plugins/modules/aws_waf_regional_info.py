@@ -76,6 +76,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -167,86 +168,40 @@ size_constraint_sets:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _waf_regional(client, module):
-    try:
-        if module.params['list_activated_rules_in_rule_group']:
-            if client.can_paginate('list_activated_rules_in_rule_group'):
-                paginator = client.get_paginator('list_activated_rules_in_rule_group')
-                return paginator.paginate(
-                    RuleGroupId=module.params['id']
-                ), True
-            else:
-                return client.list_activated_rules_in_rule_group(
-                    RuleGroupId=module.params['id']
-                ), False
-        elif module.params['list_byte_match_sets']:
-            if client.can_paginate('list_byte_match_sets'):
-                paginator = client.get_paginator('list_byte_match_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_byte_match_sets(), False
-        elif module.params['list_geo_match_sets']:
-            if client.can_paginate('list_geo_match_sets'):
-                paginator = client.get_paginator('list_geo_match_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_geo_match_sets(), False
-        elif module.params['list_ip_sets']:
-            if client.can_paginate('list_ip_sets'):
-                paginator = client.get_paginator('list_ip_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_ip_sets(), False
-        elif module.params['list_logging_configurations']:
-            if client.can_paginate('list_logging_configurations'):
-                paginator = client.get_paginator('list_logging_configurations')
-                return paginator.paginate(), True
-            else:
-                return client.list_logging_configurations(), False
-        elif module.params['list_rate_based_rules']:
-            if client.can_paginate('list_rate_based_rules'):
-                paginator = client.get_paginator('list_rate_based_rules')
-                return paginator.paginate(), True
-            else:
-                return client.list_rate_based_rules(), False
-        elif module.params['list_regex_match_sets']:
-            if client.can_paginate('list_regex_match_sets'):
-                paginator = client.get_paginator('list_regex_match_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_regex_match_sets(), False
-        elif module.params['list_rule_groups']:
-            if client.can_paginate('list_rule_groups'):
-                paginator = client.get_paginator('list_rule_groups')
-                return paginator.paginate(), True
-            else:
-                return client.list_rule_groups(), False
-        elif module.params['list_rules']:
-            if client.can_paginate('list_rules'):
-                paginator = client.get_paginator('list_rules')
-                return paginator.paginate(), True
-            else:
-                return client.list_rules(), False
-        elif module.params['list_size_constraint_sets']:
-            if client.can_paginate('list_size_constraint_sets'):
-                paginator = client.get_paginator('list_size_constraint_sets')
-                return paginator.paginate(), True
-            else:
-                return client.list_size_constraint_sets(), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS WAF Classic Regional details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_WAF_REGIONAL_OPERATIONS = dict(
+    list_activated_rules_in_rule_group=aws_list_operation(
+        'list_activated_rules_in_rule_group',
+        'activated_rules_in_rule_group',
+        'ActivatedRules',
+        RuleGroupId='id',
+    ),
+    list_byte_match_sets=aws_list_operation('list_byte_match_sets', 'byte_match_sets', 'ByteMatchSets'),
+    list_geo_match_sets=aws_list_operation('list_geo_match_sets', 'geo_match_sets', 'GeoMatchSets'),
+    list_ip_sets=aws_list_operation('list_ip_sets', 'ip_sets', 'IPSets'),
+    list_logging_configurations=aws_list_operation('list_logging_configurations', 'logging_configurations', 'LoggingConfigurations'),
+    list_rate_based_rules=aws_list_operation('list_rate_based_rules', 'rate_based_rules', 'Rules'),
+    list_regex_match_sets=aws_list_operation('list_regex_match_sets', 'regex_match_sets', 'RegexMatchSets'),
+    list_rule_groups=aws_list_operation('list_rule_groups', 'rule_groups', 'RuleGroups'),
+    list_rules=aws_list_operation('list_rules', 'rules', 'Rules'),
+    list_size_constraint_sets=aws_list_operation('list_size_constraint_sets', 'size_constraint_sets', 'SizeConstraintSets'),
+)
+
+
+def _waf_regional_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _WAF_REGIONAL_OPERATIONS,
+        error_msg='Failed to fetch AWS WAF Classic Regional details',
+    )
 
 
 def main():
@@ -263,8 +218,9 @@ def main():
         list_rules=dict(required=False, type=bool),
         list_size_constraint_sets=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_activated_rules_in_rule_group', True, ['id']),
@@ -285,31 +241,7 @@ def main():
         ],
     )
 
-    client = module.client('waf-regional', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _waf_regional(client, module)
-
-    if module.params['list_activated_rules_in_rule_group']:
-        module.exit_json(activated_rules_in_rule_group=aws_response_list_parser(paginate, it, 'ActivatedRules'))
-    elif module.params['list_byte_match_sets']:
-        module.exit_json(byte_match_sets=aws_response_list_parser(paginate, it, 'ByteMatchSets'))
-    elif module.params['list_geo_match_sets']:
-        module.exit_json(geo_match_sets=aws_response_list_parser(paginate, it, 'GeoMatchSets'))
-    elif module.params['list_ip_sets']:
-        module.exit_json(ip_sets=aws_response_list_parser(paginate, it, 'IPSets'))
-    elif module.params['list_logging_configurations']:
-        module.exit_json(logging_configurations=aws_response_list_parser(paginate, it, 'LoggingConfigurations'))
-    elif module.params['list_rate_based_rules']:
-        module.exit_json(rate_based_rules=aws_response_list_parser(paginate, it, 'Rules'))
-    elif module.params['list_regex_match_sets']:
-        module.exit_json(regex_match_sets=aws_response_list_parser(paginate, it, 'RegexMatchSets'))
-    elif module.params['list_rule_groups']:
-        module.exit_json(rule_groups=aws_response_list_parser(paginate, it, 'RuleGroups'))
-    elif module.params['list_rules']:
-        module.exit_json(rules=aws_response_list_parser(paginate, it, 'Rules'))
-    elif module.params['list_size_constraint_sets']:
-        module.exit_json(size_constraint_sets=aws_response_list_parser(paginate, it, 'SizeConstraintSets'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'waf-regional', _waf_regional_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -57,6 +57,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -121,82 +122,36 @@ web_acls:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _wafv2(client, module):
-    try:
-        if module.params['list_available_managed_rule_groups']:
-            if client.can_paginate('list_available_managed_rule_groups'):
-                paginator = client.get_paginator('list_available_managed_rule_groups')
-                return paginator.paginate(
-                    Scope=module.params['scope']
-                ), True
-            else:
-                return client.list_available_managed_rule_groups(
-                    Scope=module.params['scope']
-                ), False
-        elif module.params['list_ip_sets']:
-            if client.can_paginate('list_ip_sets'):
-                paginator = client.get_paginator('list_ip_sets')
-                return paginator.paginate(
-                    Scope=module.params['scope']
-                ), True
-            else:
-                return client.list_ip_sets(
-                    Scope=module.params['scope']
-                ), False
-        elif module.params['list_logging_configurations']:
-            if client.can_paginate('list_logging_configurations'):
-                paginator = client.get_paginator('list_logging_configurations')
-                return paginator.paginate(
-                    Scope=module.params['scope']
-                ), True
-            else:
-                return client.list_logging_configurations(
-                    Scope=module.params['scope']
-                ), False
-        elif module.params['list_regex_pattern_sets']:
-            if client.can_paginate('list_regex_pattern_sets'):
-                paginator = client.get_paginator('list_regex_pattern_sets')
-                return paginator.paginate(
-                    Scope=module.params['scope']
-                ), True
-            else:
-                return client.list_regex_pattern_sets(
-                    Scope=module.params['scope']
-                ), False
-        elif module.params['list_rule_groups']:
-            if client.can_paginate('list_rule_groups'):
-                paginator = client.get_paginator('list_rule_groups')
-                return paginator.paginate(
-                    Scope=module.params['scope']
-                ), True
-            else:
-                return client.list_rule_groups(
-                    Scope=module.params['scope']
-                ), False
-        elif module.params['list_web_acls']:
-            if client.can_paginate('list_web_acls'):
-                paginator = client.get_paginator('list_web_acls')
-                return paginator.paginate(
-                    Scope=module.params['scope']
-                ), True
-            else:
-                return client.list_web_acls(
-                    Scope=module.params['scope']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS WAFV2 details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_WAFV2_OPERATIONS = dict(
+    list_available_managed_rule_groups=aws_list_operation(
+        'list_available_managed_rule_groups',
+        'available_managed_rule_groups',
+        'ManagedRuleGroups',
+        Scope='scope',
+    ),
+    list_ip_sets=aws_list_operation('list_ip_sets', 'ip_sets', 'IPSets', Scope='scope'),
+    list_logging_configurations=aws_list_operation('list_logging_configurations', 'logging_configurations', 'LoggingConfigurations', Scope='scope'),
+    list_regex_pattern_sets=aws_list_operation('list_regex_pattern_sets', 'regex_pattern_sets', 'RegexPatternSets', Scope='scope'),
+    list_rule_groups=aws_list_operation('list_rule_groups', 'rule_groups', 'RuleGroups', Scope='scope'),
+    list_web_acls=aws_list_operation('list_web_acls', 'web_acls', 'WebACLs', Scope='scope'),
+)
+
+
+def _wafv2_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _WAFV2_OPERATIONS,
+        error_msg='Failed to fetch AWS WAFV2 details',
+    )
 
 
 def main():
@@ -209,8 +164,9 @@ def main():
         list_rule_groups=dict(required=False, type=bool),
         list_web_acls=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(),
         mutually_exclusive=[
@@ -225,23 +181,7 @@ def main():
         ],
     )
 
-    client = module.client('wafv2', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _wafv2(client, module)
-
-    if module.params['list_available_managed_rule_groups']:
-        module.exit_json(available_managed_rule_groups=aws_response_list_parser(paginate, it, 'ManagedRuleGroups'))
-    elif module.params['list_ip_sets']:
-        module.exit_json(ip_sets=aws_response_list_parser(paginate, it, 'IPSets'))
-    elif module.params['list_logging_configurations']:
-        module.exit_json(logging_configurations=aws_response_list_parser(paginate, it, 'LoggingConfigurations'))
-    elif module.params['list_regex_pattern_sets']:
-        module.exit_json(regex_pattern_sets=aws_response_list_parser(paginate, it, 'RegexPatternSets'))
-    elif module.params['list_rule_groups']:
-        module.exit_json(rule_groups=aws_response_list_parser(paginate, it, 'RuleGroups'))
-    elif module.params['list_web_acls']:
-        module.exit_json(web_acls=aws_response_list_parser(paginate, it, 'WebACLs'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'wafv2', _wafv2_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -52,6 +52,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -97,58 +98,29 @@ workloads:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _wellarchitected(client, module):
-    try:
-        if module.params['list_lenses']:
-            if client.can_paginate('list_lenses'):
-                paginator = client.get_paginator('list_lenses')
-                return paginator.paginate(), True
-            else:
-                return client.list_lenses(), False
-        elif module.params['list_milestones']:
-            if client.can_paginate('list_milestones'):
-                paginator = client.get_paginator('list_milestones')
-                return paginator.paginate(
-                    WorkloadId=module.params['id']
-                ), True
-            else:
-                return client.list_milestones(
-                    WorkloadId=module.params['id']
-                ), False
-        elif module.params['list_notifications']:
-            if client.can_paginate('list_notifications'):
-                paginator = client.get_paginator('list_notifications')
-                return paginator.paginate(
-                    WorkloadId=module.params['id']
-                ), True
-            else:
-                return client.list_notifications(
-                    WorkloadId=module.params['id']
-                ), False
-        elif module.params['list_workloads']:
-            if client.can_paginate('list_workloads'):
-                paginator = client.get_paginator('list_workloads')
-                return paginator.paginate(
-                    WorkloadNamePrefix=module.params['prefix']
-                ), True
-            else:
-                return client.list_workloads(
-                    WorkloadNamePrefix=module.params['prefix']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch AWS Well-Architected Tool details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_WELLARCHITECTED_OPERATIONS = dict(
+    list_lenses=aws_list_operation('list_lenses', 'lenses', 'LensSummaries'),
+    list_milestones=aws_list_operation('list_milestones', 'milestones', 'MilestoneSummaries', WorkloadId='id'),
+    list_notifications=aws_list_operation('list_notifications', 'notifications', 'NotificationSummaries', WorkloadId='id'),
+    list_workloads=aws_list_operation('list_workloads', 'workloads', 'WorkloadSummaries', WorkloadNamePrefix='prefix'),
+)
+
+
+def _wellarchitected_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _WELLARCHITECTED_OPERATIONS,
+        error_msg='Failed to fetch AWS Well-Architected Tool details',
+    )
 
 
 def main():
@@ -160,8 +132,9 @@ def main():
         list_notifications=dict(required=False, type=bool),
         list_workloads=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_milestones', True, ['id']),
@@ -178,19 +151,7 @@ def main():
         ],
     )
 
-    client = module.client('wellarchitected', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _wellarchitected(client, module)
-
-    if module.params['list_lenses']:
-        module.exit_json(lenses=aws_response_list_parser(paginate, it, 'LensSummaries'))
-    elif module.params['list_milestones']:
-        module.exit_json(milestones=aws_response_list_parser(paginate, it, 'MilestoneSummaries'))
-    elif module.params['list_notifications']:
-        module.exit_json(notifications=aws_response_list_parser(paginate, it, 'NotificationSummaries'))
-    elif module.params['list_workloads']:
-        module.exit_json(workloads=aws_response_list_parser(paginate, it, 'WorkloadSummaries'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'wellarchitected', _wellarchitected_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -46,6 +46,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -92,58 +93,34 @@ website_authorization_providers:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _worklink(client, module):
-    try:
-        if module.params['list_devices']:
-            if client.can_paginate('list_devices'):
-                paginator = client.get_paginator('list_devices')
-                return paginator.paginate(
-                    FleetArn=module.params['arn']
-                ), True
-            else:
-                return client.list_devices(
-                    FleetArn=module.params['arn']
-                ), False
-        elif module.params['list_domains']:
-            if client.can_paginate('list_domains'):
-                paginator = client.get_paginator('list_domains')
-                return paginator.paginate(
-                    FleetArn=module.params['arn']
-                ), True
-            else:
-                return client.list_domains(
-                    FleetArn=module.params['arn']
-                ), False
-        elif module.params['list_fleets']:
-            if client.can_paginate('list_fleets'):
-                paginator = client.get_paginator('list_fleets')
-                return paginator.paginate(), True
-            else:
-                return client.list_fleets(), False
-        elif module.params['list_website_authorization_providers']:
-            if client.can_paginate('list_website_authorization_providers'):
-                paginator = client.get_paginator('list_website_authorization_providers')
-                return paginator.paginate(
-                    FleetArn=module.params['arn']
-                ), True
-            else:
-                return client.list_website_authorization_providers(
-                    FleetArn=module.params['arn']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon WorkLink details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_WORKLINK_OPERATIONS = dict(
+    list_devices=aws_list_operation('list_devices', 'devices', 'Devices', FleetArn='arn'),
+    list_domains=aws_list_operation('list_domains', 'domains', 'Domains', FleetArn='arn'),
+    list_fleets=aws_list_operation('list_fleets', 'fleets', 'FleetSummaryList'),
+    list_website_authorization_providers=aws_list_operation(
+        'list_website_authorization_providers',
+        'website_authorization_providers',
+        'WebsiteAuthorizationProviders',
+        FleetArn='arn',
+    ),
+)
+
+
+def _worklink_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _WORKLINK_OPERATIONS,
+        error_msg='Failed to fetch Amazon WorkLink details',
+    )
 
 
 def main():
@@ -154,8 +131,9 @@ def main():
         list_fleets=dict(required=False, type=bool),
         list_website_authorization_providers=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_devices', True, ['arn']),
@@ -172,19 +150,7 @@ def main():
         ],
     )
 
-    client = module.client('worklink', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _worklink(client, module)
-
-    if module.params['list_devices']:
-        module.exit_json(devices=aws_response_list_parser(paginate, it, 'Devices'))
-    elif module.params['list_domains']:
-        module.exit_json(domains=aws_response_list_parser(paginate, it, 'Domains'))
-    elif module.params['list_fleets']:
-        module.exit_json(fleets=aws_response_list_parser(paginate, it, 'FleetSummaryList'))
-    elif module.params['list_website_authorization_providers']:
-        module.exit_json(website_authorization_providers=aws_response_list_parser(paginate, it, 'WebsiteAuthorizationProviders'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'worklink', _worklink_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -61,6 +61,7 @@ author:
 extends_documentation_fragment:
   - amazon.aws.ec2
   - amazon.aws.aws
+  - community.missing_collection.aws_info
 requirements:
   - boto3
   - botocore
@@ -133,88 +134,32 @@ users:
   type: list
 """
 
-try:
-    from botocore.exceptions import BotoCoreError, ClientError
-except ImportError:
-    pass    # Handled by AnsibleAWSModule
-
-from ansible_collections.amazon.aws.plugins.module_utils.core import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.ec2 import AWSRetry
-from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
-
-
-def _workmail(client, module):
-    try:
-        if module.params['list_access_control_rules']:
-            if client.can_paginate('list_access_control_rules'):
-                paginator = client.get_paginator('list_access_control_rules')
-                return paginator.paginate(
-                    OrganizationId=module.params['id']
-                ), True
-            else:
-                return client.list_access_control_rules(
-                    OrganizationId=module.params['id']
-                ), False
-        elif module.params['list_groups']:
-            if client.can_paginate('list_groups'):
-                paginator = client.get_paginator('list_groups')
-                return paginator.paginate(
-                    OrganizationId=module.params['id']
-                ), True
-            else:
-                return client.list_groups(
-                    OrganizationId=module.params['id']
-                ), False
-        elif module.params['list_mailbox_export_jobs']:
-            if client.can_paginate('list_mailbox_export_jobs'):
-                paginator = client.get_paginator('list_mailbox_export_jobs')
-                return paginator.paginate(
-                    OrganizationId=module.params['id']
-                ), True
-            else:
-                return client.list_mailbox_export_jobs(
-                    OrganizationId=module.params['id']
-                ), False
-        elif module.params['list_mobile_device_access_rules']:
-            if client.can_paginate('list_mobile_device_access_rules'):
-                paginator = client.get_paginator('list_mobile_device_access_rules')
-                return paginator.paginate(
-                    OrganizationId=module.params['id']
-                ), True
-            else:
-                return client.list_mobile_device_access_rules(
-                    OrganizationId=module.params['id']
-                ), False
-        elif module.params['list_organizations']:
-            if client.can_paginate('list_organizations'):
-                paginator = client.get_paginator('list_organizations')
-                return paginator.paginate(), True
-            else:
-                return client.list_organizations(), False
-        elif module.params['list_resources']:
-            if client.can_paginate('list_resources'):
-                paginator = client.get_paginator('list_resources')
-                return paginator.paginate(
-                    OrganizationId=module.params['id']
-                ), True
-            else:
-                return client.list_resources(
-                    OrganizationId=module.params['id']
-                ), False
-        elif module.params['list_users']:
-            if client.can_paginate('list_users'):
-                paginator = client.get_paginator('list_users')
-                return paginator.paginate(
-                    OrganizationId=module.params['id']
-                ), True
-            else:
-                return client.list_users(
-                    OrganizationId=module.params['id']
-                ), False
-        else:
-            return None, False
-    except (BotoCoreError, ClientError) as e:
-        module.fail_json_aws(e, msg='Failed to fetch Amazon WorkMail details')
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_module
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_retry
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_run
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_list_operation
+
+
+_WORKMAIL_OPERATIONS = dict(
+    list_access_control_rules=aws_list_operation('list_access_control_rules', 'access_control_rules', 'Rules', OrganizationId='id'),
+    list_groups=aws_list_operation('list_groups', 'groups', 'Groups', OrganizationId='id'),
+    list_mailbox_export_jobs=aws_list_operation('list_mailbox_export_jobs', 'mailbox_export_jobs', 'Jobs', OrganizationId='id'),
+    list_mobile_device_access_rules=aws_list_operation('list_mobile_device_access_rules', 'mobile_device_access_rules', 'Rules', OrganizationId='id'),
+    list_organizations=aws_list_operation('list_organizations', 'organizations', 'OrganizationSummaries'),
+    list_resources=aws_list_operation('list_resources', 'resources', 'Resources', OrganizationId='id'),
+    list_users=aws_list_operation('list_users', 'users', 'Users', OrganizationId='id'),
+)
+
+
+def _workmail_result(client, module) -> dict:
+    return aws_operations_result(
+        client,
+        module,
+        _WORKMAIL_OPERATIONS,
+        error_msg='Failed to fetch Amazon WorkMail details',
+    )
 
 
 def main():
@@ -228,8 +173,9 @@ def main():
         list_resources=dict(required=False, type=bool),
         list_users=dict(required=False, type=bool),
     )
+    argument_spec.update(aws_info_argument_spec())
 
-    module = AnsibleAWSModule(
+    module = aws_info_module(
         argument_spec=argument_spec,
         required_if=(
             ('list_access_control_rules', True, ['id']),
@@ -252,25 +198,7 @@ def main():
         ],
     )
 
-    client = module.client('workmail', retry_decorator=AWSRetry.exponential_backoff())
-    it, paginate = _workmail(client, module)
-
-    if module.params['list_access_control_rules']:
-        module.exit_json(access_control_rules=aws_response_list_parser(paginate, it, 'Rules'))
-    elif module.params['list_groups']:
-        module.exit_json(groups=aws_response_list_parser(paginate, it, 'Groups'))
-    elif module.params['list_mailbox_export_jobs']:
-        module.exit_json(mailbox_export_jobs=aws_response_list_parser(paginate, it, 'Jobs'))
-    elif module.params['list_mobile_device_access_rules']:
-        module.exit_json(mobile_device_access_rules=aws_response_list_parser(paginate, it, 'Rules'))
-    elif module.params['list_organizations']:
-        module.exit_json(organizations=aws_response_list_parser(paginate, it, 'OrganizationSummaries'))
-    elif module.params['list_resources']:
-        module.exit_json(resources=aws_response_list_parser(paginate, it, 'Resources'))
-    elif module.params['list_users']:
-        module.exit_json(users=aws_response_list_parser(paginate, it, 'Users'))
-    else:
-        module.fail_json("unknown options are passed")
+    module.exit_json(**aws_info_run(module, 'workmail', _workmail_result, retry_decorator=aws_info_retry()))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""
+time per item, peak memory and json result size of aws response parsers and info modules with synthetic responses.
+
+aws is replaced by botocore Stubber, so results only depend on code of this collection, botocore and the machine.
+`aws_operations_result/<module>` runs every list operation of the module's operation tables with synthetic pages
+instead, so no service model is needed.
+
+usage:
+  python tests/benchmarks/aws_info_benchmark.py                        # compare against saved baseline
+  python tests/benchmarks/aws_info_benchmark.py --save-baseline        # after intended performance change
+  python tests/benchmarks/aws_info_benchmark.py --sizes 1000 --scenarios aws_logs_info
+  python tests/benchmarks/aws_info_benchmark.py --registry-sizes 1000 10000 --scenarios aws_operations_result/aws_ecs_info
+"""
+import argparse
+import collections
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import sys
+import time
+import tracemalloc
+
+import boto3
+import botocore
+from botocore.stub import Stubber
+
+from ansible_collections.community.missing_collection.plugins import modules
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_info import aws_info_argument_spec
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import AwsOperation
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_operations import aws_operations_result
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_nested_list_parser
+from ansible_collections.community.missing_collection.plugins.modules.aws_logs_info import _logs_result
+from ansible_collections.community.missing_collection.plugins.modules.aws_pinpoint_info import _pinpoint_result
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'aws_info_benchmark.json')
+PAGE_SIZE = 50
+REGISTRY_SCENARIO = 'aws_operations_result/'
+# date options of operation parameter functions, other unset options are None.
+REGISTRY_PARAMS = dict(start_time='2021-12-01', end_time='2021-12-02', from_time='2021-12-01')
+
+
+class BenchmarkModule(object):
+    # only what `_<service>_result` functions use, unset module options are None like in AnsibleModule.
+
+    def __init__(self, **params):
+        self.params = collections.defaultdict(lambda: None)
+        self.params.update((k, v.get('default')) for k, v in aws_info_argument_spec().items())
+        self.params.update(params)
+
+    def fail_json(self, msg=None, **kwargs):
+        raise RuntimeError(msg)
+
+    def fail_json_aws(self, exception, msg=None, **kwargs):
+        raise RuntimeError('{0}: {1}'.format(msg, exception))
+
+
+def log_group(i: int) -> dict:
+    return {
+        'logGroupName': '/aws/lambda/function-%d' % i,
+        'creationTime': 1638316800000 + i,
+        'retentionInDays': 30,
+        'metricFilterCount': i % 3,
+        'arn': 'arn:aws:logs:eu-central-1:123456789012:log-group:/aws/lambda/function-%d:*' % i,
+        'storedBytes': i * 1024,
+        'kmsKeyId': 'arn:aws:kms:eu-central-1:123456789012:key/%d' % i,
+        'dataProtectionStatus': 'ACTIVATED',
+        'inheritedProperties': ['ACCOUNT_DATA_PROTECTION'],
+        'logGroupClass': 'STANDARD',
+    }
+
+
+def pinpoint_app(i: int) -> dict:
+    return {
+        'Arn': 'arn:aws:mobiletargeting:eu-central-1:123456789012:apps/app-%d' % i,
+        'Id': 'app-%d' % i,
+        'Name': 'application-%d' % i,
+        'tags': {'Team': 'ops', 'Name': 'application-%d' % i},
+        'CreationDate': '2021-12-01T00:00:00Z',
+    }
+
+
+def log_group_pages(items: int) -> list:
+    pages = []
+    for start in range(0, items, PAGE_SIZE):
+        page = {'logGroups': [log_group(i) for i in range(start, min(start + PAGE_SIZE, items))]}
+        if start + PAGE_SIZE < items:
+            page['nextToken'] = 'token-%d' % (start + PAGE_SIZE)
+        pages.append(page)
+    return pages
+
+
+def synthetic_item(i: int) -> dict:
+    return {
+        'Name': 'resource-%d' % i,
+        'Arn': 'arn:aws:service:eu-central-1:123456789012:resource/resource-%d' % i,
+        'Status': 'ACTIVE',
+        'CreationTime': '2021-12-01T00:00:00Z',
+        'Tags': [{'Key': 'Team', 'Value': 'ops'}, {'Key': 'Name', 'Value': 'resource-%d' % i}],
+    }
+
+
+class SyntheticClient(object):
+    # pages of one list operation for any api, parameters are ignored.
+
+    def __init__(self, operation: AwsOperation, items: int):
+        self.pages = []
+        for start in range(0, items, PAGE_SIZE):
+            page_items = [synthetic_item(i) for i in range(start, min(start + PAGE_SIZE, items))]
+            if operation.nested_resource_field is not None:
+                page_items = {operation.nested_resource_field: page_items}
+            self.pages.append({operation.resource_field: page_items})
+
+    def can_paginate(self, api: str) -> bool:
+        return True
+
+    def get_paginator(self, api: str):
+        return self
+
+    def paginate(self, **params):
+        return iter(self.pages)
+
+
+def registry_operations(module) -> list:
+    # list operations of all tables and single operations of module, dict operations have no pages.
+    operations = []
+    for value in vars(module).values():
+        values = value.values() if isinstance(value, dict) else value if isinstance(value, list) else [value]
+        for operation in values:
+            if isinstance(operation, AwsOperation) and operation.parser != 'dict' and operation not in operations:
+                operations.append(operation)
+    return operations
+
+
+def registry_setup(operations: list, items: int) -> tuple:
+    # items are split between operations, so us/item is comparable with other scenarios.
+    per_operation = max(1, items // len(operations))
+    return ([(SyntheticClient(operation, per_operation), operation) for operation in operations], BenchmarkModule(**REGISTRY_PARAMS))
+
+
+def registry_run(clients: list, module: BenchmarkModule) -> list:
+    return [aws_operations_result(client, module, {}, default=operation) for client, operation in clients]
+
+
+def registry_scenarios() -> list:
+    scenarios = []
+    for _finder, name, _ispkg in sorted(pkgutil.iter_modules(modules.__path__), key=lambda m: m[1]):
+        if not (name.startswith('aws_') and name.endswith('_info')):
+            continue
+        operations = registry_operations(importlib.import_module(modules.__name__ + '.' + name))
+        if operations:
+            setup = (lambda operations: lambda items: registry_setup(operations, items))(operations)
+            scenarios.append((REGISTRY_SCENARIO + name, (setup, registry_run)))
+    return scenarios
+
+
+def stubbed_client(service: str, operation: str, responses: list):
+    client = boto3.client(service, region_name='eu-central-1', aws_access_key_id='benchmark', aws_secret_access_key='benchmark')
+    stubber = Stubber(client)
+    for response in responses:
+        stubber.add_response(operation, response)
+    stubber.activate()
+    return client
+
+
+# name: ( setup( items ) -> arguments, run( *arguments ) -> result )
+SCENARIOS = collections.OrderedDict((
+    (
+        'aws_response_list_parser',
+        (
+            lambda items: (log_group_pages(items),),
+            lambda pages: aws_response_list_parser(True, pages, 'logGroups'),
+        ),
+    ),
+    (
+        'aws_response_nested_list_parser',
+        (
+            lambda items: ({'ApplicationsResponse': {'Item': [pinpoint_app(i) for i in range(items)]}},),
+            lambda response: aws_response_nested_list_parser(False, response, 'ApplicationsResponse', 'Item'),
+        ),
+    ),
+    (
+        'aws_logs_info',
+        (
+            lambda items: (stubbed_client('logs', 'describe_log_groups', log_group_pages(items)), BenchmarkModule(describe_log_groups=True)),
+            _logs_result,
+        ),
+    ),
+    (
+        'aws_pinpoint_info',
+        (
+            lambda items: (
+                stubbed_client('pinpoint', 'get_apps', [{'ApplicationsResponse': {'Item': [pinpoint_app(i) for i in range(items)]}}]),
+                BenchmarkModule(get_apps=True),
+            ),
+            _pinpoint_result,
+        ),
+    ),
+) + tuple(registry_scenarios()))
+
+
+def measure(name: str, items: int, repeat: int) -> dict:
+    setup, run = SCENARIOS[name]
+
+    elapsed = None
+    for _i in range(repeat):
+        arguments = setup(items)
+        start = time.perf_counter()
+        result = run(*arguments)
+        elapsed = min(elapsed or float('inf'), time.perf_counter() - start)
+
+    # separate run, tracemalloc slows down every allocation.
+    arguments = setup(items)
+    tracemalloc.start()
+    run(*arguments)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return dict(
+        us_per_item=round(elapsed / items * 1e6, 3),
+        peak_memory_bytes=peak,
+        json_bytes=len(json.dumps(result, default=str)),
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for key, result in sorted(results.items()):
+        expected = baseline.get('results', {}).get(key)
+        if expected is None:
+            continue
+        for metric in ('us_per_item', 'peak_memory_bytes'):
+            if result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append('{0} {1}: {2} > baseline {3}'.format(key, metric, result[metric], expected[metric]))
+        if result['json_bytes'] != expected['json_bytes']:
+            # result size is deterministic, change means result format changed.
+            regressions.append('{0} json_bytes: {1} != baseline {2}'.format(key, result['json_bytes'], expected['json_bytes']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--registry-sizes', type=int, nargs='+', default=[1000], help='sizes of aws_operations_result scenarios')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--repeat', type=int, default=5, help='best of given runs is reported')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='overwrite baseline with this run')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown / memory growth, 0.25 is 25% slower')
+    args = parser.parse_args()
+
+    results = {}
+    print('%-60s %8s %12s %14s %12s' % ('scenario', 'items', 'us/item', 'peak memory', 'json bytes'))
+    for name in args.scenarios:
+        for items in args.registry_sizes if name.startswith(REGISTRY_SCENARIO) else args.sizes:
+            key = '{0}/{1}'.format(name, items)
+            results[key] = measure(name, items, args.repeat)
+            print('%-60s %8d %12.3f %14d %12d' % (name, items, results[key]['us_per_item'], results[key]['peak_memory_bytes'], results[key]['json_bytes']))
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.setdefault('results', {}).update(results)
+        baseline['environment'] = dict(python=platform.python_version(), botocore=botocore.__version__, machine=platform.machine())
+        if not os.path.isdir(os.path.dirname(args.baseline)):
+            os.makedirs(os.path.dirname(args.baseline))
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('baseline saved to %s' % args.baseline)
+        return
+
+    if not os.path.exists(args.baseline):
+        print('no baseline at %s, run with --save-baseline' % args.baseline)
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print('REGRESSION ' + regression)
+    if regressions:
+        sys.exit(1)
+    print('no regression against baseline ( %s )' % ', '.join('%s %s' % kv for kv in sorted(baseline.get('environment', {}).items())))
+
+
+if __name__ == '__main__':
+    main()
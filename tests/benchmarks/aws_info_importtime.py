@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""
+startup cost of aws info modules, measured with `python -X importtime` in fresh interpreters.
+
+* import_ms: import of module file, boto3 and amazon.aws must not be part of it.
+* fail_ms: whole run of module with invalid option until it fails, no aws call is made.
+* boto3_ms: import of boto3 alone, paid by every run which calls aws.
+
+usage:
+  python tests/benchmarks/aws_info_importtime.py                        # compare against saved baseline
+  python tests/benchmarks/aws_info_importtime.py --save-baseline        # after intended startup change
+  python tests/benchmarks/aws_info_importtime.py --modules aws_ecs_info --repeat 10
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'aws_info_importtime.json')
+PACKAGE = 'ansible_collections.community.missing_collection.plugins.modules'
+MODULES = ('aws_lightsail_info', 'aws_ecs_info', 'aws_logs_info', 'aws_backup_info')
+# imported only after options are validated.
+HEAVY_IMPORTS = ('boto3', 'ansible_collections.amazon.aws.plugins.module_utils.core')
+# invalid for every module, fails in argument validation.
+INVALID_ARGS = {'max_items': 'not-a-number', 'region': 'eu-central-1'}
+
+_IMPORTTIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def importtime(args: list) -> tuple:
+    """
+    :return: ( wall seconds, {imported module: cumulative microseconds} )
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime'] + args, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    imported = {}
+    for line in process.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            imported[match.group(4)] = int(match.group(2))
+    return elapsed, imported
+
+
+def measure(name: str, repeat: int) -> dict:
+    fqcn = '{0}.{1}'.format(PACKAGE, name)
+    path = importlib.util.find_spec(fqcn).origin
+
+    import_us = fail_s = None
+    imported = failed_imports = {}
+    with tempfile.NamedTemporaryFile('w', suffix='.json') as args_file:
+        json.dump({'ANSIBLE_MODULE_ARGS': INVALID_ARGS}, args_file)
+        args_file.flush()
+        for _i in range(repeat):
+            _elapsed, imported = importtime(['-c', 'import ' + fqcn])
+            import_us = min(import_us or float('inf'), imported[fqcn])
+            elapsed, failed_imports = importtime([path, args_file.name])
+            fail_s = min(fail_s or float('inf'), elapsed)
+
+    return dict(
+        import_ms=round(import_us / 1000.0, 3),
+        fail_ms=round(fail_s * 1000.0, 3),
+        imported_modules=len(imported),
+        heavy_imports=sorted(set(HEAVY_IMPORTS) & (set(imported) | set(failed_imports))),
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for key, result in sorted(results.items()):
+        if result['heavy_imports']:
+            regressions.append('{0} imports {1} before options are validated'.format(key, ', '.join(result['heavy_imports'])))
+        expected = baseline.get('results', {}).get(key)
+        if expected is None:
+            continue
+        for metric in ('import_ms', 'fail_ms'):
+            if result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append('{0} {1}: {2} > baseline {3}'.format(key, metric, result[metric], expected[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--modules', nargs='+', default=list(MODULES))
+    parser.add_argument('--repeat', type=int, default=5, help='best of given runs is reported')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='overwrite baseline with this run')
+    parser.add_argument('--tolerance', type=float, default=1.0, help='allowed slowdown, 1.0 is twice as slow')
+    args = parser.parse_args()
+
+    boto3_us = min(importtime(['-c', 'import boto3'])[1]['boto3'] for _i in range(args.repeat))
+    print('boto3 import %.3f ms, paid after options are validated' % (boto3_us / 1000.0))
+
+    results = {}
+    print('%-24s %12s %12s %10s  %s' % ('module', 'import ms', 'fail ms', 'modules', 'heavy imports'))
+    for name in args.modules:
+        results[name] = measure(name, args.repeat)
+        print('%-24s %12.3f %12.3f %10d  %s' % (
+            name, results[name]['import_ms'], results[name]['fail_ms'], results[name]['imported_modules'],
+            ', '.join(results[name]['heavy_imports']) or '-',
+        ))
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.setdefault('results', {}).update(results)
+        baseline['environment'] = dict(python=platform.python_version(), machine=platform.machine(), boto3_ms=round(boto3_us / 1000.0, 3))
+        if not os.path.isdir(os.path.dirname(args.baseline)):
+            os.makedirs(os.path.dirname(args.baseline))
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('baseline saved to %s' % args.baseline)
+        return
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    else:
+        print('no baseline at %s, run with --save-baseline' % args.baseline)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print('REGRESSION ' + regression)
+    if regressions:
+        sys.exit(1)
+    if baseline:
+        print('no regression against baseline ( %s )' % ', '.join('%s %s' % kv for kv in sorted(baseline.get('environment', {}).items())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+r"""
+compare camelCase to snake_case conversion of `aws_response_list_parser` against ansible camel_dict_to_snake_dict.
+
+usage: python tests/benchmarks/snake_case_benchmark.py --items 100000 --page-size 100
+"""
+import argparse
+import time
+
+from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+from ansible_collections.community.missing_collection.plugins.module_utils.aws_response_parser import aws_response_list_parser
+
+
+def synthetic_item(i: int) -> dict:
+    return {
+        'ClusterArn': 'arn:aws:ecs:eu-central-1:123456789012:cluster/cluster-%d' % i,
+        'ClusterName': 'cluster-%d' % i,
+        'CreationTime': '2021-12-01T00:00:00Z',
+        'Status': 'ACTIVE',
+        'RegisteredContainerInstancesCount': i % 10,
+        'TargetGroupARNs': ['arn:aws:elasticloadbalancing:eu-central-1:123456789012:targetgroup/tg-%d' % i],
+        'Tags': [{'Key': 'Name', 'Value': 'cluster-%d' % i}, {'Key': 'Team', 'Value': 'ops'}],
+        'settings': [{'name': 'containerInsights', 'value': 'enabled'}],
+        'CapacityProviderStrategy': [{'CapacityProvider': 'FARGATE', 'Weight': 1, 'Base': 0}],
+        'Configuration': {'ExecuteCommandConfiguration': {'KmsKeyId': 'key', 'Logging': 'DEFAULT'}},
+    }
+
+
+def synthetic_pages(items: int, page_size: int) -> list:
+    return [
+        {'Clusters': [synthetic_item(i) for i in range(start, min(start + page_size, items))]}
+        for start in range(0, items, page_size)
+    ]
+
+
+def ansible_list_parser(paginate: bool, iterator, resource_field: str) -> list:
+    # aws_response_list_parser before module_utils/snake_case.py
+    _return = []
+    for response in iterator:
+        for _app in response[resource_field]:
+            try:
+                _return.append(camel_dict_to_snake_dict(_app))
+            except AttributeError:
+                _return.append(_app)
+    return _return
+
+
+def benchmark(name: str, parser, pages: list, items: int) -> list:
+    start = time.perf_counter()
+    result = parser(True, pages, 'Clusters')
+    elapsed = time.perf_counter() - start
+    print('%-28s %8.3f s %12.0f items/s' % (name, elapsed, items / elapsed))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    pages = synthetic_pages(args.items, args.page_size)
+    print('%d items in %d pages' % (args.items, len(pages)))
+    expected = benchmark('camel_dict_to_snake_dict', ansible_list_parser, pages, args.items)
+    result = benchmark('aws_response_list_parser', aws_response_list_parser, pages, args.items)
+    assert result == expected, 'aws_response_list_parser output differs from camel_dict_to_snake_dict'
+
+
+if __name__ == '__main__':
+    main()